@@ -14,17 +14,25 @@
 # ==============================================================================
 
 from model_compression_toolkit.defaultdict import DefaultDict
-from model_compression_toolkit.target_platform_capabilities import target_platform
-from model_compression_toolkit.target_platform_capabilities.tpc_models.get_target_platform_capabilities import get_target_platform_capabilities
-from model_compression_toolkit import core
 from model_compression_toolkit.logger import set_log_folder
-from model_compression_toolkit import trainable_infrastructure
-from model_compression_toolkit import ptq
-from model_compression_toolkit import qat
-from model_compression_toolkit import exporter
-from model_compression_toolkit import gptq
-from model_compression_toolkit import data_generation
-from model_compression_toolkit import pruning
-from model_compression_toolkit.trainable_infrastructure.keras.load_model import keras_load_quantized_model
+from model_compression_toolkit.lazy_loader import lazy_attributes
+
+# The public API is loaded on first use, so importing the package does not import TensorFlow or PyTorch.
+_LAZY_ATTRIBUTES = {
+    'get_target_platform_capabilities': ('model_compression_toolkit.target_platform_capabilities.tpc_models.get_target_platform_capabilities', 'get_target_platform_capabilities'),
+    'target_platform': ('model_compression_toolkit.target_platform_capabilities.target_platform', None),
+    'core': ('model_compression_toolkit.core', None),
+    'trainable_infrastructure': ('model_compression_toolkit.trainable_infrastructure', None),
+    'ptq': ('model_compression_toolkit.ptq', None),
+    'qat': ('model_compression_toolkit.qat', None),
+    'exporter': ('model_compression_toolkit.exporter', None),
+    'gptq': ('model_compression_toolkit.gptq', None),
+    'data_generation': ('model_compression_toolkit.data_generation', None),
+    'pruning': ('model_compression_toolkit.pruning', None),
+    'keras_load_quantized_model': ('model_compression_toolkit.trainable_infrastructure.keras.load_model', 'keras_load_quantized_model'),
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
 
 __version__ = "2.1.0"
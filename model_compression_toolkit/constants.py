@@ -100,6 +100,10 @@ DEC_RANGE_UPPER = 1.03
 
 NUM_QPARAM_HESSIAN_SAMPLES = 16
 
+# Bound on the size (in bytes) of the quantized tensors that a vectorized parameters search computes at once (small
+# chunks stay in the CPU cache while they are quantized and their errors are computed).
+QPARAMS_SEARCH_MAX_CHUNK_BYTES = 2 ** 20
+
 # Resource utilization computation parameters
 BITS_TO_BYTES = 8.0
 
@@ -13,16 +13,30 @@
 # limitations under the License.
 # ==============================================================================
 
-from model_compression_toolkit.core.common.framework_info import FrameworkInfo, ChannelAxis
-from model_compression_toolkit.core.common import network_editors as network_editor
-from model_compression_toolkit.core.common.quantization.debug_config import DebugConfig
-from model_compression_toolkit.core.common.quantization import quantization_config
-from model_compression_toolkit.core.common.mixed_precision import mixed_precision_quantization_config
-from model_compression_toolkit.core.common.quantization.quantization_config import QuantizationConfig, QuantizationErrorMethod, DEFAULTCONFIG
-from model_compression_toolkit.core.common.quantization.core_config import CoreConfig
-from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.resource_utilization import ResourceUtilization
-from model_compression_toolkit.core.common.mixed_precision.mixed_precision_quantization_config import MixedPrecisionQuantizationConfig
-from model_compression_toolkit.core.keras.resource_utilization_data_facade import keras_resource_utilization_data
-from model_compression_toolkit.core.pytorch.resource_utilization_data_facade import pytorch_resource_utilization_data
-from model_compression_toolkit.core.common.mixed_precision.distance_weighting import MpDistanceWeighting
+from model_compression_toolkit.lazy_loader import lazy_attributes
 
+_LAZY_ATTRIBUTES = {
+    'FrameworkInfo': ('model_compression_toolkit.core.common.framework_info', 'FrameworkInfo'),
+    'ChannelAxis': ('model_compression_toolkit.core.common.framework_info', 'ChannelAxis'),
+    'network_editor': ('model_compression_toolkit.core.common.network_editors', None),
+    'DebugConfig': ('model_compression_toolkit.core.common.quantization.debug_config', 'DebugConfig'),
+    'quantization_config': ('model_compression_toolkit.core.common.quantization.quantization_config', None),
+    'mixed_precision_quantization_config': ('model_compression_toolkit.core.common.mixed_precision.mixed_precision_quantization_config', None),
+    'QuantizationConfig': ('model_compression_toolkit.core.common.quantization.quantization_config', 'QuantizationConfig'),
+    'QuantizationErrorMethod': ('model_compression_toolkit.core.common.quantization.quantization_config', 'QuantizationErrorMethod'),
+    'DEFAULTCONFIG': ('model_compression_toolkit.core.common.quantization.quantization_config', 'DEFAULTCONFIG'),
+    'CoreConfig': ('model_compression_toolkit.core.common.quantization.core_config', 'CoreConfig'),
+    'PipelineCacheConfig': ('model_compression_toolkit.core.common.quantization.pipeline_cache_config', 'PipelineCacheConfig'),
+    'StatsConvergenceConfig': ('model_compression_toolkit.core.common.quantization.stats_convergence_config', 'StatsConvergenceConfig'),
+    'StatsSamplingConfig': ('model_compression_toolkit.core.common.quantization.stats_sampling_config', 'StatsSamplingConfig'),
+    'StatsSamplingMethod': ('model_compression_toolkit.core.common.quantization.stats_sampling_config', 'StatsSamplingMethod'),
+    'ResourceUtilization': ('model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.resource_utilization', 'ResourceUtilization'),
+    'MixedPrecisionQuantizationConfig': ('model_compression_toolkit.core.common.mixed_precision.mixed_precision_quantization_config', 'MixedPrecisionQuantizationConfig'),
+    'keras_resource_utilization_data': ('model_compression_toolkit.core.keras.resource_utilization_data_facade', 'keras_resource_utilization_data'),
+    'pytorch_resource_utilization_data': ('model_compression_toolkit.core.pytorch.resource_utilization_data_facade', 'pytorch_resource_utilization_data'),
+    'MpDistanceWeighting': ('model_compression_toolkit.core.common.mixed_precision.distance_weighting', 'MpDistanceWeighting'),
+    'MpSolver': ('model_compression_toolkit.core.common.mixed_precision.mp_solver', 'MpSolver'),
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
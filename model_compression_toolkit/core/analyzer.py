@@ -14,7 +14,12 @@
 # ==============================================================================
 
 
-from typing import Callable
+import csv
+import os
+from typing import Callable, List
+
+import numpy as np
+from matplotlib import pyplot as plt
 
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
 from model_compression_toolkit.core.common import FrameworkInfo
@@ -27,6 +32,42 @@ from model_compression_toolkit.core.common.visualization.nn_visualizer import NN
 from model_compression_toolkit.core.common.visualization.tensorboard_writer import TensorboardWriter
 from model_compression_toolkit.logger import Logger
 
+SIMILARITY_TABLE_FILE = 'similarity_table.csv'
+
+
+def _export_similarity_table(similarity: np.ndarray,
+                             compare_points_names: List[str],
+                             tb_w: TensorboardWriter):
+    """
+    Export a table with the similarity statistics (over all the analyzed samples) of each compare point.
+    The table is saved as a CSV file in the TensorboardWriter's folder, and the mean similarity of each compare point
+    is also logged as a scalar to Tensorboard.
+
+    Args:
+        similarity: Similarity of each sample at each compare point, with shape (number of samples, number of
+            compare points).
+        compare_points_names: Name of each compare point.
+        tb_w: TensorBoardWriter object to log events.
+
+    """
+    mean_similarity = similarity.mean(axis=0)
+    os.makedirs(tb_w.dir_path, exist_ok=True)
+    table_path = os.path.join(tb_w.dir_path, SIMILARITY_TABLE_FILE)
+    with open(table_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['layer', 'mean', 'std', 'min', 'max'])
+        for name, mean, std, min_similarity, max_similarity in zip(compare_points_names,
+                                                                  mean_similarity,
+                                                                  similarity.std(axis=0),
+                                                                  similarity.min(axis=0),
+                                                                  similarity.max(axis=0)):
+            writer.writerow([name, f'{mean:.6f}', f'{std:.6f}', f'{min_similarity:.6f}', f'{max_similarity:.6f}'])
+    Logger.info(f'Similarity table of {similarity.shape[0]} samples is in {table_path}')
+
+    tb_w.add_scalars({f'{i}_{name}': float(mean) for i, (name, mean) in enumerate(zip(compare_points_names,
+                                                                                     mean_similarity))},
+                     main_tag_name='similarity')
+
 
 def analyzer_model_quantization(representative_data_gen: Callable,
                                 tb_w: TensorboardWriter,
@@ -57,17 +98,23 @@ def analyzer_model_quantization(representative_data_gen: Callable,
             Logger.error(f'No comparing points were found to plot analyze similarity.')
         else:
             visualized_samples = 0
+            similarity = []
             for _data in representative_data_gen():
-                batch_size = _data[0].shape[0]
-                for sample_index in range(batch_size):
-                    if visualized_samples >= NUM_SAMPLES_DISTANCE_TENSORBOARD:
-                        break
-                    figure = visual.plot_distance_graph(_data,
-                                                        sample_index=sample_index,
-                                                        distance_fn=compute_cs,
-                                                        convert_to_range=lambda a: 1 - 2 * a)
+                # Only the samples that are required to complete the figures are inferred.
+                num_samples = min(_data[0].shape[0], NUM_SAMPLES_DISTANCE_TENSORBOARD - visualized_samples)
+                batch_similarity = visual.compute_distances([d[:num_samples] for d in _data],
+                                                            distance_fn=compute_cs,
+                                                            convert_to_range=lambda a: 1 - 2 * a)
+                for sample_similarity in batch_similarity:
+                    figure = visual.plot_distances(sample_similarity)
                     tb_w.add_figure(figure, f'similarity_distance_sample_{visualized_samples}')
+                    plt.close(figure)
                     visualized_samples += 1
+                similarity.append(batch_similarity)
+                if visualized_samples >= NUM_SAMPLES_DISTANCE_TENSORBOARD:
+                    break
             if visualized_samples < NUM_SAMPLES_DISTANCE_TENSORBOARD:
                 Logger.error(f'Not enough batches in representative dataset to generate {NUM_SAMPLES_DISTANCE_TENSORBOARD} figures')
+            if visualized_samples > 0:
+                _export_similarity_table(np.concatenate(similarity, axis=0), visual.compare_points_name, tb_w)
         tb_w.close()
@@ -48,6 +48,19 @@ class BaseCollector(object):
         raise NotImplemented(
             f'{self.__class__.__name__} needs to implement shift operation for its state.')  # pragma: no cover
 
+    def merge(self, other: 'BaseCollector'):
+        """
+        Merge the statistics another collector of the same type collected into this collector (e.g., when
+        the statistics of a tensor are collected on several shards of the dataset).
+
+        Args:
+            other: Collector to merge its statistics.
+
+        """
+
+        raise NotImplemented(
+            f'{self.__class__.__name__} needs to implement merge operation for its state.')  # pragma: no cover
+
     def update_legal_status(self, is_illegal: bool):
         """
         If statistics were manipulated in a granularity they were not collected by, the data is invalid,
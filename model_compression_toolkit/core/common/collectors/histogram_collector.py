@@ -13,7 +13,7 @@
 # limitations under the License.
 # ==============================================================================
 
-from typing import Tuple
+from typing import List, Tuple
 import numpy as np
 from model_compression_toolkit.core.common.collectors.base_collector import BaseCollector
 
@@ -122,6 +122,32 @@ class HistogramCollector(BaseCollector):
             bins, _ = self.get_histogram()
             self.__bins = bins + shift_value
 
+    def merge(self, other: 'HistogramCollector'):
+        """
+        Merge the histograms another histogram collector collected into this collector.
+        The collector keeps the histograms of both collectors (this collector's histograms first) and merges them
+        lazily into a single histogram, as if all histograms were collected by this collector.
+
+        Args:
+            other: Histogram collector to merge its histograms.
+
+        """
+
+        self.update_legal_status(is_illegal=not other.is_legal)
+        self.__histogram_per_iteration = self.__get_histograms() + other.__get_histograms()
+        self.__bins = None
+        self.__counts = None
+
+    def __get_histograms(self) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Returns: The histograms (counts and bins) the collector holds: its merged histogram if it was already
+        merged (and maybe manipulated), or the histograms it collected otherwise.
+        """
+
+        if self.__bins is not None and self.__counts is not None:
+            return [(self.__counts, self.__bins)]
+        return list(self.__histogram_per_iteration)
+
     def get_histogram(self) -> Tuple[np.ndarray, np.ndarray]:
         """
         Returns: The histogram (bins and counts) the collector holds.
@@ -134,6 +160,13 @@ class HistogramCollector(BaseCollector):
             self.__merge_histograms()
         return self.__bins, self.__counts
 
+    def get_last_histogram(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns: The histogram (counts and bins) of the last tensor that went through the collector.
+        """
+
+        return self.__histogram_per_iteration[-1]
+
     def max(self):
         """
         Returns: Maximum value in the histogram.
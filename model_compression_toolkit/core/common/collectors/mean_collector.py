@@ -68,6 +68,22 @@ class MeanCollector(BaseCollector):
 
         self.current_mean += shift_value
 
+    def merge(self, other: 'MeanCollector'):
+        """
+        Merge the batches' means another mean collector collected into this collector.
+        The merged mean is the mean of the batches' means of both collectors.
+
+        Args:
+            other: Mean collector to merge its statistics.
+
+        """
+
+        self.update_legal_status(is_illegal=not other.is_legal)
+        if other.i > 0:
+            self.current_sum = self.current_sum + other.current_sum
+            self.i += other.i
+            self.current_mean = self.current_sum / self.i
+
     @property
     def state(self):
         """
@@ -85,6 +85,24 @@ class MinMaxPerChannelCollector(BaseCollector):
             if self.init_min_value is not None:
                 self.init_min_value += shift_value
 
+    def merge(self, other: 'MinMaxPerChannelCollector'):
+        """
+        Merge the min/max values per-channel another collector observed into this collector.
+
+        Args:
+            other: Min/max per-channel collector to merge its statistics.
+
+        """
+
+        self.update_legal_status(is_illegal=not other.is_legal)
+        self.ignore_init_values = self.ignore_init_values or other.ignore_init_values
+        if other.state is not None:
+            if self.state is None:
+                self.state = np.copy(other.state)
+            else:
+                self.state = np.stack([np.maximum(self.state[:, 0], other.state[:, 0]),
+                                       np.minimum(self.state[:, 1], other.state[:, 1])], axis=-1)
+
     @property
     def min(self) -> float:
         """
@@ -140,4 +158,4 @@ class MinMaxPerChannelCollector(BaseCollector):
         else:
             x_max = np.maximum(np.max(x_reshape, axis=-1), self.state[:, 0])
             x_min = np.minimum(np.min(x_reshape, axis=-1), self.state[:, 1])
-        self.state = np.stack([x_max, x_min], axis=-1)
+        self.state = np.stack([x_max, x_min], axis=-1).astype(np.float64)
@@ -24,6 +24,9 @@ from model_compression_toolkit.core.common.framework_info import FrameworkInfo,
 from model_compression_toolkit.core.common.collectors.histogram_collector import HistogramCollector
 from model_compression_toolkit.core.common.collectors.mean_collector import MeanCollector
 from model_compression_toolkit.core.common.collectors.min_max_per_channel_collector import MinMaxPerChannelCollector
+from model_compression_toolkit.core.common.quantization.stats_sampling_config import StatsSamplingConfig, \
+    StatsSamplingMethod
+from model_compression_toolkit.logger import Logger
 
 
 class BaseStatsCollector(object):
@@ -49,6 +52,15 @@ class BaseStatsCollector(object):
         """
         raise NotImplemented(f'update_statistics is not implemented in {self.__class__.__name__}')  # pragma: no cover
 
+    def merge(self, other: 'BaseStatsCollector'):
+        """
+        Merge the statistics another statistics collector of the same type collected into this collector.
+
+        Args:
+            other: Statistics collector to merge its statistics.
+        """
+        raise NotImplemented(f'merge is not implemented in {self.__class__.__name__}')  # pragma: no cover
+
 
 class StatsCollector(BaseStatsCollector):
     """
@@ -58,7 +70,8 @@ class StatsCollector(BaseStatsCollector):
     def __init__(self,
                  out_channel_axis: int,
                  init_min_value: float = None,
-                 init_max_value: float = None):
+                 init_max_value: float = None,
+                 sampling_config: StatsSamplingConfig = None):
         """
         Instantiate three statistics collectors: histogram, mean and min/max per channel.
         Set initial min/max values if are known.
@@ -67,9 +80,14 @@ class StatsCollector(BaseStatsCollector):
             out_channel_axis: Index of output channels.
             init_min_value: Initial min value for min/max stored values.
             init_max_value: Initial max value for min/max stored values.
+            sampling_config: Configuration of sampling large tensors for the histogram and mean statistics. If None,
+                all elements of the tensors are used.
         """
 
         super().__init__()
+        self.out_channel_axis = out_channel_axis
+        self.sampling_config = sampling_config
+        self.rng = None if sampling_config is None else np.random.default_rng(sampling_config.seed)
         self.hc = HistogramCollector()
         self.mc = MeanCollector(axis=out_channel_axis)
         self.mpcc = MinMaxPerChannelCollector(init_min_value=init_min_value,
@@ -84,10 +102,32 @@ class StatsCollector(BaseStatsCollector):
             x: Tensor to consider when updating statistics.
         """
 
-        x = standardize_tensor(x)
-        self.hc.update(x)
-        self.mc.update(x)
-        self.mpcc.update(x)
+        if self.sampling_config is not None and np.size(x) > self.sampling_config.max_elements and np.ndim(x) > 1:
+            # The min/max are collected on the full tensor, and the histogram and mean on a sample of its positions.
+            # The tensor's min and max values are added to the sample, so the histogram covers its full range.
+            self.mpcc.update(x)
+            x_sample = sample_tensor(x, self.out_channel_axis, self.sampling_config, self.rng)
+            x_sample = standardize_tensor(x_sample)
+            self.hc.update(np.concatenate([x_sample.flatten(), [np.min(x), np.max(x)]]))
+            self.mc.update(x_sample)
+        else:
+            x = standardize_tensor(x)
+            self.hc.update(x)
+            self.mc.update(x)
+            self.mpcc.update(x)
+
+    def merge(self, other: 'StatsCollector'):
+        """
+        Merge the statistics another statistics collector collected (e.g., on another shard of the dataset)
+        into all collectors.
+
+        Args:
+            other: Statistics collector to merge its statistics.
+        """
+
+        self.hc.merge(other.hc)
+        self.mc.merge(other.mc)
+        self.mpcc.merge(other.mpcc)
 
     def get_mean(self) -> np.ndarray:
         """
@@ -159,6 +199,16 @@ class NoStatsCollector(BaseStatsCollector):
 
         pass  # pragma: no cover
 
+    def merge(self, other: 'NoStatsCollector'):
+        """
+        Do nothing since there are no statistics to merge.
+
+        Args:
+            other: Statistics collector to merge.
+        """
+
+        pass
+
     def __repr__(self):
         """
         Returns: Display object as "No Quantization".
@@ -207,6 +257,51 @@ def standardize_tensor(x: Any) -> np.ndarray:
     return x
 
 
+def sample_tensor(x: np.ndarray,
+                  channel_axis: int,
+                  sampling_config: StatsSamplingConfig,
+                  rng: np.random.Generator) -> np.ndarray:
+    """
+    Sample positions of a tensor (all channels of each sampled position are kept), so the sample holds about
+    sampling_config.max_elements elements.
+
+    Args:
+        x: Tensor to sample (with at least two dimensions).
+        channel_axis: Index of the tensor's channels axis.
+        sampling_config: Configuration of the sampling.
+        rng: Random generator to sample with.
+
+    Returns:
+        A tensor of the sampled positions, with the channels in the same axis as in x.
+    """
+    channel_axis = channel_axis % x.ndim
+    n_channels = x.shape[channel_axis]
+    positions_shape = [d for i, d in enumerate(x.shape) if i != channel_axis]
+    n_positions = int(np.prod(positions_shape))
+    n_samples = min(n_positions, max(1, sampling_config.max_elements // n_channels))
+
+    if sampling_config.method == StatsSamplingMethod.RANDOM:
+        positions = rng.integers(0, n_positions, n_samples)
+    elif sampling_config.method == StatsSamplingMethod.STRATIFIED:
+        strata_starts = (np.arange(n_samples) * n_positions) // n_samples
+        strata_sizes = np.diff(np.append(strata_starts, n_positions))
+        positions = strata_starts + (rng.random(n_samples) * strata_sizes).astype(int)
+    else:
+        Logger.critical(f'Unknown statistics sampling method {sampling_config.method}.')  # pragma: no cover
+
+    # Index the sampled positions without copying the full tensor. The result is of shape
+    # (number of samples, channels), unless the channels are the first axis.
+    index = list(np.unravel_index(positions, positions_shape))
+    index.insert(channel_axis, slice(None))
+    x_sample = x[tuple(index)]
+    if channel_axis == 0:
+        x_sample = x_sample.T
+
+    # Place the channels in their axis, as in the sampled tensor.
+    x_sample = x_sample.reshape([n_samples] + [1] * (x.ndim - 2) + [n_channels])
+    return np.moveaxis(x_sample, -1, channel_axis)
+
+
 def shift_statistics(collector: BaseStatsCollector,
                      shift_value: np.ndarray) -> BaseStatsCollector:
     """
@@ -0,0 +1,132 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import List
+
+import numpy as np
+
+from model_compression_toolkit.core.common.collectors.statistics_collector import StatsCollector
+from model_compression_toolkit.core.common.quantization.stats_convergence_config import StatsConvergenceConfig
+from model_compression_toolkit.logger import Logger
+
+# Minimal range of a tensor's values for computing the relative change of its statistics.
+MIN_RANGE = 1e-8
+
+
+def get_histogram_quantiles(counts: np.ndarray, bins: np.ndarray, quantiles: List[float]) -> np.ndarray:
+    """
+    Compute quantiles of a histogram (by linear interpolation in its bins).
+
+    Args:
+        counts: Counts of the histogram.
+        bins: Edges of the histogram's bins.
+        quantiles: Quantiles to compute (in [0, 1]).
+
+    Returns:
+        The values of the quantiles, or None if the histogram is empty (its quantiles are undefined).
+    """
+    total_count = np.sum(counts)
+    if total_count == 0:
+        return None
+    cdf = np.concatenate([[0], np.cumsum(counts)]) / total_count
+    return np.interp(quantiles, cdf, bins)
+
+
+class StatsConvergenceMonitor:
+    """
+    Monitor of the convergence of the statistics collection. After each batch, the statistics that the
+    thresholds selection relies on are taken from each statistics collector: min/max, mean per-channel, and
+    the quantiles of the histogram (averaged over the batches with a non-empty histogram, since the collected
+    histograms are merged only when they are used). A tensor is stable in a batch if the change of its statistics, relative to its range of
+    values, is within the tolerance, and the collection can stop once all tensors are stable for a number of
+    consecutive batches (and the minimal number of batches was collected), or when the maximal number of batches
+    was collected.
+    """
+
+    def __init__(self, config: StatsConvergenceConfig):
+        """
+        Args:
+            config: StatsConvergenceConfig with the convergence criterion.
+        """
+        self.config = config
+        self.num_batches = 0
+        self.stable_batches = 0
+        self.tracked_stats = None
+        self.quantiles_sums = None
+        self.num_histograms = None
+
+    @property
+    def converged(self) -> bool:
+        """
+        Returns: Whether all tensors were stable for the required number of consecutive batches.
+        """
+        return self.stable_batches >= self.config.patience
+
+    def should_stop(self) -> bool:
+        """
+        Returns: Whether the statistics collection can stop.
+        """
+        if self.config.max_batches is not None and self.num_batches >= self.config.max_batches:
+            return True
+        return self.num_batches >= self.config.min_batches and self.converged
+
+    def update(self, stats_containers_list: List):
+        """
+        Update the monitor with the statistics after a batch was collected.
+
+        Args:
+            stats_containers_list: Statistics containers of a ModelCollector (a statistics collector or a list of
+                statistics collectors per output node).
+
+        """
+        stats_collectors = [sc for scs in stats_containers_list for sc in (scs if isinstance(scs, (list, tuple))
+                                                                             else [scs])
+                            if isinstance(sc, StatsCollector)]
+        if self.quantiles_sums is None:
+            self.quantiles_sums = [np.zeros(len(self.config.tracked_quantiles)) for _ in stats_collectors]
+            self.num_histograms = [0] * len(stats_collectors)
+
+        self.num_batches += 1
+        tracked_stats = []
+        relative_changes = []
+        for i, sc in enumerate(stats_collectors):
+            counts, bins = sc.hc.get_last_histogram()
+            quantiles = get_histogram_quantiles(counts, bins, self.config.tracked_quantiles)
+            # An empty histogram is skipped, so its undefined quantiles do not prevent the convergence.
+            if quantiles is not None:
+                self.quantiles_sums[i] = self.quantiles_sums[i] + quantiles
+                self.num_histograms[i] += 1
+            min_value, max_value = sc.mpcc.min, sc.mpcc.max
+            stats = np.concatenate([[min_value, max_value],
+                                    np.asarray(sc.mc.state).flatten(),
+                                    self.quantiles_sums[i] / max(self.num_histograms[i], 1)])
+            if self.tracked_stats is not None:
+                value_range = max(max_value - min_value, MIN_RANGE)
+                relative_changes.append(np.max(np.abs(stats - self.tracked_stats[i])) / value_range)
+            tracked_stats.append(stats)
+
+        if self.tracked_stats is not None and all(c <= self.config.tolerance for c in relative_changes):
+            self.stable_batches += 1
+        else:
+            self.stable_batches = 0
+        self.tracked_stats = tracked_stats
+
+    def log_summary(self):
+        """
+        Log the number of batches the statistics were collected on.
+        """
+        if self.converged:
+            Logger.info(f'Statistics collection converged after {self.num_batches} batches.')
+        else:
+            Logger.info(f'Statistics were collected on {self.num_batches} batches without converging.')
@@ -13,7 +13,7 @@
 # limitations under the License.
 # ==============================================================================
 from abc import ABC, abstractmethod
-from typing import Callable, Any, List, Tuple, Dict
+from typing import Callable, Any, List, Tuple, Dict, Iterable
 
 import numpy as np
 
@@ -151,6 +151,39 @@ class FrameworkImplementation(ABC):
         raise NotImplemented(f'{self.__class__.__name__} have to implement the '
                              f'framework\'s run_model_inference method.')  # pragma: no cover
 
+    def get_representative_dataset_iterator(self,
+                                            representative_data_gen: Callable) -> Iterable:
+        """
+        Returns an iterable over the representative dataset batches to use as models inputs.
+        Frameworks can override it to feed the batches through a prefetched input pipeline.
+
+        Args:
+            representative_data_gen: Dataset used for calibration.
+
+        Returns:
+            An iterable of batches (lists of inputs for the model).
+        """
+        return representative_data_gen()
+
+    @property
+    def supports_forked_workers(self) -> bool:
+        """
+        Returns: Whether the framework's models can run in worker processes that are forked from the current
+        process after the framework's runtime was initialized.
+        """
+        return False
+
+    def set_num_threads(self, num_threads: int):
+        """
+        Set the number of threads the framework uses for running operations (e.g., in a worker process that
+        shares the machine's cores with other workers). Frameworks that can not change it once their runtime is
+        initialized keep their current setting.
+
+        Args:
+            num_threads: Number of threads.
+        """
+        pass
+
     @abstractmethod
     def shift_negative_correction(self,
                                   graph: Graph,
@@ -31,6 +31,7 @@ from model_compression_toolkit.core.common.collectors.statistics_collector impor
 from model_compression_toolkit.core.common.collectors.statistics_collector import scale_statistics, shift_statistics
 from model_compression_toolkit.core.common.pruning.pruning_section import PruningSection
 from model_compression_toolkit.core.common.user_info import UserInformation
+from model_compression_toolkit.core.common.quantization.quantized_weights_cache import QuantizedWeightsCache
 from model_compression_toolkit.logger import Logger
 from model_compression_toolkit.target_platform_capabilities.target_platform.targetplatform2framework import \
     TargetPlatformCapabilities, LayerFilterParams
@@ -75,6 +76,7 @@ class Graph(nx.MultiDiGraph, GraphSearches):
         self.user_info = UserInformation()
         self.fw_info = fw_info
         self.fused_nodes = []
+        self.quantized_weights_cache = QuantizedWeightsCache()
 
     def set_fw_info(self,
                     fw_info: FrameworkInfo):
@@ -21,6 +21,7 @@ import numpy as np
 from model_compression_toolkit.constants import WEIGHTS_NBITS_ATTRIBUTE, CORRECTED_BIAS_ATTRIBUTE, \
     ACTIVATION_NBITS_ATTRIBUTE, FP32_BYTES_PER_PARAMETER
 from model_compression_toolkit.core.common.quantization.node_quantization_config import WeightsAttrQuantizationConfig
+from model_compression_toolkit.core.common.quantization.quantized_weights_cache import tensor_fingerprint
 from model_compression_toolkit.logger import Logger
 from model_compression_toolkit.target_platform_capabilities.target_platform import QuantizationConfigOptions, \
     TargetPlatformCapabilities, LayerFilterParams
@@ -68,6 +69,9 @@ class BaseNode:
         self.input_shape = input_shape
         self.output_shape = output_shape
         self.weights = weights
+        # Fingerprints of the weights' content by weight name (with the tensor each fingerprint was computed for),
+        # so a weights tensor is hashed once when it is quantized several times.
+        self.weights_fingerprints = dict()
         self.layer_class = layer_class
         self.reuse = reuse
         self.reuse_group = reuse_group
@@ -209,6 +213,25 @@ class BaseNode:
         else:  # Add if not exist
             self.weights[name] = tensor
             self.weights_keys = list(self.weights.keys())  # update keys
+        self.weights_fingerprints.pop(name, None)
+
+    def get_weights_fingerprint(self, name: str) -> Tuple:
+        """
+        Get a fingerprint of the content of a node's weight (used as the weight's key in a quantized weights cache).
+        The fingerprint is computed once for each weight, and it is invalidated when the weight is set.
+
+        Args:
+            name: Name of the variable for a node's weight.
+
+        Returns:
+            A hashable fingerprint of the weight.
+        """
+        tensor = self.get_weights_by_keys(name)
+        fingerprinted_tensor, fingerprint = self.weights_fingerprints.get(name, (None, None))
+        if fingerprinted_tensor is not tensor:
+            fingerprint = tensor_fingerprint(tensor)
+            self.weights_fingerprints[name] = (tensor, fingerprint)
+        return fingerprint
 
     def get_weights_list(self):
         """
@@ -338,7 +361,7 @@ class BaseNode:
 
         if self.is_weights_quantization_enabled(kernel_attr):
             parameters_dict = copy.deepcopy(self.candidates_quantization_cfg[0].weights_quantization_cfg.
-                                            get_attr_config(kernel_attr).__dict__)
+                                            get_attr_config(kernel_attr).get_config_dict())
             for shared_parameter in shared_parameters:
                 if shared_parameter in parameters_dict:
                     unified_param = []
@@ -361,7 +384,7 @@ class BaseNode:
         shared_attributes = [ACTIVATION_NBITS_ATTRIBUTE]
         attr = dict()
         if self.is_activation_quantization_enabled():
-            attr = copy.deepcopy(self.candidates_quantization_cfg[0].activation_quantization_cfg.__dict__)
+            attr = copy.deepcopy(self.candidates_quantization_cfg[0].activation_quantization_cfg.get_config_dict())
             for shared_attr in shared_attributes:
                 if shared_attr in attr:
                     unified_attr = []
@@ -515,12 +538,12 @@ class BaseNode:
                            f"An empty list of candidates is returned.")
             return []
 
-        unique_candidates = copy.deepcopy(self.candidates_quantization_cfg)
+        # Filter before copying, so only the returned candidates are copied.
         seen_candidates = set()
-        unique_candidates = [candidate for candidate in unique_candidates if
+        unique_candidates = [candidate for candidate in self.candidates_quantization_cfg if
                              candidate.weights_quantization_cfg.get_attr_config(attr) not in seen_candidates
                              and not seen_candidates.add(candidate.weights_quantization_cfg.get_attr_config(attr))]
-        return unique_candidates
+        return copy.deepcopy(unique_candidates)
 
     def get_unique_activation_candidates(self) -> List[Any]:
         """
@@ -531,12 +554,12 @@ class BaseNode:
         Returns: A list with node's candidates of unique activation bit-width value.
         """
 
-        unique_candidates = copy.deepcopy(self.candidates_quantization_cfg)
+        # Filter before copying, so only the returned candidates are copied.
         seen_candidates = set()
-        unique_candidates = [candidate for candidate in unique_candidates if
+        unique_candidates = [candidate for candidate in self.candidates_quantization_cfg if
                              candidate.activation_quantization_cfg not in seen_candidates
                              and not seen_candidates.add(candidate.activation_quantization_cfg)]
-        return unique_candidates
+        return copy.deepcopy(unique_candidates)
 
     def has_activation_quantization_enabled_candidate(self) -> bool:
         """
@@ -577,11 +600,13 @@ class BaseNode:
         if tpc is None:
             Logger.critical(f'Can not retrieve QC options for None TPC')  # pragma: no cover
 
-        for fl, qco in tpc.filterlayer2qco.items():
+        # Only the mappings of the node's type (or of a type with the same name) are candidates to match the node.
+        filters_candidates, layers_candidates = tpc.qco_dispatch_index.get_candidates(self.type)
+        for fl, qco in filters_candidates:
             if self.is_match_filter_params(fl):
                 return qco
         # Extract qco with is_match_type to overcome mismatch of function types in TF 2.15
-        matching_qcos = [_qco for _type, _qco in tpc.layer2qco.items() if self.is_match_type(_type)]
+        matching_qcos = [_qco for _type, _qco in layers_candidates if self.is_match_type(_type)]
         if matching_qcos:
             if len(matching_qcos) > 1:
                 Logger.error('Found duplicate qco types!')
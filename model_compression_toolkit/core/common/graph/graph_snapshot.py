@@ -0,0 +1,129 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import pickle
+import shutil
+import tempfile
+from typing import Any, Tuple
+
+import numpy as np
+
+from model_compression_toolkit.core.common.graph.base_graph import Graph
+from model_compression_toolkit.logger import Logger
+
+GRAPH_FILE = 'graph.pkl'
+ARRAYS_FILE = 'arrays.bin'
+
+# Arrays smaller than this (in bytes) are stored inside the pickled graph rather than in the arrays file.
+MIN_MEMMAP_BYTES = 1024
+
+# Alignment (in bytes) of each array in the arrays file.
+ARRAY_ALIGNMENT = 64
+
+
+class _SnapshotPickler(pickle.Pickler):
+    """
+    A pickler that writes the large numpy arrays of the pickled objects (weights, statistics, etc.) to a separate
+    binary file, and records their offset, shape and type in the pickled stream instead.
+    """
+
+    def __init__(self, file, arrays_file):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.arrays_file = arrays_file
+        self.offset = 0
+
+    def persistent_id(self, obj: Any) -> Tuple:
+        if not isinstance(obj, np.ndarray) or obj.dtype.hasobject or obj.nbytes < MIN_MEMMAP_BYTES:
+            return None
+
+        padding = -self.offset % ARRAY_ALIGNMENT
+        self.arrays_file.write(b'\0' * padding)
+        self.offset += padding
+        array_offset = self.offset
+        data = np.ascontiguousarray(obj).tobytes()
+        self.arrays_file.write(data)
+        self.offset += len(data)
+        return array_offset, obj.shape, obj.dtype.str
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """
+    An unpickler that maps the arrays recorded by _SnapshotPickler to the arrays file.
+    """
+
+    def __init__(self, file, arrays_buffer: np.ndarray):
+        super().__init__(file)
+        self.arrays_buffer = arrays_buffer
+
+    def persistent_load(self, pid: Tuple) -> np.ndarray:
+        offset, shape, dtype = pid
+        dtype = np.dtype(dtype)
+        n_bytes = int(np.prod(shape)) * dtype.itemsize
+        return self.arrays_buffer[offset:offset + n_bytes].view(dtype).reshape(shape)
+
+
+def save_graph_snapshot(graph: Graph, snapshot_dir: str, extra: Any = None):
+    """
+    Save a snapshot of a graph (its nodes and edges, with their quantization configurations and statistics
+    collectors) to a directory. The large arrays of the graph (e.g., weights) are written to a binary file, so they
+    can be memory mapped when the snapshot is loaded, and the rest of the graph is pickled.
+    The snapshot is written to a temporary directory which is then renamed, so a snapshot directory is always complete.
+
+    Args:
+        graph: Graph to save.
+        snapshot_dir: Directory to save the snapshot to. An existing snapshot in the directory is replaced.
+        extra: Additional (picklable) data to save with the graph.
+
+    """
+    parent_dir = os.path.dirname(os.path.abspath(snapshot_dir))
+    os.makedirs(parent_dir, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(dir=parent_dir)
+    try:
+        with open(os.path.join(tmp_dir, GRAPH_FILE), 'wb') as graph_file, \
+                open(os.path.join(tmp_dir, ARRAYS_FILE), 'wb') as arrays_file:
+            _SnapshotPickler(graph_file, arrays_file).dump((graph, extra))
+        shutil.rmtree(snapshot_dir, ignore_errors=True)
+        os.replace(tmp_dir, snapshot_dir)
+    except Exception:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+
+def load_graph_snapshot(snapshot_dir: str) -> Tuple[Graph, Any]:
+    """
+    Load a graph snapshot that was saved by save_graph_snapshot. The large arrays of the graph are memory mapped
+    (copy-on-write) from the snapshot's arrays file, so they are read lazily and modifying them does not modify the
+    snapshot.
+
+    Args:
+        snapshot_dir: Directory of the snapshot.
+
+    Returns:
+        The loaded graph, and the additional data that was saved with it.
+
+    """
+    graph_path = os.path.join(snapshot_dir, GRAPH_FILE)
+    arrays_path = os.path.join(snapshot_dir, ARRAYS_FILE)
+    if not os.path.isfile(graph_path) or not os.path.isfile(arrays_path):
+        Logger.critical(f'No graph snapshot was found in {snapshot_dir}.')
+
+    if os.path.getsize(arrays_path) > 0:
+        arrays_buffer = np.memmap(arrays_path, dtype=np.uint8, mode='c').view(np.ndarray)
+    else:
+        arrays_buffer = np.zeros(0, dtype=np.uint8)
+
+    with open(graph_path, 'rb') as graph_file:
+        graph, extra = _SnapshotUnpickler(graph_file, arrays_buffer).load()
+    return graph, extra
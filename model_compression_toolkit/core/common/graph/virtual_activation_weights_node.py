@@ -114,7 +114,10 @@ class VirtualActivationWeightsNode(BaseNode):
     """
     A node that represents a composition of pair of sequential activation node and weights (kernel) node.
     This structure is used for mixed-precision search with bit-operation constraint.
-    The node's candidates are the cartesian product of both nodes' candidates.
+    The node's candidates are the cartesian product of both nodes' candidates. Each candidate is also kept in a
+    factorized form, as the pair of indices of its activation candidate (in the activation node) and its weights
+    candidate (in the weights node), so the BOPS of a candidate are computed from per-factor bit-width tables and a
+    candidate can be mapped back to the original nodes' candidates without searching.
 
     Important: note that not like regular BaseNode or FunctionalNode, in VirtualActivationWeightsNode the activation
     candidates config refer to the quantization config of the activation that precedes the linear operation! instead of
@@ -176,19 +179,33 @@ class VirtualActivationWeightsNode(BaseNode):
         self.original_activation_node = act_node
         self.original_weights_node = weights_node
 
-        v_candidates = []
-        for c_a in act_node.candidates_quantization_cfg:
-            for c_w in weights_node.candidates_quantization_cfg:
-                composed_candidate = CandidateNodeQuantizationConfig(activation_quantization_cfg=c_a.activation_quantization_cfg,
-                                                                     weights_quantization_cfg=c_w.weights_quantization_cfg)
-                v_candidates.append(composed_candidate)
-
-        # sorting the candidates by weights number of bits first and then by activation number of bits (reversed order)
         kernel_attr = fw_info.get_kernel_op_attributes(self.type)[0]
-        v_candidates.sort(key=lambda c: (c.weights_quantization_cfg.get_attr_config(kernel_attr).weights_n_bits,
-                                         c.activation_quantization_cfg.activation_n_bits), reverse=True)
 
-        self.candidates_quantization_cfg = v_candidates
+        # The bit-width of each factor's candidates, as used for computing the BOPS.
+        self.activation_factor_bits = [c.activation_quantization_cfg.activation_n_bits
+                                       if c.activation_quantization_cfg.enable_activation_quantization else FLOAT_BITWIDTH
+                                       for c in act_node.candidates_quantization_cfg]
+        kernel_attrs_cfg = [c.weights_quantization_cfg.get_attr_config(kernel_attr)
+                            for c in weights_node.candidates_quantization_cfg]
+        self.weights_factor_bits = [attr_cfg.weights_n_bits if attr_cfg.enable_weights_quantization else FLOAT_BITWIDTH
+                                    for attr_cfg in kernel_attrs_cfg]
+
+        # sorting the candidates by weights number of bits first and then by activation number of bits (reversed order)
+        factors = [(a_idx, w_idx) for a_idx in range(len(act_node.candidates_quantization_cfg))
+                   for w_idx in range(len(weights_node.candidates_quantization_cfg))]
+        factors.sort(key=lambda f: (kernel_attrs_cfg[f[1]].weights_n_bits,
+                                    act_node.candidates_quantization_cfg[f[0]].activation_quantization_cfg.activation_n_bits),
+                     reverse=True)
+
+        self.candidates_factors = factors
+        self.candidates_quantization_cfg = [
+            CandidateNodeQuantizationConfig(
+                activation_quantization_cfg=act_node.candidates_quantization_cfg[a_idx].activation_quantization_cfg,
+                weights_quantization_cfg=weights_node.candidates_quantization_cfg[w_idx].weights_quantization_cfg)
+            for a_idx, w_idx in factors]
+
+        # The MAC count of the weights node is computed on the first BOPS computation.
+        self._node_mac = None
 
     def get_bops_count(self, fw_impl: Any, fw_info: FrameworkInfo, candidate_idx: int) -> float:
         """
@@ -202,13 +219,9 @@ class VirtualActivationWeightsNode(BaseNode):
         Returns: The BOPS count of the composed node.
 
         """
-        kernel_attr = fw_info.get_kernel_op_attributes(self.original_weights_node.type)[0]
-        node_mac = fw_impl.get_node_mac_operations(self.original_weights_node, fw_info)
-        candidate = self.candidates_quantization_cfg[candidate_idx]
-        kernel_attr_cfg = candidate.weights_quantization_cfg.get_attr_config(kernel_attr)
-        weights_bit = kernel_attr_cfg.weights_n_bits if \
-            kernel_attr_cfg.enable_weights_quantization else FLOAT_BITWIDTH
-        activation_bit = candidate.activation_quantization_cfg.activation_n_bits if \
-            candidate.activation_quantization_cfg.enable_activation_quantization else FLOAT_BITWIDTH
-        node_bops = weights_bit * activation_bit * node_mac
+        if self._node_mac is None:
+            self._node_mac = fw_impl.get_node_mac_operations(self.original_weights_node, fw_info)
+        activation_factor, weights_factor = self.candidates_factors[candidate_idx]
+        node_bops = self.weights_factor_bits[weights_factor] * self.activation_factor_bits[activation_factor] * \
+                    self._node_mac
         return node_bops
@@ -18,6 +18,7 @@ from typing import Callable, List
 
 from model_compression_toolkit.constants import HESSIAN_NUM_ITERATIONS
 from model_compression_toolkit.core.common.hessian.trace_hessian_request import TraceHessianRequest
+from model_compression_toolkit.core.common.profiler import Profiler
 from model_compression_toolkit.logger import Logger
 
 
@@ -157,7 +158,8 @@ class HessianInfoService:
             trace_hessian_request = self._get_request_of_reuse_group(trace_hessian_request)
 
         # Ensure the saved info has the required number of approximations
-        self._populate_saved_info_to_size(trace_hessian_request, required_size)
+        with Profiler.profile(f'hessian/{trace_hessian_request.target_node.name}'):
+            self._populate_saved_info_to_size(trace_hessian_request, required_size)
 
         # Return the saved approximations for the given request
         return self.trace_hessian_request_to_score_list[trace_hessian_request]
@@ -12,12 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import List, Callable, Any
+from typing import List, Callable, Any, Tuple
 
 import numpy as np
 
 from model_compression_toolkit.core.common.quantization.candidate_node_quantization_config import \
     CandidateNodeQuantizationConfig
+from model_compression_toolkit.core.common.quantization.quantized_weights_cache import QuantizedWeightsCache
 
 
 def verify_candidates_descending_order(node_q_cfg: List[CandidateNodeQuantizationConfig],
@@ -59,7 +60,9 @@ def verify_candidates_descending_order(node_q_cfg: List[CandidateNodeQuantizatio
 def init_quantized_weights(node_q_cfg: List[CandidateNodeQuantizationConfig],
                            float_weights: Any,
                            fw_tensor_convert_func: Callable,
-                           kernel_attr: str) -> List:
+                           kernel_attr: str,
+                           quantized_weights_cache: QuantizedWeightsCache = None,
+                           weights_fingerprint: Tuple = None) -> List:
     """
     Initilizes quantized weights tensors according to the given quantization configuration candidates.
 
@@ -69,6 +72,10 @@ def init_quantized_weights(node_q_cfg: List[CandidateNodeQuantizationConfig],
         float_weights: A tensor of the layer's weights.
         fw_tensor_convert_func: A function that converts a tensor to a framework specific tensor type.
         kernel_attr: The kernel attribute name of the node. Only layers with kernel op can be configured.
+        quantized_weights_cache: Cache of quantized weights to take the candidates' quantized weights from.
+            If None, the weights are quantized without a cache.
+        weights_fingerprint: Fingerprint of the float weights in the quantized weights cache (see
+            BaseNode.get_weights_fingerprint). If None, it is computed by the cache.
 
     Returns: A list with the quantized weights for each candidate.
 
@@ -77,13 +84,19 @@ def init_quantized_weights(node_q_cfg: List[CandidateNodeQuantizationConfig],
     quantized_weights = []
     for qc in node_q_cfg:
         qc_weights_attr = qc.weights_quantization_cfg.get_attr_config(kernel_attr)
-        q_weight = qc_weights_attr.weights_quantization_fn(float_weights,
-                                                           qc_weights_attr.weights_n_bits,
-                                                           True,
-                                                           qc_weights_attr.weights_quantization_params,
-                                                           qc_weights_attr.weights_per_channel_threshold,
-                                                           qc_weights_attr.weights_channels_axis[
-                                                               0])  # output channel axis
+        output_channels_axis = qc_weights_attr.weights_channels_axis[0]
+        if quantized_weights_cache is not None:
+            q_weight = quantized_weights_cache.get_quantized_weights(float_weights,
+                                                                     qc_weights_attr,
+                                                                     output_channels_axis,
+                                                                     weights_fingerprint)
+        else:
+            q_weight = qc_weights_attr.weights_quantization_fn(float_weights,
+                                                               qc_weights_attr.weights_n_bits,
+                                                               True,
+                                                               qc_weights_attr.weights_quantization_params,
+                                                               qc_weights_attr.weights_per_channel_threshold,
+                                                               output_channels_axis)
 
         quantized_weights.append(fw_tensor_convert_func(q_weight))
 
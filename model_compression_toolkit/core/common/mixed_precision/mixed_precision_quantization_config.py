@@ -16,6 +16,7 @@
 from typing import List, Callable
 
 from model_compression_toolkit.core.common.mixed_precision.distance_weighting import MpDistanceWeighting
+from model_compression_toolkit.core.common.mixed_precision.mp_solver import MpSolver
 
 
 class MixedPrecisionQuantizationConfig:
@@ -29,7 +30,13 @@ class MixedPrecisionQuantizationConfig:
                  use_hessian_based_scores: bool = False,
                  norm_scores: bool = True,
                  refine_mp_solution: bool = True,
-                 metric_normalization_threshold: float = 1e10):
+                 metric_normalization_threshold: float = 1e10,
+                 solver: MpSolver = MpSolver.CBC,
+                 configurations_per_inference: int = 1,
+                 prune_candidates: bool = False,
+                 adaptive_num_of_images: bool = False,
+                 images_per_round: int = 8,
+                 adaptive_tolerance: float = 0.05):
         """
         Class with mixed precision parameters to quantize the input model.
 
@@ -43,6 +50,12 @@ class MixedPrecisionQuantizationConfig:
             norm_scores (bool): Whether to normalize the returned scores for the weighted distance metric (to get values between 0 and 1).
             refine_mp_solution (bool): Whether to try to improve the final mixed-precision configuration using a greedy algorithm that searches layers to increase their bit-width, or not.
             metric_normalization_threshold (float): A threshold for checking the mixed precision distance metric values, In case of values larger than this threshold, the metric will be scaled to prevent numerical issues.
+            solver (MpSolver): MpSolver enum value of the solver to use for searching the mixed precision configuration.
+            configurations_per_inference (int): Number of bit-width configurations to evaluate in a single inference of the mixed-precision model when computing the sensitivity of the layers' candidates. The inputs are replicated along the batch dimension for each configuration, so each inference holds configurations_per_inference copies of an images batch and its memory grows linearly with this value.
+            prune_candidates (bool): Whether to skip the sensitivity evaluation of candidates that can not be selected under the target resource utilization (candidates that violate it by themselves, or that are dominated by another candidate of the layer with equal or higher bit-widths and equal or lower resource utilization). Pruning dominated candidates assumes that a layer's sensitivity does not increase with its bit-widths, so it may change the search result when this assumption does not hold.
+            adaptive_num_of_images (bool): Whether to evaluate the sensitivity of each layer's candidate on an adaptive number of images (up to num_of_images). The images are used in rounds of images_per_round images, until the confidence interval of the candidate's sensitivity is tight enough (see adaptive_tolerance), or it does not overlap the confidence intervals of the layer's other candidates.
+            images_per_round (int): Number of images to add in each round of an adaptive sensitivity evaluation.
+            adaptive_tolerance (float): Maximal half-width of the confidence interval of a candidate's sensitivity in an adaptive sensitivity evaluation, relative to the sensitivity.
 
         """
 
@@ -63,6 +76,17 @@ class MixedPrecisionQuantizationConfig:
 
         self.metric_normalization_threshold = metric_normalization_threshold
 
+        self.solver = solver
+
+        assert configurations_per_inference >= 1, "configurations_per_inference should be a positive integer"
+        self.configurations_per_inference = configurations_per_inference
+        self.prune_candidates = prune_candidates
+
+        assert images_per_round >= 1, "images_per_round should be a positive integer"
+        self.adaptive_num_of_images = adaptive_num_of_images
+        self.images_per_round = images_per_round
+        self.adaptive_tolerance = adaptive_tolerance
+
         self._mixed_precision_enable = False
 
     def set_mixed_precision_enable(self):
@@ -44,6 +44,36 @@ search_methods = {
     BitWidthSearchMethod.INTEGER_PROGRAMMING: mp_integer_programming_search}
 
 
+class MixedPrecisionParetoPoint:
+    """
+    A mixed-precision configuration on the Pareto front of a multi-target mixed-precision search, i.e., no other
+    configuration that was found has both a lower sensitivity and a lower resource utilization.
+    """
+
+    def __init__(self,
+                 bit_widths_config: List[int],
+                 sensitivity: float,
+                 resource_utilization: ResourceUtilization,
+                 target_resource_utilizations: List[ResourceUtilization]):
+        """
+
+        Args:
+            bit_widths_config: The mixed-precision configuration (list of candidates' indices of the configurable nodes).
+            sensitivity: The sensitivity metric of the model when quantized with the configuration.
+            resource_utilization: The resource utilization of the model when quantized with the configuration.
+            target_resource_utilizations: The target resource utilizations for which the configuration was found.
+        """
+        self.bit_widths_config = bit_widths_config
+        self.sensitivity = sensitivity
+        self.resource_utilization = resource_utilization
+        self.target_resource_utilizations = target_resource_utilizations
+
+    def __repr__(self):
+        return f"Bit-widths config: {self.bit_widths_config}, " \
+               f"Sensitivity: {self.sensitivity}, " \
+               f"Resource utilization: ({self.resource_utilization})"
+
+
 def search_bit_width(graph_to_search_cfg: Graph,
                      fw_info: FrameworkInfo,
                      fw_impl: FrameworkImplementation,
@@ -81,6 +111,109 @@ def search_bit_width(graph_to_search_cfg: Graph,
     if target_resource_utilization is None:
         Logger.critical("Target ResourceUtilization is required for the bit-width search method's configuration.")  # pragma: no cover
 
+    search_manager = _get_search_manager(graph_to_search_cfg,
+                                         fw_info,
+                                         fw_impl,
+                                         target_resource_utilization,
+                                         mp_config,
+                                         representative_data_gen,
+                                         hessian_info_service)
+
+    result_bit_cfg = _search_target_bit_width(search_manager, target_resource_utilization, mp_config, search_method)
+    search_manager.sensitivity_evaluator.log_num_images_summary()
+
+    return result_bit_cfg
+
+
+def search_bit_width_multi_target(graph_to_search_cfg: Graph,
+                                  fw_info: FrameworkInfo,
+                                  fw_impl: FrameworkImplementation,
+                                  target_resource_utilizations: List[ResourceUtilization],
+                                  mp_config: MixedPrecisionQuantizationConfig,
+                                  representative_data_gen: Callable,
+                                  search_method: BitWidthSearchMethod = BitWidthSearchMethod.INTEGER_PROGRAMMING,
+                                  hessian_info_service: HessianInfoService = None) -> List[MixedPrecisionParetoPoint]:
+    """
+    Search for MP configurations for a given graph under multiple target resource utilizations (e.g., a sweep over
+    memory budgets), and return the Pareto front of the found configurations.
+    The sensitivity evaluation of the candidates and the resource utilization matrices do not depend on the target
+    resource utilization values, so they are computed once and only the search itself (see search_bit_width) is
+    done for each target.
+    All targets have to constrain the same resource utilization metrics (e.g., all of them set only weights_memory).
+
+    Args:
+        graph_to_search_cfg: Graph to search MP configurations for.
+        fw_info: FrameworkInfo object about the specific framework (e.g., attributes of different layers' weights to quantize).
+        fw_impl: FrameworkImplementation object with specific framework methods implementation.
+        target_resource_utilizations: List of target resource utilizations to search a configuration for each.
+        mp_config: Mixed-precision quantization configuration.
+        representative_data_gen: Dataset to use for retrieving images for the models inputs.
+        search_method: BitWidthSearchMethod to define which searching method to use.
+        hessian_info_service: HessianInfoService to fetch Hessian traces approximations.
+
+    Returns:
+        A list of the configurations on the Pareto front (of sensitivity and resource utilization), sorted by
+        descending sensitivity.
+
+    """
+    if target_resource_utilizations is None or len(target_resource_utilizations) == 0:
+        Logger.critical("At least one target ResourceUtilization is required for the multi-target bit-width search.")
+
+    constrained_targets = _get_constrained_targets(target_resource_utilizations[0])
+    if any(_get_constrained_targets(ru) != constrained_targets for ru in target_resource_utilizations):
+        Logger.critical("All target resource utilizations of a multi-target bit-width search must constrain the same "
+                        "resource utilization metrics.")
+
+    search_manager = _get_search_manager(graph_to_search_cfg,
+                                         fw_info,
+                                         fw_impl,
+                                         target_resource_utilizations[0],
+                                         mp_config,
+                                         representative_data_gen,
+                                         hessian_info_service)
+
+    # Group the targets by the configuration found for them.
+    config_to_targets = {}
+    for target_resource_utilization in target_resource_utilizations:
+        result_bit_cfg = _search_target_bit_width(search_manager, target_resource_utilization, mp_config, search_method,
+                                                  evaluation_targets=target_resource_utilizations)
+        config_to_targets.setdefault(tuple(result_bit_cfg), []).append(target_resource_utilization)
+    search_manager.sensitivity_evaluator.log_num_images_summary()
+
+    solutions = [MixedPrecisionParetoPoint(bit_widths_config=list(config),
+                                           sensitivity=search_manager.compute_metric_fn(list(config)),
+                                           resource_utilization=search_manager.compute_resource_utilization_for_config(list(config)),
+                                           target_resource_utilizations=targets)
+                 for config, targets in config_to_targets.items()]
+
+    return _get_pareto_front(solutions, constrained_targets)
+
+
+def _get_search_manager(graph_to_search_cfg: Graph,
+                        fw_info: FrameworkInfo,
+                        fw_impl: FrameworkImplementation,
+                        target_resource_utilization: ResourceUtilization,
+                        mp_config: MixedPrecisionQuantizationConfig,
+                        representative_data_gen: Callable,
+                        hessian_info_service: HessianInfoService = None) -> MixedPrecisionSearchManager:
+    """
+    Build a MixedPrecisionSearchManager for searching MP configurations of a graph under the resource utilization
+    metrics that the target resource utilization constrains.
+
+    Args:
+        graph_to_search_cfg: Graph to search a MP configuration for.
+        fw_info: FrameworkInfo object about the specific framework (e.g., attributes of different layers' weights to quantize).
+        fw_impl: FrameworkImplementation object with specific framework methods implementation.
+        target_resource_utilization: Target Resource Utilization to bound our feasible solution space s.t the configuration does not violate it.
+        mp_config: Mixed-precision quantization configuration.
+        representative_data_gen: Dataset to use for retrieving images for the models inputs.
+        hessian_info_service: HessianInfoService to fetch Hessian traces approximations.
+
+    Returns:
+        A MixedPrecisionSearchManager for the graph.
+
+    """
+
     # Set graph for MP search
     graph = copy.deepcopy(graph_to_search_cfg)  # Copy graph before searching
     if target_resource_utilization.bops < np.inf:
@@ -109,14 +242,35 @@ def search_bit_width(graph_to_search_cfg: Graph,
     ru_functions = ru_functions_mapping
 
     # Instantiate a manager object
-    search_manager = MixedPrecisionSearchManager(graph,
-                                                 fw_info,
-                                                 fw_impl,
-                                                 se,
-                                                 ru_functions,
-                                                 target_resource_utilization,
-                                                 original_graph=graph_to_search_cfg)
+    return MixedPrecisionSearchManager(graph,
+                                       fw_info,
+                                       fw_impl,
+                                       se,
+                                       ru_functions,
+                                       target_resource_utilization,
+                                       original_graph=graph_to_search_cfg)
+
+
+def _search_target_bit_width(search_manager: MixedPrecisionSearchManager,
+                             target_resource_utilization: ResourceUtilization,
+                             mp_config: MixedPrecisionQuantizationConfig,
+                             search_method: BitWidthSearchMethod,
+                             evaluation_targets: List[ResourceUtilization] = None) -> List[int]:
+    """
+    Search for a MP configuration that holds a target resource utilization using a search manager.
+
+    Args:
+        search_manager: MixedPrecisionSearchManager of the graph to search a MP configuration for.
+        target_resource_utilization: Target Resource Utilization to bound our feasible solution space s.t the configuration does not violate it.
+        mp_config: Mixed-precision quantization configuration.
+        search_method: BitWidthSearchMethod to define which searching method to use.
+        evaluation_targets: Target resource utilizations to evaluate the sensitivity of their candidates on the first
+        search with the search manager (see mp_integer_programming_search).
 
+    Returns:
+        A MP configuration for the graph (see search_bit_width).
+
+    """
     if search_method in search_methods:  # Get a specific search function
         search_method_fn = search_methods.get(search_method)
     else:
@@ -124,9 +278,45 @@ def search_bit_width(graph_to_search_cfg: Graph,
 
     # Search for the desired mixed-precision configuration
     result_bit_cfg = search_method_fn(search_manager,
-                                      target_resource_utilization)
+                                      target_resource_utilization,
+                                      solver=mp_config.solver,
+                                      evaluation_targets=evaluation_targets)
 
     if mp_config.refine_mp_solution:
         result_bit_cfg = greedy_solution_refinement_procedure(result_bit_cfg, search_manager, target_resource_utilization)
 
     return result_bit_cfg
+
+
+def _get_constrained_targets(target_resource_utilization: ResourceUtilization) -> List[RUTarget]:
+    """
+    Returns: The resource utilization targets that have a finite value in the target resource utilization.
+    """
+    return [target for target, ru_value in target_resource_utilization.get_resource_utilization_dict().items()
+            if ru_value < np.inf]
+
+
+def _get_pareto_front(solutions: List[MixedPrecisionParetoPoint],
+                      constrained_targets: List[RUTarget]) -> List[MixedPrecisionParetoPoint]:
+    """
+    Filter out solutions that are dominated by another solution, i.e., another solution has a sensitivity and
+    resource utilization (in the constrained targets) that are not larger, and at least one of them is smaller.
+
+    Args:
+        solutions: List of the found solutions.
+        constrained_targets: Resource utilization targets to compare the solutions by.
+
+    Returns:
+        The non-dominated solutions, sorted by descending sensitivity.
+
+    """
+    def _costs(solution):
+        ru_dict = solution.resource_utilization.get_resource_utilization_dict()
+        return np.asarray([solution.sensitivity] + [ru_dict[target] for target in constrained_targets])
+
+    costs = [_costs(solution) for solution in solutions]
+    pareto_front = [solution for solution, solution_costs in zip(solutions, costs)
+                    if not any(np.all(other_costs <= solution_costs) and np.any(other_costs < solution_costs)
+                               for other_costs in costs)]
+
+    return sorted(pareto_front, key=lambda solution: solution.sensitivity, reverse=True)
@@ -65,6 +65,10 @@ class MixedPrecisionSearchManager:
         self.sensitivity_evaluator = sensitivity_evaluator
         self.layer_to_bitwidth_mapping = self.get_search_space()
         self.compute_metric_fn = self.get_sensitivity_metric()
+        # Function to compute the metric for several configurations in a single inference, and the number
+        # of configurations to evaluate together.
+        self.compute_metrics_fn = self.sensitivity_evaluator.compute_metrics
+        self.configurations_per_inference = self.sensitivity_evaluator.quant_config.configurations_per_inference
 
         self.compute_ru_functions = ru_functions
         self.target_resource_utilization = target_resource_utilization
@@ -76,6 +80,12 @@ class MixedPrecisionSearchManager:
         self.config_reconstruction_helper = ConfigReconstructionHelper(virtual_graph=self.graph,
                                                                        original_graph=self.original_graph)
 
+        # The sensitivity of each layer's candidates and the resource utilization matrices do not depend on the
+        # target resource utilization values, so they are computed once and reused when searching for multiple targets.
+        # Only candidates that were not pruned from a searched space are evaluated (see prune_search_space).
+        self.layer_to_metrics_mapping = None
+        self.ru_matrices = {}
+
     def get_search_space(self) -> Dict[int, List[int]]:
         """
         The search space is a mapping from a node's index to a list of integers (possible bitwidths candidates indeces
@@ -93,6 +103,152 @@ class MixedPrecisionSearchManager:
             indices_mapping[idx] = list(range(len(n.candidates_quantization_cfg)))  # all search_methods space
         return indices_mapping
 
+    def prune_search_space(self, target_resource_utilizations: List[ResourceUtilization]) -> Dict[int, List[int]]:
+        """
+        Prune the search space from candidates that can not be selected under any of the given target resource
+        utilizations, so their sensitivity does not need to be evaluated. A candidate of a node is pruned under a
+        target if:
+        - It is infeasible: the target is violated even if all other nodes use their candidates with the minimal
+          resource utilization.
+        - It is dominated: another candidate of the node has equal or higher weights and activation bit-widths, and
+          an equal or lower resource utilization in all the constrained targets.
+        A candidate is kept if it is not pruned under at least one of the targets. If all candidates of a node are
+        infeasible, the node's candidates are not pruned (so the search reports the infeasibility).
+
+        Args:
+            target_resource_utilizations: Target resource utilizations to prune the search space for.
+
+        Returns:
+            The pruned search space: a mapping from a node's index to a list of its candidates' indices.
+        """
+        if not self.sensitivity_evaluator.quant_config.prune_candidates:
+            return self.layer_to_bitwidth_mapping
+
+        candidates_bit_widths = self._get_candidates_bit_widths()
+        num_candidates = sum(len(c) for c in self.layer_to_bitwidth_mapping.values())
+        kept_candidates = {node_idx: set() for node_idx in self.layer_to_bitwidth_mapping}
+        infeasible_candidates = None
+        for target_resource_utilization in target_resource_utilizations:
+            constrained_ru = {target: ru_value for target, ru_value in
+                              target_resource_utilization.get_resource_utilization_dict().items()
+                              if ru_value < np.inf}
+            # Relative resource utilization of each candidate (a column per candidate) in all the constrained targets.
+            candidates_ru = np.concatenate([np.zeros((0, num_candidates))] +
+                                           [self.compute_resource_utilization_matrix(target).reshape([-1, num_candidates])
+                                            for target in constrained_ru])
+            feasible = self._get_feasible_candidates(constrained_ru)
+            target_infeasible_candidates = set()
+
+            first_column = 0
+            for node_idx, candidates in self.layer_to_bitwidth_mapping.items():
+                columns = first_column + np.arange(len(candidates))
+                first_column += len(candidates)
+
+                node_feasible = feasible[columns] if np.any(feasible[columns]) else np.ones(len(candidates), dtype=bool)
+                dominated = self._get_dominated_candidates(candidates_bit_widths[node_idx],
+                                                           candidates_ru[:, columns], node_feasible)
+                for i, candidate_idx in enumerate(candidates):
+                    if not node_feasible[i]:
+                        target_infeasible_candidates.add((node_idx, candidate_idx))
+                    elif not dominated[i]:
+                        kept_candidates[node_idx].add(candidate_idx)
+
+            infeasible_candidates = target_infeasible_candidates if infeasible_candidates is None \
+                else infeasible_candidates & target_infeasible_candidates
+
+        search_space = {node_idx: [c for c in candidates if c in kept_candidates[node_idx]]
+                        for node_idx, candidates in self.layer_to_bitwidth_mapping.items()}
+
+        num_pruned = num_candidates - sum(len(c) for c in search_space.values())
+        num_infeasible = len(infeasible_candidates)
+        Logger.info(f'Pruned {num_pruned} out of {num_candidates} candidates from the mixed precision search space '
+                    f'({num_infeasible} infeasible, {num_pruned - num_infeasible} dominated), '
+                    f'skipping their sensitivity evaluation.')
+
+        return search_space
+
+    def _get_feasible_candidates(self, constrained_ru: Dict[RUTarget, float]) -> np.ndarray:
+        """
+        Find the candidates that do not violate the target resource utilization when all other nodes use their
+        candidates with the minimal resource utilization.
+
+        Args:
+            constrained_ru: Target resource utilization value of each constrained target.
+
+        Returns:
+            A boolean array that indicates for each candidate (in the order of the search space) whether it is feasible.
+        """
+        num_candidates = sum(len(c) for c in self.layer_to_bitwidth_mapping.values())
+        # The index of the node of each candidate.
+        candidates_nodes = np.repeat(np.arange(len(self.layer_to_bitwidth_mapping)),
+                                     [len(c) for c in self.layer_to_bitwidth_mapping.values()])
+        feasible = np.ones(num_candidates, dtype=bool)
+        for target, ru_value in constrained_ru.items():
+            ru_matrix = self.compute_resource_utilization_matrix(target)
+            # The minimal resource utilization of each node (last axis) in each of the matrix entries.
+            nodes_min_ru = np.stack([ru_matrix[..., candidates_nodes == node_idx].min(axis=-1)
+                                     for node_idx in range(len(self.layer_to_bitwidth_mapping))], axis=-1)
+            # The resource utilization vector of each candidate (first axis), with all other nodes using their
+            # candidates with the minimal resource utilization.
+            candidates_ru_vectors = np.moveaxis(nodes_min_ru.sum(axis=-1, keepdims=True) -
+                                                nodes_min_ru[..., candidates_nodes] + ru_matrix +
+                                                self.min_ru[target][..., np.newaxis], -1, 0)
+
+            non_conf_ru_vector = None if self.non_conf_ru_dict is None else self.non_conf_ru_dict.get(target)
+            if non_conf_ru_vector is not None and len(non_conf_ru_vector) > 0:
+                candidates_ru_vectors = [np.concatenate([ru_vector, non_conf_ru_vector])
+                                         for ru_vector in candidates_ru_vectors]
+            ru = np.array([self.compute_ru_functions[target][1](ru_vector, False)[0]
+                           for ru_vector in candidates_ru_vectors])
+            feasible &= ru <= ru_value + 1e-9 * max(abs(ru_value), 1.0)
+
+        return feasible
+
+    @staticmethod
+    def _get_dominated_candidates(bit_widths: List[Tuple[int, int]],
+                                  candidates_ru: np.ndarray,
+                                  feasible: np.ndarray) -> np.ndarray:
+        """
+        Find the candidates of a node that are dominated by another feasible candidate of the node, which has equal
+        or higher weights and activation bit-widths and an equal or lower resource utilization. Of identical
+        candidates, the first one is not dominated.
+
+        Args:
+            bit_widths: The (weights, activation) bit-widths of each of the node's candidates.
+            candidates_ru: The resource utilization of the node's candidates (a column per candidate).
+            feasible: Whether each of the node's candidates is feasible.
+
+        Returns:
+            A boolean array that indicates for each of the node's candidates whether it is dominated.
+        """
+        bit_widths = np.asarray(bit_widths)
+        candidates_idx = np.arange(len(bit_widths))
+        # Pairwise comparisons, where entry [i, j] compares candidate i to candidate j.
+        higher_bit_widths = np.all(bit_widths[:, np.newaxis] >= bit_widths[np.newaxis], axis=-1)
+        lower_ru = np.all(candidates_ru[:, :, np.newaxis] <= candidates_ru[:, np.newaxis], axis=0)
+        identical = np.all(bit_widths[:, np.newaxis] == bit_widths[np.newaxis], axis=-1) & \
+            np.all(candidates_ru[:, :, np.newaxis] == candidates_ru[:, np.newaxis], axis=0)
+        dominates = higher_bit_widths & lower_ru & feasible[:, np.newaxis] & \
+            (~identical | (candidates_idx[:, np.newaxis] < candidates_idx[np.newaxis]))
+        np.fill_diagonal(dominates, False)
+        return np.any(dominates, axis=0)
+
+    def _get_candidates_bit_widths(self) -> Dict[int, List[Tuple[int, int]]]:
+        """
+        Returns: A mapping from a node's index to the (weights, activation) bit-widths of each of its candidates. The
+        weights bit-width is of the kernel attribute, and 0 for nodes without a kernel.
+        """
+        candidates_bit_widths = {}
+        nodes_to_configure = self.graph.get_configurable_sorted_nodes(self.fw_info)
+        for node_idx, n in enumerate(nodes_to_configure):
+            kernel_attr = self.fw_info.get_kernel_op_attributes(n.type)[0]
+            candidates_bit_widths[node_idx] = [
+                (c.weights_quantization_cfg.get_attr_config(kernel_attr).weights_n_bits
+                 if kernel_attr is not None and c.weights_quantization_cfg.has_attribute_config(kernel_attr) else 0,
+                 c.activation_quantization_cfg.activation_n_bits)
+                for c in n.candidates_quantization_cfg]
+        return candidates_bit_widths
+
     def get_sensitivity_metric(self) -> Callable:
         """
 
@@ -143,6 +299,9 @@ class MixedPrecisionSearchManager:
         """
         assert isinstance(target, RUTarget), f"{target} is not a valid resource target"
 
+        if target in self.ru_matrices:
+            return self.ru_matrices[target]
+
         configurable_sorted_nodes = self.graph.get_configurable_sorted_nodes(self.fw_info)
 
         ru_matrix = []
@@ -162,7 +321,8 @@ class MixedPrecisionSearchManager:
         # the remaining axes include the metric specific nodes (rows dimension of the new tensor)
         # and the ru metric values (if they are non-scalars)
         np_ru_matrix = np.array(ru_matrix)
-        return np.moveaxis(np_ru_matrix, source=0, destination=len(np_ru_matrix.shape) - 1)
+        self.ru_matrices[target] = np.moveaxis(np_ru_matrix, source=0, destination=len(np_ru_matrix.shape) - 1)
+        return self.ru_matrices[target]
 
     def compute_candidate_relative_ru(self,
                                       conf_node_idx: int,
@@ -342,8 +502,18 @@ class ConfigReconstructionHelper:
         self.original_graph = original_graph
         self.fw_info = original_graph.fw_info
 
-        self.virtual_sorted_nodes_names = self.virtual_graph.get_configurable_sorted_nodes_names(self.fw_info)
-        self.origin_sorted_conf_nodes_names = self.original_graph.get_configurable_sorted_nodes_names(self.fw_info)
+        self.virtual_sorted_conf_nodes = self.virtual_graph.get_configurable_sorted_nodes(self.fw_info)
+        self.origin_sorted_conf_nodes = self.original_graph.get_configurable_sorted_nodes(self.fw_info)
+        self.virtual_sorted_nodes_names = [n.name for n in self.virtual_sorted_conf_nodes]
+        self.origin_sorted_conf_nodes_names = [n.name for n in self.origin_sorted_conf_nodes]
+
+        # Mappings from a configurable node's name to its index, for constant time lookups during reconstruction.
+        self.virtual_node_name_to_idx = {name: i for i, name in enumerate(self.virtual_sorted_nodes_names)}
+        self.origin_node_name_to_idx = {name: i for i, name in enumerate(self.origin_sorted_conf_nodes_names)}
+
+        # Mappings from an original node's name to a dictionary from its candidates' bit-widths to the index of the
+        # node's first candidate with these bit-widths (built on first use).
+        self.origin_candidates_lookup = {}
 
         self.origin_node_idx_to_cfg = {}
 
@@ -381,20 +551,18 @@ class ConfigReconstructionHelper:
             if original_base_config is None:
                 Logger.critical("To run config reconstruction for a partial set of nodes, a base original config must be provided.")  # pragma: no cover
 
-            updated_virtual_nodes = \
-                [(idx, self.virtual_graph.get_configurable_sorted_nodes(self.fw_info)[idx]) for idx in changed_virtual_nodes_idx]
+            updated_virtual_nodes = [(idx, self.virtual_sorted_conf_nodes[idx]) for idx in changed_virtual_nodes_idx]
             # Iterating only over the virtual nodes that have updated config
             for virtual_node_idx, n in updated_virtual_nodes:
                 self.reconstruct_node_config(n, virtual_mp_cfg, virtual_node_idx)
             # Updating reconstructed config for all other nodes based on provided base_config
-            original_sorted_conf_nodes = self.original_graph.get_configurable_sorted_nodes(self.fw_info)
             for i in range(len(original_base_config)):
-                if i not in list(self.origin_node_idx_to_cfg.keys()):
-                    self.update_config_at_original_idx(n=original_sorted_conf_nodes[i],
+                if i not in self.origin_node_idx_to_cfg:
+                    self.update_config_at_original_idx(n=self.origin_sorted_conf_nodes[i],
                                                        origin_cfg_idx=original_base_config[i])
         else:
             # Reconstruct entire config
-            for virtual_node_idx, n in enumerate(self.virtual_graph.get_configurable_sorted_nodes(self.fw_info)):
+            for virtual_node_idx, n in enumerate(self.virtual_sorted_conf_nodes):
                 self.reconstruct_node_config(n, virtual_mp_cfg, virtual_node_idx)
 
         res_config = [self.origin_node_idx_to_cfg[key] for key in sorted(self.origin_node_idx_to_cfg.keys())]
@@ -427,7 +595,7 @@ class ConfigReconstructionHelper:
             if isinstance(activation_node, VirtualSplitActivationNode):
                 self.get_weights_for_split_activation(activation_node, n, virtual_cfg_idx, virtual_mp_cfg)
             else:
-                if activation_node.name in self.origin_sorted_conf_nodes_names:
+                if activation_node.name in self.origin_node_name_to_idx:
                     # It is possible that the original activation node is not configurable,
                     # in this case we don't need to retrieve its bit-width config
                     self.retrieve_activation_only_config(activation_node, n, virtual_cfg_idx)
@@ -447,9 +615,9 @@ class ConfigReconstructionHelper:
             self.get_weights_for_split_activation(n, n, virtual_cfg_idx, virtual_mp_cfg)
         else:
             # Node didn't change in virtual graph - candidates list is similar to original
-            if n.name not in self.origin_sorted_conf_nodes_names:
+            if n.name not in self.origin_node_name_to_idx:
                 Logger.critical(f"Configuration mismatch: Node '{n.name}' is configurable in the virtual graph but not in the original graph. Verify node configurations.")  # pragma: no cover
-            origin_idx = self.origin_sorted_conf_nodes_names.index(n.name)
+            origin_idx = self.origin_node_name_to_idx[n.name]
             self.origin_node_idx_to_cfg[origin_idx] = virtual_cfg_idx
 
     def retrieve_weights_only_config(self, weights_node: BaseNode, virtual_node: BaseNode, virtual_cfg_idx: int):
@@ -464,17 +632,15 @@ class ConfigReconstructionHelper:
             virtual_cfg_idx: The virtual node's chosen config index.
         """
 
-        if weights_node.name in self.origin_sorted_conf_nodes_names:
+        if weights_node.name in self.origin_node_name_to_idx:
             # It is possible that the original weights node is not configurable,
             # in this case we don't need to retrieve its bit-width config
             kernel_attr = self.fw_info.get_kernel_op_attributes(weights_node.type)[0]
             weights_bitwidth = (virtual_node.candidates_quantization_cfg[virtual_cfg_idx].weights_quantization_cfg
                                 .get_attr_config(kernel_attr).weights_n_bits)
-            origin_cfg_idx = [i for i, c in
-                              enumerate(weights_node.candidates_quantization_cfg) if
-                              c.weights_quantization_cfg.get_attr_config(kernel_attr).weights_n_bits == weights_bitwidth]
+            origin_cfg_idx = self._get_origin_candidate_idx(weights_node, weights_bitwidth=weights_bitwidth)
 
-            self.update_config_at_original_idx(weights_node, origin_cfg_idx[0])
+            self.update_config_at_original_idx(weights_node, origin_cfg_idx)
 
     def retrieve_activation_only_config(self, activation_node: BaseNode, virtual_node: BaseNode, virtual_cfg_idx: int):
         """
@@ -488,16 +654,14 @@ class ConfigReconstructionHelper:
             virtual_cfg_idx: The virtual node's chosen config index.
         """
 
-        if activation_node.name in self.origin_sorted_conf_nodes_names:
+        if activation_node.name in self.origin_node_name_to_idx:
             # It is possible that the original activation node is not configurable,
             # in this case we don't need to retrieve its bit-width config
             activation_bitwidth = virtual_node.candidates_quantization_cfg[
                 virtual_cfg_idx].activation_quantization_cfg.activation_n_bits
-            origin_cfg_idx = [i for i, c in
-                              enumerate(activation_node.candidates_quantization_cfg) if
-                              c.activation_quantization_cfg.activation_n_bits == activation_bitwidth]
+            origin_cfg_idx = self._get_origin_candidate_idx(activation_node, activation_bitwidth=activation_bitwidth)
 
-            self.update_config_at_original_idx(activation_node, origin_cfg_idx[0])
+            self.update_config_at_original_idx(activation_node, origin_cfg_idx)
 
     def retrieve_activation_weights_config(self,
                                            activation_node: BaseNode,
@@ -519,19 +683,18 @@ class ConfigReconstructionHelper:
         """
 
         activation_bitwidth = activation_node.candidates_quantization_cfg[virtual_mp_cfg[
-            self.virtual_sorted_nodes_names.index(activation_node.name)]].activation_quantization_cfg.activation_n_bits
+            self.virtual_node_name_to_idx[activation_node.name]]].activation_quantization_cfg.activation_n_bits
 
         kernel_attr = self.fw_info.get_kernel_op_attributes(weights_node.type)[0]
 
         weights_bitwidth = (virtual_node.candidates_quantization_cfg[virtual_cfg_idx].weights_quantization_cfg
                             .get_attr_config(kernel_attr).weights_n_bits)
 
-        origin_cfg_idx = [i for i, c in
-                          enumerate(weights_node.origin_node.candidates_quantization_cfg) if
-                          c.weights_quantization_cfg.get_attr_config(kernel_attr).weights_n_bits == weights_bitwidth and
-                          c.activation_quantization_cfg.activation_n_bits == activation_bitwidth]
+        origin_cfg_idx = self._get_origin_candidate_idx(weights_node.origin_node,
+                                                        weights_bitwidth=weights_bitwidth,
+                                                        activation_bitwidth=activation_bitwidth)
 
-        self.update_config_at_original_idx(weights_node.origin_node, origin_cfg_idx[0])
+        self.update_config_at_original_idx(weights_node.origin_node, origin_cfg_idx)
 
     def retrieve_weights_activation_config(self,
                                            activation_node: BaseNode,
@@ -555,17 +718,17 @@ class ConfigReconstructionHelper:
         kernel_attr = self.fw_info.get_kernel_op_attributes(weights_node.type)[0]
 
         weights_bitwidth = (weights_node.candidates_quantization_cfg[virtual_mp_cfg[
-            self.virtual_sorted_nodes_names.index(weights_node.name)]]
+            self.virtual_node_name_to_idx[weights_node.name]]]
                             .weights_quantization_cfg.get_attr_config(kernel_attr).weights_n_bits)
 
         activation_bitwidth = virtual_node.candidates_quantization_cfg[
             virtual_cfg_idx].activation_quantization_cfg.activation_n_bits
 
-        origin_cfg_idx = [i for i, c in enumerate(activation_node.origin_node.candidates_quantization_cfg) if
-                          c.weights_quantization_cfg.get_attr_config(kernel_attr).weights_n_bits == weights_bitwidth and
-                          c.activation_quantization_cfg.activation_n_bits == activation_bitwidth]
+        origin_cfg_idx = self._get_origin_candidate_idx(activation_node.origin_node,
+                                                        weights_bitwidth=weights_bitwidth,
+                                                        activation_bitwidth=activation_bitwidth)
 
-        self.update_config_at_original_idx(activation_node.origin_node, origin_cfg_idx[0])
+        self.update_config_at_original_idx(activation_node.origin_node, origin_cfg_idx)
 
     def get_activation_for_split_weights(self,
                                          weights_node: BaseNode,
@@ -593,7 +756,7 @@ class ConfigReconstructionHelper:
         if isinstance(activation_node, VirtualActivationWeightsNode):
             if activation_node.original_activation_node.is_activation_quantization_enabled() and not \
                     activation_node.original_activation_node.is_all_activation_candidates_equal():
-                assert activation_node.name in self.virtual_sorted_nodes_names  # Sanity check
+                assert activation_node.name in self.virtual_node_name_to_idx  # Sanity check
                 # The original node is both weights and activation configurable
                 self.retrieve_activation_weights_config(activation_node, weights_node, virtual_node, virtual_cfg_idx, virtual_mp_cfg)
             else:
@@ -601,7 +764,7 @@ class ConfigReconstructionHelper:
                 self.retrieve_weights_only_config(weights_node.origin_node, virtual_node, virtual_cfg_idx)
         else:
             assert isinstance(activation_node, VirtualSplitActivationNode)  # Sanity check
-            if activation_node.name in self.virtual_sorted_nodes_names:
+            if activation_node.name in self.virtual_node_name_to_idx:
                 self.retrieve_activation_weights_config(activation_node, weights_node, virtual_node, virtual_cfg_idx, virtual_mp_cfg)
             else:
                 # The original node is only weights configurable
@@ -635,7 +798,7 @@ class ConfigReconstructionHelper:
             kernel_attr = self.fw_info.get_kernel_op_attributes(weights_node.type)[0]
             if weights_node.original_weights_node.is_weights_quantization_enabled(kernel_attr) and not \
                     weights_node.original_weights_node.is_all_weights_candidates_equal(kernel_attr):
-                assert weights_node.name in self.virtual_sorted_nodes_names  # Sanity check
+                assert weights_node.name in self.virtual_node_name_to_idx  # Sanity check
                 # The original node is both weights and activation configurable
                 self.retrieve_weights_activation_config(activation_node, weights_node, virtual_node, virtual_cfg_idx, virtual_mp_cfg)
             else:
@@ -666,5 +829,35 @@ class ConfigReconstructionHelper:
 
         """
 
-        origin_idx = self.origin_sorted_conf_nodes_names.index(n.name)
+        origin_idx = self.origin_node_name_to_idx[n.name]
         self.origin_node_idx_to_cfg[origin_idx] = origin_cfg_idx
+
+    def _get_origin_candidate_idx(self,
+                                  n: BaseNode,
+                                  weights_bitwidth: int = None,
+                                  activation_bitwidth: int = None) -> int:
+        """
+        Finds the index of the first candidate of an original node with the given kernel weights bit-width and/or
+        activation bit-width. The node's candidates are indexed by their bit-widths on the first lookup, so
+        following lookups take constant time.
+
+        Args:
+            n: An original graph's node.
+            weights_bitwidth: The kernel weights bit-width of the candidate (None to match any bit-width).
+            activation_bitwidth: The activation bit-width of the candidate (None to match any bit-width).
+
+        Returns: The index of the node's candidate.
+
+        """
+        if n.name not in self.origin_candidates_lookup:
+            kernel_attr = self.fw_info.get_kernel_op_attributes(n.type)[0]
+            lookup = {}
+            for i, c in enumerate(n.candidates_quantization_cfg):
+                w_bits = c.weights_quantization_cfg.get_attr_config(kernel_attr).weights_n_bits \
+                    if kernel_attr is not None and c.weights_quantization_cfg.has_attribute_config(kernel_attr) else None
+                a_bits = c.activation_quantization_cfg.activation_n_bits
+                for key in [(w_bits, a_bits), (w_bits, None), (None, a_bits)]:
+                    lookup.setdefault(key, i)
+            self.origin_candidates_lookup[n.name] = lookup
+
+        return self.origin_candidates_lookup[n.name][(weights_bitwidth, activation_bitwidth)]
@@ -0,0 +1,31 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from enum import Enum
+
+
+class MpSolver(Enum):
+    """
+    Defines the solver of the mixed precision integer programming problem.
+
+     CBC - the CBC solver (through PuLP), which supports all resource utilization targets.
+
+     KNAPSACK - an in-process exact multiple-choice knapsack solver. It supports problems in which at most two
+     constraints involve more than one layer (e.g., weights memory, BOPS, or weights and activation memory targets),
+     and falls back to CBC on other problems.
+
+    """
+
+    CBC = 0
+    KNAPSACK = 1
@@ -16,9 +16,12 @@
 import numpy as np
 from pulp import *
 from tqdm import tqdm
-from typing import Dict, List, Tuple, Callable
+from typing import Dict, List, Tuple, Callable, Any
 
 from model_compression_toolkit.logger import Logger
+from model_compression_toolkit.core.common.mixed_precision.mp_solver import MpSolver
+from model_compression_toolkit.core.common.mixed_precision.search_methods.multiple_choice_knapsack import \
+    solve_multiple_choice_knapsack
 from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.resource_utilization import ResourceUtilization, RUTarget
 from model_compression_toolkit.core.common.mixed_precision.mixed_precision_search_manager import MixedPrecisionSearchManager
 
@@ -27,7 +30,9 @@ SOLVER_TIME_LIMIT = 60
 
 
 def mp_integer_programming_search(search_manager: MixedPrecisionSearchManager,
-                                  target_resource_utilization: ResourceUtilization = None) -> List[int]:
+                                  target_resource_utilization: ResourceUtilization = None,
+                                  solver: MpSolver = MpSolver.CBC,
+                                  evaluation_targets: List[ResourceUtilization] = None) -> List[int]:
     """
     Searching and returning a mixed-precision configuration using an ILP optimization solution.
     It first builds a mapping from each layer's index (in the model) to a dictionary that maps the
@@ -42,6 +47,11 @@ def mp_integer_programming_search(search_manager: MixedPrecisionSearchManager,
         search_manager: MixedPrecisionSearchManager object to be used for problem formalization.
         target_resource_utilization: Target resource utilization to constrain our LP problem with some resources limitations (like model' weights memory
         consumption).
+        solver: MpSolver to solve the LP problem with. If the KNAPSACK solver does not support the problem, it is
+        solved with CBC.
+        evaluation_targets: Target resource utilizations to evaluate the sensitivity of their candidates (in addition
+        to target_resource_utilization's candidates), if the sensitivity is not evaluated yet. Used when searching for
+        several targets with the same search manager, to evaluate the sensitivity of all candidates in a single pass.
 
     Returns:
         The mixed-precision configuration (list of indices. Each indicates the bitwidth index of a node).
@@ -55,11 +65,81 @@ def mp_integer_programming_search(search_manager: MixedPrecisionSearchManager,
         Logger.critical("Invalid parameters: 'target_resource_utilization' and 'search_manager' must not be 'None' "
                         "for mixed-precision search. Ensure valid inputs are provided.")
 
-    layer_to_metrics_mapping = _build_layer_to_metrics_mapping(search_manager, target_resource_utilization)
+    # Candidates that can not be selected under the target resource utilization are pruned from the search space.
+    search_space = search_manager.prune_search_space([target_resource_utilization])
+
+    # The sensitivity of a candidate does not depend on the target resource utilization values, so it is evaluated
+    # once and kept in the search manager for following searches.
+    if search_manager.layer_to_metrics_mapping is None:
+        search_manager.layer_to_metrics_mapping = {node_idx: {} for node_idx in search_space}
+    if any(c not in search_manager.layer_to_metrics_mapping[node_idx]
+           for node_idx, candidates in search_space.items() for c in candidates):
+        candidates_to_evaluate = search_space
+        if evaluation_targets is not None:
+            evaluation_space = search_manager.prune_search_space(evaluation_targets)
+            candidates_to_evaluate = {node_idx: sorted(set(candidates) | set(evaluation_space[node_idx]))
+                                      for node_idx, candidates in search_space.items()}
+        candidates_to_evaluate = {node_idx: [c for c in candidates
+                                             if c not in search_manager.layer_to_metrics_mapping[node_idx]]
+                                  for node_idx, candidates in candidates_to_evaluate.items()}
+        for node_idx, metrics in _build_layer_to_metrics_mapping(search_manager,
+                                                                 target_resource_utilization,
+                                                                 candidates_to_evaluate).items():
+            search_manager.layer_to_metrics_mapping[node_idx].update(metrics)
+
+    layer_to_metrics_mapping = {node_idx: {c: search_manager.layer_to_metrics_mapping[node_idx][c] for c in candidates}
+                                for node_idx, candidates in search_space.items()}
+
+    # Finalize distance metric mapping
+    search_manager.finalize_distance_metric(layer_to_metrics_mapping)
 
     # Init variables to find their values when solving the lp problem.
     layer_to_indicator_vars_mapping, layer_to_objective_vars_mapping = _init_problem_vars(layer_to_metrics_mapping)
 
+    config = None
+    if solver == MpSolver.KNAPSACK:
+        config = _knapsack_search(layer_to_indicator_vars_mapping,
+                                  layer_to_metrics_mapping,
+                                  target_resource_utilization,
+                                  search_manager)
+        if config is None:
+            Logger.info("The mixed precision search problem is not supported by the knapsack solver, "
+                        "solving it with CBC.")
+
+    if config is None:
+        config = _cbc_search(layer_to_indicator_vars_mapping,
+                             layer_to_metrics_mapping,
+                             layer_to_objective_vars_mapping,
+                             target_resource_utilization,
+                             search_manager)
+
+    if target_resource_utilization.bops < np.inf:
+        return search_manager.config_reconstruction_helper.reconstruct_config_from_virtual_graph(config)
+    else:
+        return config
+
+
+def _cbc_search(layer_to_indicator_vars_mapping: Dict[int, Dict[int, LpVariable]],
+                layer_to_metrics_mapping: Dict[int, Dict[int, float]],
+                layer_to_objective_vars_mapping: Dict[int, LpVariable],
+                target_resource_utilization: ResourceUtilization,
+                search_manager: MixedPrecisionSearchManager) -> np.ndarray:
+    """
+    Solve the mixed-precision LP problem with the CBC solver.
+
+    Args:
+        layer_to_indicator_vars_mapping: Dictionary that maps each node's index to a dictionary of bitwidth to
+        indicator variable.
+        layer_to_metrics_mapping: Dictionary that maps each node's index to a dictionary of bitwidth to sensitivity
+        evaluation.
+        layer_to_objective_vars_mapping: Dictionary that maps each node's index to a bitwidth variable we find its
+        value.
+        target_resource_utilization: Target resource utilization to reduce our feasible solution space.
+        search_manager: MixedPrecisionSearchManager object to be used for resource utilization constraints formalization.
+
+    Returns:
+        The mixed-precision configuration (array of indices. Each indicates the bitwidth index of a node).
+    """
     # Add all equations and inequalities that define the problem.
     lp_problem = _formalize_problem(layer_to_indicator_vars_mapping,
                                     layer_to_metrics_mapping,
@@ -76,16 +156,73 @@ def mp_integer_programming_search(search_manager: MixedPrecisionSearchManager,
     Logger.info(LpStatus[lp_problem.status])
 
     # Take the bitwidth index only if its corresponding indicator is one.
-    config = np.asarray(
+    return np.asarray(
         [[nbits for nbits, indicator in nbits_to_indicator.items() if indicator.varValue == 1.0] for
          nbits_to_indicator
          in layer_to_indicator_vars_mapping.values()]
     ).flatten()
 
-    if target_resource_utilization.bops < np.inf:
-        return search_manager.config_reconstruction_helper.reconstruct_config_from_virtual_graph(config)
-    else:
-        return config
+
+def _knapsack_search(layer_to_indicator_vars_mapping: Dict[int, Dict[int, LpVariable]],
+                     layer_to_metrics_mapping: Dict[int, Dict[int, float]],
+                     target_resource_utilization: ResourceUtilization,
+                     search_manager: MixedPrecisionSearchManager) -> np.ndarray:
+    """
+    Solve the mixed-precision LP problem in-process as a multiple-choice knapsack problem (see
+    solve_multiple_choice_knapsack): each layer chooses one bitwidth, the objective is the sum of the chosen
+    bitwidths' sensitivity, and each resource utilization constraint is a linear constraint on the indicators.
+
+    Args:
+        layer_to_indicator_vars_mapping: Dictionary that maps each node's index to a dictionary of bitwidth to
+        indicator variable.
+        layer_to_metrics_mapping: Dictionary that maps each node's index to a dictionary of bitwidth to sensitivity
+        evaluation.
+        target_resource_utilization: Target resource utilization to reduce our feasible solution space.
+        search_manager: MixedPrecisionSearchManager object to be used for resource utilization constraints formalization.
+
+    Returns:
+        The mixed-precision configuration (array of indices. Each indicates the bitwidth index of a node), or None
+        if the problem is not supported by the knapsack solver.
+    """
+    indicators = [indicator for layer in layer_to_metrics_mapping.keys()
+                  for indicator in layer_to_indicator_vars_mapping[layer].values()]
+    indicator_index = {indicator.name: i for i, indicator in enumerate(indicators)}
+
+    # Each constraint is represented by its indicators' coefficients and its bound.
+    constraints_rows, bounds = [], []
+    for target, ru_value in target_resource_utilization.get_resource_utilization_dict().items():
+        if not np.isinf(ru_value):
+            non_conf_ru_vector = None if search_manager.non_conf_ru_dict is None \
+                else search_manager.non_conf_ru_dict.get(target)
+            for v in _get_ru_constraints(search_manager, target,
+                                         _get_ru_indicators(layer_to_indicator_vars_mapping, search_manager),
+                                         non_conf_ru_vector):
+                if isinstance(v, float):
+                    if v > ru_value:
+                        Logger.critical(
+                            f"The model cannot be quantized to meet the specified target resource utilization {target.value} "
+                            f"with the value {ru_value}.")  # pragma: no cover
+                else:
+                    row = np.zeros(len(indicators))
+                    for indicator, coefficient in v.items():
+                        row[indicator_index[indicator.name]] += coefficient
+                    constraints_rows.append(row)
+                    bounds.append(ru_value - v.constant)
+
+    constraints_matrix = np.asarray(constraints_rows).reshape([len(bounds), len(indicators)])
+    costs, constraints, layers_bitwidths = [], [], []
+    first_indicator = 0
+    for layer, nbits_to_indicator in layer_to_indicator_vars_mapping.items():
+        layers_bitwidths.append(list(nbits_to_indicator.keys()))
+        costs.append(np.asarray([layer_to_metrics_mapping[layer][nbits] for nbits in nbits_to_indicator.keys()]))
+        constraints.append(constraints_matrix[:, first_indicator:first_indicator + len(nbits_to_indicator)])
+        first_indicator += len(nbits_to_indicator)
+
+    solution = solve_multiple_choice_knapsack(costs, constraints, np.asarray(bounds))
+    if solution is None:
+        return None
+
+    return np.asarray([layer_bitwidths[candidate] for layer_bitwidths, candidate in zip(layers_bitwidths, solution)])
 
 
 def _init_problem_vars(layer_to_metrics_mapping: Dict[int, Dict[int, float]]) -> Tuple[
@@ -159,13 +296,7 @@ def _formalize_problem(layer_to_indicator_vars_mapping: Dict[int, Dict[int, LpVa
     # Bound the feasible solution space with the desired resource utilization values.
     # Creates separate constraints for weights utilization and activation utilization.
     if target_resource_utilization is not None:
-        indicators = []
-        for layer in layer_to_metrics_mapping.keys():
-            for _, indicator in layer_to_indicator_vars_mapping[layer].items():
-                indicators.append(indicator)
-
-        indicators_arr = np.array(indicators)
-        indicators_matrix = np.diag(indicators_arr)
+        indicators_arr = _get_ru_indicators(layer_to_indicator_vars_mapping, search_manager)
 
         for target, ru_value in target_resource_utilization.get_resource_utilization_dict().items():
             if not np.isinf(ru_value):
@@ -174,7 +305,7 @@ def _formalize_problem(layer_to_indicator_vars_mapping: Dict[int, Dict[int, LpVa
                 _add_set_of_ru_constraints(search_manager=search_manager,
                                            target=target,
                                            target_resource_utilization_value=ru_value,
-                                           indicators_matrix=indicators_matrix,
+                                           indicators=indicators_arr,
                                            lp_problem=lp_problem,
                                            non_conf_ru_vector=non_conf_ru_vector)
     else:  # pragma: no cover
@@ -183,10 +314,30 @@ def _formalize_problem(layer_to_indicator_vars_mapping: Dict[int, Dict[int, LpVa
     return lp_problem
 
 
+def _get_ru_indicators(layer_to_indicator_vars_mapping: Dict[int, Dict[int, LpVariable]],
+                       search_manager: MixedPrecisionSearchManager) -> np.ndarray:
+    """
+    Build the array of indicators that multiplies the configurations' axis of the resource utilization matrices,
+    which has a column for each candidate of each node. Candidates that were pruned from the search space have no
+    indicator, so they get a zero coefficient.
+
+    Args:
+        layer_to_indicator_vars_mapping: Dictionary that maps each node's index to a dictionary of bitwidth to
+        indicator variable.
+        search_manager: MixedPrecisionSearchManager object to be used for resource utilization constraints formalization.
+
+    Returns:
+        An array with an indicator (or zero) for each candidate of each node.
+    """
+    return np.array([layer_to_indicator_vars_mapping[layer].get(nbits, 0)
+                     for layer, layer_bitwidths in search_manager.layer_to_bitwidth_mapping.items()
+                     for nbits in layer_bitwidths], dtype=object)
+
+
 def _add_set_of_ru_constraints(search_manager: MixedPrecisionSearchManager,
                                target: RUTarget,
                                target_resource_utilization_value: float,
-                               indicators_matrix: np.ndarray,
+                               indicators: np.ndarray,
                                lp_problem: LpProblem,
                                non_conf_ru_vector: np.ndarray):
     """
@@ -198,14 +349,46 @@ def _add_set_of_ru_constraints(search_manager: MixedPrecisionSearchManager,
         target: A RUTarget.
         target_resource_utilization_value: Target resource utilization value of the given target resource utilization
         for which the constraint is added.
-        indicators_matrix: A diagonal matrix of the Lp problem's indicators.
+        indicators: An array of the Lp problem's indicators.
         lp_problem: An Lp problem object to add constraint to.
         non_conf_ru_vector: A non-configurable nodes' resource utilization vector.
 
     """
 
+    for v in _get_ru_constraints(search_manager, target, indicators, non_conf_ru_vector):
+        if isinstance(v, float):
+            if v > target_resource_utilization_value:
+                Logger.critical(
+                    f"The model cannot be quantized to meet the specified target resource utilization {target.value} "
+                    f"with the value {target_resource_utilization_value}.")  # pragma: no cover
+        else:
+            lp_problem += v <= target_resource_utilization_value
+
+
+def _get_ru_constraints(search_manager: MixedPrecisionSearchManager,
+                        target: RUTarget,
+                        indicators: np.ndarray,
+                        non_conf_ru_vector: np.ndarray) -> List[Any]:
+    """
+    Build the aggregated resource utilization expressions of the given target resource utilization, each one should be
+    bounded by the target resource utilization value.
+
+    Args:
+        search_manager:  MixedPrecisionSearchManager object to be used for resource utilization constraints formalization.
+        target: A RUTarget.
+        indicators: An array of the Lp problem's indicators.
+        non_conf_ru_vector: A non-configurable nodes' resource utilization vector.
+
+    Returns:
+        A list of the aggregated resource utilization values, which are either Lp expressions of the indicators or
+        floats (if they do not depend on the indicators).
+
+    """
+
     ru_matrix = search_manager.compute_resource_utilization_matrix(target)
-    indicated_ru_matrix = np.matmul(ru_matrix, indicators_matrix)
+    # Multiplying the configurations' axis (the last one) by the indicators is equivalent to a multiplication by a
+    # diagonal matrix of the indicators.
+    indicated_ru_matrix = ru_matrix * indicators
     # Need to re-organize the tensor such that the configurations' axis will be second,
     # and all metric values' axis will come afterword
     indicated_ru_matrix = np.moveaxis(indicated_ru_matrix, source=len(indicated_ru_matrix.shape) - 1, destination=1)
@@ -221,22 +404,13 @@ def _add_set_of_ru_constraints(search_manager: MixedPrecisionSearchManager,
     # search_manager.compute_ru_functions contains a pair of ru_metric and ru_aggregation for each ru target
     # get aggregated ru, considering both configurable and non-configurable nodes
     if non_conf_ru_vector is None or len(non_conf_ru_vector) == 0:
-        aggr_ru = search_manager.compute_ru_functions[target][1](ru_sum_vector)
-    else:
-        aggr_ru = search_manager.compute_ru_functions[target][1](np.concatenate([ru_sum_vector, non_conf_ru_vector]))
-
-    for v in aggr_ru:
-        if isinstance(v, float):
-            if v > target_resource_utilization_value:
-                Logger.critical(
-                    f"The model cannot be quantized to meet the specified target resource utilization {target.value} "
-                    f"with the value {target_resource_utilization_value}.")  # pragma: no cover
-        else:
-            lp_problem += v <= target_resource_utilization_value
+        return search_manager.compute_ru_functions[target][1](ru_sum_vector)
+    return search_manager.compute_ru_functions[target][1](np.concatenate([ru_sum_vector, non_conf_ru_vector]))
 
 
 def _build_layer_to_metrics_mapping(search_manager: MixedPrecisionSearchManager,
                                     target_resource_utilization: ResourceUtilization,
+                                    search_space: Dict[int, List[int]] = None,
                                     eps: float = EPS) -> Dict[int, Dict[int, float]]:
     """
     This function measures the sensitivity of a change in a bitwidth of a layer on the entire model.
@@ -250,6 +424,8 @@ def _build_layer_to_metrics_mapping(search_manager: MixedPrecisionSearchManager,
         search_manager: MixedPrecisionSearchManager object to be used for problem formalization.
         target_resource_utilization: ResourceUtilization to constrain our LP problem with some resources limitations
         (like model' weights memory consumption).
+        search_space: Mapping from each node's index to the bitwidth indices to evaluate. If None, all bitwidths of
+        all nodes are evaluated.
         eps: Epsilon value to manually increase metric value (if necessary) for numerical stability
 
     Returns:
@@ -269,8 +445,12 @@ def _build_layer_to_metrics_mapping(search_manager: MixedPrecisionSearchManager,
     else:
         max_config_value = search_manager.compute_metric_fn(search_manager.max_ru_config)
 
-    for node_idx, layer_possible_bitwidths_indices in tqdm(search_manager.layer_to_bitwidth_mapping.items(),
-                                                           total=len(search_manager.layer_to_bitwidth_mapping)):
+    # Collect the configurations to evaluate their metric.
+    configurations_to_evaluate = []
+    if search_space is None:
+        search_space = search_manager.layer_to_bitwidth_mapping
+
+    for node_idx, layer_possible_bitwidths_indices in search_space.items():
         layer_to_metrics_mapping[node_idx] = {}
 
         for bitwidth_idx in layer_possible_bitwidths_indices:
@@ -283,7 +463,6 @@ def _build_layer_to_metrics_mapping(search_manager: MixedPrecisionSearchManager,
             mp_model_configuration = search_manager.max_ru_config.copy()
             mp_model_configuration[node_idx] = bitwidth_idx
 
-            # Build a distance matrix using the function we got from the framework implementation.
             if is_bops_target_resource_utilization:
                 # Reconstructing original graph's configuration from virtual graph's configuration
                 origin_mp_model_configuration = \
@@ -293,19 +472,24 @@ def _build_layer_to_metrics_mapping(search_manager: MixedPrecisionSearchManager,
                         original_base_config=origin_max_config)
                 origin_changed_nodes_indices = [i for i, c in enumerate(origin_max_config) if
                                                 c != origin_mp_model_configuration[i]]
-                metric_value = search_manager.compute_metric_fn(
-                    origin_mp_model_configuration,
-                    origin_changed_nodes_indices,
-                    origin_max_config)
+                configurations_to_evaluate.append((node_idx, bitwidth_idx, origin_mp_model_configuration,
+                                                   origin_changed_nodes_indices))
             else:
-                metric_value = search_manager.compute_metric_fn(
-                    mp_model_configuration,
-                    [node_idx],
-                    search_manager.max_ru_config)
+                configurations_to_evaluate.append((node_idx, bitwidth_idx, mp_model_configuration, [node_idx]))
 
-            layer_to_metrics_mapping[node_idx][bitwidth_idx] = max(metric_value, max_config_value + eps)
+    baseline_configuration = origin_max_config if is_bops_target_resource_utilization else search_manager.max_ru_config
 
-    # Finalize distance metric mapping
-    search_manager.finalize_distance_metric(layer_to_metrics_mapping)
+    # Build a distance matrix using the function we got from the framework implementation.
+    # Several configurations are evaluated together in a single inference of the MP model.
+    chunk_size = search_manager.configurations_per_inference
+    for chunk_start in tqdm(range(0, len(configurations_to_evaluate), chunk_size)):
+        chunk = configurations_to_evaluate[chunk_start:chunk_start + chunk_size]
+        changed_nodes_indices = sorted(set().union(*[changed_nodes for _, _, _, changed_nodes in chunk]))
+        metric_values = search_manager.compute_metrics_fn([configuration for _, _, configuration, _ in chunk],
+                                                          changed_nodes_indices,
+                                                          baseline_configuration)
+
+        for (node_idx, bitwidth_idx, _, _), metric_value in zip(chunk, metric_values):
+            layer_to_metrics_mapping[node_idx][bitwidth_idx] = max(metric_value, max_config_value + eps)
 
     return layer_to_metrics_mapping
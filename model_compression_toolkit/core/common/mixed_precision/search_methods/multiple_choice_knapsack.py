@@ -0,0 +1,158 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import List
+
+import numpy as np
+
+from model_compression_toolkit.logger import Logger
+
+# Maximal number of constraints that involve more than one layer, which the solver supports.
+MAX_COUPLED_CONSTRAINTS = 2
+
+# Maximal number of partial solutions to keep in each step of the dynamic programming.
+MAX_STATES = 20000
+
+# Chunk size for the pairwise dominance check of partial solutions with more than one coupled constraint.
+DOMINANCE_CHUNK_SIZE = 1024
+
+
+def solve_multiple_choice_knapsack(costs: List[np.ndarray],
+                                   constraints: List[np.ndarray],
+                                   bounds: np.ndarray,
+                                   max_states: int = MAX_STATES) -> List[int]:
+    """
+    Exact solver of a multiple-choice knapsack problem: choose one candidate for each layer, such that the sum of the
+    candidates' costs is minimal and the sum of their constraints' coefficients holds the bounds.
+
+    Constraints that involve a single layer only bound its candidates, so infeasible candidates are filtered out.
+    The rest of the constraints (coupled constraints) are solved with dynamic programming over the layers: each step
+    keeps the partial solutions (choices for the layers so far) that are not dominated by another partial solution
+    (i.e., another partial solution has a lower or equal cost and uses a lower or equal amount of each constraint),
+    and that can still be completed into a feasible solution.
+
+    Args:
+        costs: List with an array of the candidates' costs for each layer.
+        constraints: List with a matrix of constraints' coefficients for each layer, of shape
+            (number of constraints, number of the layer's candidates).
+        bounds: Bound on the sum of the coefficients of each constraint.
+        max_states: Maximal number of partial solutions to keep in a step. If it is exceeded, the problem is not solved.
+
+    Returns:
+        The index of the chosen candidate of each layer, or None if the problem is not supported by the solver
+        (it has more than MAX_COUPLED_CONSTRAINTS coupled constraints, or the number of partial solutions exceeded
+        max_states).
+
+    """
+    n_layers = len(costs)
+    bounds = np.asarray(bounds, dtype=np.float64)
+    tolerance = 1e-9 * np.maximum(np.abs(bounds), 1.0)
+    constraints = [np.asarray(c, dtype=np.float64).reshape([len(bounds), len(cost)])
+                   for c, cost in zip(constraints, costs)]
+
+    # The layers that each constraint involves.
+    involved_layers = [[l for l in range(n_layers) if np.any(constraints[l][r] != 0)] for r in range(len(bounds))]
+    if any(len(layers) == 0 and bounds[r] < -tolerance[r] for r, layers in enumerate(involved_layers)):
+        Logger.critical("No solution was found for the multiple-choice knapsack problem.")
+
+    # Filter out candidates that violate a single-layer constraint.
+    candidates = [np.arange(len(cost)) for cost in costs]
+    for r, layers in enumerate(involved_layers):
+        if len(layers) == 1:
+            l = layers[0]
+            candidates[l] = candidates[l][constraints[l][r, candidates[l]] <= bounds[r] + tolerance[r]]
+
+    coupled = [r for r, layers in enumerate(involved_layers) if len(layers) > 1]
+    if len(coupled) > MAX_COUPLED_CONSTRAINTS:
+        return None
+
+    layers_candidates = []
+    for l in range(n_layers):
+        if len(candidates[l]) == 0:
+            Logger.critical("No solution was found for the multiple-choice knapsack problem.")
+        layer_costs = np.asarray(costs[l], dtype=np.float64)[candidates[l]]
+        layer_usage = constraints[l][coupled][:, candidates[l]].T
+        keep = _non_dominated(layer_usage, layer_costs)
+        layers_candidates.append((candidates[l][keep], layer_usage[keep], layer_costs[keep]))
+
+    # Minimal usage of each coupled constraint by the layers from each layer to the last one, to filter out partial
+    # solutions that can not be completed into a feasible solution.
+    min_usage = np.stack([usage.min(axis=0) for _, usage, _ in layers_candidates] + [np.zeros(len(coupled))])
+    remaining_min_usage = np.cumsum(min_usage[::-1], axis=0)[::-1]
+    coupled_bounds = bounds[coupled] + tolerance[coupled]
+
+    states_usage = np.zeros((1, len(coupled)))
+    states_cost = np.zeros(1)
+    backtrack = []
+    for l, (_, usage, layer_costs) in enumerate(layers_candidates):
+        n_states, n_candidates = len(states_cost), len(layer_costs)
+        new_usage = (states_usage[:, None, :] + usage[None, :, :]).reshape([n_states * n_candidates, len(coupled)])
+        new_cost = (states_cost[:, None] + layer_costs[None, :]).flatten()
+        parents, chosen = np.divmod(np.arange(n_states * n_candidates), n_candidates)
+
+        feasible = np.all(new_usage + remaining_min_usage[l + 1] <= coupled_bounds, axis=1)
+        if not np.any(feasible):
+            Logger.critical("No solution was found for the multiple-choice knapsack problem.")
+        new_usage, new_cost, parents, chosen = new_usage[feasible], new_cost[feasible], parents[feasible], chosen[feasible]
+
+        keep = _non_dominated(new_usage, new_cost)
+        if len(keep) > max_states:
+            return None
+        states_usage, states_cost = new_usage[keep], new_cost[keep]
+        backtrack.append((parents[keep], chosen[keep]))
+
+    # Backtrack the choices of the optimal solution from the last layer.
+    state = int(np.argmin(states_cost))
+    solution = []
+    for (parents, chosen), (layer_candidates, _, _) in zip(reversed(backtrack), reversed(layers_candidates)):
+        solution.append(int(layer_candidates[chosen[state]]))
+        state = parents[state]
+
+    return solution[::-1]
+
+
+def _non_dominated(usage: np.ndarray, cost: np.ndarray) -> np.ndarray:
+    """
+    Find the solutions that are not dominated by another solution, i.e., no other solution has a lower or equal cost
+    and a lower or equal usage of each constraint (of identical solutions, only the first one is kept).
+
+    Args:
+        usage: Constraints' usage of each solution, of shape (number of solutions, number of constraints).
+        cost: Cost of each solution.
+
+    Returns:
+        Sorted indices of the non-dominated solutions.
+
+    """
+    # Sort by cost (and then by usage), so a solution can only be dominated by a solution that precedes it.
+    order = np.lexsort(tuple(usage.T[::-1]) + (cost,))
+    sorted_usage = usage[order]
+
+    if usage.shape[1] == 0:
+        keep = order[:1]
+    elif usage.shape[1] == 1:
+        # A solution is not dominated only if it uses strictly less than all the solutions with a lower cost.
+        prev_min_usage = np.minimum.accumulate(np.concatenate([[np.inf], sorted_usage[:-1, 0]]))
+        keep = order[sorted_usage[:, 0] < prev_min_usage]
+    else:
+        is_dominated = np.zeros(len(order), dtype=bool)
+        for start in range(0, len(order), DOMINANCE_CHUNK_SIZE):
+            chunk = sorted_usage[start:start + DOMINANCE_CHUNK_SIZE]
+            # dominates[i, j]: the i-th solution of the chunk is dominated by the j-th sorted solution.
+            dominates = np.all(sorted_usage[None, :start + len(chunk), :] <= chunk[:, None, :], axis=2)
+            dominates[:, start:] &= np.tri(len(chunk), k=-1, dtype=bool)
+            is_dominated[start:start + len(chunk)] = np.any(dominates, axis=1)
+        keep = order[~is_dominated]
+
+    return np.sort(keep)
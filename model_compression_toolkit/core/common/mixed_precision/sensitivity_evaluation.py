@@ -28,6 +28,11 @@ from model_compression_toolkit.core.common.hessian import TraceHessianRequest, H
     HessianInfoGranularity, HessianInfoService
 from model_compression_toolkit.core.common.hessian import hessian_info_utils as hessian_utils
 
+# Z-score of the confidence interval of a candidate's sensitivity in an adaptive sensitivity evaluation (95%).
+ADAPTIVE_CONFIDENCE_Z = 1.96
+# Minimal number of rounds of images in an adaptive sensitivity evaluation, to estimate the confidence interval.
+MIN_ADAPTIVE_ROUNDS = 2
+
 
 class SensitivityEvaluation:
     """
@@ -43,7 +48,8 @@ class SensitivityEvaluation:
                  fw_impl: Any,
                  set_layer_to_bitwidth: Callable,
                  disable_activation_for_metric: bool = False,
-                 hessian_info_service: HessianInfoService = None
+                 hessian_info_service: HessianInfoService = None,
+                 set_layer_to_replicas_bitwidths: Callable = None
                  ):
         """
         Initiates all relevant objects to manage a sensitivity evaluation for MP search.
@@ -67,6 +73,9 @@ class SensitivityEvaluation:
                     with a specific bit-width configuration.
             disable_activation_for_metric: Whether to disable activation quantization when computing the MP metric.
             hessian_info_service: HessianInfoService to fetch Hessian traces approximations.
+            set_layer_to_replicas_bitwidths: A fw-dependent function that allows to configure a configurable MP model
+                    with a different bit-width for each replica of the inputs, to evaluate several configurations in
+                    a single inference. If None, configurations are always evaluated one at a time.
 
         """
         self.graph = graph
@@ -75,6 +84,7 @@ class SensitivityEvaluation:
         self.fw_info = fw_info
         self.fw_impl = fw_impl
         self.set_layer_to_bitwidth = set_layer_to_bitwidth
+        self.set_layer_to_replicas_bitwidths = set_layer_to_replicas_bitwidths
         self.disable_activation_for_metric = disable_activation_for_metric
         if self.quant_config.use_hessian_based_scores:
             if not isinstance(hessian_info_service, HessianInfoService):
@@ -115,6 +125,18 @@ class SensitivityEvaluation:
         # Build images batches for inference comparison
         self.images_batches = self._get_images_batches(quant_config.num_of_images)
 
+        # In an adaptive sensitivity evaluation, each batch is a round of images.
+        if self.quant_config.adaptive_num_of_images:
+            self.images_batches = [[x[i:i + self.quant_config.images_per_round] for x in images]
+                                   for images in self.images_batches
+                                   for i in range(0, images[0].shape[0], self.quant_config.images_per_round)]
+
+        # The confidence interval of the sensitivity of each candidate that was evaluated adaptively (by the indices
+        # of the nodes it changes and their bit-widths), and the number of images used to evaluate each candidate
+        # of each configurable node.
+        self.candidates_confidence_intervals = {}
+        self.num_images_per_node = {node_name: [] for node_name in self.sorted_configurable_nodes_names}
+
         # Get baseline model inference on all samples
         self.baseline_tensors_list = []  # setting from outside scope
 
@@ -168,6 +190,9 @@ class SensitivityEvaluation:
         is computed based on the similarity of the interest points' outputs between the MP model
         and the float model).
 
+        If an adaptive number of images is used and a baseline configuration is provided, the metric is computed
+        on the images rounds until its confidence interval is tight enough (see _compute_adaptive_distance).
+
         Args:
             mp_model_configuration: Bitwidth configuration to use to configure the MP model.
             node_idx: A list of nodes' indices to configure (instead of using the entire mp_model_configuration).
@@ -183,7 +208,12 @@ class SensitivityEvaluation:
                                         node_idx)
 
         # Compute the distance metric
-        ipts_distances, out_pts_distances = self._compute_distance()
+        if self.quant_config.adaptive_num_of_images and baseline_mp_configuration is not None:
+            ipts_distances, out_pts_distances = self._compute_adaptive_distance([mp_model_configuration],
+                                                                                node_idx,
+                                                                                baseline_mp_configuration)[0]
+        else:
+            ipts_distances, out_pts_distances = self._compute_distance()
 
         # Configure MP model back to the same configuration as the baseline model if baseline provided
         if baseline_mp_configuration is not None:
@@ -193,6 +223,76 @@ class SensitivityEvaluation:
         return self._compute_mp_distance_measure(ipts_distances, out_pts_distances,
                                                  self.quant_config.distance_weighting_method)
 
+    def compute_metrics(self,
+                        mp_model_configurations: List[List[int]],
+                        node_idx: List[int] = None,
+                        baseline_mp_configuration: List[int] = None) -> List[float]:
+        """
+        Compute the sensitivity metric of the MP model for several configurations.
+        The configurations are evaluated in a single inference of the MP model: the images are replicated along the
+        batch dimension (one replica per configuration), and each configurable layer is configured to quantize
+        each replica with the configuration's bit-width. The distances of each replica's outputs are then computed
+        separately. If the framework does not support configuring the model per replica, the configurations are
+        evaluated one at a time.
+
+        Args:
+            mp_model_configurations: Bitwidth configurations to compute the metric for.
+            node_idx: A list of nodes' indices to configure (instead of using the entire configurations).
+            baseline_mp_configuration: A mixed-precision configuration to set the model back to after modifying it to
+                compute the metric for the given configurations. If not provided, the model is left configured
+                with the last configuration.
+
+        Returns:
+            The sensitivity metric of the MP model for each of the given configurations.
+        """
+
+        if len(mp_model_configurations) == 1 or self.set_layer_to_replicas_bitwidths is None:
+            return [self.compute_metric(mp_model_configuration, node_idx, baseline_mp_configuration)
+                    for mp_model_configuration in mp_model_configurations]
+
+        # Configure the MP model with the last configuration, and configure the nodes that differ between
+        # the configurations per replica.
+        nodes_to_configure = range(len(mp_model_configurations[0])) if node_idx is None else node_idx
+        replicas_nodes = [n for n in nodes_to_configure
+                          if any(c[n] != mp_model_configurations[-1][n] for c in mp_model_configurations)]
+        self._configure_bitwidths_model(mp_model_configurations[-1], node_idx)
+        for n in replicas_nodes:
+            self._configure_node_replicas_bitwidths(n, [c[n] for c in mp_model_configurations])
+
+        if self.quant_config.adaptive_num_of_images and baseline_mp_configuration is not None:
+            replicas_distances = self._compute_adaptive_distance(mp_model_configurations,
+                                                                 node_idx,
+                                                                 baseline_mp_configuration)
+        else:
+            replicas_distances = self._compute_replicas_distance(len(mp_model_configurations))
+
+        for n in replicas_nodes:
+            self._configure_node_replicas_bitwidths(n, [])
+
+        if baseline_mp_configuration is not None:
+            self._configure_bitwidths_model(baseline_mp_configuration,
+                                            node_idx)
+
+        return [self._compute_mp_distance_measure(ipts_distances, out_pts_distances,
+                                                  self.quant_config.distance_weighting_method)
+                for ipts_distances, out_pts_distances in replicas_distances]
+
+    def log_num_images_summary(self):
+        """
+        Log the number of images that were used to evaluate the candidates of each configurable node in an adaptive
+        sensitivity evaluation (the minimal, mean and maximal number over the node's evaluated candidates).
+        """
+        evaluated_nodes = {node_name: num_images for node_name, num_images in self.num_images_per_node.items()
+                           if len(num_images) > 0}
+        if len(evaluated_nodes) == 0:
+            return
+
+        Logger.info(f'Number of images used by the adaptive sensitivity evaluation out of '
+                    f'{sum(baseline_tensors[0].shape[0] for baseline_tensors in self.baseline_tensors_list)} '
+                    f'images (min/mean/max over the candidates of each layer):')
+        for node_name, num_images in evaluated_nodes.items():
+            Logger.info(f'{node_name}: {min(num_images)}/{np.mean(num_images):.1f}/{max(num_images)}')
+
     def _init_baseline_tensors_list(self):
         """
         Evaluates the baseline model on all images and saves the obtained lists of tensors in a list for later use.
@@ -329,6 +429,27 @@ class SensitivityEvaluation:
         for current_layer in layers_to_config:
             self.set_layer_to_bitwidth(current_layer, mp_model_configuration[node_idx_to_configure])
 
+    def _configure_node_replicas_bitwidths(self,
+                                           node_idx_to_configure: int,
+                                           bitwidths_indices: List[int]):
+        """
+        Configures a node with multiple quantization candidates to use a different bitwidth candidate for each
+        replica of the MP model inputs.
+
+        Args:
+            node_idx_to_configure: Index of the node to configure in the sorted configurable nodes.
+            bitwidths_indices: Quantization configuration candidate to use for each replica (an empty list
+                sets the node back to use its configured candidate for the entire input).
+
+        """
+        node_name = self.sorted_configurable_nodes_names[node_idx_to_configure]
+        layers_to_config = self.conf_node2layers.get(node_name, None)
+        if layers_to_config is None:
+            Logger.critical(f"Matching layers for node {node_name} not found in the mixed precision model configuration.")  # pragma: no cover
+
+        for current_layer in layers_to_config:
+            self.set_layer_to_replicas_bitwidths(current_layer, bitwidths_indices)
+
     def _compute_points_distance(self,
                                  baseline_tensors: List[Any],
                                  mp_tensors: List[Any],
@@ -363,37 +484,213 @@ class SensitivityEvaluation:
         Returns: A distance vector.
         """
 
-        ipts_per_batch_distance = []
-        out_pts_per_batch_distance = []
+        return self._compute_replicas_distance(1)[0]
+
+    def _compute_replicas_distance(self, num_replicas: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Computing the interest points distance and the output points distance of each replica of the images,
+        when the MP model is configured with a different configuration per replica.
+
+        Args:
+            num_replicas: Number of replicas of the images (number of evaluated configurations).
+
+        Returns: A list with the interest points distance matrix and output points distance matrix of each replica.
+        """
 
         # Compute the distance matrix for num_of_images images.
+        return self._merge_batches_distance(list(self._iter_batches_distance(num_replicas)))
+
+    def _compute_adaptive_distance(self,
+                                   mp_model_configurations: List[List[int]],
+                                   node_idx: List[int],
+                                   baseline_mp_configuration: List[int]) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Computing the interest points distance and the output points distance of each configuration (a replica of
+        the images per configuration) on an adaptive number of images. The images rounds are inferred until the
+        confidence interval of each configuration's metric is tight enough (its half-width is up to
+        adaptive_tolerance of the metric), or does not overlap the confidence intervals of the other candidates of
+        the nodes it changes (so the candidates' ranking is settled).
+
+        Args:
+            mp_model_configurations: Bitwidth configurations the MP model is configured with (one per replica).
+            node_idx: A list of the configured nodes' indices.
+            baseline_mp_configuration: The mixed-precision configuration the evaluated candidates are compared to.
+
+        Returns: A list with the interest points distance matrix and output points distance matrix of each
+            configuration.
+        """
+
+        # Each configuration evaluates the candidates of the nodes it changes in the baseline configuration.
+        nodes_to_configure = range(len(baseline_mp_configuration)) if node_idx is None else node_idx
+        candidates = []
+        for mp_model_configuration in mp_model_configurations:
+            changed_nodes = tuple(n for n in nodes_to_configure
+                                  if mp_model_configuration[n] != baseline_mp_configuration[n])
+            candidates.append((changed_nodes, tuple(mp_model_configuration[n] for n in changed_nodes)))
+
+        batches_distances = []
+        for batch_distances in self._iter_batches_distance(len(mp_model_configurations)):
+            batches_distances.append(batch_distances)
+            replicas_distances = self._merge_batches_distance(batches_distances)
+            intervals = [self._get_confidence_interval(ipts_distances, out_pts_distances)
+                         for ipts_distances, out_pts_distances in replicas_distances]
+            if len(batches_distances) >= MIN_ADAPTIVE_ROUNDS and \
+                    all(self._is_candidate_settled(i, candidates, intervals) for i in range(len(candidates))):
+                break
+
+        num_images = sum(baseline_tensors[0].shape[0] for baseline_tensors in
+                         self.baseline_tensors_list[:len(batches_distances)])
+        for (changed_nodes, bitwidths), interval in zip(candidates, intervals):
+            self.candidates_confidence_intervals.setdefault(changed_nodes, {})[bitwidths] = interval
+            for n in changed_nodes:
+                self.num_images_per_node[self.sorted_configurable_nodes_names[n]].append(num_images)
+
+        return replicas_distances
+
+    def _is_candidate_settled(self,
+                              candidate_idx: int,
+                              candidates: List[Tuple[Tuple[int], Tuple[int]]],
+                              intervals: List[Tuple[float, float]]) -> bool:
+        """
+        Check whether the evaluation of a candidate can stop: either its confidence interval is tight enough, or it
+        does not overlap the confidence intervals of the other candidates of the same nodes (evaluated earlier or
+        in the same inference).
+
+        Args:
+            candidate_idx: Index of the candidate to check.
+            candidates: The changed nodes' indices and their bit-widths of each candidate in the inference.
+            intervals: The confidence interval (mean, half-width) of each candidate in the inference.
+
+        Returns: Whether the candidate's evaluation is settled.
+        """
+
+        mean, half_width = intervals[candidate_idx]
+        if half_width <= self.quant_config.adaptive_tolerance * abs(mean):
+            return True
+
+        changed_nodes, bitwidths = candidates[candidate_idx]
+        other_intervals = [interval for b, interval in self.candidates_confidence_intervals.get(changed_nodes, {}).items()
+                           if b != bitwidths]
+        other_intervals += [interval for (n, b), interval in zip(candidates, intervals)
+                            if n == changed_nodes and b != bitwidths]
+        return len(other_intervals) > 0 and all(abs(mean - other_mean) > half_width + other_half_width
+                                                for other_mean, other_half_width in other_intervals)
+
+    def _get_confidence_interval(self,
+                                 ipts_distances: np.ndarray,
+                                 out_pts_distances: np.ndarray) -> Tuple[float, float]:
+        """
+        Computes the confidence interval of the distance value from the distance value of each image.
+
+        Args:
+            ipts_distances: A matrix that contains the distances between the baseline and MP models
+                for each interest point.
+            out_pts_distances: A matrix that contains the distances between the baseline and MP models
+                for each output point.
+
+        Returns: The mean and the half-width of the confidence interval of the distance value.
+        """
+
+        images_distance = 0
+        if len(ipts_distances) > 0:
+            weights = self.quant_config.distance_weighting_method(ipts_distances)
+            images_distance = images_distance + np.average(ipts_distances, axis=0, weights=weights)
+        if len(out_pts_distances) > 0:
+            images_distance = images_distance + out_pts_distances.mean(axis=0)
+
+        images_distance = np.atleast_1d(images_distance)
+        if len(images_distance) < 2:
+            return float(np.mean(images_distance)), np.inf
+        return float(np.mean(images_distance)), \
+            float(ADAPTIVE_CONFIDENCE_Z * np.std(images_distance, ddof=1) / np.sqrt(len(images_distance)))
+
+    def _iter_batches_distance(self, num_replicas: int):
+        """
+        Infers the MP model on the images batches one at a time (each image replicated num_replicas times), and
+        computes the interest points distance and the output points distance of each replica of the batch.
+
+        Args:
+            num_replicas: Number of replicas of the images.
+
+        Returns: A generator of a list with the interest points distance matrix and output points distance matrix of
+            each replica, for each batch.
+        """
+
         for images, baseline_tensors in zip(self.images_batches, self.baseline_tensors_list):
+            if num_replicas > 1:
+                # Replicated per inference rather than kept for all batches, so only a single batch is held
+                # num_replicas times in memory.
+                images = self._replicate_images(images, num_replicas)
             # when using model.predict(), it does not use the QuantizeWrapper functionality
             mp_tensors = self.fw_impl.sensitivity_eval_inference(self.model_mp, images)
             mp_tensors = self.fw_impl.to_numpy(mp_tensors)
 
-            # Compute distance: similarity between the baseline model to the float model
-            # in every interest point for every image in the batch.
-            ips_distance = self._compute_points_distance([baseline_tensors[i] for i in self.ips_act_indices],
-                                                         [mp_tensors[i] for i in self.ips_act_indices],
-                                                         self.ips_distance_fns,
-                                                         self.ips_axis)
-            outputs_distance = self._compute_points_distance([baseline_tensors[i] for i in self.out_ps_act_indices],
-                                                             [mp_tensors[i] for i in self.out_ps_act_indices],
-                                                             self.out_ps_distance_fns,
-                                                             self.out_ps_axis)
-
-            # Extending the dimensions for the concatenation at the end in case we need to
-            ips_distance = ips_distance if len(ips_distance.shape) > 1 else ips_distance[:, None]
-            outputs_distance = outputs_distance if len(outputs_distance.shape) > 1 else outputs_distance[:, None]
-            ipts_per_batch_distance.append(ips_distance)
-            out_pts_per_batch_distance.append(outputs_distance)
-
-        # Merge all distance matrices into a single distance matrix.
-        ipts_distances = np.concatenate(ipts_per_batch_distance, axis=1)
-        out_pts_distances = np.concatenate(out_pts_per_batch_distance, axis=1)
-
-        return ipts_distances, out_pts_distances
+            if num_replicas == 1:
+                yield [self._compute_batch_distance(baseline_tensors, mp_tensors)]
+            else:
+                # The outputs of each replica are in consecutive slices along the batch dimension.
+                batch_size = baseline_tensors[0].shape[0]
+                yield [self._compute_batch_distance(baseline_tensors,
+                                                    [t[r * batch_size:(r + 1) * batch_size] for t in mp_tensors])
+                       for r in range(num_replicas)]
+
+    @staticmethod
+    def _merge_batches_distance(batches_distances: List[List[Tuple[np.ndarray, np.ndarray]]]) -> \
+            List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Merges the distance matrices of all batches into a single distance matrix for each replica.
+
+        Args:
+            batches_distances: A list with the interest points and output points distance matrices of each replica,
+                for each batch.
+
+        Returns: A list with the interest points distance matrix and output points distance matrix of each replica.
+        """
+
+        return [(np.concatenate([d[0] for d in replica_distances], axis=1),
+                 np.concatenate([d[1] for d in replica_distances], axis=1))
+                for replica_distances in zip(*batches_distances)]
+
+    def _compute_batch_distance(self,
+                                baseline_tensors: List[np.ndarray],
+                                mp_tensors: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Computing the interest points distance and the output points distance for a batch of images.
+
+        Args:
+            baseline_tensors: Baseline model's output tensors for the batch.
+            mp_tensors: MP model's output tensors for the batch.
+
+        Returns: The interest points distance matrix and the output points distance matrix of the batch.
+        """
+
+        # Compute distance: similarity between the baseline model to the float model
+        # in every interest point for every image in the batch.
+        ips_distance = self._compute_points_distance([baseline_tensors[i] for i in self.ips_act_indices],
+                                                     [mp_tensors[i] for i in self.ips_act_indices],
+                                                     self.ips_distance_fns,
+                                                     self.ips_axis)
+        outputs_distance = self._compute_points_distance([baseline_tensors[i] for i in self.out_ps_act_indices],
+                                                         [mp_tensors[i] for i in self.out_ps_act_indices],
+                                                         self.out_ps_distance_fns,
+                                                         self.out_ps_axis)
+
+        # Extending the dimensions for the concatenation at the end in case we need to
+        ips_distance = ips_distance if len(ips_distance.shape) > 1 else ips_distance[:, None]
+        outputs_distance = outputs_distance if len(outputs_distance.shape) > 1 else outputs_distance[:, None]
+        return ips_distance, outputs_distance
+
+    def _replicate_images(self, images: List[Any], num_replicas: int) -> List[Any]:
+        """
+        Replicate an images batch along the batch dimension.
+
+        Args:
+            images: Images batch (a tensor per model input).
+            num_replicas: Number of replicas of the batch.
+
+        Returns: The replicated images batch.
+        """
+        return self.fw_impl.to_tensor([np.concatenate([self.fw_impl.to_numpy(x)] * num_replicas) for x in images])
 
     @staticmethod
     def _compute_mp_distance_measure(ipts_distances: np.ndarray,
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Any
+from typing import Any, List
 
 
 def set_layer_to_bitwidth(quantization_layer: Any,
@@ -48,3 +48,33 @@ def set_layer_to_bitwidth(quantization_layer: Any,
             # for instance, if only weights are quantized with mixed precision and activation are quantized with
             # fixed precision
             quantization_layer.activation_holder_quantizer.set_active_activation_quantizer(bitwidth_idx)
+
+
+def set_layer_to_replicas_bitwidths(quantization_layer: Any,
+                                    bitwidths_indices: List[int],
+                                    weights_quantizer_type: type,
+                                    activation_quantizer_type: type,
+                                    weights_quant_layer_type: type,
+                                    activation_quant_layer_type: type):
+    """
+    Configures a layer's configurable quantizer to work with a different bit-width for each replica of the layer's
+    inputs (the inputs are replicated along the batch dimension, so several configurations are evaluated in a single
+    inference). An empty list of indices sets the quantizer back to use its active bit-width for the entire input.
+
+    Args:
+        quantization_layer: Layer to change its bit-width.
+        bitwidths_indices: Index of the bit-width each replica of the layer's inputs should work with.
+        weights_quantizer_type: A class of weights quantizer with configurable bitwidth options.
+        activation_quantizer_type: A class of activation quantizer with configurable bitwidth options.
+        weights_quant_layer_type: A class of a weights layer wrapper.
+        activation_quant_layer_type: A class of an activation quantization holder.
+    """
+
+    if isinstance(quantization_layer, weights_quant_layer_type):
+        for _, quantizer in quantization_layer.weights_quantizers.items():
+            if isinstance(quantizer, weights_quantizer_type):
+                quantizer.set_replicas_bit_width_indices(bitwidths_indices)
+
+    if isinstance(quantization_layer, activation_quant_layer_type):
+        if isinstance(quantization_layer.activation_holder_quantizer, activation_quantizer_type):
+            quantization_layer.activation_holder_quantizer.set_replicas_bit_width_indices(bitwidths_indices)
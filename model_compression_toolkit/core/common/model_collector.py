@@ -25,10 +25,13 @@ from model_compression_toolkit.core.common.graph.base_graph import Graph
 from model_compression_toolkit.logger import Logger
 from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
 from model_compression_toolkit.core.common.collectors.statistics_collector import BaseStatsCollector
+from model_compression_toolkit.core.common.collectors.stats_convergence_monitor import StatsConvergenceMonitor
+from model_compression_toolkit.core.common.quantization.stats_sampling_config import StatsSamplingConfig
 
 
 def create_stats_collector_for_node(node: common.BaseNode,
-                                    fw_info: FrameworkInfo) -> BaseStatsCollector:
+                                    fw_info: FrameworkInfo,
+                                    sampling_config: StatsSamplingConfig = None) -> BaseStatsCollector:
     """
     Gets a node and a groups list and create and return a statistics collector for a node
     according to whether its statistics should be collected and the prior information we
@@ -37,6 +40,7 @@ def create_stats_collector_for_node(node: common.BaseNode,
     Args:
         node: Node to create its statistics collector.
         fw_info: Information relevant to a specific framework about what is out channel axis (for statistics per-channel).
+        sampling_config: Configuration of sampling large tensors for the statistics (if None, full tensors are used).
 
     Returns:
         Statistics collector for statistics collection for the node.
@@ -47,7 +51,8 @@ def create_stats_collector_for_node(node: common.BaseNode,
         max_output = getattr(node.prior_info, 'max_output', None)
         stats_collector = common.StatsCollector(out_channel_axis=fw_info.out_channel_axis_mapping.get(node.type),
                                                 init_min_value=min_output,
-                                                init_max_value=max_output)
+                                                init_max_value=max_output,
+                                                sampling_config=sampling_config)
     else:
         stats_collector = common.NoStatsCollector()
 
@@ -56,19 +61,22 @@ def create_stats_collector_for_node(node: common.BaseNode,
 
 def create_tensor2node(graph: common.Graph,
                        node: common.BaseNode,
-                       fw_info: common.FrameworkInfo):
+                       fw_info: common.FrameworkInfo,
+                       sampling_config: StatsSamplingConfig = None):
     """
     Force statistic collector creation and assignment for a node.
     Args:
         graph: Graph of the node (for retrieving the current tensor).
         node: Node to create a tensor for.
         fw_info: Specific framework information (for example, output channels index).
+        sampling_config: Configuration of sampling large tensors for the statistics (if None, full tensors are used).
 
     """
     current_sc = graph.get_out_stats_collector(node)
     is_list_nostat_collectors = isinstance(current_sc, list) and len([sc for sc in current_sc if not isinstance(sc, common.NoStatsCollector)]) == 0
     if isinstance(current_sc, common.NoStatsCollector) or current_sc is None or is_list_nostat_collectors:
-        stats_collector = common.StatsCollector(fw_info.out_channel_axis_mapping.get(node.type))
+        stats_collector = common.StatsCollector(fw_info.out_channel_axis_mapping.get(node.type),
+                                                sampling_config=sampling_config)
         graph.set_out_stats_collector_to_node(node, stats_collector)
 
 
@@ -99,7 +107,8 @@ class ModelCollector:
 
         # Assign statisitcs collectors to nodes
         for n in graph.get_topo_sorted_nodes():
-            sc = create_stats_collector_for_node(n, fw_info=fw_info)  # Get static collector for the node
+            # Get static collector for the node
+            sc = create_stats_collector_for_node(n, fw_info=fw_info, sampling_config=qc.stats_sampling_config)
             # If we use bias correction, and the node has kernel weights to quantize, we need to make sure
             # its previous nodes' tensors are consistent with this node.
             kernel_attr = fw_info.get_kernel_op_attributes(n.type)[0]
@@ -108,7 +117,8 @@ class ModelCollector:
                     input_node = ie.source_node
                     create_tensor2node(graph,
                                        input_node,
-                                       fw_info)
+                                       fw_info,
+                                       sampling_config=qc.stats_sampling_config)
             if sc is not None:
                 graph.set_out_stats_collector_to_node(n, sc)
 
@@ -135,6 +145,10 @@ class ModelCollector:
                     outputs_nodes.append(n)
                     self.stats_containers_list.append(out_stats_container)
 
+        # Monitor the convergence of the collected statistics, to stop the collection early (if enabled).
+        self.convergence_monitor = None if qc.stats_convergence_config is None else \
+            StatsConvergenceMonitor(qc.stats_convergence_config)
+
         # Build a float model and output all layers' outputs
         # (that should be collected) as the model's outputs
         self.model, _ = self.fw_impl.model_builder(graph,
@@ -165,3 +179,32 @@ class ModelCollector:
                     sci.update_statistics(self.fw_impl.to_numpy(tdi))
             else:
                 sc.update_statistics(self.fw_impl.to_numpy(td))
+
+        if self.convergence_monitor is not None:
+            self.convergence_monitor.update(self.stats_containers_list)
+
+    def is_collection_done(self) -> bool:
+        """
+        Returns: Whether the statistics collection can stop before the end of the representative dataset (when
+        the collected statistics are monitored for convergence).
+        """
+
+        return self.convergence_monitor is not None and self.convergence_monitor.should_stop()
+
+    def merge_statistics(self, stats_containers_list: List):
+        """
+        Merge the statistics another ModelCollector of the same graph collected (e.g., on another shard of the
+        representative dataset) into the statistics containers the ModelCollector holds.
+
+        Args:
+            stats_containers_list: Statistics containers of the other ModelCollector (ordered as the
+                ModelCollector's statistics containers).
+
+        """
+
+        for sc, other_sc in zip(self.stats_containers_list, stats_containers_list):
+            if isinstance(sc, (list, tuple)):
+                for sci, other_sci in zip(sc, other_sc):
+                    sci.merge(other_sci)
+            else:
+                sc.merge(other_sc)
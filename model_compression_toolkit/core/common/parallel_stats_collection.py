@@ -0,0 +1,165 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import multiprocessing as mp
+import os
+import queue
+import traceback
+from typing import Callable, List
+
+from tqdm import tqdm
+
+from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
+from model_compression_toolkit.core.common.model_collector import ModelCollector
+from model_compression_toolkit.logger import Logger
+
+# Maximal number of batches waiting in the queue of each worker.
+WORKER_QUEUE_SIZE = 2
+
+# Interval (in seconds) for checking that the workers are alive while waiting for them.
+WORKERS_POLL_INTERVAL = 1.0
+
+
+def collect_statistics_in_parallel(model_collector: ModelCollector,
+                                   representative_data_gen: Callable,
+                                   fw_impl: FrameworkImplementation,
+                                   num_workers: int):
+    """
+    Collect statistics of a ModelCollector's graph in several local worker processes.
+    The representative dataset is read by the current process, and its batches are dealt to the workers in a
+    round-robin order, so each worker collects statistics on its shard of the dataset with its own copy of the
+    collector model. When the dataset is exhausted, the statistics of the workers are merged into the
+    ModelCollector's statistics containers in the workers' order, so the merged statistics are deterministic.
+
+    The workers are forked from the current process before the dataset is read, so they get the ModelCollector
+    without serializing it.
+
+    Args:
+        model_collector: ModelCollector to collect statistics for (its statistics containers should be empty).
+        representative_data_gen: Dataset used for calibration.
+        fw_impl: FrameworkImplementation object with a specific framework methods implementation.
+        num_workers: Number of worker processes.
+
+    """
+    if 'fork' not in mp.get_all_start_methods():
+        Logger.critical('Parallel statistics collection requires forking worker processes, which is not '
+                        'supported on this platform.')  # pragma: no cover
+
+    ctx = mp.get_context('fork')
+    batches_queues = [ctx.Queue(maxsize=WORKER_QUEUE_SIZE) for _ in range(num_workers)]
+    results_queue = ctx.Queue()
+    workers = [ctx.Process(target=_run_worker,
+                           args=(rank, num_workers, model_collector, fw_impl, batches_queues[rank], results_queue),
+                           daemon=True)
+               for rank in range(num_workers)]
+    for worker in workers:
+        worker.start()
+
+    try:
+        for i, _data in enumerate(tqdm(fw_impl.get_representative_dataset_iterator(representative_data_gen),
+                                       "Statistics Collection")):
+            _put_batch(batches_queues[i % num_workers], fw_impl.to_numpy(list(_data)), workers[i % num_workers])
+        for batches_queue, worker in zip(batches_queues, workers):
+            _put_batch(batches_queue, None, worker)
+
+        workers_stats = _get_workers_results(results_queue, workers)
+    finally:
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+            worker.join()
+
+    for rank in range(num_workers):
+        model_collector.merge_statistics(workers_stats[rank])
+
+
+def _run_worker(rank: int,
+                num_workers: int,
+                model_collector: ModelCollector,
+                fw_impl: FrameworkImplementation,
+                batches_queue: mp.Queue,
+                results_queue: mp.Queue):
+    """
+    Collect statistics on the batches of a worker's queue, until a None batch is received. The worker sends its
+    statistics containers (or the error it failed with) to the results queue.
+
+    Args:
+        rank: Index of the worker.
+        num_workers: Number of workers.
+        model_collector: ModelCollector to collect statistics with.
+        fw_impl: FrameworkImplementation object with a specific framework methods implementation.
+        batches_queue: Queue of the worker's batches.
+        results_queue: Queue to send the worker's statistics to.
+
+    """
+    try:
+        # The machine's cores are split between the workers.
+        fw_impl.set_num_threads(max(1, (os.cpu_count() or 1) // num_workers))
+        while True:
+            _data = batches_queue.get()
+            if _data is None:
+                break
+            model_collector.infer(_data)
+        results_queue.put((rank, model_collector.stats_containers_list, None))
+    except Exception:
+        results_queue.put((rank, None, traceback.format_exc()))
+
+
+def _put_batch(batches_queue: mp.Queue, batch: List, worker: mp.Process):
+    """
+    Put a batch in a worker's queue, and verify the worker is alive while the queue is full.
+
+    Args:
+        batches_queue: Queue of the worker's batches.
+        batch: Batch to put (or None to stop the worker).
+        worker: The worker process.
+
+    """
+    while True:
+        try:
+            batches_queue.put(batch, timeout=WORKERS_POLL_INTERVAL)
+            return
+        except queue.Full:
+            if not worker.is_alive():
+                Logger.critical(f'A statistics collection worker exited unexpectedly '
+                                f'(exit code {worker.exitcode}).')
+
+
+def _get_workers_results(results_queue: mp.Queue, workers: List[mp.Process]) -> List[List]:
+    """
+    Wait for the statistics of all workers.
+
+    Args:
+        results_queue: Queue the workers send their statistics to.
+        workers: The worker processes.
+
+    Returns:
+        The statistics containers of each worker (ordered by the workers' indices).
+    """
+    workers_stats = [None] * len(workers)
+    received = 0
+    while received < len(workers):
+        try:
+            rank, stats_containers_list, error = results_queue.get(timeout=WORKERS_POLL_INTERVAL)
+        except queue.Empty:
+            # A worker that exited without sending its statistics failed unexpectedly (e.g., it was killed).
+            if any(w.exitcode not in [None, 0] for w in workers):
+                Logger.critical(f'A statistics collection worker exited unexpectedly (exit codes '
+                                f'{[w.exitcode for w in workers]}).')
+            continue
+        if error is not None:
+            Logger.critical(f'Statistics collection worker {rank} failed:\n{error}')
+        workers_stats[rank] = stats_containers_list
+        received += 1
+    return workers_stats
@@ -0,0 +1,327 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import functools
+import hashlib
+import os
+import types
+from enum import Enum
+from typing import Any, Callable, Dict, Tuple
+
+import numpy as np
+
+from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
+from model_compression_toolkit.core.common.graph.base_graph import Graph
+from model_compression_toolkit.core.common.graph.graph_snapshot import save_graph_snapshot, load_graph_snapshot
+from model_compression_toolkit.core.common.quantization.pipeline_cache_config import PipelineCacheConfig
+from model_compression_toolkit.logger import Logger
+
+_PRIMITIVE_TYPES = (type(None), bool, int, float, complex, str, bytes)
+
+# Packages whose functions are hashed by their names and code only, since their constants, closures and the
+# functions they wrap are fixed by the installed package's version.
+_VERSIONED_PACKAGES = ('model_compression_toolkit', 'mct_quantizers', 'numpy', 'tensorflow', 'keras', 'torch')
+
+# Types of callables that are implemented in C (e.g., builtins, numpy ufuncs and tensors' methods), which are hashed
+# by their names only.
+_BUILTIN_CALLABLE_TYPES = (types.BuiltinFunctionType, types.MethodDescriptorType, types.WrapperDescriptorType,
+                           types.MethodWrapperType, types.ClassMethodDescriptorType, np.ufunc)
+
+
+class UnfingerprintableObjectError(Exception):
+    """
+    Raised when the content of an object can not be fingerprinted reliably (so a stage that depends on it can't be
+    cached).
+    """
+
+
+def _update_fingerprint(h: Any, obj: Any, memo: Dict[int, Tuple[int, Any]]):
+    """
+    Update a hash with the content of an object. Containers and objects' attributes are hashed recursively, functions
+    and classes are hashed by their qualified names (and functions also by their code), and arrays by their values.
+    Raises UnfingerprintableObjectError if the object's content can't be hashed reliably.
+
+    Args:
+        h: Hash object (from hashlib) to update.
+        obj: Object to hash.
+        memo: Mapping from the ids of the objects that were already hashed to their order (and the objects, to keep
+            them alive while hashing), so shared and cyclic references are hashed by reference.
+
+    """
+    if isinstance(obj, _PRIMITIVE_TYPES):
+        h.update(repr((type(obj).__name__, obj)).encode())
+        return
+    if isinstance(obj, Enum):
+        h.update(f'enum:{type(obj).__qualname__}.{obj.name}'.encode())
+        return
+
+    if id(obj) in memo:
+        h.update(f'ref:{memo[id(obj)][0]}'.encode())
+        return
+    memo[id(obj)] = (len(memo), obj)
+
+    if isinstance(obj, (type, functools.partial)) or callable(obj) and hasattr(obj, '__qualname__'):
+        _update_callable_fingerprint(h, obj, memo)
+        return
+
+    if isinstance(obj, (list, tuple)):
+        h.update(f'{type(obj).__name__}:{len(obj)}'.encode())
+        for item in obj:
+            _update_fingerprint(h, item, memo)
+    elif isinstance(obj, dict):
+        h.update(f'dict:{len(obj)}'.encode())
+        for key, value in obj.items():
+            _update_fingerprint(h, key, memo)
+            _update_fingerprint(h, value, memo)
+    elif isinstance(obj, (set, frozenset)):
+        # The iteration order of sets is not deterministic between processes, so their items are hashed separately
+        # and sorted.
+        h.update(f'set:{len(obj)}'.encode())
+        for item_fingerprint in sorted(get_fingerprint(item) for item in obj):
+            h.update(item_fingerprint.encode())
+    elif isinstance(obj, (np.ndarray, np.generic)) or hasattr(obj, '__array__'):
+        # Numpy arrays and framework tensors.
+        _update_array_fingerprint(h, obj, memo)
+    elif hasattr(obj, '__dict__'):
+        h.update(f'object:{type(obj).__module__}.{type(obj).__qualname__}'.encode())
+        _update_fingerprint(h, vars(obj), memo)
+    elif type(obj).__repr__ is object.__repr__:
+        # The default representation holds the object's address rather than its content.
+        raise UnfingerprintableObjectError(f'Can not fingerprint an object of type {type(obj).__qualname__}.')
+    else:
+        h.update(f'{type(obj).__qualname__}:{obj!r}'.encode())
+
+
+def _update_callable_fingerprint(h: Any, obj: Callable, memo: Dict[int, Tuple[int, Any]]):
+    """
+    Update a hash with a class or a function (by its qualified name and code, and for bound methods and partial
+    functions, also by the object or arguments they are bound to). Functions that are not part of a versioned package
+    (e.g., lambdas or closures in the user's configuration) are also hashed by their constants, names, defaults and
+    closure contents.
+    """
+    if isinstance(obj, functools.partial):
+        h.update(b'partial')
+        _update_fingerprint(h, (obj.func, obj.args, obj.keywords), memo)
+        return
+    module = getattr(obj, '__module__', None)
+    h.update(f'callable:{module}.{obj.__qualname__}'.encode())
+    bound_object = getattr(obj, '__self__', None)
+    if bound_object is not None and not isinstance(bound_object, types.ModuleType):
+        _update_fingerprint(h, bound_object, memo)
+
+    func = getattr(obj, '__func__', obj)
+    if isinstance(obj, type) or isinstance(func, _BUILTIN_CALLABLE_TYPES):
+        return
+    code = getattr(func, '__code__', None)
+    if code is not None and (module or '').split('.')[0] in _VERSIONED_PACKAGES:
+        h.update(code.co_code)
+    elif isinstance(func, types.FunctionType):
+        # The function's constants, defaults and closure are part of its behavior (e.g., lambdas that differ only in
+        # a constant, or closures that capture different values).
+        _update_code_fingerprint(h, code, memo)
+        _update_fingerprint(h, (func.__defaults__, func.__kwdefaults__), memo)
+        for cell in func.__closure__ or ():
+            try:
+                cell_contents = cell.cell_contents
+            except ValueError:
+                h.update(b'empty_cell')
+                continue
+            _update_fingerprint(h, cell_contents, memo)
+    elif hasattr(func, '__wrapped__'):
+        _update_fingerprint(h, func.__wrapped__, memo)
+    elif (module or '').split('.')[0] not in _VERSIONED_PACKAGES:
+        raise UnfingerprintableObjectError(f'Can not fingerprint the callable {module}.{obj.__qualname__}.')
+
+
+def _update_code_fingerprint(h: Any, code: types.CodeType, memo: Dict[int, Tuple[int, Any]]):
+    """
+    Update a hash with a function's code object: its bytecode, the names it refers to and its constants (including
+    the code of nested functions).
+    """
+    h.update(code.co_code)
+    h.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _update_code_fingerprint(h, const, memo)
+        else:
+            _update_fingerprint(h, const, memo)
+
+
+def _update_array_fingerprint(h: Any, obj: Any, memo: Dict[int, Tuple[int, Any]]):
+    """
+    Update a hash with an array (numpy, or a framework tensor that can be converted to numpy).
+    """
+    try:
+        array = np.asarray(obj)
+    except Exception:
+        # E.g., tensors that require gradients can not be converted without detaching them.
+        h.update(f'{type(obj).__qualname__}:{obj!r}'.encode())
+        return
+    if array.dtype.hasobject:
+        _update_fingerprint(h, array.tolist(), memo)
+        return
+    array = np.ascontiguousarray(array)
+    h.update(f'array:{array.dtype.str}:{array.shape}'.encode())
+    h.update(array.tobytes())
+
+
+def get_fingerprint(*objs: Any) -> str:
+    """
+    Compute a fingerprint of the content of objects (e.g., configurations, target platform capabilities, or a graph),
+    that is stable between processes.
+
+    Args:
+        *objs: Objects to compute their fingerprint.
+
+    Returns:
+        Hexadecimal digest of the objects' content.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    _update_fingerprint(h, objs, {})
+    return h.hexdigest()
+
+
+class PipelineCache:
+    """
+    A cache of the results of the optimization process stages, saved in a directory between runs.
+    Each stage is keyed by a fingerprint of its inputs (e.g., the model's graph, the relevant configurations, the
+    target platform capabilities or the representative dataset) and of the key of the stage that preceded it, so
+    a stage is reused only when none of its inputs, and none of the inputs of the stages before it, changed.
+    The graphs are saved as graph snapshots, so their weights are memory mapped when they are loaded.
+    """
+
+    def __init__(self, pipeline_cache_config: PipelineCacheConfig):
+        """
+        Args:
+            pipeline_cache_config: PipelineCacheConfig with the cache directory.
+        """
+        self.cache_dir = pipeline_cache_config.cache_dir
+        self.dataset_id = pipeline_cache_config.dataset_id
+        # Key of the last keyed stage, or None once the inputs of a stage could not be fingerprinted.
+        self.last_key = ''
+        self.dataset_fingerprint = None
+
+    def get_stage_key(self, stage: str, *inputs: Any) -> str:
+        """
+        Compute the key of a stage, from its inputs and from the key of the previous stage (the stages must be keyed
+        in the order they run).
+
+        Args:
+            stage: Name of the stage.
+            *inputs: The inputs of the stage.
+
+        Returns:
+            The key of the stage.
+        """
+        self.last_key = get_fingerprint(self.last_key, stage, *inputs)
+        return self.last_key
+
+    def get_dataset_fingerprint(self, representative_data_gen: Callable, fw_impl: FrameworkImplementation) -> str:
+        """
+        Get the fingerprint of the representative dataset: its identifier from the configuration if it was set,
+        otherwise a hash of all its batches (computed once).
+
+        Args:
+            representative_data_gen: Dataset used for calibration.
+            fw_impl: FrameworkImplementation object with a specific framework methods implementation.
+
+        Returns:
+            The fingerprint of the representative dataset.
+        """
+        if self.dataset_id is not None:
+            return self.dataset_id
+        if self.dataset_fingerprint is None:
+            h = hashlib.blake2b(digest_size=16)
+            for batch in representative_data_gen():
+                for inputs in (batch if isinstance(batch, (list, tuple)) else [batch]):
+                    _update_array_fingerprint(h, fw_impl.to_numpy(inputs), {})
+            self.dataset_fingerprint = h.hexdigest()
+        return self.dataset_fingerprint
+
+    def load(self, stage: str, key: str) -> Tuple[Graph, Any]:
+        """
+        Load the result of a stage from the cache.
+
+        Args:
+            stage: Name of the stage.
+            key: Key of the stage.
+
+        Returns:
+            The cached graph and additional data of the stage, or None if the stage is not cached with this key.
+        """
+        snapshot_dir = self._get_snapshot_dir(stage, key)
+        if not os.path.isdir(snapshot_dir):
+            Logger.info(f'No cached result was found for stage {stage}.')
+            return None
+        Logger.info(f'Loading the cached result of stage {stage} from {snapshot_dir}.')
+        return load_graph_snapshot(snapshot_dir)
+
+    def save(self, stage: str, key: str, graph: Graph = None, extra: Any = None):
+        """
+        Save the result of a stage to the cache.
+
+        Args:
+            stage: Name of the stage.
+            key: Key of the stage.
+            graph: The graph that the stage outputs (if any).
+            extra: Additional data that the stage outputs.
+
+        """
+        save_graph_snapshot(graph, self._get_snapshot_dir(stage, key), extra)
+
+    def _get_snapshot_dir(self, stage: str, key: str) -> str:
+        """
+        Returns: Directory of the snapshot of a stage's result.
+        """
+        return os.path.join(self.cache_dir, f'{stage}_{key}')
+
+
+def run_cached_stage(pipeline_cache: PipelineCache,
+                     stage: str,
+                     stage_inputs: Tuple,
+                     stage_fn: Callable[[], Any]) -> Any:
+    """
+    Run a stage of the optimization process, or load its result from the cache if the stage was cached with the
+    same inputs.
+
+    Args:
+        pipeline_cache: PipelineCache to load the stage's result from or save it to. If None, the stage is run.
+        stage: Name of the stage.
+        stage_inputs: The inputs of the stage to key it by.
+        stage_fn: Function that runs the stage and returns its result (a graph or other picklable data).
+
+    Returns:
+        The result of the stage.
+    """
+    if pipeline_cache is None or pipeline_cache.last_key is None:
+        return stage_fn()
+
+    try:
+        cache_key = pipeline_cache.get_stage_key(stage, *stage_inputs)
+    except UnfingerprintableObjectError as e:
+        # The following stages depend on this stage's inputs too, so none of them is cached.
+        Logger.warning(f'Stage {stage} and the stages after it are not cached, since their inputs can not be '
+                       f'fingerprinted: {e}')
+        pipeline_cache.last_key = None
+        return stage_fn()
+    cached_result = pipeline_cache.load(stage, cache_key)
+    if cached_result is not None:
+        return cached_result[0] if isinstance(cached_result[0], Graph) else cached_result[1]
+
+    result = stage_fn()
+    if isinstance(result, Graph):
+        pipeline_cache.save(stage, cache_key, graph=result)
+    else:
+        pipeline_cache.save(stage, cache_key, extra=result)
+    return result
@@ -0,0 +1,188 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Any, Iterable, Iterator, Callable
+
+from model_compression_toolkit.logger import Logger
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    # The resource module is not available on Windows, so peak memory is not recorded.
+    resource = None
+
+PROFILING_REPORT_FILE = 'profiling_report.json'
+WALL_TIME = 'wall_time_sec'
+CALLS = 'calls'
+PROCESS_PEAK_RSS = 'process_peak_rss_mb'
+RSS_DELTA = 'rss_delta_mb'
+
+# Per-process memory statistics file on Linux (its second field is the current resident set size, in pages).
+PROC_STATM_FILE = '/proc/self/statm'
+
+
+def _get_process_peak_rss_mb() -> float:
+    """
+    Returns: The peak resident set size of the process since it started (in MB), or None if it can not be measured.
+    """
+    if resource is None:
+        return None  # pragma: no cover
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux.
+    return peak_rss / 2 ** 20 if sys.platform == 'darwin' else peak_rss / 2 ** 10
+
+
+def _get_process_rss_mb() -> float:
+    """
+    Returns: The current resident set size of the process (in MB), or None if it can not be measured (it is read
+    from /proc, so it is measured on Linux only).
+    """
+    try:
+        with open(PROC_STATM_FILE) as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):  # pragma: no cover
+        return None
+    return resident_pages * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+
+
+class Profiler:
+    """
+    Records the wall time, number of calls and memory of the stages of the optimization process. The memory of a
+    stage is recorded as its RSS delta: the change of the process's current RSS between the entry to the stage and
+    its exit (summed over its calls), i.e., the memory the stage left allocated (or freed, if negative). The process
+    memory high-water mark (peak RSS since the process started, as reported at the end of the stage) is recorded as
+    well. The peak RSS is not reset between stages, so it shows by which stage the process reached its memory peak.
+    Stages are recorded by wrapping them with Profiler.profile(stage_name). Stages that run inside other stages are
+    recorded under the path of the stages that contain them (e.g., 'core_runner/graph_preparation').
+    Profiling is enabled by Profiler.start, and until then profiling a stage does nothing.
+    """
+    enabled = False
+    records = {}
+    stages_stack = []
+
+    @staticmethod
+    def start():
+        """
+        Enable the profiler and clear all previous records.
+
+        """
+        Profiler.enabled = True
+        Profiler.records = {}
+        Profiler.stages_stack = []
+
+    @staticmethod
+    def profile(stage_name: str):
+        """
+        Get a context manager that records a stage of the optimization process (if the profiler is enabled).
+
+        Args:
+            stage_name: Name of the stage to record.
+
+        Returns:
+            A context manager to wrap the stage with.
+        """
+        if not Profiler.enabled:
+            return nullcontext()
+        return Profiler._record_stage(stage_name)
+
+    @staticmethod
+    def profile_each(items: Iterable, get_stage_name: Callable[[Any], str]) -> Iterator:
+        """
+        Iterate over items, recording the processing of each item (the loop body) as a stage.
+
+        Args:
+            items: Items to iterate over.
+            get_stage_name: Function that returns the name of the stage to record for an item.
+
+        Returns:
+            An iterator over the items.
+        """
+        for item in items:
+            with Profiler.profile(get_stage_name(item)):
+                yield item
+
+    @staticmethod
+    @contextmanager
+    def _record_stage(stage_name: str):
+        """
+        Context manager that records the wall time, RSS delta, process peak RSS and calls of a stage.
+
+        Args:
+            stage_name: Name of the stage to record.
+
+        """
+        Profiler.stages_stack.append(stage_name)
+        stage_path = '/'.join(Profiler.stages_stack)
+        start_rss = _get_process_rss_mb()
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            record = Profiler.records.setdefault(stage_path, {WALL_TIME: 0.0, CALLS: 0, RSS_DELTA: None,
+                                                              PROCESS_PEAK_RSS: None})
+            record[WALL_TIME] += time.perf_counter() - start_time
+            record[CALLS] += 1
+            end_rss = _get_process_rss_mb()
+            if start_rss is not None and end_rss is not None:
+                record[RSS_DELTA] = (record[RSS_DELTA] or 0.0) + end_rss - start_rss
+            record[PROCESS_PEAK_RSS] = _get_process_peak_rss_mb()
+            Profiler.stages_stack.pop()
+
+    @staticmethod
+    def get_report() -> Dict[str, Dict[str, Any]]:
+        """
+        Returns: A dictionary from each recorded stage path to its wall time (in seconds), number of calls, RSS delta
+        (in MB, summed over its calls) and the process peak RSS (in MB) at the end of its last call.
+        """
+        return {stage: dict(record) for stage, record in Profiler.records.items()}
+
+    @staticmethod
+    def stop(report_path: str = None, tb_w=None) -> Dict[str, Dict[str, Any]]:
+        """
+        Disable the profiler and emit the profiling report. The report is saved as a JSON file in report_path.
+        If report_path is None and the logger's folder is set, the report is saved in the logger's folder.
+        If a TensorboardWriter is passed, the report is also logged as scalars to Tensorboard.
+        Does nothing if the profiler is not enabled.
+
+        Args:
+            report_path: Path of the JSON file to save the report to.
+            tb_w: TensorboardWriter to log the report to.
+
+        Returns:
+            The profiling report (see Profiler.get_report), or None if the profiler is not enabled.
+        """
+        if not Profiler.enabled:
+            return None
+        Profiler.enabled = False
+        report = Profiler.get_report()
+
+        if report_path is None and Logger.LOG_PATH is not None:
+            report_path = os.path.join(Logger.LOG_PATH, PROFILING_REPORT_FILE)
+        if report_path is not None:
+            with open(report_path, 'w') as f:
+                json.dump(report, f, indent=4)
+            Logger.info(f'Profiling report is in {report_path}')
+
+        if tb_w is not None:
+            tb_w.add_scalars({f'{stage}/{metric}': value
+                              for stage, record in report.items()
+                              for metric, value in record.items() if value is not None},
+                             main_tag_name='profiling')
+
+        return report
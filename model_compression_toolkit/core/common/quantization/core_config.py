@@ -15,6 +15,7 @@
 from model_compression_toolkit.core.common.quantization.quantization_config import QuantizationConfig
 from model_compression_toolkit.core.common.quantization.debug_config import DebugConfig
 from model_compression_toolkit.core.common.mixed_precision.mixed_precision_quantization_config import MixedPrecisionQuantizationConfig
+from model_compression_toolkit.core.common.quantization.pipeline_cache_config import PipelineCacheConfig
 
 
 class CoreConfig:
@@ -24,7 +25,8 @@ class CoreConfig:
     def __init__(self,
                  quantization_config: QuantizationConfig = QuantizationConfig(),
                  mixed_precision_config: MixedPrecisionQuantizationConfig = None,
-                 debug_config: DebugConfig = DebugConfig()
+                 debug_config: DebugConfig = DebugConfig(),
+                 pipeline_cache_config: PipelineCacheConfig = None
                  ):
         """
 
@@ -33,9 +35,12 @@ class CoreConfig:
             mixed_precision_config (MixedPrecisionQuantizationConfig): Config for mixed precision quantization.
             If None, a default MixedPrecisionQuantizationConfig is used.
             debug_config (DebugConfig): Config for debugging and editing the network quantization process.
+            pipeline_cache_config (PipelineCacheConfig): Config for caching the results of the optimization process
+            stages between runs. If None, no results are cached.
         """
         self.quantization_config = quantization_config
         self.debug_config = debug_config
+        self.pipeline_cache_config = pipeline_cache_config
 
         if mixed_precision_config is None:
             self.mixed_precision_config = MixedPrecisionQuantizationConfig()
@@ -25,7 +25,12 @@ class DebugConfig:
     """
     def __init__(self,
                  analyze_similarity: bool = False,
-                 network_editor: List[EditRule] = []):
+                 network_editor: List[EditRule] = [],
+                 profile: bool = False,
+                 profiling_report_path: str = None,
+                 tensorboard_async_write: bool = True,
+                 tensorboard_stages: List[str] = None,
+                 tensorboard_max_logged_nodes: int = None):
         """
 
         Args:
@@ -33,6 +38,23 @@ class DebugConfig:
             analyze_similarity (bool): Whether to plot similarity figures within TensorBoard (when logger is
              enabled) or not. Can be used to pinpoint problematic layers in the quantization process.
             network_editor (List[EditRule]): A list of rules and actions to edit the network for quantization.
+            profile (bool): Whether to record the wall time, number of calls, RSS delta (the change of the process
+             memory between the entry to the stage and its exit) and process peak memory (high-water mark) of each
+             stage of the optimization process. The report is saved as a JSON file (and logged to TensorBoard when logger is
+             enabled).
+            profiling_report_path (str): Path of the JSON profiling report. If None, the report is saved in the
+             logger's folder (when logger is enabled).
+            tensorboard_async_write (bool): Whether to create and write the TensorBoard events in a background thread
+             (when logger is enabled), so the optimization process does not wait for them.
+            tensorboard_stages (List[str]): Tag names of the stages to log to TensorBoard (e.g., 'initial_graph',
+             'thresholds_selection'). If None, all stages are logged.
+            tensorboard_max_logged_nodes (int): Maximal number of nodes to log the statistics of to TensorBoard in
+             each stage (the nodes are evenly sampled). If None, the statistics of all nodes are logged.
         """
         self.analyze_similarity = analyze_similarity
         self.network_editor = network_editor
+        self.profile = profile
+        self.profiling_report_path = profiling_report_path
+        self.tensorboard_async_write = tensorboard_async_write
+        self.tensorboard_stages = tensorboard_stages
+        self.tensorboard_max_logged_nodes = tensorboard_max_logged_nodes
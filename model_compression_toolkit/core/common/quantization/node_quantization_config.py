@@ -14,7 +14,8 @@
 # ==============================================================================
 
 
-from typing import Callable, Any, List, Tuple, Union, Dict
+from functools import partial
+from typing import Callable, Any, List, Tuple, Union, Dict, NamedTuple
 
 import numpy as np
 
@@ -26,7 +27,7 @@ from model_compression_toolkit.core.common.quantization.quantization_params_fn_s
 from model_compression_toolkit.core.common.quantization.quantization_config import QuantizationConfig, \
     QuantizationErrorMethod
 from model_compression_toolkit.target_platform_capabilities.target_platform import OpQuantizationConfig, \
-    AttributeQuantizationConfig
+    AttributeQuantizationConfig, QuantizationMethod
 
 
 ##########################################
@@ -36,6 +37,120 @@ from model_compression_toolkit.target_platform_capabilities.target_platform impo
 ##########################################
 
 
+# The quantization settings of a node (quantizers, bit-width, error method, flags) are shared by many nodes
+# and candidates, so each distinct set of settings is kept once as an immutable spec, and the nodes' configs
+# only hold a reference to it in addition to their own computed quantization params.
+_INTERNED_SPECS: Dict[Tuple, NamedTuple] = {}
+
+
+def _spec_value_key(value: Any) -> Tuple:
+    """
+    Returns the key of a quantization spec's value in the interned specs table.
+
+    Args:
+        value: A value of a quantization spec.
+
+    Returns: A key that is equal for equal values of the same type.
+
+    """
+    if isinstance(value, partial):
+        # Partial functions are compared by identity, but equal ones are created for each config (e.g., the LUT
+        # quantization params functions), so they are keyed by their function and arguments. Otherwise, each config
+        # would add its own spec to the table.
+        return partial, value.func, value.args, tuple(sorted(value.keywords.items()))
+    # The value's type is part of the key so that, e.g., 8 and 8.0 are not interned to the same spec.
+    return type(value), value
+
+
+def _intern_spec(spec: NamedTuple) -> NamedTuple:
+    """
+    Returns the shared instance of a quantization spec, registering the given spec if no equal spec exists.
+
+    Args:
+        spec: Quantization spec to intern.
+
+    Returns: A spec equal to the given spec that is shared by all configs with the same settings.
+
+    """
+    key = (type(spec), tuple(_spec_value_key(v) for v in spec))
+    try:
+        return _INTERNED_SPECS.setdefault(key, spec)
+    except TypeError:
+        # A spec with an unhashable value (e.g., a custom quantization function) can't be shared.
+        return spec
+
+
+def _spec_property(field_name: str) -> property:
+    """
+    Creates a property that exposes a field of a config's quantization spec as a regular attribute.
+    Setting the attribute replaces the config's spec with the interned spec of the new settings,
+    thus, other configs that share the previous spec are not affected.
+
+    Args:
+        field_name: Name of the spec field.
+
+    Returns: A property for the spec field.
+
+    """
+    def _get(self):
+        return getattr(self._spec, field_name)
+
+    def _set(self, value):
+        self._spec = _intern_spec(self._spec._replace(**{field_name: value}))
+
+    return property(_get, _set, doc=f"{field_name} of the config's shared quantization spec.")
+
+
+class _ActivationQuantizationSpec(NamedTuple):
+    """
+    Immutable quantization settings of a NodeActivationQuantizationConfig.
+    """
+    activation_quantization_fn: Callable
+    activation_quantization_params_fn: Callable
+    activation_quantization_method: QuantizationMethod
+    activation_error_method: QuantizationErrorMethod
+    activation_n_bits: int
+    relu_bound_to_power_of_2: bool
+    enable_activation_quantization: bool
+    activation_channel_equalization: bool
+    input_scaling: bool
+    min_threshold: float
+    l_p_value: int
+    shift_negative_activation_correction: bool
+    z_threshold: float
+    shift_negative_ratio: float
+    shift_negative_threshold_recalculation: bool
+    concat_threshold_update: bool
+
+    # The spec is immutable, so copies of a config share it.
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class _WeightsAttrQuantizationSpec(NamedTuple):
+    """
+    Immutable quantization settings of a WeightsAttrQuantizationConfig.
+    """
+    weights_quantization_fn: Callable
+    weights_quantization_params_fn: Callable
+    weights_quantization_method: QuantizationMethod
+    weights_error_method: QuantizationErrorMethod
+    weights_n_bits: int
+    weights_per_channel_threshold: bool
+    enable_weights_quantization: bool
+    l_p_value: int
+
+    # The spec is immutable, so copies of a config share it.
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
 class BaseNodeQuantizationConfig(object):
     """
     Base class for node quantization configuration
@@ -61,18 +176,42 @@ class BaseNodeQuantizationConfig(object):
             Logger.warning(f"Parameter {config_parameter_name} could not be found in the node quantization config and "
                            f"was not updated!")
 
+    def get_config_dict(self) -> Dict[str, Any]:
+        """
+        Returns: A dictionary with the configuration's attributes names and values.
+        """
+        return dict(self.__dict__)
+
     def __repr__(self) -> str:
         """
         Returns: String to display a NodeQuantizationConfig object.
         """
         # Used for debugging, thus no cover.
-        return ''.join(f'{k}: {v}\n' for k, v in self.__dict__.items())  # pragma: no cover
+        return ''.join(f'{k}: {v}\n' for k, v in self.get_config_dict().items())  # pragma: no cover
 
 
 class NodeActivationQuantizationConfig(BaseNodeQuantizationConfig):
     """
     Attributes for configuring the quantization of the activations of a node.
+    The quantization settings are kept in a spec that is shared by all configs with the same settings,
+    and only the computed activation quantization params are held by each config.
     """
+    activation_quantization_fn = _spec_property('activation_quantization_fn')
+    activation_quantization_params_fn = _spec_property('activation_quantization_params_fn')
+    activation_quantization_method = _spec_property('activation_quantization_method')
+    activation_n_bits = _spec_property('activation_n_bits')
+    relu_bound_to_power_of_2 = _spec_property('relu_bound_to_power_of_2')
+    enable_activation_quantization = _spec_property('enable_activation_quantization')
+    activation_channel_equalization = _spec_property('activation_channel_equalization')
+    input_scaling = _spec_property('input_scaling')
+    min_threshold = _spec_property('min_threshold')
+    l_p_value = _spec_property('l_p_value')
+    shift_negative_activation_correction = _spec_property('shift_negative_activation_correction')
+    z_threshold = _spec_property('z_threshold')
+    shift_negative_ratio = _spec_property('shift_negative_ratio')
+    shift_negative_threshold_recalculation = _spec_property('shift_negative_threshold_recalculation')
+    concat_threshold_update = _spec_property('concat_threshold_update')
+
     def __init__(self,
                  qc: QuantizationConfig,
                  op_cfg: OpQuantizationConfig,
@@ -88,23 +227,26 @@ class NodeActivationQuantizationConfig(BaseNodeQuantizationConfig):
             activation_quantization_params_fn: Function to use when computing the threshold for quantizing a node's activations.
         """
 
-        self.activation_quantization_fn = activation_quantization_fn
-        self.activation_quantization_params_fn = activation_quantization_params_fn
-        self.activation_quantization_params = {}
-        self.activation_quantization_method = op_cfg.activation_quantization_method
+        self._spec = _intern_spec(_ActivationQuantizationSpec(
+            activation_quantization_fn=activation_quantization_fn,
+            activation_quantization_params_fn=activation_quantization_params_fn,
+            activation_quantization_method=op_cfg.activation_quantization_method,
+            activation_error_method=qc.activation_error_method,
+            activation_n_bits=op_cfg.activation_n_bits,
+            relu_bound_to_power_of_2=qc.relu_bound_to_power_of_2,
+            enable_activation_quantization=op_cfg.enable_activation_quantization,
+            activation_channel_equalization=qc.activation_channel_equalization,
+            input_scaling=qc.input_scaling,
+            min_threshold=qc.min_threshold,
+            l_p_value=qc.l_p_value,
+            shift_negative_activation_correction=qc.shift_negative_activation_correction,
+            z_threshold=qc.z_threshold,
+            shift_negative_ratio=qc.shift_negative_ratio,
+            shift_negative_threshold_recalculation=qc.shift_negative_threshold_recalculation,
+            concat_threshold_update=qc.concat_threshold_update))
+        # Set through the property setter to update the params function accordingly.
         self.activation_error_method = qc.activation_error_method
-        self.activation_n_bits = op_cfg.activation_n_bits
-        self.relu_bound_to_power_of_2 = qc.relu_bound_to_power_of_2
-        self.enable_activation_quantization = op_cfg.enable_activation_quantization
-        self.activation_channel_equalization = qc.activation_channel_equalization
-        self.input_scaling = qc.input_scaling
-        self.min_threshold = qc.min_threshold
-        self.l_p_value = qc.l_p_value
-        self.shift_negative_activation_correction = qc.shift_negative_activation_correction
-        self.z_threshold = qc.z_threshold
-        self.shift_negative_ratio = qc.shift_negative_ratio
-        self.shift_negative_threshold_recalculation = qc.shift_negative_threshold_recalculation
-        self.concat_threshold_update = qc.concat_threshold_update
+        self.activation_quantization_params = {}
 
     def quantize_node_output(self,
                              tensors: Any) -> Any:
@@ -131,7 +273,7 @@ class NodeActivationQuantizationConfig(BaseNodeQuantizationConfig):
         """
         activation_error_method getter.
         """
-        return self._activation_error_method
+        return self._spec.activation_error_method
 
     @activation_error_method.setter
     def activation_error_method(self, value: QuantizationErrorMethod):
@@ -142,8 +284,9 @@ class NodeActivationQuantizationConfig(BaseNodeQuantizationConfig):
             value: New activation_error_method to set to the node activation configuration.
 
         """
-        self._activation_error_method = value
-        self.activation_quantization_params_fn = get_activation_quantization_params_fn(activation_quantization_method=self.activation_quantization_method)
+        self._spec = _intern_spec(self._spec._replace(
+            activation_error_method=value,
+            activation_quantization_params_fn=get_activation_quantization_params_fn(activation_quantization_method=self.activation_quantization_method)))
 
     def set_activation_quantization_fn(self, activation_quantization_fn: Callable):
         """
@@ -192,6 +335,15 @@ class NodeActivationQuantizationConfig(BaseNodeQuantizationConfig):
         """
         return (not self.has_activation_quantization_params())
 
+    def get_config_dict(self) -> Dict[str, Any]:
+        """
+        Returns: A dictionary with the configuration's attributes names and values, including the shared
+        quantization settings.
+        """
+        config_dict = self._spec._asdict()
+        config_dict.update({k: v for k, v in self.__dict__.items() if k != '_spec'})
+        return config_dict
+
     def __eq__(self, other: Any) -> bool:
         """
         Compares the object to another object to find if they are equal.
@@ -205,6 +357,10 @@ class NodeActivationQuantizationConfig(BaseNodeQuantizationConfig):
         if not isinstance(other, NodeActivationQuantizationConfig):
             return False
 
+        # Configs with the same settings share the same interned spec.
+        if self._spec is other._spec:
+            return True
+
         return self.activation_quantization_fn == other.activation_quantization_fn and \
                self.activation_quantization_params_fn == other.activation_quantization_params_fn and \
                self.activation_error_method == other.activation_error_method and \
@@ -240,7 +396,17 @@ class NodeActivationQuantizationConfig(BaseNodeQuantizationConfig):
 class WeightsAttrQuantizationConfig:
     """
     Configuration for quantizing a weights attribute of a node.
+    The quantization settings are kept in a spec that is shared by all configs with the same settings,
+    and only the channels axis and the computed weights quantization params are held by each config.
     """
+    weights_quantization_fn = _spec_property('weights_quantization_fn')
+    weights_quantization_params_fn = _spec_property('weights_quantization_params_fn')
+    weights_quantization_method = _spec_property('weights_quantization_method')
+    weights_n_bits = _spec_property('weights_n_bits')
+    weights_per_channel_threshold = _spec_property('weights_per_channel_threshold')
+    enable_weights_quantization = _spec_property('enable_weights_quantization')
+    l_p_value = _spec_property('l_p_value')
+
     def __init__(self,
                  qc: QuantizationConfig,
                  weights_attr_cfg: AttributeQuantizationConfig,
@@ -252,23 +418,24 @@ class WeightsAttrQuantizationConfig:
             weights_attr_cfg: AttributeQuantizationConfig with parameters to use when creating the node's attribute quantization config.
             weights_channels_axis: Axis to quantize a node's attribute when quantizing per-channel (if not quantizing per-channel than expecting None).
         """
-        self.weights_quantization_fn = get_weights_quantization_fn(weights_attr_cfg.weights_quantization_method)
-        self.weights_quantization_params_fn = get_weights_quantization_params_fn(weights_attr_cfg.weights_quantization_method)
+        self._spec = _intern_spec(_WeightsAttrQuantizationSpec(
+            weights_quantization_fn=get_weights_quantization_fn(weights_attr_cfg.weights_quantization_method),
+            weights_quantization_params_fn=get_weights_quantization_params_fn(weights_attr_cfg.weights_quantization_method),
+            weights_quantization_method=weights_attr_cfg.weights_quantization_method,
+            weights_error_method=qc.weights_error_method,
+            weights_n_bits=weights_attr_cfg.weights_n_bits,
+            weights_per_channel_threshold=weights_attr_cfg.weights_per_channel_threshold,
+            enable_weights_quantization=weights_attr_cfg.enable_weights_quantization,
+            l_p_value=qc.l_p_value))
         self.weights_channels_axis = weights_channels_axis
         self.weights_quantization_params = {}
-        self.weights_quantization_method = weights_attr_cfg.weights_quantization_method
-        self.weights_error_method = qc.weights_error_method
-        self.weights_n_bits = weights_attr_cfg.weights_n_bits
-        self.weights_per_channel_threshold = weights_attr_cfg.weights_per_channel_threshold
-        self.enable_weights_quantization = weights_attr_cfg.enable_weights_quantization
-        self.l_p_value = qc.l_p_value
 
     @property
     def weights_error_method(self) -> QuantizationErrorMethod:
         """
         weights_error_method getter.
         """
-        return self._weights_error_method
+        return self._spec.weights_error_method
 
     @weights_error_method.setter
     def weights_error_method(self, value: QuantizationErrorMethod):
@@ -279,8 +446,9 @@ class WeightsAttrQuantizationConfig:
             value: New weights_error_method to set to the node weights configuration.
 
         """
-        self._weights_error_method = value
-        self.weights_quantization_params_fn = get_weights_quantization_params_fn(weights_quantization_method=self.weights_quantization_method)
+        self._spec = _intern_spec(self._spec._replace(
+            weights_error_method=value,
+            weights_quantization_params_fn=get_weights_quantization_params_fn(weights_quantization_method=self.weights_quantization_method)))
 
     def set_weights_quantization_fn(self, weights_quantization_fn: Callable):
         """
@@ -344,6 +512,15 @@ class WeightsAttrQuantizationConfig:
         """
         return len(self.weights_quantization_params) > 0
 
+    def get_config_dict(self) -> Dict[str, Any]:
+        """
+        Returns: A dictionary with the configuration's attributes names and values, including the shared
+        quantization settings.
+        """
+        config_dict = self._spec._asdict()
+        config_dict.update({k: v for k, v in self.__dict__.items() if k != '_spec'})
+        return config_dict
+
     def __eq__(self, other: Any) -> bool:
         """
         Compares the object to another object to find if they are equal.
@@ -357,26 +534,12 @@ class WeightsAttrQuantizationConfig:
         if not isinstance(other, WeightsAttrQuantizationConfig):
             return False
 
-        return self.weights_quantization_fn == other.weights_quantization_fn and \
-               self.weights_quantization_params_fn == other.weights_quantization_params_fn and \
-               self.weights_channels_axis == other.weights_channels_axis and \
-               self.weights_error_method == other.weights_error_method and \
-               self.weights_quantization_method == other.weights_quantization_method and \
-               self.weights_n_bits == other.weights_n_bits and \
-               self.weights_per_channel_threshold == other.weights_per_channel_threshold and \
-               self.enable_weights_quantization == other.enable_weights_quantization and \
-               self.l_p_value == other.l_p_value
+        # The spec holds all the compared settings, and configs with the same settings share the same interned spec.
+        return (self._spec is other._spec or self._spec == other._spec) and \
+               self.weights_channels_axis == other.weights_channels_axis
 
     def __hash__(self):
-        return hash((self.weights_quantization_fn,
-                     self.weights_quantization_params_fn,
-                     self.weights_channels_axis,
-                     self.weights_error_method,
-                     self.weights_quantization_method,
-                     self.weights_n_bits,
-                     self.weights_per_channel_threshold,
-                     self.enable_weights_quantization,
-                     self.l_p_value))
+        return hash((self._spec, self.weights_channels_axis))
 
 
 class NodeWeightsQuantizationConfig(BaseNodeQuantizationConfig):
@@ -398,6 +561,8 @@ class NodeWeightsQuantizationConfig(BaseNodeQuantizationConfig):
 
         """
         self.min_threshold = qc.min_threshold
+        self.qparams_search_max_chunk_bytes = qc.qparams_search_max_chunk_bytes
+        self.qparams_search_float32 = qc.qparams_search_float32
         self.simd_size = op_cfg.simd_size
         self.weights_second_moment_correction = qc.weights_second_moment_correction
         self.weights_bias_correction = qc.weights_bias_correction
@@ -559,6 +724,8 @@ class NodeWeightsQuantizationConfig(BaseNodeQuantizationConfig):
             return False
 
         return self.min_threshold == other.min_threshold and \
+            self.qparams_search_max_chunk_bytes == other.qparams_search_max_chunk_bytes and \
+            self.qparams_search_float32 == other.qparams_search_float32 and \
             self.simd_size == other.simd_size and \
             self.weights_second_moment_correction == other.weights_second_moment_correction and \
             self.weights_bias_correction == other.weights_bias_correction and \
@@ -571,6 +738,8 @@ class NodeWeightsQuantizationConfig(BaseNodeQuantizationConfig):
 
     def __hash__(self):
         return hash((self.min_threshold,
+                     self.qparams_search_max_chunk_bytes,
+                     self.qparams_search_float32,
                      self.simd_size,
                      self.weights_second_moment_correction,
                      self.weights_bias_correction,
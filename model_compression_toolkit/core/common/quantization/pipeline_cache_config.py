@@ -0,0 +1,35 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+class PipelineCacheConfig:
+    """
+    A class to configure the caching of the results of the optimization process stages (graph preparation,
+    quantization preparation and mixed-precision search) between runs.
+    """
+    def __init__(self,
+                 cache_dir: str,
+                 dataset_id: str = None):
+        """
+
+        Args:
+            cache_dir (str): Directory to save the cached results of the stages to. A stage whose inputs (the model,
+             the relevant configurations, the target platform capabilities and the representative dataset) did not
+             change since a previous run in the same directory is loaded from the cache instead of running it again.
+            dataset_id (str): An identifier of the representative dataset's content (e.g., its version). If None, the
+             dataset is identified by hashing all its batches, which requires a pass over the dataset.
+        """
+        self.cache_dir = cache_dir
+        self.dataset_id = dataset_id
@@ -17,7 +17,9 @@
 import math
 from enum import Enum
 
-from model_compression_toolkit.constants import MIN_THRESHOLD
+from model_compression_toolkit.constants import MIN_THRESHOLD, QPARAMS_SEARCH_MAX_CHUNK_BYTES
+from model_compression_toolkit.core.common.quantization.stats_convergence_config import StatsConvergenceConfig
+from model_compression_toolkit.core.common.quantization.stats_sampling_config import StatsSamplingConfig
 
 
 class QuantizationErrorMethod(Enum):
@@ -66,7 +68,12 @@ class QuantizationConfig:
                  shift_negative_ratio: float = 0.05,
                  shift_negative_threshold_recalculation: bool = False,
                  shift_negative_params_search: bool = False,
-                 concat_threshold_update: bool = False):
+                 concat_threshold_update: bool = False,
+                 num_stats_collection_workers: int = 1,
+                 stats_convergence_config: StatsConvergenceConfig = None,
+                 stats_sampling_config: StatsSamplingConfig = None,
+                 qparams_search_max_chunk_bytes: int = QPARAMS_SEARCH_MAX_CHUNK_BYTES,
+                 qparams_search_float32: bool = False):
         """
         Class to wrap all different parameters the library quantize the input model according to.
 
@@ -87,6 +94,11 @@ class QuantizationConfig:
             shift_negative_ratio (float): Value for the ratio between the minimal negative value of a non-linearity output to its activation threshold, which above it - shifting negative activation should occur if enabled.
             shift_negative_threshold_recalculation (bool): Whether or not to recompute the threshold after shifting negative activation.
             shift_negative_params_search (bool): Whether to search for optimal shift and threshold in shift negative activation.
+            num_stats_collection_workers (int): Number of local worker processes to collect statistics with (PyTorch only). Each worker collects statistics on a shard of the representative dataset, and the workers' statistics are merged.
+            stats_convergence_config (StatsConvergenceConfig): Configuration of an early stop of the statistics collection once the collected statistics converged. If None, the statistics are collected on the whole representative dataset.
+            stats_sampling_config (StatsSamplingConfig): Configuration of sampling large tensors for the histogram and mean statistics (the min/max statistics are collected on the full tensors). If None, all elements of the tensors are used.
+            qparams_search_max_chunk_bytes (int): Bound on the size (in bytes) of the arrays computed at once in the weights quantization parameters search and in the shift negative correction parameters search. The search candidates are evaluated in chunks that fit this bound.
+            qparams_search_float32 (bool): Whether to evaluate the weights quantization parameters search candidates in float32 instead of float64 (faster, but the selected parameters may slightly differ).
 
         Examples:
             One may create a quantization configuration to quantize a model according to.
@@ -122,6 +134,12 @@ class QuantizationConfig:
         self.shift_negative_threshold_recalculation = shift_negative_threshold_recalculation
         self.shift_negative_params_search = shift_negative_params_search
         self.concat_threshold_update = concat_threshold_update
+        assert num_stats_collection_workers >= 1, f'num_stats_collection_workers must be at least 1, but got {num_stats_collection_workers}.'
+        self.num_stats_collection_workers = num_stats_collection_workers
+        self.stats_convergence_config = stats_convergence_config
+        self.stats_sampling_config = stats_sampling_config
+        self.qparams_search_max_chunk_bytes = qparams_search_max_chunk_bytes
+        self.qparams_search_float32 = qparams_search_float32
 
     def __repr__(self):
         # Used for debugging, thus no cover.
@@ -12,8 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from copy import deepcopy
-from typing import Tuple, Callable, List
+from typing import Callable, List
 import numpy as np
 import model_compression_toolkit.core.common.quantization.quantization_config as qc
 from model_compression_toolkit.core.common.hessian import TraceHessianRequest, HessianMode, HessianInfoGranularity, \
@@ -22,73 +21,7 @@ from model_compression_toolkit.core.common.similarity_analyzer import compute_ms
 from model_compression_toolkit.target_platform_capabilities.target_platform import QuantizationMethod
 from model_compression_toolkit.constants import FLOAT_32, NUM_QPARAM_HESSIAN_SAMPLES
 from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import uniform_quantize_tensor, \
-    reshape_tensor_for_per_channel_search
-
-
-def _mse_error_histogram(q_bins: np.ndarray,
-                         q_count: np.ndarray,
-                         bins: np.ndarray,
-                         counts: np.ndarray) -> np.float32:
-    """
-    Compute the error function between a histogram to its quantized version.
-    The error is computed based on the mean square error the distributions have.
-
-    Args:
-        q_bins: Bins values of the quantized histogram.
-        q_count: Bins counts of the quantized histogram.
-        bins: Bins values of the original histogram.
-        counts: Bins counts of the original histogram.
-
-    Returns:
-        MSE between the two histograms.
-    """
-
-    return np.sum((np.power((q_bins - bins)[:-1], 2.0) * counts)) / np.sum(counts)
-
-
-def _mae_error_histogram(q_bins: np.ndarray,
-                         q_count: np.ndarray,
-                         bins: np.ndarray,
-                         counts: np.ndarray) -> np.ndarray:
-    """
-    Compute the error function between a histogram to its quantized version.
-    The error is computed using the mean absolute error between the two histograms.
-
-    Args:
-        q_bins: Bins values of the quantized histogram.
-        q_count: Bins counts of the quantized histogram.
-        bins: Bins values of the original histogram.
-        counts: Bins counts of the original histogram.
-
-    Returns:
-        Mean absolute error of the two histograms.
-    """
-
-    return np.sum((np.abs((q_bins - bins)[:-1]) * counts)) / np.sum(counts)
-
-
-def _lp_error_histogram(q_bins: np.ndarray,
-                        q_count: np.ndarray,
-                        bins: np.ndarray,
-                        counts: np.ndarray,
-                        p: int) -> np.float32:
-    """
-    Compute the error function between a histogram to its quantized version.
-    The error is computed based on the distance in Lp-norm between the two distributions.
-    The p-norm to use for the distance computing is passed.
-
-    Args:
-        q_bins: Bins values of the quantized histogram.
-        q_count: Bins counts of the quantized histogram.
-        bins: Bins values of the original histogram.
-        counts: Bins counts of the original histogram.
-        p: p-norm to use for the Lp-norm distance.
-
-    Returns:
-        The Lp-norm distance between the two histograms.
-    """
-
-    return np.sum((np.power(np.abs((q_bins - bins)[:-1]), p) * counts)) / np.sum(counts)
+    reshape_tensor_for_per_channel_search, fix_range_to_include_zero
 
 
 def _kl_error_function(x: np.ndarray,
@@ -132,15 +65,8 @@ def _kl_error_function(x: np.ndarray,
                                      range_max,
                                      n_bits)
 
-    # Sum all quantized values to a single bin of that value. Other bins of the same value
-    # are zero.
-    bcq, _ = np.histogram(q_bins,
-                          bins=bv,
-                          weights=np.concatenate([bc.flatten(), np.array([0])]))
-
     # compute error
     return _kl_error_histogram(q_bins,
-                               bcq,
                                bv,
                                bc,
                                range_min=range_min,
@@ -182,7 +108,6 @@ def _kl_error_function_wrapper(x: np.ndarray,
 
 
 def _kl_error_histogram(q_bins: np.ndarray,
-                        q_count: np.ndarray,
                         bins: np.ndarray,
                         counts: np.ndarray,
                         range_min: np.ndarray,
@@ -195,7 +120,6 @@ def _kl_error_histogram(q_bins: np.ndarray,
 
     Args:
         q_bins: Bins values of the quantized histogram.
-        q_count: Bins counts of the quantized histogram.
         bins: Bins values of the histogram.
         counts: Bins counts of the histogram.
         range_min: min bound on the quantization range.
@@ -205,173 +129,382 @@ def _kl_error_histogram(q_bins: np.ndarray,
         KL-divergence score between the two histograms.
     """
 
-    if not _is_range_valid(bins, range_min, range_max):
-        return np.inf
+    return _batch_kl_error_histogram(q_bins.reshape([1, -1]), bins, counts,
+                                     np.asarray([range_min]), np.asarray([range_max]))[0]
 
-    first_bin_idx, last_bin_idx = _get_bins_indices_from_range(bins, range_min, range_max)
 
-    if first_bin_idx == last_bin_idx:
-        return 0.0
+def _batch_mse_error_histogram(q_bins: np.ndarray,
+                               bins: np.ndarray,
+                               counts: np.ndarray) -> np.ndarray:
+    """
+    Compute the mean square error between a histogram to a batch of its quantized versions.
 
-    bins_subset, counts_subset = _get_sliced_histogram(bins,
-                                                       counts,
-                                                       first_bin_idx,
-                                                       last_bin_idx)
+    Args:
+        q_bins: Bins values of the quantized histograms, one quantized histogram per row.
+        bins: Bins values of the original histogram.
+        counts: Bins counts of the original histogram.
 
-    q_bins_subset, q_counts_subset = _get_sliced_histogram(q_bins,
-                                                           q_count,
-                                                           first_bin_idx,
-                                                           last_bin_idx)
+    Returns:
+        MSE between the histogram and each of the quantized histograms.
+    """
 
-    if not counts_subset.any():
-        return np.inf
+    errors = (q_bins - bins)[:, :-1]
+    return np.sum(errors * errors * counts, axis=-1) / np.sum(counts)
 
-    counts_acc = _compute_clipped_counts(counts,
-                                         counts_subset,
-                                         first_bin_idx,
-                                         last_bin_idx)
 
-    qbc = np.zeros(q_counts_subset.shape)
+def _batch_mae_error_histogram(q_bins: np.ndarray,
+                               bins: np.ndarray,
+                               counts: np.ndarray) -> np.ndarray:
+    """
+    Compute the mean absolute error between a histogram to a batch of its quantized versions.
 
-    for qbvui in np.unique(q_bins_subset):
-        q_status = q_bins_subset[:-1] == qbvui
-        positive_bins = (counts_subset[q_status] > 0).astype(FLOAT_32)
-        sum_relative = np.sum(counts_subset[q_status]) / (np.sum(positive_bins) + 1e-6)
-        qbc[q_status] = sum_relative * positive_bins
+    Args:
+        q_bins: Bins values of the quantized histograms, one quantized histogram per row.
+        bins: Bins values of the original histogram.
+        counts: Bins counts of the original histogram.
 
-    p_fxp = qbc / np.sum(qbc)
-    p_fxp = _smooth_distribution(p_fxp)
+    Returns:
+        Mean absolute error between the histogram and each of the quantized histograms.
+    """
 
-    p_float = counts_acc / np.sum(counts_acc)
-    p_float = _smooth_distribution(p_float)
+    return np.sum(np.abs((q_bins - bins)[:, :-1]) * counts, axis=-1) / np.sum(counts)
 
-    return np.sum(p_float * np.log(p_float / p_fxp))
 
+def _batch_lp_error_histogram(q_bins: np.ndarray,
+                              bins: np.ndarray,
+                              counts: np.ndarray,
+                              p: int) -> np.ndarray:
+    """
+    Compute the Lp-norm distance between a histogram to a batch of its quantized versions.
 
-def _get_bins_indices_from_range(bins: np.ndarray,
-                                 range_min: np.ndarray,
-                                 range_max: np.ndarray) -> Tuple[int, int]:
+    Args:
+        q_bins: Bins values of the quantized histograms, one quantized histogram per row.
+        bins: Bins values of the original histogram.
+        counts: Bins counts of the original histogram.
+        p: p-norm to use for the Lp-norm distance.
+
+    Returns:
+        The Lp-norm distance between the histogram and each of the quantized histograms.
+    """
+
+    return np.sum(np.power(np.abs((q_bins - bins)[:, :-1]), p) * counts, axis=-1) / np.sum(counts)
+
+
+def _histogram_quantization_levels(bins: np.ndarray,
+                                   range_min: np.ndarray,
+                                   range_max: np.ndarray,
+                                   n_bits: int,
+                                   n_edges_per_level: int):
     """
-    For bins and a threshold, compute the first and last bins in between the threshold
-    ranges.
+    Compute the quantization levels of a batch of quantization ranges that may hold bins of a histogram.
+    Since the histogram's bins are sorted, each level is the value of a contiguous run of bins, and the bins below
+    (above) the range are in the run of the lowest (highest) level. Runs of levels that hold no bins are empty.
+    Locating the runs' edges takes a binary search per edge, so the runs are used only if their edges are fewer
+    than the bins by more than the search's factor. That is, for low bit-widths (e.g., up to 6 bits for 2048 bins).
 
     Args:
-        bins: Bins to look for its first and last bins in the range.
-        range_min: min bound on the quantization range.
-        range_max: max bound on the quantization range.
+        bins: Bins values of the histogram.
+        range_min: Min bounds of the quantization ranges, one per candidate.
+        range_max: Max bounds of the quantization ranges, one per candidate.
+        n_bits: Number of bits the histogram is quantized by.
+        n_edges_per_level: Number of edges to locate per level.
 
     Returns:
-        First and last bins indices that are in a range.
+        The levels of the candidates, of shape (candidates, levels), and the candidates' quantization steps, of shape
+        (candidates, 1). None if a range is empty or quantizing the bins is cheaper than locating the runs.
+    """
+    values = bins[:-1]
+    a, b = fix_range_to_include_zero(np.asarray(range_min, dtype=np.float64).reshape([-1, 1]),
+                                     np.asarray(range_max, dtype=np.float64).reshape([-1, 1]), n_bits)
+    delta = (b - a) / (2 ** n_bits - 1)
+    if not np.all(delta > 0):
+        return None
+
+    # The levels of the bins' extreme values bound the levels that may hold bins.
+    first_level = np.clip(np.floor((values[0] - a) / delta), 0, 2 ** n_bits - 1)
+    last_level = np.clip(np.ceil((values[-1] - a) / delta), 0, 2 ** n_bits - 1)
+    n_levels = int(np.max(last_level - first_level)) + 1
+    if n_levels * n_edges_per_level * np.ceil(np.log2(len(values))) >= len(values):
+        return None
+
+    return a + np.minimum(first_level + np.arange(n_levels), 2 ** n_bits - 1) * delta, delta
+
+
+def _histogram_segments_moments(bins: np.ndarray,
+                                counts: np.ndarray,
+                                edges: np.ndarray,
+                                n_moments: int) -> List[np.ndarray]:
     """
-    assert range_min < range_max
-    first_bin_idx = max(np.where(bins >= range_min)[0].min() - 1, 0)
-    last_bin_idx = np.where(bins < range_max)[0].max()
-    assert first_bin_idx <= last_bin_idx
-    return first_bin_idx, last_bin_idx
+    Compute the moments of the counts of a histogram in the segments between sorted edges, from prefix sums of the
+    histogram's moments. A segment holds the bins from its lower edge (inclusive) to its upper edge (exclusive).
+    The first segment of each row starts at the lowest bin, and the last segment ends at the highest bin.
 
+    Args:
+        bins: Bins values of the histogram.
+        counts: Bins counts of the histogram.
+        edges: Upper edges of the segments, a row of sorted edges per candidate.
+        n_moments: Number of moments to compute.
 
-def _is_range_valid(bins: np.ndarray, range_min: np.ndarray, range_max: np.ndarray) -> bool:
+    Returns:
+        A list of the segments' moments (sum of counts, sum of counts times values, and so on), each of the edges'
+        shape.
     """
-    Check whether there are some bins from a numpy array of bins that are in between
-    a threshold range or not.
+    values = bins[:-1].astype(np.float64)
+    idx = np.searchsorted(values, edges.ravel()).reshape(edges.shape)
+    idx[:, -1] = len(values)
+
+    moments = []
+    weighted_counts = counts.astype(np.float64)
+    for _ in range(n_moments):
+        prefix_sum = np.concatenate([[0.0], np.cumsum(weighted_counts)])[idx]
+        moments.append(np.diff(prefix_sum, axis=-1, prepend=0.0))
+        weighted_counts = weighted_counts * values
+    return moments
+
+
+def _batch_mse_error_histogram_by_ranges(bins: np.ndarray,
+                                         counts: np.ndarray,
+                                         range_min: np.ndarray,
+                                         range_max: np.ndarray,
+                                         n_bits: int) -> np.ndarray:
+    """
+    Compute the mean square error between a histogram to its quantized versions by a batch of quantization ranges,
+    from the moments of the runs of bins that are quantized to the same level: a run of count S0, first moment S1
+    and second moment S2 that is quantized to q has a square error of S2 - 2 * q * S1 + q^2 * S0.
+
     Args:
-        bins: Bins to check.
-        range_min: min bound on the quantization range.
-        range_max: max bound on the quantization range.
+        bins: Bins values of the histogram.
+        counts: Bins counts of the histogram.
+        range_min: Min bounds of the quantization ranges, one per candidate.
+        range_max: Max bounds of the quantization ranges, one per candidate.
+        n_bits: Number of bits the histogram is quantized by.
 
     Returns:
-        Whether there are bins in the range or not.
+        MSE between the histogram and each of the quantized histograms, or None if the bins should be quantized
+        instead (see _histogram_quantization_levels).
     """
-    gt_range_bins = np.where(bins >= range_min)[0]
-    st_range_bins = np.where(bins < range_max)[0]
-    return not (len(gt_range_bins) == 0 or len(st_range_bins) == 0)
+    quantization_levels = _histogram_quantization_levels(bins, range_min, range_max, n_bits, n_edges_per_level=1)
+    if quantization_levels is None:
+        return None
+    levels, delta = quantization_levels
+
+    # A run ends at the rounding boundary above its level.
+    s0, s1, s2 = _histogram_segments_moments(bins, counts, levels + delta / 2, n_moments=3)
+    # Each run's error is non-negative, so negative values are due to cancellation.
+    errors = np.maximum(s2 - 2 * levels * s1 + levels * levels * s0, 0)
+    return np.sum(errors, axis=-1) / np.sum(s0, axis=-1)
+
+
+def _batch_mae_error_histogram_by_ranges(bins: np.ndarray,
+                                         counts: np.ndarray,
+                                         range_min: np.ndarray,
+                                         range_max: np.ndarray,
+                                         n_bits: int) -> np.ndarray:
+    """
+    Compute the mean absolute error between a histogram to its quantized versions by a batch of quantization ranges,
+    from the moments of the runs of bins that are quantized to the same level. Each run is split at its level q:
+    a part of count S0 and first moment S1 below q has an absolute error of q * S0 - S1, and the part above q has an
+    absolute error of S1 - q * S0.
 
+    Args:
+        bins: Bins values of the histogram.
+        counts: Bins counts of the histogram.
+        range_min: Min bounds of the quantization ranges, one per candidate.
+        range_max: Max bounds of the quantization ranges, one per candidate.
+        n_bits: Number of bits the histogram is quantized by.
 
-def _smooth_distribution(probability: np.ndarray) -> np.ndarray:
+    Returns:
+        Mean absolute error between the histogram and each of the quantized histograms, or None if the bins should
+        be quantized instead (see _histogram_quantization_levels).
     """
-    Smooth distribution by decreasing non-zeros counts evenly, and increasing zeros counts
-    by the total amount that was decreased.
-    More info: http://hanj.cs.illinois.edu/cs412/bk3/KL-divergence.pdf
+    quantization_levels = _histogram_quantization_levels(bins, range_min, range_max, n_bits, n_edges_per_level=2)
+    if quantization_levels is None:
+        return None
+    levels, delta = quantization_levels
+
+    # Each run is split into the segment below its level and the segment up to the rounding boundary above it.
+    # Levels that are repeated at the top of the range get empty segments.
+    edges = np.maximum.accumulate(np.stack([levels, levels + delta / 2], axis=-1).reshape([levels.shape[0], -1]),
+                                  axis=-1)
+    s0, s1 = [m.reshape(levels.shape + (2,)) for m in _histogram_segments_moments(bins, counts, edges, n_moments=2)]
+    errors = levels * (s0[..., 0] - s0[..., 1]) - s1[..., 0] + s1[..., 1]
+    return np.sum(errors, axis=-1) / np.sum(s0, axis=(-2, -1))
+
+
+def _batch_mse_error_tensor(x: np.ndarray, q_x: np.ndarray) -> np.ndarray:
+    """
+    Compute the mean square error between a tensor to a batch of its quantized versions (the quantized tensors are
+    overwritten).
 
     Args:
-        probability: A flatten Numpy array with probabilities.
+        x: Tensor values (reshaped to (channels, -1) for a per-channel error).
+        q_x: Quantized tensors, stacked on the first axis.
 
     Returns:
-        Numpy array of the smoothed distribution.
+        MSE between the tensor and each of the quantized tensors (per channel, for a per-channel error).
     """
 
-    # make sure the subtracted value is smaller than all current probabilities.
-    smoothing_term = np.min(probability[probability != 0]) / (2.0 * len(probability))
-    assert smoothing_term > 0
+    q_x -= x
+    q_x **= 2
+    return q_x.mean(axis=-1)
 
-    # Count the amount of zeros vs. nonzeros in the probability.
-    zeros_indices = (probability == 0).astype(FLOAT_32)
-    nonzeros_indices = (probability != 0).astype(FLOAT_32)
-    total_indices = probability.size
-    nonzero_count = nonzeros_indices.sum()
-    zero_counts = total_indices - nonzero_count
 
-    assert nonzero_count > 0, 'Can not smooth distribution that is all zeros'
-    reduce_to_fix = smoothing_term * float(zero_counts) / float(nonzero_count)
+def _batch_mae_error_tensor(x: np.ndarray, q_x: np.ndarray) -> np.ndarray:
+    """
+    Compute the mean absolute error between a tensor to a batch of its quantized versions (the quantized tensors are
+    overwritten).
 
-    # Compute correction term
-    hist = probability.astype(FLOAT_32)
-    correction_hist = smoothing_term * zeros_indices + (-reduce_to_fix) * nonzeros_indices
+    Args:
+        x: Tensor values (reshaped to (channels, -1) for a per-channel error).
+        q_x: Quantized tensors, stacked on the first axis.
 
-    hist += correction_hist  # apply correction
-    assert (hist <= 0).sum() == 0  # Make sure all probabilities are positive
+    Returns:
+        Mean absolute error between the tensor and each of the quantized tensors (per channel, for a per-channel
+        error).
+    """
 
-    return hist
+    q_x -= x
+    return np.abs(q_x, out=q_x).mean(axis=-1)
 
 
-def _compute_clipped_counts(counts: np.ndarray,
-                            counts_subset: np.ndarray,
-                            first_bin_idx: int,
-                            last_bin_idx: int) -> np.ndarray:
+def _batch_lp_error_tensor(x: np.ndarray, q_x: np.ndarray, p: int) -> np.ndarray:
     """
-    Compute a clipped Numpy array containing counts. All bins outside the range
-    between first_bin_idx and last_bin_idx are clipped.
-    A clipped histogram is a histogram where all bins that are out a given range
-    are accumulated to the first and last bins of the bins that are in that range.
+    Compute the Lp-norm distance between a tensor to a batch of its quantized versions (the quantized tensors are
+    overwritten).
 
     Args:
-        counts: Counts array of a histogram.
-        counts_subset: Subset of the counts array of a histogram.
-        first_bin_idx: First bin index of the range.
-        last_bin_idx: Last bin index of the range.
+        x: Tensor values (reshaped to (channels, -1) for a per-channel error).
+        q_x: Quantized tensors, stacked on the first axis.
+        p: p-norm to use for the Lp-norm distance.
 
     Returns:
-        A clipped histogram.
+        The Lp-norm distance between the tensor and each of the quantized tensors (per channel, for a per-channel
+        error).
     """
 
-    p_float_accumulated_edges = deepcopy(counts_subset)
-    p_float_accumulated_edges[0] += np.sum(counts[:first_bin_idx])
-    p_float_accumulated_edges[-1] += np.sum(counts[last_bin_idx:])
+    q_x -= x
+    np.abs(q_x, out=q_x)
+    q_x **= p
+    return q_x.mean(axis=-1)
 
-    return p_float_accumulated_edges
 
+def _batch_kl_error_histogram(q_bins: np.ndarray,
+                              bins: np.ndarray,
+                              counts: np.ndarray,
+                              range_min: np.ndarray,
+                              range_max: np.ndarray) -> np.ndarray:
+    """
+    Compute the KL-divergence between a histogram to a batch of its quantized versions, each quantized
+    by a different range.
+    All candidates are evaluated at once: the clipped edges counts are taken from prefix sums of the counts,
+    and the counts of each quantized bin value are summed with a single bincount over all candidates
+    (bins values are sorted, so bins that are quantized to the same value are contiguous).
 
-def _get_sliced_histogram(bins: np.ndarray,
-                          counts: np.ndarray,
-                          first_bin_idx: int,
-                          last_bin_idx: int) -> Tuple[np.ndarray, np.ndarray]:
+    Args:
+        q_bins: Bins values of the quantized histograms, one quantized histogram per row.
+        bins: Bins values of the histogram (sorted).
+        counts: Bins counts of the histogram.
+        range_min: min bounds on the quantization range, one per quantized histogram.
+        range_max: max bounds on the quantization range, one per quantized histogram.
+
+    Returns:
+        KL-divergence score between the histogram and each of the quantized histograms.
     """
-    Get a subset of a histogram. First and last bins to consider are passed.
+
+    n_candidates, n_counts = q_bins.shape[0], counts.shape[0]
+    range_min = np.broadcast_to(np.asarray(range_min, dtype=np.float64).flatten(), (n_candidates,))
+    range_max = np.broadcast_to(np.asarray(range_max, dtype=np.float64).flatten(), (n_candidates,))
+
+    # A range is valid if some bins are in between its bounds.
+    valid_range = np.logical_and(range_min < range_max,
+                                 np.logical_and(range_min <= bins.max(), range_max > bins.min()))
+
+    # First and last bins in each range.
+    first_bin_idx = np.maximum(np.searchsorted(bins, range_min, side='left') - 1, 0)
+    last_bin_idx = np.maximum(np.searchsorted(bins, range_max, side='left') - 1, first_bin_idx)
+    bins_indices = np.arange(n_counts)
+    in_range = np.logical_and(bins_indices >= first_bin_idx.reshape([-1, 1]),
+                              bins_indices < last_bin_idx.reshape([-1, 1]))
+    has_bins = last_bin_idx > first_bin_idx
+
+    counts_subset = counts.reshape([1, -1]) * in_range
+    has_counts = counts_subset.any(axis=-1)
+
+    # Clipped histogram: all counts out of the range are accumulated to the first and last bins in the range.
+    acc_counts = np.concatenate([[0], np.cumsum(counts)])
+    rows = np.arange(n_candidates)[has_bins]
+    counts_acc = counts_subset.astype(np.float64)
+    counts_acc[rows, first_bin_idx[has_bins]] += acc_counts[first_bin_idx[has_bins]]
+    counts_acc[rows, last_bin_idx[has_bins] - 1] += acc_counts[-1] - acc_counts[last_bin_idx[has_bins]]
+
+    # Spread the counts of each quantized value evenly over the bins with positive counts that are quantized to it.
+    q_values = q_bins[:, :-1]
+    q_values_groups = np.concatenate([np.zeros((n_candidates, 1), dtype=int),
+                                      np.cumsum(q_values[:, 1:] != q_values[:, :-1], axis=-1)], axis=-1)
+    q_values_groups = q_values_groups + n_counts * np.arange(n_candidates).reshape([-1, 1])
+    positive_bins = (counts_subset > 0).astype(FLOAT_32)
+    groups_counts = np.bincount(q_values_groups.flatten(), weights=counts_subset.flatten(),
+                                minlength=n_candidates * n_counts)
+    groups_positive = np.bincount(q_values_groups.flatten(), weights=positive_bins.flatten(),
+                                  minlength=n_candidates * n_counts)
+    qbc = groups_counts[q_values_groups] / (groups_positive[q_values_groups] + 1e-6) * positive_bins
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p_fxp = _batch_smooth_distribution(qbc / np.sum(qbc, axis=-1, keepdims=True), in_range)
+        p_float = _batch_smooth_distribution(counts_acc / np.sum(counts_acc, axis=-1, keepdims=True), in_range)
+        kl = np.sum(np.where(in_range, p_float * np.log(np.where(in_range, p_float / p_fxp, 1)), 0), axis=-1)
+
+    kl = np.where(has_counts, kl, np.inf)
+    kl = np.where(has_bins, kl, 0.0)
+    return np.where(valid_range, kl, np.inf)
+
+
+def _batch_smooth_distribution(probability: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """
+    Smooth a batch of distributions by decreasing non-zeros counts evenly, and increasing zeros counts
+    by the total amount that was decreased. Each row holds a distribution over the entries marked by the mask.
+    More info: http://hanj.cs.illinois.edu/cs412/bk3/KL-divergence.pdf
 
     Args:
-        bins: Histogram's bins to create its subset bins.
-        counts: Histogram's counts to create its subset counts.
-        first_bin_idx: First bin index to consider.
-        last_bin_idx: Last bin index to consider.
+        probability: Numpy array with probabilities, one distribution per row.
+        mask: Boolean Numpy array marking the entries of each row's distribution.
 
     Returns:
-        A sliced histogram.
+        Numpy array of the smoothed distributions.
     """
 
-    bins_subset = deepcopy(bins[first_bin_idx:last_bin_idx + 1])
-    counts_subset = deepcopy(counts[first_bin_idx:last_bin_idx])
+    nonzeros_indices = np.logical_and(probability != 0, mask)
+    zeros_indices = np.logical_and(probability == 0, mask)
+    total_indices = np.sum(mask, axis=-1, keepdims=True)
+    nonzero_count = np.sum(nonzeros_indices, axis=-1, keepdims=True)
+
+    # make sure the subtracted value is smaller than all current probabilities.
+    smoothing_term = np.min(np.where(nonzeros_indices, probability, np.inf), axis=-1, keepdims=True) / \
+                     (2.0 * total_indices)
+    reduce_to_fix = smoothing_term * (total_indices - nonzero_count) / nonzero_count
+
+    # Compute correction term
+    hist = probability.astype(FLOAT_32)
+    hist += smoothing_term * zeros_indices + (-reduce_to_fix) * nonzeros_indices
+
+    return hist
 
-    return bins_subset, counts_subset
+
+def _is_range_valid(bins: np.ndarray, range_min: np.ndarray, range_max: np.ndarray) -> bool:
+    """
+    Check whether there are some bins from a numpy array of bins that are in between
+    a threshold range or not.
+    Args:
+        bins: Bins to check.
+        range_min: min bound on the quantization range.
+        range_max: max bound on the quantization range.
+
+    Returns:
+        Whether there are bins in the range or not.
+    """
+    gt_range_bins = np.where(bins >= range_min)[0]
+    st_range_bins = np.where(bins < range_max)[0]
+    return not (len(gt_range_bins) == 0 or len(st_range_bins) == 0)
 
 
 def _compute_hessian_for_hmse(node,
@@ -490,30 +623,72 @@ def get_threshold_selection_tensor_error_function(quantization_method: Quantizat
     return quant_method_error_function_mapping[quant_error_method]
 
 
-def get_threshold_selection_histogram_error_function(quantization_method: QuantizationMethod,
-                                                     quant_error_method: qc.QuantizationErrorMethod,
-                                                     p: int) -> Callable:
+def get_threshold_selection_tensor_batch_error_function(quant_error_method: qc.QuantizationErrorMethod,
+                                                        p: int) -> Callable:
     """
-    Returns the error function compatible to the provided threshold method,
-    to be used in the threshold optimization search for histogram quantization.
+    Returns the error function compatible to the provided error method, to be used in the threshold optimization
+    search for tensor quantization, when a batch of candidates is evaluated at once.
+    The returned function gets the tensor (reshaped to (channels, -1) for a per-channel search), the quantized tensors
+    of the candidates (stacked on the first axis, and overwritten by the function) and the candidates' params, and
+    returns an error for each candidate (a row of per-channel errors, for a per-channel search).
+
+    Args:
+        quant_error_method: the requested error function type.
+        p: p-norm to use for the Lp-norm distance.
+
+    Returns: a Callable method that calculates the errors between a tensor and a batch of quantized tensors, or None
+    if the error method is not supported in a batch evaluation (KL and HMSE).
+    """
+    quant_method_error_function_mapping = {
+        qc.QuantizationErrorMethod.MSE: lambda x, q_x, _params: _batch_mse_error_tensor(x, q_x),
+        qc.QuantizationErrorMethod.MAE: lambda x, q_x, _params: _batch_mae_error_tensor(x, q_x),
+        qc.QuantizationErrorMethod.LP: lambda x, q_x, _params: _batch_lp_error_tensor(x, q_x, p=p),
+    }
+
+    return quant_method_error_function_mapping.get(quant_error_method)
+
+
+def get_threshold_selection_histogram_batch_error_function(quantization_method: QuantizationMethod,
+                                                           quant_error_method: qc.QuantizationErrorMethod,
+                                                           p: int,
+                                                           n_bits: int = None) -> Callable:
+    """
+    Returns the error function compatible to the provided threshold method, to be used in the threshold
+    optimization search for histogram quantization, when all candidates are evaluated at once.
+    The returned function gets a batch of quantized bins (one row per candidate), the original bins and counts,
+    and the candidates' thresholds and quantization ranges, and returns an error for each candidate.
+    If n_bits is passed, MSE and MAE errors are computed from the candidates' quantization ranges by prefix sums
+    of the histogram's moments, rather than from the quantized bins.
+
     Args:
         quantization_method: Quantization method for threshold selection
         quant_error_method: the requested error function type.
         p: p-norm to use for the Lp-norm distance.
+        n_bits: Number of bits the histogram is quantized by.
 
-    Returns: a Callable method that calculates the error between a tensor and a quantized tensor.
+    Returns: a Callable method that calculates the errors between a histogram and a batch of quantized histograms.
     """
+
+    def _by_ranges_or_bins(by_ranges_fn: Callable, by_bins_fn: Callable) -> Callable:
+        def _error_function(q_bins, bins, counts, threshold, _range):
+            errors = None
+            if n_bits is not None and _range is not None:
+                errors = by_ranges_fn(bins, counts, _range[:, 0], _range[:, 1], n_bits)
+            return by_bins_fn(q_bins, bins, counts) if errors is None else errors
+        return _error_function
+
     quant_method_error_function_mapping = {
-        qc.QuantizationErrorMethod.MSE: lambda q_bins, q_count, bins, counts, threshold, _range:
-        _mse_error_histogram(q_bins, q_count, bins, counts),
-        qc.QuantizationErrorMethod.MAE: lambda q_bins, q_count, bins, counts, threshold, _range:
-        _mae_error_histogram(q_bins, q_count, bins, counts),
-        qc.QuantizationErrorMethod.LP: lambda q_bins, q_count, bins, counts, threshold, _range:
-        _lp_error_histogram(q_bins, q_count, bins, counts, p=p),
+        qc.QuantizationErrorMethod.MSE: _by_ranges_or_bins(_batch_mse_error_histogram_by_ranges,
+                                                           _batch_mse_error_histogram),
+        qc.QuantizationErrorMethod.MAE: _by_ranges_or_bins(_batch_mae_error_histogram_by_ranges,
+                                                           _batch_mae_error_histogram),
+        qc.QuantizationErrorMethod.LP: lambda q_bins, bins, counts, threshold, _range:
+        _batch_lp_error_histogram(q_bins, bins, counts, p=p),
         qc.QuantizationErrorMethod.KL:
-            lambda q_bins, q_count, bins, counts, threshold, _range: _kl_error_histogram(q_bins, q_count, bins, counts, _range[0], _range[1])
+            lambda q_bins, bins, counts, threshold, _range: _batch_kl_error_histogram(q_bins, bins, counts,
+                                                                                      _range[:, 0], _range[:, 1])
             if quantization_method == QuantizationMethod.UNIFORM
-            else _kl_error_histogram(q_bins, q_count, bins, counts, -threshold, threshold)
+            else _batch_kl_error_histogram(q_bins, bins, counts, -threshold, threshold)
     }
 
     return quant_method_error_function_mapping[quant_error_method]
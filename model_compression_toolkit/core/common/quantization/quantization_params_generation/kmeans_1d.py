@@ -0,0 +1,132 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import numpy as np
+
+
+def weighted_kmeans_1d(data: np.ndarray,
+                       n_clusters: int,
+                       sample_weight: np.ndarray = None,
+                       max_exact_values: int = 1024,
+                       n_iter: int = 300) -> np.ndarray:
+    """
+    Weighted k-means clustering of 1-D data.
+    The data is reduced to its sorted unique values (weighted by their total weight). If there are at most
+    max_exact_values unique values, the optimal clustering is found with dynamic programming (see
+    _optimal_weighted_kmeans_1d). Otherwise, the unique values are grouped into max_exact_values contiguous chunks,
+    the chunks (represented by their weighted means) are clustered optimally, and the resulting centers are refined
+    with weighted Lloyd iterations over all unique values.
+
+    Args:
+        data: Values to cluster (flattened before clustering).
+        n_clusters: Maximal number of clusters. If there are fewer unique values with positive weight, each
+            such value is a cluster of its own.
+        sample_weight: Weight of each value (the same shape as data). If None, all values have weight 1.
+        max_exact_values: Maximal number of points to cluster with dynamic programming.
+        n_iter: Maximal number of Lloyd iterations to refine the centers with.
+
+    Returns:
+        Sorted cluster centers of shape (n_clusters, 1).
+    """
+    data = data.flatten()
+    sample_weight = np.ones_like(data, dtype=np.float64) if sample_weight is None else sample_weight.flatten()
+
+    values, inverse = np.unique(data[sample_weight > 0], return_inverse=True)
+    weights = np.bincount(inverse, weights=sample_weight[sample_weight > 0])
+    n_values = len(values)
+    if n_values <= n_clusters:
+        return values.reshape([-1, 1]).astype(np.float64)
+    if n_values <= max_exact_values:
+        return _optimal_weighted_kmeans_1d(values, weights, n_clusters).reshape([-1, 1])
+
+    # Initial centers: the optimal clustering of the values aggregated in evenly-spaced bins. When the values are
+    # too concentrated for n_clusters bins to be non-empty (e.g., a few outliers far from all other values), the
+    # values are aggregated in bins with equal numbers of values instead, so there are always n_clusters centers.
+    n_chunks = max(max_exact_values, n_clusters)
+    chunks = np.minimum(((values - values[0]) / (values[-1] - values[0]) * n_chunks).astype(int), n_chunks - 1)
+    chunks_weights = np.bincount(chunks, weights=weights)
+    if np.count_nonzero(chunks_weights) < n_clusters:
+        chunks = np.arange(n_values) * n_chunks // n_values
+        chunks_weights = np.bincount(chunks, weights=weights)
+    chunks_means = np.bincount(chunks, weights=weights * values)[chunks_weights > 0] / chunks_weights[chunks_weights > 0]
+    chunks_weights = chunks_weights[chunks_weights > 0]
+    centers = _optimal_weighted_kmeans_1d(chunks_means, chunks_weights, n_clusters)
+
+    # Lloyd iterations: in 1-D, the values closest to each center are in between the midpoints to its neighbours.
+    for _ in range(n_iter):
+        assignments = np.searchsorted((centers[1:] + centers[:-1]) / 2, values)
+        clusters_weights = np.bincount(assignments, weights=weights, minlength=n_clusters)
+        clusters_sums = np.bincount(assignments, weights=weights * values, minlength=n_clusters)
+        # Clusters that lost all their values keep their previous center.
+        new_centers = np.where(clusters_weights > 0, clusters_sums / np.maximum(clusters_weights, 1e-300), centers)
+        if np.array_equal(new_centers, centers):
+            break
+        centers = new_centers
+
+    return centers.reshape([-1, 1])
+
+
+def _optimal_weighted_kmeans_1d(values: np.ndarray,
+                                weights: np.ndarray,
+                                n_clusters: int) -> np.ndarray:
+    """
+    Exact weighted k-means clustering of sorted unique 1-D values.
+    In 1-D every cluster of the optimal clustering is a contiguous range of the sorted values, so the optimal
+    clustering is found with dynamic programming, where the cost of each range is computed in O(1) from prefix sums
+    of the weights. The result is the global minimum of the weighted sum of squared distances (which iterative
+    k-means only approximates).
+
+    Args:
+        values: Sorted unique values to cluster.
+        weights: Positive weight of each value.
+        n_clusters: Number of clusters (smaller than the number of values).
+
+    Returns:
+        Sorted cluster centers.
+    """
+    n_values = len(values)
+
+    # Center the values to avoid cancellation errors in the clusters costs computation.
+    shifted_values = values - np.sum(weights * values) / np.sum(weights)
+    acc_weights = np.concatenate([[0], np.cumsum(weights)])
+    acc_values = np.concatenate([[0], np.cumsum(weights * shifted_values)])
+    acc_squares = np.concatenate([[0], np.cumsum(weights * shifted_values ** 2)])
+
+    # costs[i, j] is the weighted sum of squared distances of the values i, ..., j-1 from their mean.
+    first, last = np.triu_indices(n_values + 1, k=1)
+    costs = np.full((n_values + 1, n_values + 1), np.inf)
+    costs[first, last] = np.maximum(acc_squares[last] - acc_squares[first] -
+                                    (acc_values[last] - acc_values[first]) ** 2 /
+                                    (acc_weights[last] - acc_weights[first]), 0)
+
+    # min_costs[j] is the minimal cost of clustering the first j values into the current number of clusters,
+    # and splits[k][j] is the first value of the last cluster in that clustering.
+    min_costs = costs[0]
+    splits = [np.zeros(n_values + 1, dtype=int)]
+    total_costs = np.empty_like(costs)
+    for _ in range(1, n_clusters):
+        np.add(min_costs.reshape([-1, 1]), costs, out=total_costs)
+        splits.append(np.argmin(total_costs, axis=0))
+        min_costs = total_costs[splits[-1], np.arange(n_values + 1)]
+
+    # Backtrack the clusters from the last one.
+    centers = []
+    cluster_end = n_values
+    for cluster_splits in reversed(splits):
+        cluster_start = cluster_splits[cluster_end]
+        centers.append(np.sum(weights[cluster_start:cluster_end] * values[cluster_start:cluster_end]) /
+                       np.sum(weights[cluster_start:cluster_end]))
+        cluster_end = cluster_start
+
+    return np.asarray(centers[::-1])
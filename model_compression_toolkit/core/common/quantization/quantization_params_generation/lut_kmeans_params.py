@@ -15,11 +15,10 @@
 
 from typing import Dict
 import numpy as np
-from sklearn.cluster import KMeans
 
 import model_compression_toolkit.core.common.quantization.quantization_config as qc
 from model_compression_toolkit.constants import LUT_VALUES, MIN_THRESHOLD, SCALE_PER_CHANNEL, \
-    LUT_VALUES_BITWIDTH, THRESHOLD, NUM_QPARAM_HESSIAN_SAMPLES
+    LUT_VALUES_BITWIDTH, THRESHOLD, NUM_QPARAM_HESSIAN_SAMPLES, QPARAMS_SEARCH_MAX_CHUNK_BYTES
 from model_compression_toolkit.core.common.hessian import HessianInfoService
 from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import \
     max_power_of_two, int_quantization_with_threshold
@@ -27,6 +26,8 @@ from model_compression_toolkit.core.common.quantization.quantization_params_gene
     symmetric_selection_tensor
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.power_of_two_selection import \
     power_of_two_selection_tensor
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.kmeans_1d import \
+    weighted_kmeans_1d
 
 from model_compression_toolkit.logger import Logger
 
@@ -42,12 +43,15 @@ def lut_kmeans_tensor(tensor_data: np.ndarray,
                       is_symmetric: bool = False,
                       node=None,
                       hessian_info_service: HessianInfoService = None,
-                      num_hessian_samples: int = NUM_QPARAM_HESSIAN_SAMPLES) -> Dict:
+                      num_hessian_samples: int = NUM_QPARAM_HESSIAN_SAMPLES,
+                      max_chunk_bytes: int = QPARAMS_SEARCH_MAX_CHUNK_BYTES,
+                      use_float32: bool = False) -> Dict:
     """
     The quantizer first finds the closest max value per channel of tensor_data.
     Now, we divide tensor_data with the threshold vector per channel. In addition, we scale the result to the range
     [-2^(LUT_VALUES_BITWIDTH-1), 2^(LUT_VALUES_BITWIDTH-1)-1].
-    Next, we take the scaled tensor_data and perform k-means clustering with 2^nbit clusters.
+    Next, we take the scaled tensor_data and perform k-means clustering with 2^nbit clusters (an exact 1-D
+    clustering over the unique values of the scaled tensor, weighted by their number of occurrences).
     We return the rounded cluster centers, and threshold per channel. We use these to quantize the data.
     Args:
         tensor_data: Tensor content as Numpy array.
@@ -62,6 +66,8 @@ def lut_kmeans_tensor(tensor_data: np.ndarray,
         node: The node for which the quantization error is computed (not used for this method).
         hessian_info_service: HessianInfoService object for retrieving Hessian-based scores (not used for this method).
         num_hessian_samples: Number of samples to approximate Hessian-based scores on (not used for this method).
+        max_chunk_bytes: Bound on the size (in bytes) of the arrays computed at once during the parameters search (not used for this method).
+        use_float32: Whether to evaluate the search candidates in float32 (not used for this method).
 
     Returns:
         A dictionary containing the cluster assignments according to the k-means algorithm,
@@ -74,7 +80,6 @@ def lut_kmeans_tensor(tensor_data: np.ndarray,
         n_clusters = len(np.unique(tensor_data.flatten()))
     else:
         n_clusters = 2 ** n_bits
-    kmeans = KMeans(n_clusters=n_clusters, n_init=10)
 
     threshold_selection_tensor = symmetric_selection_tensor if is_symmetric else power_of_two_selection_tensor
     thresholds_per_channel = threshold_selection_tensor(tensor_data, p, n_bits, per_channel,
@@ -82,10 +87,10 @@ def lut_kmeans_tensor(tensor_data: np.ndarray,
                                                         qc.QuantizationErrorMethod.NOCLIPPING)[THRESHOLD]
 
     tensor_for_kmeans = int_quantization_with_threshold(tensor_data, thresholds_per_channel, LUT_VALUES_BITWIDTH)
-    kmeans.fit(tensor_for_kmeans.reshape(-1, 1))
+    cluster_centers = weighted_kmeans_1d(tensor_for_kmeans, n_clusters)
 
     # Add 0 to the LUT
-    cc = np.round(kmeans.cluster_centers_)
+    cc = np.round(cluster_centers)
     closest2zero_idx = (np.abs(cc - 0)).argmin()
     cc[closest2zero_idx] = 0.0
 
@@ -107,7 +112,8 @@ def lut_kmeans_histogram(bins: np.ndarray,
     Finds quantization cluster points for non-uniform activation quantization.
     The quantizer first finds the closest power-of-two number to the max value of the given histogram,
     and scales the bins within 8-bit quantization range.
-    Next, it performs a weighted k-means clustering with 2^nbit clusters (using the histogram counts as weights).
+    Next, it performs a weighted k-means clustering with 2^nbit clusters (using the histogram counts as weights),
+    which is an exact 1-D clustering over the unique scaled bins values.
     Returns the rounded cluster centers, and 8-bit quantization threshold.
 
     Args:
@@ -136,13 +142,12 @@ def lut_kmeans_histogram(bins: np.ndarray,
     else:
         n_clusters = 2 ** n_bits
 
-    kmeans = KMeans(n_clusters=n_clusters, n_init=10)
     tensor_max = np.max(bins_with_values)
     threshold = max_power_of_two(tensor_max, min_threshold)
 
     signed = np.any(bins[:-1][counts != 0] < 0)  # Whether histogram contains negative values or not.
     tensor_for_kmeans = int_quantization_with_threshold(data=bins, threshold=threshold, n_bits=LUT_VALUES_BITWIDTH, signed=signed)
-    kmeans.fit(tensor_for_kmeans.reshape(-1, 1), sample_weight=np.insert(counts, 0, 0))
+    cluster_centers = weighted_kmeans_1d(tensor_for_kmeans, n_clusters, sample_weight=np.insert(counts, 0, 0))
 
-    return {LUT_VALUES: np.float32(np.round(kmeans.cluster_centers_)),
+    return {LUT_VALUES: np.float32(np.round(cluster_centers)),
             THRESHOLD: threshold}
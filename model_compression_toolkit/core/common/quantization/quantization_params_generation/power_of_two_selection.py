@@ -15,13 +15,15 @@
 import numpy as np
 
 import model_compression_toolkit.core.common.quantization.quantization_config as qc
-from model_compression_toolkit.constants import MIN_THRESHOLD, THRESHOLD, NUM_QPARAM_HESSIAN_SAMPLES
+from model_compression_toolkit.constants import MIN_THRESHOLD, THRESHOLD, NUM_QPARAM_HESSIAN_SAMPLES, \
+    QPARAMS_SEARCH_MAX_CHUNK_BYTES
 from model_compression_toolkit.core.common.hessian import HessianInfoService
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search import \
     qparams_selection_tensor_search, qparams_selection_histogram_search
 from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import max_power_of_two, get_tensor_max
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.error_functions import \
-    get_threshold_selection_tensor_error_function, get_threshold_selection_histogram_error_function
+    get_threshold_selection_tensor_error_function, get_threshold_selection_histogram_batch_error_function, \
+    get_threshold_selection_tensor_batch_error_function
 from model_compression_toolkit.target_platform_capabilities.target_platform import QuantizationMethod
 
 
@@ -36,6 +38,8 @@ def power_of_two_selection_tensor(tensor_data: np.ndarray,
                                   node=None,
                                   hessian_info_service: HessianInfoService = None,
                                   num_hessian_samples: int = NUM_QPARAM_HESSIAN_SAMPLES,
+                                  max_chunk_bytes: int = QPARAMS_SEARCH_MAX_CHUNK_BYTES,
+                                  use_float32: bool = False,
                                   ) -> dict:
     """
     Compute the power of two threshold based on the provided QuantizationErrorMethod to quantize the tensor.
@@ -53,6 +57,8 @@ def power_of_two_selection_tensor(tensor_data: np.ndarray,
         node: The node for which the quantization error is computed (used only with HMSE error method).
         hessian_info_service: HessianInfoService object for retrieving Hessian-based scores (used only with HMSE error method).
         num_hessian_samples: Number of samples to approximate Hessian-based scores on (used only with HMSE error method).
+        max_chunk_bytes: Bound on the size (in bytes) of the arrays computed at once during the parameters search.
+        use_float32: Whether to evaluate the search candidates in float32 (MSE, MAE and Lp error methods only).
 
     Returns:
         Power of two threshold to quantize the tensor in a power of 2 manner.
@@ -63,12 +69,15 @@ def power_of_two_selection_tensor(tensor_data: np.ndarray,
         threshold = max_power_of_two(tensor_max, min_threshold)
     else:
         signed = True  # weights are always signed
-        axis = -1 if per_channel else None
-        error_function = get_threshold_selection_tensor_error_function(QuantizationMethod.POWER_OF_TWO,
-                                                                       quant_error_method, p, axis=axis, norm=False,
-                                                                       n_bits=n_bits, signed=signed, node=node,
-                                                                       hessian_info_service=hessian_info_service,
-                                                                       num_hessian_samples=num_hessian_samples)
+        error_function = get_threshold_selection_tensor_batch_error_function(quant_error_method, p)
+        vectorized_loss = error_function is not None
+        if not vectorized_loss:
+            axis = -1 if per_channel else None
+            error_function = get_threshold_selection_tensor_error_function(QuantizationMethod.POWER_OF_TWO,
+                                                                           quant_error_method, p, axis=axis, norm=False,
+                                                                           n_bits=n_bits, signed=signed, node=node,
+                                                                           hessian_info_service=hessian_info_service,
+                                                                           num_hessian_samples=num_hessian_samples)
         threshold = qparams_selection_tensor_search(error_function,
                                                     tensor_data,
                                                     n_bits,
@@ -76,7 +85,10 @@ def power_of_two_selection_tensor(tensor_data: np.ndarray,
                                                     channel_axis=channel_axis,
                                                     n_iter=n_iter,
                                                     min_threshold=min_threshold,
-                                                    signed=signed)
+                                                    signed=signed,
+                                                    vectorized_loss=vectorized_loss,
+                                                    max_chunk_bytes=max_chunk_bytes,
+                                                    use_float32=use_float32)
     return {THRESHOLD: threshold}
 
 
@@ -113,8 +125,9 @@ def power_of_two_selection_histogram(bins: np.ndarray,
         tensor_max = np.max(np.abs(bins)[1:][counts > 0])
         threshold = max_power_of_two(tensor_max, min_threshold)
     else:
-        error_function = get_threshold_selection_histogram_error_function(QuantizationMethod.POWER_OF_TWO,
-                                                                          quant_error_method, p)
+        error_function = get_threshold_selection_histogram_batch_error_function(QuantizationMethod.POWER_OF_TWO,
+                                                                                quant_error_method, p,
+                                                                                n_bits=n_bits)
         threshold = qparams_selection_histogram_search(error_function,
                                                        bins,
                                                        counts,
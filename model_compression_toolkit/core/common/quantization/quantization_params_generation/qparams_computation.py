@@ -21,6 +21,7 @@ from model_compression_toolkit.constants import NUM_QPARAM_HESSIAN_SAMPLES
 from model_compression_toolkit.core import QuantizationErrorMethod
 from model_compression_toolkit.core.common import Graph, BaseNode
 from model_compression_toolkit.core.common.hessian import HessianInfoService
+from model_compression_toolkit.core.common.profiler import Profiler
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_activations_computation \
     import get_activations_qparams
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_weights_computation import \
@@ -58,7 +59,12 @@ def calculate_quantization_params(graph: Graph,
     # Create a list of nodes to compute their thresholds
     nodes_list: List[BaseNode] = nodes if specific_nodes else graph.nodes()
 
-    for n in tqdm(nodes_list, "Calculating quantization parameters"):  # iterate only nodes that we should compute their thresholds
+    for n in Profiler.profile_each(tqdm(nodes_list, "Calculating quantization parameters"), lambda n: n.name):  # iterate only nodes that we should compute their thresholds
+        # Candidates of a mixed-precision node often share the same weights attribute or activation configuration
+        # (e.g., activation-only MP candidates with a single kernel bit-width). We cache the computed params by the
+        # effective quantization configuration, so each distinct parameters search runs once per node.
+        weights_params_cache = {}
+        activation_params_cache = {}
         for candidate_qc in n.candidates_quantization_cfg:
             for attr in n.get_node_weights_attributes():
                 if n.is_weights_quantization_enabled(attr):
@@ -84,20 +90,37 @@ def calculate_quantization_params(graph: Graph,
                             mod_attr_cfg = copy.deepcopy(attr_cfg)
                             mod_attr_cfg.weights_error_method = QuantizationErrorMethod.MSE
 
-                    weights_params = get_weights_qparams(n.get_weights_by_keys(attr),
-                                                         candidate_qc.weights_quantization_cfg,
-                                                         mod_attr_cfg,
-                                                         output_channels_axis,
-                                                         node=n,
-                                                         hessian_info_service=hessian_info_service,
-                                                         num_hessian_samples=num_hessian_samples)
+                    cache_key = (attr, mod_attr_cfg, candidate_qc.weights_quantization_cfg.min_threshold,
+                                 candidate_qc.weights_quantization_cfg.qparams_search_float32)
+                    if cache_key in weights_params_cache:
+                        weights_params = copy.deepcopy(weights_params_cache[cache_key])
+                    else:
+                        weights_params = get_weights_qparams(n.get_weights_by_keys(attr),
+                                                             candidate_qc.weights_quantization_cfg,
+                                                             mod_attr_cfg,
+                                                             output_channels_axis,
+                                                             node=n,
+                                                             hessian_info_service=hessian_info_service,
+                                                             num_hessian_samples=num_hessian_samples)
+                        weights_params_cache[cache_key] = weights_params
                     attr_cfg.set_weights_quantization_param(weights_params)
 
             if n.is_activation_quantization_enabled():
-                # If node's activations should be quantized as well, we compute its activation quantization parameters
-                activation_params = get_activations_qparams(
-                    activation_quant_cfg=candidate_qc.activation_quantization_cfg,
-                    nodes_prior_info=n.prior_info,
-                    out_stats_container=graph.get_out_stats_collector(n))
+                # If node's activations should be quantized as well, we compute its activation quantization parameters.
+                # The cache key is taken before computing the params, since the computation may replace the
+                # configuration's params function (for nodes with a bounded output).
+                activation_cfg = candidate_qc.activation_quantization_cfg
+                cache_key = copy.copy(activation_cfg)
+                if cache_key in activation_params_cache:
+                    activation_params, params_fn = activation_params_cache[cache_key]
+                    activation_params = copy.deepcopy(activation_params)
+                    activation_cfg.set_activation_quantization_params_fn(params_fn)
+                else:
+                    activation_params = get_activations_qparams(
+                        activation_quant_cfg=activation_cfg,
+                        nodes_prior_info=n.prior_info,
+                        out_stats_container=graph.get_out_stats_collector(n))
+                    activation_params_cache[cache_key] = (activation_params,
+                                                          activation_cfg.activation_quantization_params_fn)
                 # Create a NodeQuantizationConfig containing all quantization params and attach it to the node
-                candidate_qc.activation_quantization_cfg.set_activation_quantization_param(activation_params)
+                activation_cfg.set_activation_quantization_param(activation_params)
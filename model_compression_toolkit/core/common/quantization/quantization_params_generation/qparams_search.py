@@ -23,9 +23,10 @@ from model_compression_toolkit.constants import MIN_THRESHOLD, DEFAULT_TOL, DEFA
     SYMMETRIC_TENSOR_PER_CHANNEL_DEC_FREQ, SYMMETRIC_TENSOR_N_INTERVALS, SYMMETRIC_TENSOR_N_ITER, \
     UNIFORM_TENSOR_PER_CHANNEL_N_ITER, UNIFORM_TENSOR_N_ITER, SYMMETRIC_HISTOGRAM_DEC_FREQ, SYMMETRIC_HISTOGRAM_N_ITER, \
     SYMMETRIC_HISTOGRAM_N_INTERVALS, UNIFORM_HISTOGRAM_N_ITER, BOTTOM_FACTOR, UPPER_FACTOR, UNIFORM_TENSOR_N_SAMPLES, \
-    UNIFORM_HISTOGRAM_N_SAMPLES, DEC_RANGE_UPPER, DEC_RANGE_BOTTOM
+    UNIFORM_HISTOGRAM_N_SAMPLES, DEC_RANGE_UPPER, DEC_RANGE_BOTTOM, QPARAMS_SEARCH_MAX_CHUNK_BYTES
 from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import quantize_tensor, \
-    reshape_tensor_for_per_channel_search, uniform_quantize_tensor, get_output_shape
+    reshape_tensor_for_per_channel_search, uniform_quantize_tensor, get_output_shape, calculate_min_max_values, \
+    fix_range_to_include_zero
 from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import max_power_of_two, \
     get_tensor_max
 
@@ -37,7 +38,10 @@ def qparams_selection_tensor_search(error_function: Callable,
                                     channel_axis: int = 1,
                                     n_iter: int = 10,
                                     min_threshold=MIN_THRESHOLD,
-                                    signed: bool = True) -> Any:
+                                    signed: bool = True,
+                                    vectorized_loss: bool = False,
+                                    max_chunk_bytes: int = QPARAMS_SEARCH_MAX_CHUNK_BYTES,
+                                    use_float32: bool = False) -> Any:
     """
     Search for an optimal threshold to quantize a tensor.
     The search_methods starts with the constrained no-clipping threshold the tensor has, and continues with
@@ -54,6 +58,10 @@ def qparams_selection_tensor_search(error_function: Callable,
         n_iter: Number of searching iterations.
         min_threshold: Threshold to return if the computed threshold is smaller that min_threshold.
         signed: a flag whether the tensor is signed.
+        vectorized_loss: Whether error_function computes the errors of a batch of candidates at once (gets the
+            quantized tensors of the candidates stacked on the first axis).
+        max_chunk_bytes: Bound on the size (in bytes) of the quantized tensors computed at once in a vectorized search.
+        use_float32: Whether to evaluate the candidates in float32 in a vectorized search.
 
     Returns:
         Optimal constrained threshold to quantize the tensor.
@@ -71,24 +79,37 @@ def qparams_selection_tensor_search(error_function: Callable,
     if per_channel:
         tensor_data_r = reshape_tensor_for_per_channel_search(tensor_data, channel_axis)
 
-    error_list = []  # init an empty error list
-    # On each iteration a new constrained threshold which equal to half of the previous tested threshold
-    # is used for quantizing the tensor and computing the error. The error is appended to an error list, which
-    # eventually used to select the threshold with the minimal error.
-    for i in range(n_iter):
+    if vectorized_loss:
+        # All the constrained thresholds (each one is half of the previous tested threshold) are evaluated at once,
+        # with a row of thresholds per candidate (a threshold per channel, if the search is per-channel).
+        thresholds = np.reshape(threshold, [1, -1]) / np.power(2, np.arange(n_iter)).reshape([-1, 1])
+        search_dtype = _get_search_dtype(tensor_data, per_channel, use_float32)
         if per_channel:
-            threshold_hat = (threshold / (2 ** i)).reshape([-1, 1])
-            qt = quantize_tensor(tensor_data_r, threshold_hat, n_bits, signed)
-            per_channel_error = _error_function_wrapper(error_function, tensor_data_r, qt, threshold_hat)
-
-            error_list.append(per_channel_error)
-        else:  # quantize per-tensor
-            qt = quantize_tensor(tensor_data, threshold / (2 ** i), n_bits, signed)
-            error = error_function(qt, tensor_data, threshold=threshold / (2 ** i))
-            error_list.append(error)
-
-    # Take the index of the minimal error, and use it compute the threshold which yielded it.
-    i = np.argmin(np.stack(error_list, axis=-1), axis=-1)
+            errors = _compute_thresholds_losses(error_function, tensor_data_r, thresholds, n_bits, signed,
+                                                max_chunk_bytes, search_dtype)
+        else:
+            errors = _compute_thresholds_losses(error_function, tensor_data.flatten(), thresholds[:, 0], n_bits,
+                                                signed, max_chunk_bytes, search_dtype)
+        i = np.argmin(errors, axis=0)
+    else:
+        error_list = []  # init an empty error list
+        # On each iteration a new constrained threshold which equal to half of the previous tested threshold
+        # is used for quantizing the tensor and computing the error. The error is appended to an error list, which
+        # eventually used to select the threshold with the minimal error.
+        for i in range(n_iter):
+            if per_channel:
+                threshold_hat = (threshold / (2 ** i)).reshape([-1, 1])
+                qt = quantize_tensor(tensor_data_r, threshold_hat, n_bits, signed)
+                per_channel_error = _error_function_wrapper(error_function, tensor_data_r, qt, threshold_hat)
+
+                error_list.append(per_channel_error)
+            else:  # quantize per-tensor
+                qt = quantize_tensor(tensor_data, threshold / (2 ** i), n_bits, signed)
+                error = error_function(qt, tensor_data, threshold=threshold / (2 ** i))
+                error_list.append(error)
+
+        # Take the index of the minimal error, and use it compute the threshold which yielded it.
+        i = np.argmin(np.stack(error_list, axis=-1), axis=-1)
 
     return np.maximum(np.reshape(threshold.flatten() / np.power(2, i), output_shape), min_threshold)
 
@@ -103,12 +124,13 @@ def qparams_selection_histogram_search(error_function: Callable,
     """
     Search for an optimal threshold to quantize a histogram of collected float values.
     The search_methods starts with the constrained no-clipping threshold by the bins' maximal value, and continues with
-    n_iter another smaller constrained thresholds. For each candidate threshold, an error is computed
-    based on the passed error function, and the threshold which yields the minimal error is selected
-    and returned.
+    n_iter another smaller constrained thresholds. The histogram is quantized by all candidate thresholds at once,
+    an error is computed for each of them based on the passed error function, and the threshold which yields the
+    minimal error is selected and returned.
 
     Args:
-        error_function: Function to compute the error between the original and quantized histograms.
+        error_function: Function to compute the errors between the original histogram and a batch of quantized
+            histograms.
         bins: Bins of the histogram to search_methods for an optimal threshold.
         counts: Number of elements in the bins to search_methods for a threshold.
         n_bits: Number of bits to quantize the tensor.
@@ -128,18 +150,18 @@ def qparams_selection_histogram_search(error_function: Callable,
         return tensor_max
     threshold = (1 + int(constrained)) * max_power_of_two(tensor_max, min_threshold=min_threshold)
 
-    # Init a list of thresholds.
-    error_list = []
+    # Init a list of thresholds. Each constrained threshold is equal to half of the previous tested threshold.
     threshold_list = threshold / np.power(2, np.linspace(0, n_iter - 1, n_iter))
 
-    # On each iteration a new constrained threshold which equal to half of the previous tested threshold
-    # is used for quantizing the histogram and computing the error. The error is appended to an error list, which
-    # eventually used to select the threshold with the minimal error.
-    for threshold in threshold_list:
-        q_bins = quantize_tensor(bins, threshold, n_bits, signed)  # compute the quantized values of the bins.
-        error = qparams_selection_histogram_search_error_function(error_function, bins, q_bins, counts,
-                                                                  threshold=threshold)
-        error_list.append(error)
+    # Quantize the histogram by all thresholds at once (a row of quantized bins per threshold), and compute
+    # the errors of all thresholds, which are eventually used to select the threshold with the minimal error.
+    q_bins = quantize_tensor(bins, threshold_list.reshape([-1, 1]), n_bits, signed)
+    error_list = qparams_selection_histogram_search_error_function(error_function, bins, q_bins, counts,
+                                                                   threshold=threshold_list,
+                                                                   min_max_range=np.stack(
+                                                                       calculate_min_max_values(threshold_list,
+                                                                                                n_bits, signed),
+                                                                       axis=-1))
 
     # Return the threshold with the minimal error.
     return np.maximum(threshold_list[np.argmin(error_list)], min_threshold)
@@ -157,7 +179,10 @@ def qparams_symmetric_iterative_minimization(x0: np.ndarray,
                                              dec_factor: Tuple = DEFAULT_DEC_FACTOR,
                                              dec_freq: int = SYMMETRIC_TENSOR_DEC_FREQ,
                                              tolerance: float = DEFAULT_TOL,
-                                             per_channel=False) -> Dict[str, np.ndarray]:
+                                             per_channel=False,
+                                             vectorized_loss: bool = False,
+                                             max_chunk_bytes: int = QPARAMS_SEARCH_MAX_CHUNK_BYTES,
+                                             search_dtype: np.dtype = None) -> Dict[str, np.ndarray]:
     """
     Search for an optimal threshold to for symmetric tensor quantization.
     The search starts with the no-clipping threshold the tensor has, and continues with
@@ -181,6 +206,11 @@ def qparams_symmetric_iterative_minimization(x0: np.ndarray,
         dec_freq: Frequency for decreasing the multiplication factors.
         tolerance: If the improvement between iterations is smaller than tolerance, then early stop.
         per_channel: Whether quantization is done per-channel or per-tensor.
+        vectorized_loss: Whether loss_fn computes the losses of a batch of candidates at once (gets the quantized
+            tensors of the candidates stacked on the first axis).
+        max_chunk_bytes: Bound on the size (in bytes) of the quantized tensors computed at once in a vectorized search.
+        search_dtype: Type to evaluate the candidates in, in a vectorized search (if None, the common type of the
+            tensor and the candidates).
 
     Returns:
         Dictionary with optimized threshold for symmetric tensor quantization (best obtained during the search),
@@ -194,7 +224,14 @@ def qparams_symmetric_iterative_minimization(x0: np.ndarray,
         # wrapping loss function with per-channel wrapper for vectorized per-channel computation
         # Note: x should be already reshaped tensor for per-channel search
         curr_threshold = curr_threshold.reshape([-1, 1])
-        loss = _error_function_wrapper(loss_fn, x, quantize_tensor(x, curr_threshold, n_bits, signed), curr_threshold).reshape([-1, 1])
+        if vectorized_loss:
+            loss = _compute_thresholds_losses(loss_fn, x, curr_threshold.reshape([1, -1]), n_bits, signed,
+                                              max_chunk_bytes, search_dtype)[0].reshape([-1, 1])
+        else:
+            loss = _error_function_wrapper(loss_fn, x, quantize_tensor(x, curr_threshold, n_bits, signed), curr_threshold).reshape([-1, 1])
+    elif vectorized_loss:
+        init_threshold = np.reshape(curr_threshold, [1])
+        loss = _compute_thresholds_losses(loss_fn, x, init_threshold, n_bits, signed, max_chunk_bytes, search_dtype)[0]
     else:
         loss = loss_fn(x, quantize_tensor(x, curr_threshold, n_bits, signed), curr_threshold)
 
@@ -204,7 +241,9 @@ def qparams_symmetric_iterative_minimization(x0: np.ndarray,
         prev_best_loss = best['loss']
         new_range_bounds = curr_threshold * range_scale
 
-        curr_res = search_fixed_range_intervals(new_range_bounds, x, loss_fn, n_bits, signed, n_intervals, per_channel)
+        curr_res = search_fixed_range_intervals(new_range_bounds, x, loss_fn, n_bits, signed, n_intervals, per_channel,
+                                                vectorized_loss=vectorized_loss, max_chunk_bytes=max_chunk_bytes,
+                                                search_dtype=search_dtype)
         curr_threshold = curr_res['param']
         curr_loss = curr_res['loss']
 
@@ -233,7 +272,10 @@ def iterative_uniform_dynamic_range_search(x0: np.ndarray,
                                            n_bits: int,
                                            n_iter: int = UNIFORM_TENSOR_N_ITER,
                                            tolerance: float = DEFAULT_TOL,
-                                           per_channel: bool = False) -> Dict[str, np.ndarray]:
+                                           per_channel: bool = False,
+                                           vectorized_loss: bool = False,
+                                           max_chunk_bytes: int = QPARAMS_SEARCH_MAX_CHUNK_BYTES,
+                                           search_dtype: np.dtype = None) -> Dict[str, np.ndarray]:
     """
     Search for an optimal quantization range for uniform tensor quantization.
     The search starts with the no-clipping range the tensor has, and continues with
@@ -249,6 +291,11 @@ def iterative_uniform_dynamic_range_search(x0: np.ndarray,
         n_iter: Number of searching iterations.
         tolerance: If the improvement between iterations is smaller than tolerance, then early stop.
         per_channel: Whether quantization is done per-channel or per-tensor.
+        vectorized_loss: Whether loss_fn computes the losses of a batch of candidates at once (gets the quantized
+            tensors of the candidates stacked on the first axis).
+        max_chunk_bytes: Bound on the size (in bytes) of the quantized tensors computed at once in a vectorized search.
+        search_dtype: Type to evaluate the candidates in, in a vectorized search (if None, the common type of the
+            tensor and the candidates).
 
     Returns:
         Dictionary with optimized quantization range for uniform tensor quantization (best obtained during the search),
@@ -257,7 +304,10 @@ def iterative_uniform_dynamic_range_search(x0: np.ndarray,
     """
     curr_range_bounds = x0
 
-    if per_channel:
+    if per_channel and vectorized_loss:
+        loss = _compute_ranges_losses(loss_fn, x, curr_range_bounds[np.newaxis], n_bits, max_chunk_bytes,
+                                      search_dtype)[0].reshape([-1, 1])
+    elif per_channel:
         # wrapping loss function with per-channel wrapper for vectorized per-channel computation
         # Note: x should be already reshaped tensor for per-channel search and x0 is a tensor or ranges
         # of shape (num_channels, 2)
@@ -266,6 +316,9 @@ def iterative_uniform_dynamic_range_search(x0: np.ndarray,
                                                                            curr_range_bounds[:, 1].reshape([-1, 1]),
                                                                            n_bits),
                                        curr_range_bounds).reshape([-1, 1])
+    elif vectorized_loss:
+        init_range = np.reshape(curr_range_bounds, [1, 2])
+        loss = _compute_ranges_losses(loss_fn, x, init_range, n_bits, max_chunk_bytes, search_dtype)[0]
     else:
         loss = loss_fn(x, uniform_quantize_tensor(x, curr_range_bounds[0], curr_range_bounds[1], n_bits),
                        curr_range_bounds)
@@ -275,7 +328,8 @@ def iterative_uniform_dynamic_range_search(x0: np.ndarray,
     for n in range(n_iter):
         prev_best_loss = best['loss']
         curr_res = search_dynamic_range(base_range=curr_range_bounds, scalers=scalers, x=x, loss_fn=loss_fn,
-                                        n_bits=n_bits, per_channel=per_channel)
+                                        n_bits=n_bits, per_channel=per_channel, vectorized_loss=vectorized_loss,
+                                        max_chunk_bytes=max_chunk_bytes, search_dtype=search_dtype)
         curr_range_bounds = curr_res['param']
         curr_loss = curr_res['loss']
 
@@ -297,7 +351,10 @@ def search_fixed_range_intervals(range_bounds: np.ndarray,
                                  n_bits: int,
                                  signed: bool = True,
                                  n_intervals: int = 100,
-                                 per_channel: bool = False) -> Dict[str, np.ndarray]:
+                                 per_channel: bool = False,
+                                 vectorized_loss: bool = False,
+                                 max_chunk_bytes: int = QPARAMS_SEARCH_MAX_CHUNK_BYTES,
+                                 search_dtype: np.dtype = None) -> Dict[str, np.ndarray]:
     """
     Searches in a set of n_intervals thresholds, taken from evenly-space intervales from the constructed range.
 
@@ -309,11 +366,26 @@ def search_fixed_range_intervals(range_bounds: np.ndarray,
         signed: Whether quantization range is signed or not.
         n_intervals: Number of locations to examine each iteration from the given range.
         per_channel: Whether the search is done per-channel or per-tensor.
+        vectorized_loss: Whether loss_fn computes the losses of a batch of candidates at once (gets the quantized
+            tensors of the candidates stacked on the first axis).
+        max_chunk_bytes: Bound on the size (in bytes) of the quantized tensors computed at once in a vectorized search.
+        search_dtype: Type to evaluate the thresholds in, in a vectorized search (if None, the common type of the
+            tensor and the thresholds).
 
     Returns: Dictionary with best obtained threshold and the threshold's matching loss.
 
     """
-    if per_channel:
+    if per_channel and vectorized_loss:
+        # search per-channel, evaluating a row of per-channel thresholds per interval at once, and selecting the
+        # interval with the minimal loss for each channel
+        intervals = np.linspace(start=range_bounds[:, 0], stop=range_bounds[:, 1], num=n_intervals, dtype=float)
+        interval_losses = _compute_thresholds_losses(loss_fn, x, intervals, n_bits, signed, max_chunk_bytes,
+                                                     search_dtype)
+        best_intervals = np.argmin(interval_losses, axis=0)
+        channels = np.arange(intervals.shape[1])
+        best = {"param": intervals[best_intervals, channels].reshape([-1, 1]),
+                "loss": interval_losses[best_intervals, channels].reshape([-1, 1])}
+    elif per_channel:
         # search per-channel
         intervals = np.linspace(start=range_bounds[:, 0], stop=range_bounds[:, 1], num=n_intervals, dtype=float)
         # just the first interval values
@@ -334,14 +406,20 @@ def search_fixed_range_intervals(range_bounds: np.ndarray,
     else:
         # search per-tensor
         intervals = np.linspace(start=range_bounds[0], stop=range_bounds[1], num=n_intervals, dtype=float)
-        interval_losses = list(map(lambda t: loss_fn(x, quantize_tensor(x, t, n_bits, signed), t), intervals))
+        if vectorized_loss:
+            interval_losses = _compute_thresholds_losses(loss_fn, x, intervals, n_bits, signed, max_chunk_bytes,
+                                                         search_dtype)
+        else:
+            interval_losses = list(map(lambda t: loss_fn(x, quantize_tensor(x, t, n_bits, signed), t), intervals))
         best = {"param": intervals[np.argmin(interval_losses)], "loss": np.min(interval_losses)}
 
     return best
 
 
 def search_dynamic_range(base_range: np.ndarray, x: np.ndarray, scalers: np.ndarray, loss_fn: Callable, n_bits: int,
-                         per_channel: bool = False) -> Dict[str, np.ndarray]:
+                         per_channel: bool = False, vectorized_loss: bool = False,
+                         max_chunk_bytes: int = QPARAMS_SEARCH_MAX_CHUNK_BYTES,
+                         search_dtype: np.dtype = None) -> Dict[str, np.ndarray]:
     """
     Searches in a set of constructed quantization ranges.
 
@@ -352,11 +430,27 @@ def search_dynamic_range(base_range: np.ndarray, x: np.ndarray, scalers: np.ndar
         loss_fn: Function to compute the error between the original and quantized tensors.
         n_bits: Number of bits to quantize the
         per_channel: Whether the search is done per-channel or per-tensor.
+        vectorized_loss: Whether loss_fn computes the losses of a batch of candidates at once (gets the quantized
+            tensors of the candidates stacked on the first axis).
+        max_chunk_bytes: Bound on the size (in bytes) of the quantized tensors computed at once in a vectorized search.
+        search_dtype: Type to evaluate the ranges in, in a vectorized search (if None, the common type of the
+            tensor and the ranges).
 
     Returns: Dictionary with best obtained quantization range and the threshold's matching loss.
 
     """
-    if per_channel:
+    if per_channel and vectorized_loss:
+        # search per-channel, evaluating a set of per-channel ranges per scaler at once, and selecting the
+        # range with the minimal loss for each channel
+        ranges = np.stack([np.multiply.outer(base_range[:, 0], scalers[:, 0]),
+                           np.multiply.outer(base_range[:, 1], scalers[:, 1])], axis=2)
+        ranges_losses = _compute_ranges_losses(loss_fn, x, np.transpose(ranges, [1, 0, 2]), n_bits, max_chunk_bytes,
+                                               search_dtype)
+        best_ranges = np.argmin(ranges_losses, axis=0)
+        channels = np.arange(ranges.shape[0])
+        best = {"param": ranges[channels, best_ranges],
+                "loss": ranges_losses[best_ranges, channels].reshape([-1, 1])}
+    elif per_channel:
         # search per-channel
         ranges = np.stack([np.multiply.outer(base_range[:, 0], scalers[:, 0]),
                            np.multiply.outer(base_range[:, 1], scalers[:, 1])], axis=2)
@@ -382,7 +476,10 @@ def search_dynamic_range(base_range: np.ndarray, x: np.ndarray, scalers: np.ndar
     else:
         # search per-tensor
         ranges = base_range * scalers
-        ranges_losses = list(map(lambda mm: loss_fn(x, uniform_quantize_tensor(x, mm[0], mm[1], n_bits), mm), ranges))
+        if vectorized_loss:
+            ranges_losses = _compute_ranges_losses(loss_fn, x, ranges, n_bits, max_chunk_bytes, search_dtype)
+        else:
+            ranges_losses = list(map(lambda mm: loss_fn(x, uniform_quantize_tensor(x, mm[0], mm[1], n_bits), mm), ranges))
         best = {"param": ranges[np.argmin(ranges_losses)], "loss": np.min(ranges_losses)}
 
     return best
@@ -396,7 +493,10 @@ def qparams_symmetric_selection_tensor_search(error_function: Callable,
                                               channel_axis: int = 1,
                                               n_iter: int = SYMMETRIC_TENSOR_PER_CHANNEL_N_ITER,
                                               min_threshold=MIN_THRESHOLD,
-                                              signed: bool = True) -> Any:
+                                              signed: bool = True,
+                                              vectorized_loss: bool = False,
+                                              max_chunk_bytes: int = QPARAMS_SEARCH_MAX_CHUNK_BYTES,
+                                              use_float32: bool = False) -> Any:
     """
     Search for optimal threshold (per-channel or per-tensor) for symmetric quantization of a tensor,
     using the iterative optimizer method.
@@ -411,6 +511,10 @@ def qparams_symmetric_selection_tensor_search(error_function: Callable,
         n_iter: Number of searching iterations.
         min_threshold: Threshold to return if the computed threshold is smaller that min_threshold.
         signed: a flag whether the tensor is signed.
+        vectorized_loss: Whether error_function computes the errors of a batch of candidates at once (gets the
+            quantized tensors of the candidates stacked on the first axis).
+        max_chunk_bytes: Bound on the size (in bytes) of the quantized tensors computed at once in a vectorized search.
+        use_float32: Whether to evaluate the candidates in float32 in a vectorized search.
 
     Returns:
         Ndarray with an optimized threshold (or set of thresholds shaped according to the channels_axis if per-channel).
@@ -432,19 +536,27 @@ def qparams_symmetric_selection_tensor_search(error_function: Callable,
                                                        n_intervals=SYMMETRIC_TENSOR_PER_CHANNEL_N_INTERVALS,
                                                        n_iter=SYMMETRIC_TENSOR_PER_CHANNEL_N_ITER,
                                                        dec_freq=SYMMETRIC_TENSOR_PER_CHANNEL_DEC_FREQ,
-                                                       per_channel=True)
+                                                       per_channel=True,
+                                                       vectorized_loss=vectorized_loss,
+                                                       max_chunk_bytes=max_chunk_bytes,
+                                                       search_dtype=_get_search_dtype(tensor_data, per_channel,
+                                                                                      use_float32))
         return np.reshape(np.maximum(min_threshold, res['param']), output_shape)
     else:
         # quantize per-tensor
         res = qparams_symmetric_iterative_minimization(x0=get_init_threshold(min_threshold, tensor_max),
-                                                       x=tensor_data,
+                                                       x=tensor_data.flatten() if vectorized_loss else tensor_data,
                                                        loss_fn=error_function,
                                                        n_bits=n_bits,
                                                        signed=signed,
                                                        n_intervals=SYMMETRIC_TENSOR_N_INTERVALS,
                                                        n_iter=SYMMETRIC_TENSOR_N_ITER,
                                                        dec_freq=SYMMETRIC_TENSOR_DEC_FREQ,
-                                                       per_channel=False)
+                                                       per_channel=False,
+                                                       vectorized_loss=vectorized_loss,
+                                                       max_chunk_bytes=max_chunk_bytes,
+                                                       search_dtype=_get_search_dtype(tensor_data, per_channel,
+                                                                                      use_float32))
 
         return max(min_threshold, res['param'])
 
@@ -456,7 +568,10 @@ def qparams_uniform_selection_tensor_search(error_function: Callable,
                                             n_bits: int,
                                             per_channel: bool = False,
                                             channel_axis: int = 1,
-                                            n_iter: int = UNIFORM_TENSOR_PER_CHANNEL_N_ITER) -> Any:
+                                            n_iter: int = UNIFORM_TENSOR_PER_CHANNEL_N_ITER,
+                                            vectorized_loss: bool = False,
+                                            max_chunk_bytes: int = QPARAMS_SEARCH_MAX_CHUNK_BYTES,
+                                            use_float32: bool = False) -> Any:
     """
     Search for optimal quantization range (per-channel or per-tensor) for uniform quantization of a tensor,
     using the iterative optimizer method and built-in scale factors
@@ -471,6 +586,10 @@ def qparams_uniform_selection_tensor_search(error_function: Callable,
         per_channel: Whether the tensor should be quantized per-channel or per-tensor.
         channel_axis: Index of output channels dimension.
         n_iter: Number of searching iterations.
+        vectorized_loss: Whether error_function computes the errors of a batch of candidates at once (gets the
+            quantized tensors of the candidates stacked on the first axis).
+        max_chunk_bytes: Bound on the size (in bytes) of the quantized tensors computed at once in a vectorized search.
+        use_float32: Whether to evaluate the candidates in float32 in a vectorized search.
 
     Returns:
         Ndarray with an optimized range (or set of thresholds shaped according to the channels_axis if per-channel).
@@ -495,18 +614,26 @@ def qparams_uniform_selection_tensor_search(error_function: Callable,
                                                          loss_fn=error_function,
                                                          n_bits=n_bits,
                                                          n_iter=UNIFORM_TENSOR_PER_CHANNEL_N_ITER,
-                                                         per_channel=True)
+                                                         per_channel=True,
+                                                         vectorized_loss=vectorized_loss,
+                                                         max_chunk_bytes=max_chunk_bytes,
+                                                         search_dtype=_get_search_dtype(tensor_data, per_channel,
+                                                                                        use_float32))
             return np.reshape(res['param'][:, 0], output_shape), np.reshape(res['param'][:, 1], output_shape)
     else:
         # quantize per-tensor
         pass
         res = iterative_uniform_dynamic_range_search(x0=np.array([tensor_min, tensor_max]),
-                                                     x=tensor_data,
+                                                     x=tensor_data.flatten() if vectorized_loss else tensor_data,
                                                      scalers=scalers,
                                                      loss_fn=error_function,
                                                      n_bits=n_bits,
                                                      n_iter=UNIFORM_TENSOR_N_ITER,
-                                                     per_channel=False)
+                                                     per_channel=False,
+                                                     vectorized_loss=vectorized_loss,
+                                                     max_chunk_bytes=max_chunk_bytes,
+                                                     search_dtype=_get_search_dtype(tensor_data, per_channel,
+                                                                                    use_float32))
         return res['param']
 
 
@@ -519,10 +646,11 @@ def qparams_symmetric_selection_histogram_search(error_function: Callable,
                                                  min_threshold: float = MIN_THRESHOLD):
     """
     search for optimal threshold (per-channel or per-tensor) for symmetric quantization of a histogram,
-    using the iterative optimizer method.
+    using the iterative optimizer method. All threshold candidates of an iteration are evaluated at once.
 
     Args:
-        error_function: Function to compute the error between the original and quantized histograms.
+        error_function: Function to compute the errors between the original histogram and a batch of quantized
+            histograms.
         tensor_max: The max value of the tensor.
         bins: Bins of the histogram to search_methods for an optimal threshold.
         counts: Number of elements in the bins to search_methods for a threshold.
@@ -538,17 +666,22 @@ def qparams_symmetric_selection_histogram_search(error_function: Callable,
 
     res = qparams_symmetric_iterative_minimization(x0=get_init_threshold(min_threshold, tensor_max),
                                                    x=bins,
-                                                   loss_fn=lambda x, q_x, t:  # t is dummy, we only need it for KL error
+                                                   loss_fn=lambda x, q_x, t:
                                                    qparams_selection_histogram_search_error_function(error_function,
                                                                                                      x,
                                                                                                      q_x,
-                                                                                                     counts),
+                                                                                                     counts,
+                                                                                                     min_max_range=np.stack(
+                                                                                                         calculate_min_max_values(
+                                                                                                             t.reshape([-1]), n_bits, signed),
+                                                                                                         axis=-1)),
                                                    n_bits=n_bits,
                                                    signed=signed,
                                                    n_intervals=SYMMETRIC_HISTOGRAM_N_INTERVALS,
                                                    n_iter=SYMMETRIC_HISTOGRAM_N_ITER,
                                                    dec_freq=SYMMETRIC_HISTOGRAM_DEC_FREQ,
-                                                   per_channel=False)
+                                                   per_channel=False,
+                                                   vectorized_loss=True)
     return max(min_threshold, res['param'])
 
 
@@ -563,10 +696,12 @@ def kl_qparams_symmetric_selection_histogram_search(error_function: Callable,
     Search for optimal threshold (per-channel or per-tensor) for symmetric quantization of a histogram,
     with KL-Divergence loss function (needs a separate search function
     since the error function needs additional arguments that are constructed from the input)
-    Using the iterative optimizer method for the search.
+    Using the iterative optimizer method for the search. All threshold candidates of an iteration are evaluated
+    at once.
 
     Args:
-        error_function: Function to compute the error between the original and quantized histograms.
+        error_function: Function to compute the errors between the original histogram and a batch of quantized
+            histograms.
         tensor_max: The max value of the tensor.
         bins: Bins of the histogram to search_methods for an optimal threshold.
         counts: Number of elements in the bins to search_methods for a threshold.
@@ -586,16 +721,16 @@ def kl_qparams_symmetric_selection_histogram_search(error_function: Callable,
                                                                                                         bins,
                                                                                                         q_x,
                                                                                                         counts,
-                                                                                                        min_max_range=np.array(
-                                                                                                            [0,
-                                                                                                             t]) if not signed else np.array(
-                                                                                                            [-t, t])),
+                                                                                                        min_max_range=np.stack(
+                                                                                                            [np.zeros_like(t) if not signed else -t,
+                                                                                                             t], axis=-1)),
                                                    n_bits=n_bits,
                                                    signed=signed,
                                                    n_intervals=SYMMETRIC_HISTOGRAM_N_INTERVALS,
                                                    n_iter=SYMMETRIC_HISTOGRAM_N_ITER,
                                                    dec_freq=SYMMETRIC_HISTOGRAM_DEC_FREQ,
-                                                   per_channel=False)
+                                                   per_channel=False,
+                                                   vectorized_loss=True)
     return max(min_threshold, res['param'])
 
 
@@ -608,10 +743,11 @@ def qparams_uniform_selection_histogram_search(error_function: Callable,
     """
     Search for optimal quantization range (per-channel or per-tensor) for uniform quantization of a histogram,
     using the iterative optimizer method and built-in scale factors
-    for constructing ranges candidates during the search.
+    for constructing ranges candidates during the search. All range candidates of an iteration are evaluated at once.
 
     Args:
-        error_function: Function to compute the error between the original and quantized histograms.
+        error_function: Function to compute the errors between the original histogram and a batch of quantized
+            histograms.
         tensor_min_max: Numpy array with tensor's min and max values.
         bins: Bins of the histogram to search_methods for an optimal threshold.
         counts: Number of elements in the bins to search_methods for a threshold.
@@ -636,7 +772,8 @@ def qparams_uniform_selection_histogram_search(error_function: Callable,
                                                                                                    min_max_range=mm),
                                                  n_bits=n_bits,
                                                  n_iter=UNIFORM_HISTOGRAM_N_ITER,
-                                                 per_channel=False)
+                                                 per_channel=False,
+                                                 vectorized_loss=True)
     return res['param']
 
 
@@ -647,26 +784,24 @@ def qparams_selection_histogram_search_error_function(error_function: Callable,
                                                       threshold: np.ndarray = None,
                                                       min_max_range=None):
     """
-    Computes the error according to the given error function, to be used in the parameters' selection process
-    for quantization.
+    Computes the errors according to the given error function, to be used in the parameters' selection process
+    for quantization. The errors of a batch of candidates are computed at once.
     Args:
-        error_function: Function to compute the error between the original and quantized histograms.
+        error_function: Function to compute the errors between the original histogram and a batch of quantized
+            histograms.
         bins: Bins values of the histogram.
-        q_bins: Bins values of the quantized histogram.
+        q_bins: Bins values of the quantized histograms, one row per candidate.
         counts: Bins counts of the original histogram.
-        threshold: Threshold bins were quantized by (used only for kl error function).
-        min_max_range: quantization parameter, used in uniform parameters' selection for quantization range validation
-        (not used for symmetric parameters' selection)
+        threshold: Thresholds bins were quantized by, one per candidate (used only for kl error function).
+        min_max_range: Quantization ranges bins were quantized by, one range per candidate (used for computing the
+            errors of the candidates' quantization grids, and for quantization range validation).
 
-    Returns: the error between the original and quantized histogram.
+    Returns: the errors between the original histogram and each of the quantized histograms.
 
     """
-    # computes the number of elements between quantized bin values.
-    q_count, _ = np.histogram(q_bins, bins=bins, weights=np.concatenate([counts.flatten(), np.asarray([0])]))
-    # threshold is only used for KL error method calculations.
-    # other error methods are passed with a wrapper that accepts a threshold argument but does not use it.
-    error = error_function(q_bins, q_count, bins, counts, threshold, min_max_range)  # computes the error
-    return error
+    # threshold is only used for KL error method calculations, and min_max_range for KL, MSE and MAE error methods.
+    # other error methods are passed with a wrapper that accepts these arguments but does not use them.
+    return error_function(q_bins, bins, counts, threshold, min_max_range)
 
 
 def kl_qparams_selection_histogram_search_error_function(error_function: Callable,
@@ -675,22 +810,21 @@ def kl_qparams_selection_histogram_search_error_function(error_function: Callabl
                                                          counts: np.ndarray,
                                                          min_max_range: np.ndarray):
     """
-    Computes the error according to the KL-divergence the distributions of the given histogram.
-    The error value is used in the threshold optimization process, for symmetric quantization.
+    Computes the errors according to the KL-divergence the distributions of the given histogram.
+    The error values are used in the threshold optimization process, for symmetric quantization.
+    The errors of a batch of candidates are computed at once.
     Args:
-        error_function: Function to compute the error between the original and quantized histograms.
+        error_function: Function to compute the errors between the original histogram and a batch of quantized
+            histograms.
         bins: Bins values of the histogram.
-        q_bins: Quantized bins values of the histogram.
+        q_bins: Quantized bins values of the histogram, one row per candidate.
         counts: Bins counts of the original histogram.
-        min_max_range: Quantization range to quantize histogram by.
+        min_max_range: Quantization ranges to quantize histogram by, one range per candidate.
 
-    Returns: the error between the original and quantized histogram.
+    Returns: the errors between the original histogram and each of the quantized histograms.
 
     """
-    # compute the number of elements between quantized bin values.
-    q_count, _ = np.histogram(q_bins, bins=bins, weights=np.concatenate([counts.flatten(), np.asarray([0])]))
-    error = error_function(q_bins, q_count, bins, counts, range_min=min_max_range[0], range_max=min_max_range[1])
-    return error
+    return error_function(q_bins, bins, counts, range_min=min_max_range[:, 0], range_max=min_max_range[:, 1])
 
 
 def get_init_threshold(min_threshold: float, tensor_max: np.ndarray, per_channel: bool = False) -> np.ndarray:
@@ -713,6 +847,176 @@ def get_init_threshold(min_threshold: float, tensor_max: np.ndarray, per_channel
     return max(min_threshold, tensor_max)
 
 
+def _get_search_dtype(tensor_data: np.ndarray, per_channel: bool, use_float32: bool) -> np.dtype:
+    """
+    Returns the type to evaluate the candidates of a vectorized tensor search in.
+    Unless float32 is requested, per-tensor candidates are evaluated in the tensor's type, as quantizing the tensor
+    by a single (scalar) threshold or range is done in the tensor's type. Per-channel candidates are evaluated in the
+    common type of the tensor and the candidates.
+
+    Args:
+        tensor_data: Numpy array with tensor's content.
+        per_channel: Whether the search is done per-channel or per-tensor.
+        use_float32: Whether to evaluate the candidates in float32.
+
+    Returns: The type to evaluate the candidates in (None for the common type of the tensor and the candidates).
+
+    """
+    if use_float32:
+        return np.float32
+    return None if per_channel else tensor_data.dtype
+
+
+def _compute_candidates_losses(loss_fn: Callable,
+                               x: np.ndarray,
+                               candidates: np.ndarray,
+                               quantize_fn: Callable,
+                               max_chunk_bytes: int = QPARAMS_SEARCH_MAX_CHUNK_BYTES,
+                               search_dtype: np.dtype = None) -> np.ndarray:
+    """
+    Computes the losses of a batch of quantization params candidates. The tensor is quantized by a chunk of
+    candidates at once (by broadcasting the tensor against the candidates' params), where the quantized tensors of a
+    chunk fit in max_chunk_bytes (a chunk holds at least a single candidate for a single channel).
+    In a per-channel search, a chunk holds all the candidates of a subset of the channels (if they fit), so each
+    channel of the tensor is read once while all candidates are evaluated on it. If the values of the channels are
+    interleaved in the tensor (e.g., a channels-last kernel), a chunk holds all the channels instead, as numpy sums
+    the errors of interleaved channels together, in a different order than it sums the errors of a single channel.
+
+    Args:
+        loss_fn: Function to compute the losses of a batch of candidates. Gets the tensor, the quantized tensors of
+            the candidates (stacked on the first axis) and the candidates' params.
+        x: Numpy array with tensor's content (reshaped to (channels, -1) for a per-channel search).
+        candidates: Params of the candidates (the first axis is the candidate, and the second axis is the channel in
+            a per-channel search).
+        quantize_fn: Function to quantize the tensor by a chunk of candidates. Gets the tensor and the candidates'
+            params, and returns the quantized tensors stacked on the first axis.
+        max_chunk_bytes: Bound on the size (in bytes) of the quantized tensors computed at once.
+        search_dtype: Type to quantize the tensor and compute the losses in (if None, the common type of the tensor
+            and the candidates).
+
+    Returns: The losses of the candidates (a row of per-channel losses per candidate, for a per-channel search).
+
+    """
+    if search_dtype is not None:
+        x = x.astype(search_dtype, copy=False)
+
+    per_channel = x.ndim > 1
+    n_candidates, n_channels = len(candidates), x.shape[0] if per_channel else 1
+    channel_bytes = x.shape[-1] * (np.result_type(x, candidates) if search_dtype is None
+                                   else np.dtype(search_dtype)).itemsize
+    if per_channel and abs(x.strides[0]) < abs(x.strides[1]):
+        channels_chunk = n_channels
+    else:
+        channels_chunk = int(min(n_channels, max(1, max_chunk_bytes // (n_candidates * channel_bytes))))
+    candidates_chunk = int(min(n_candidates, max(1, max_chunk_bytes // (channels_chunk * channel_bytes))))
+
+    losses = None
+    for c in range(0, n_channels, channels_chunk):
+        x_chunk = x[c:c + channels_chunk] if per_channel else x
+        for k in range(0, n_candidates, candidates_chunk):
+            index = (slice(k, k + candidates_chunk), slice(c, c + channels_chunk)) if per_channel \
+                else slice(k, k + candidates_chunk)
+            chunk_losses = loss_fn(x_chunk, quantize_fn(x_chunk, candidates[index]), candidates[index])
+            if losses is None:
+                losses = np.empty([n_candidates, n_channels] if per_channel else [n_candidates],
+                                  dtype=chunk_losses.dtype)
+            losses[index] = chunk_losses
+    return losses
+
+
+def _batch_uniform_quantize(x: np.ndarray,
+                            range_min: np.ndarray,
+                            range_max: np.ndarray,
+                            n_bits: int,
+                            search_dtype: np.dtype = None) -> np.ndarray:
+    """
+    Quantizes a tensor by a batch of quantization ranges, as uniform_quantize_tensor does, computing the quantized
+    tensors in-place to avoid allocating temporary arrays of the batch's size.
+
+    Args:
+        x: Tensor values to quantize.
+        range_min: Minimum bounds of the quantization ranges (broadcastable against the tensor).
+        range_max: Maximum bounds of the quantization ranges (broadcastable against the tensor).
+        n_bits: Number of bits to quantize the tensor.
+        search_dtype: Type to quantize the tensor in. The quantization grid is computed in the ranges' type and cast
+            to it (as a scalar range quantizes a tensor in the tensor's type). If None, the common type of the tensor
+            and the ranges.
+
+    Returns: The quantized tensors.
+
+    """
+    a, b = fix_range_to_include_zero(range_min, range_max, n_bits)
+    delta = (b - a) / (2 ** n_bits - 1)
+    if search_dtype is not None:
+        a, b, delta = a.astype(search_dtype), b.astype(search_dtype), delta.astype(search_dtype)
+
+    q = np.clip(x, a_min=a, a_max=b)
+    q -= a
+    q /= delta
+    np.round(q, out=q)
+    q *= delta
+    q += a
+    return q
+
+
+def _compute_thresholds_losses(loss_fn: Callable,
+                               x: np.ndarray,
+                               thresholds: np.ndarray,
+                               n_bits: int,
+                               signed: bool,
+                               max_chunk_bytes: int = QPARAMS_SEARCH_MAX_CHUNK_BYTES,
+                               search_dtype: np.dtype = None) -> np.ndarray:
+    """
+    Computes the losses of a batch of threshold candidates for symmetric quantization.
+
+    Args:
+        loss_fn: Function to compute the losses of a batch of candidates (see _compute_candidates_losses).
+        x: Numpy array with tensor's content (reshaped to (channels, -1) for a per-channel search).
+        thresholds: A threshold per candidate, or a row of per-channel thresholds per candidate.
+        n_bits: Number of bits to quantize the tensor.
+        signed: Whether quantization range is signed or not.
+        max_chunk_bytes: Bound on the size (in bytes) of the quantized tensors computed at once.
+        search_dtype: Type to quantize the tensor and compute the losses in (if None, the common type of the tensor
+            and the candidates).
+
+    Returns: The losses of the candidates (a row of per-channel losses per candidate, for a per-channel search).
+
+    """
+    def _quantize(_x, t):
+        range_min, range_max = calculate_min_max_values(np.expand_dims(t, -1), n_bits, signed)
+        return _batch_uniform_quantize(_x, range_min, range_max, n_bits, search_dtype)
+
+    return _compute_candidates_losses(loss_fn, x, thresholds, _quantize, max_chunk_bytes, search_dtype)
+
+
+def _compute_ranges_losses(loss_fn: Callable,
+                           x: np.ndarray,
+                           ranges: np.ndarray,
+                           n_bits: int,
+                           max_chunk_bytes: int = QPARAMS_SEARCH_MAX_CHUNK_BYTES,
+                           search_dtype: np.dtype = None) -> np.ndarray:
+    """
+    Computes the losses of a batch of range candidates for uniform quantization.
+
+    Args:
+        loss_fn: Function to compute the losses of a batch of candidates (see _compute_candidates_losses).
+        x: Numpy array with tensor's content (reshaped to (channels, -1) for a per-channel search).
+        ranges: A (min, max) range per candidate, of shape (candidates, 2), or per-channel ranges per candidate, of
+            shape (candidates, channels, 2).
+        n_bits: Number of bits to quantize the tensor.
+        max_chunk_bytes: Bound on the size (in bytes) of the quantized tensors computed at once.
+        search_dtype: Type to quantize the tensor and compute the losses in (if None, the common type of the tensor
+            and the candidates).
+
+    Returns: The losses of the candidates (a row of per-channel losses per candidate, for a per-channel search).
+
+    """
+    return _compute_candidates_losses(loss_fn, x, ranges,
+                                      lambda _x, r: _batch_uniform_quantize(_x, r[..., :1], r[..., 1:], n_bits,
+                                                                            search_dtype),
+                                      max_chunk_bytes, search_dtype)
+
+
 def _error_function_wrapper(error_function: Callable,
                             float_tensor: np.ndarray,
                             q_tensor: np.ndarray,
@@ -61,7 +61,9 @@ def get_weights_qparams(weights_attr_values: np.ndarray,
                                                                           quant_error_method=attr_quant_config.weights_error_method,
                                                                           node=node,
                                                                           hessian_info_service=hessian_info_service,
-                                                                          num_hessian_samples=num_hessian_samples)
+                                                                          num_hessian_samples=num_hessian_samples,
+                                                                          max_chunk_bytes=weights_quant_config.qparams_search_max_chunk_bytes,
+                                                                          use_float32=weights_quant_config.qparams_search_float32)
     else:
         weights_params = {}
 
@@ -15,10 +15,12 @@
 import numpy as np
 
 import model_compression_toolkit.core.common.quantization.quantization_config as qc
-from model_compression_toolkit.constants import MIN_THRESHOLD, THRESHOLD, NUM_QPARAM_HESSIAN_SAMPLES
+from model_compression_toolkit.constants import MIN_THRESHOLD, THRESHOLD, NUM_QPARAM_HESSIAN_SAMPLES, \
+    QPARAMS_SEARCH_MAX_CHUNK_BYTES
 from model_compression_toolkit.core.common.hessian import HessianInfoService
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.error_functions import \
-    get_threshold_selection_tensor_error_function, get_threshold_selection_histogram_error_function, _kl_error_histogram
+    get_threshold_selection_tensor_error_function, get_threshold_selection_histogram_batch_error_function, _batch_kl_error_histogram, \
+    get_threshold_selection_tensor_batch_error_function
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search import \
     qparams_symmetric_selection_tensor_search, \
     qparams_symmetric_selection_histogram_search, kl_qparams_symmetric_selection_histogram_search
@@ -37,7 +39,9 @@ def symmetric_selection_tensor(tensor_data: np.ndarray,
                                quant_error_method: qc.QuantizationErrorMethod = qc.QuantizationErrorMethod.MSE,
                                node=None,
                                hessian_info_service: HessianInfoService = None,
-                               num_hessian_samples: int = NUM_QPARAM_HESSIAN_SAMPLES) -> dict:
+                               num_hessian_samples: int = NUM_QPARAM_HESSIAN_SAMPLES,
+                               max_chunk_bytes: int = QPARAMS_SEARCH_MAX_CHUNK_BYTES,
+                               use_float32: bool = False) -> dict:
     """
     Compute the optimal threshold based on the provided QuantizationErrorMethod to quantize the tensor.
     Different search is applied, depends on the value of the selected QuantizationErrorMethod.
@@ -54,6 +58,8 @@ def symmetric_selection_tensor(tensor_data: np.ndarray,
         node: The node for which the quantization error is computed (used only with HMSE error method).
         hessian_info_service: HessianInfoService object for retrieving Hessian-based scores (used only with HMSE error method).
         num_hessian_samples: Number of samples to approximate Hessian-based scores on (used only with HMSE error method).
+        max_chunk_bytes: Bound on the size (in bytes) of the arrays computed at once during the parameters search.
+        use_float32: Whether to evaluate the search candidates in float32 (MSE, MAE and Lp error methods only).
 
     Returns:
         Optimal threshold to quantize the tensor in a symmetric manner.
@@ -65,12 +71,16 @@ def symmetric_selection_tensor(tensor_data: np.ndarray,
         threshold = get_init_threshold(min_threshold, tensor_max, per_channel)
     else:
         signed = True  # weights are always signed
-        axis = -1 if per_channel else None
-        error_function = get_threshold_selection_tensor_error_function(QuantizationMethod.SYMMETRIC, quant_error_method,
-                                                                       p, axis=axis, norm=False, n_bits=n_bits,
-                                                                       signed=signed, node=node,
-                                                                       hessian_info_service=hessian_info_service,
-                                                                       num_hessian_samples=num_hessian_samples)
+        # KL and HMSE errors have no batch version, so their search evaluates a candidate at a time.
+        error_function = get_threshold_selection_tensor_batch_error_function(quant_error_method, p)
+        vectorized_loss = error_function is not None
+        if not vectorized_loss:
+            axis = -1 if per_channel else None
+            error_function = get_threshold_selection_tensor_error_function(QuantizationMethod.SYMMETRIC,
+                                                                           quant_error_method, p, axis=axis, norm=False,
+                                                                           n_bits=n_bits, signed=signed, node=node,
+                                                                           hessian_info_service=hessian_info_service,
+                                                                           num_hessian_samples=num_hessian_samples)
         threshold = qparams_symmetric_selection_tensor_search(error_function,
                                                               tensor_data,
                                                               tensor_max,
@@ -78,7 +88,10 @@ def symmetric_selection_tensor(tensor_data: np.ndarray,
                                                               per_channel,
                                                               channel_axis,
                                                               min_threshold=min_threshold,
-                                                              signed=signed)
+                                                              signed=signed,
+                                                              vectorized_loss=vectorized_loss,
+                                                              max_chunk_bytes=max_chunk_bytes,
+                                                              use_float32=use_float32)
     return {THRESHOLD: threshold}
 
 
@@ -116,14 +129,15 @@ def symmetric_selection_histogram(bins: np.ndarray,
         threshold = get_init_threshold(min_threshold, tensor_max)
     elif quant_error_method == qc.QuantizationErrorMethod.KL:
         # search for KL error is separated because the error method signature is different from the other error methods.
-        threshold = kl_qparams_symmetric_selection_histogram_search(_kl_error_histogram,
+        threshold = kl_qparams_symmetric_selection_histogram_search(_batch_kl_error_histogram,
                                                                     tensor_max,
                                                                     bins,
                                                                     counts,
                                                                     n_bits,
                                                                     min_threshold=min_threshold)
     else:
-        error_function = get_threshold_selection_histogram_error_function(QuantizationMethod.SYMMETRIC, quant_error_method, p)
+        error_function = get_threshold_selection_histogram_batch_error_function(QuantizationMethod.SYMMETRIC, quant_error_method, p,
+                                                                                n_bits=n_bits)
         threshold = qparams_symmetric_selection_histogram_search(error_function,
                                                                  tensor_max,
                                                                  bins,
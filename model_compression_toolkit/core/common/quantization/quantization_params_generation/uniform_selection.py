@@ -15,12 +15,14 @@
 import numpy as np
 
 import model_compression_toolkit.core.common.quantization.quantization_config as qc
-from model_compression_toolkit.constants import MIN_THRESHOLD, RANGE_MIN, RANGE_MAX, NUM_QPARAM_HESSIAN_SAMPLES
+from model_compression_toolkit.constants import MIN_THRESHOLD, RANGE_MIN, RANGE_MAX, NUM_QPARAM_HESSIAN_SAMPLES, \
+    QPARAMS_SEARCH_MAX_CHUNK_BYTES
 from model_compression_toolkit.core.common.hessian import HessianInfoService
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search import \
     qparams_uniform_selection_tensor_search, qparams_uniform_selection_histogram_search
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.error_functions import \
-    get_threshold_selection_tensor_error_function, get_threshold_selection_histogram_error_function
+    get_threshold_selection_tensor_error_function, get_threshold_selection_histogram_batch_error_function, \
+    get_threshold_selection_tensor_batch_error_function
 from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import get_tensor_max, \
     get_tensor_min
 from model_compression_toolkit.target_platform_capabilities.target_platform import QuantizationMethod
@@ -35,7 +37,9 @@ def uniform_selection_tensor(tensor_data: np.ndarray,
                              quant_error_method: qc.QuantizationErrorMethod = qc.QuantizationErrorMethod.MSE,
                              node=None,
                              hessian_info_service: HessianInfoService = None,
-                             num_hessian_samples: int = NUM_QPARAM_HESSIAN_SAMPLES) -> dict:
+                             num_hessian_samples: int = NUM_QPARAM_HESSIAN_SAMPLES,
+                             max_chunk_bytes: int = QPARAMS_SEARCH_MAX_CHUNK_BYTES,
+                             use_float32: bool = False) -> dict:
     """
     Compute the optimal quantization range based on the provided QuantizationErrorMethod
     to uniformly quantize the tensor.
@@ -53,6 +57,8 @@ def uniform_selection_tensor(tensor_data: np.ndarray,
         node: The node for which the quantization error is computed (used only with HMSE error method).
         hessian_info_service: HessianInfoService object for retrieving Hessian-based scores (used only with HMSE error method).
         num_hessian_samples: Number of samples to approximate Hessian-based scores on (used only with HMSE error method).
+        max_chunk_bytes: Bound on the size (in bytes) of the arrays computed at once during the parameters search.
+        use_float32: Whether to evaluate the search candidates in float32 (MSE, MAE and Lp error methods only).
 
     Returns:
         Optimal quantization range to quantize the tensor uniformly.
@@ -63,18 +69,25 @@ def uniform_selection_tensor(tensor_data: np.ndarray,
     if quant_error_method == qc.QuantizationErrorMethod.NOCLIPPING:
         mm = tensor_min, tensor_max
     else:
-        axis = -1 if per_channel else None
-        error_function = get_threshold_selection_tensor_error_function(QuantizationMethod.UNIFORM, quant_error_method,
-                                                                       p, axis=axis, norm=False, node=node,
-                                                                       hessian_info_service=hessian_info_service,
-                                                                       num_hessian_samples=num_hessian_samples)
+        error_function = get_threshold_selection_tensor_batch_error_function(quant_error_method, p)
+        vectorized_loss = error_function is not None
+        if not vectorized_loss:
+            axis = -1 if per_channel else None
+            error_function = get_threshold_selection_tensor_error_function(QuantizationMethod.UNIFORM,
+                                                                           quant_error_method, p, axis=axis, norm=False,
+                                                                           node=node,
+                                                                           hessian_info_service=hessian_info_service,
+                                                                           num_hessian_samples=num_hessian_samples)
         mm = qparams_uniform_selection_tensor_search(error_function,
                                                      tensor_data,
                                                      tensor_min,
                                                      tensor_max,
                                                      n_bits,
                                                      per_channel,
-                                                     channel_axis)
+                                                     channel_axis,
+                                                     vectorized_loss=vectorized_loss,
+                                                     max_chunk_bytes=max_chunk_bytes,
+                                                     use_float32=use_float32)
     return {RANGE_MIN: mm[0],
             RANGE_MAX: mm[1]}
 
@@ -116,7 +129,8 @@ def uniform_selection_histogram(bins: np.ndarray,
     if quant_error_method == qc.QuantizationErrorMethod.NOCLIPPING:
         mm = tensor_min_max
     else:
-        error_function = get_threshold_selection_histogram_error_function(QuantizationMethod.UNIFORM, quant_error_method, p)
+        error_function = get_threshold_selection_histogram_batch_error_function(QuantizationMethod.UNIFORM, quant_error_method, p,
+                                                                                n_bits=n_bits)
         mm = qparams_uniform_selection_histogram_search(error_function,
                                                         tensor_min_max,
                                                         bins,
@@ -43,13 +43,15 @@ def quantize_graph_weights(graph_to_quantize: Graph) -> Graph:
                 quantized_attr, io_channels_axes = \
                     get_quantized_weights_attr_by_qc(attr,
                                                      n,
-                                                     n.final_weights_quantization_cfg.get_attr_config(attr))
+                                                     n.final_weights_quantization_cfg.get_attr_config(attr),
+                                                     _quantized_graph.quantized_weights_cache)
 
                 Logger.debug(
                     f'Weights attribute: {attr} of node name: {n.name} has the following quantization params: '
                     f'{str(n.final_weights_quantization_cfg.get_attr_config(attr).weights_quantization_params)}')
 
-                # Set the attribute to be the quantized attribute.
+                # Set the attribute to be the quantized attribute (the cached tensor is read-only, so it is
+                # shared without copying it).
                 n.set_weights_by_keys(attr, quantized_attr)
 
     return _quantized_graph
@@ -17,11 +17,13 @@
 from model_compression_toolkit.logger import Logger
 from model_compression_toolkit.core.common.graph.base_node import BaseNode
 from model_compression_toolkit.core.common.quantization.node_quantization_config import WeightsAttrQuantizationConfig
+from model_compression_toolkit.core.common.quantization.quantized_weights_cache import QuantizedWeightsCache
 
 
 def get_quantized_weights_attr_by_qc(attr_name: str,
                                      n: BaseNode,
-                                     weights_qc: WeightsAttrQuantizationConfig):
+                                     weights_qc: WeightsAttrQuantizationConfig,
+                                     quantized_weights_cache: QuantizedWeightsCache = None):
     """
     For a weights attribute and weights attribute quantization configuration, compute
     the quantized weights of the node's attribute and return it
@@ -31,6 +33,8 @@ def get_quantized_weights_attr_by_qc(attr_name: str,
         attr_name: The name of the attribute to quantize.
         n: Node to quantize its weights attribute.
         weights_qc: Weight attribute quantization configuration to use for the quantization.
+        quantized_weights_cache: Cache of quantized weights to take the quantized attribute from (if it was already
+            quantized with the same configuration). If None, the attribute is quantized without a cache.
 
     Returns:
         A quantized kernel of the node using a weights quantization configuration.
@@ -47,11 +51,17 @@ def get_quantized_weights_attr_by_qc(attr_name: str,
         output_channels_axis = None
 
     Logger.debug(f'quantizing layer {n.name} attribute {attr_name} with {weights_qc.weights_n_bits} bits')
-    quantized_kernel = weights_qc.weights_quantization_fn(n.get_weights_by_keys(attr_name),
-                                                          n_bits=weights_qc.weights_n_bits,
-                                                          signed=True,
-                                                          quantization_params=weights_qc.weights_quantization_params,
-                                                          per_channel=weights_qc.weights_per_channel_threshold,
-                                                          output_channels_axis=output_channels_axis)
+    if quantized_weights_cache is not None:
+        quantized_kernel = quantized_weights_cache.get_quantized_weights(n.get_weights_by_keys(attr_name),
+                                                                         weights_qc,
+                                                                         output_channels_axis,
+                                                                         n.get_weights_fingerprint(attr_name))
+    else:
+        quantized_kernel = weights_qc.weights_quantization_fn(n.get_weights_by_keys(attr_name),
+                                                              n_bits=weights_qc.weights_n_bits,
+                                                              signed=True,
+                                                              quantization_params=weights_qc.weights_quantization_params,
+                                                              per_channel=weights_qc.weights_per_channel_threshold,
+                                                              output_channels_axis=output_channels_axis)
 
     return quantized_kernel, channels_axis
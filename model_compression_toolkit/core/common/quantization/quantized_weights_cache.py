@@ -0,0 +1,144 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+from model_compression_toolkit.logger import Logger
+
+# Default bound on the total size (in bytes) of the quantized tensors held by a cache.
+DEFAULT_CACHE_MAX_BYTES = 2 ** 28
+
+
+def tensor_fingerprint(tensor: Any) -> Tuple:
+    """
+    Computes a fingerprint of a tensor's content.
+
+    Args:
+        tensor: A numpy array (or a value that can be converted to a numpy array).
+
+    Returns:
+        A hashable fingerprint of the tensor's shape, type and values.
+    """
+    tensor = np.ascontiguousarray(tensor)
+    return tensor.shape, tensor.dtype.str, hashlib.blake2b(tensor.tobytes(), digest_size=16).digest()
+
+
+class QuantizedWeightsCache:
+    """
+    A cache of quantized weights tensors, keyed by the float weights and the effective quantization parameters
+    (quantization function, number of bits, quantization params, per-channel mode and output channels axis).
+    The same kernel is quantized with the same parameters by several stages of the optimization process (bias
+    correction, the mixed-precision models built for the sensitivity evaluation, the final weights quantization), so
+    the graph holds a cache that is shared by all its copies, and each stage reuses the cached quantized tensors.
+    The cache is bounded by the total size of its tensors, and the least recently used tensors are evicted first.
+    Cached tensors are read-only, since they are shared between their users.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        """
+        Args:
+            max_bytes: Bound on the total size (in bytes) of the cached tensors.
+        """
+        self.max_bytes = max_bytes
+        self.cached_tensors = OrderedDict()
+        self.cached_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get_quantized_weights(self,
+                              float_weights: np.ndarray,
+                              weights_attr_cfg: Any,
+                              output_channels_axis: int,
+                              weights_fingerprint: Tuple = None) -> np.ndarray:
+        """
+        Get the quantized weights of a float weights tensor using a weights attribute quantization configuration.
+        The quantized tensor is taken from the cache if it was already computed, otherwise it is computed and cached.
+
+        Args:
+            float_weights: Float weights tensor to quantize.
+            weights_attr_cfg: WeightsAttrQuantizationConfig to quantize the tensor with.
+            output_channels_axis: Output channels axis of the tensor (for per-channel quantization).
+            weights_fingerprint: Fingerprint of the float weights tensor (see BaseNode.get_weights_fingerprint).
+                If None, it is computed from the tensor.
+
+        Returns:
+            The quantized weights tensor (read-only).
+        """
+        if weights_fingerprint is None:
+            weights_fingerprint = tensor_fingerprint(float_weights)
+        key = self._get_key(weights_fingerprint, weights_attr_cfg, output_channels_axis)
+        if key in self.cached_tensors:
+            self.hits += 1
+            self.cached_tensors.move_to_end(key)
+            return self.cached_tensors[key]
+
+        self.misses += 1
+        quantized_weights = weights_attr_cfg.weights_quantization_fn(float_weights,
+                                                                     n_bits=weights_attr_cfg.weights_n_bits,
+                                                                     signed=True,
+                                                                     quantization_params=weights_attr_cfg.weights_quantization_params,
+                                                                     per_channel=weights_attr_cfg.weights_per_channel_threshold,
+                                                                     output_channels_axis=output_channels_axis)
+        if isinstance(quantized_weights, np.ndarray) and quantized_weights.nbytes <= self.max_bytes:
+            quantized_weights.flags.writeable = False
+            self.cached_tensors[key] = quantized_weights
+            self.cached_bytes += quantized_weights.nbytes
+            self._evict()
+        return quantized_weights
+
+    def clear(self):
+        """
+        Remove all tensors from the cache.
+        """
+        self.cached_tensors.clear()
+        self.cached_bytes = 0
+
+    def _evict(self):
+        """
+        Evict the least recently used tensors until the cache holds its size bound.
+        """
+        while self.cached_bytes > self.max_bytes:
+            _, evicted_tensor = self.cached_tensors.popitem(last=False)
+            self.cached_bytes -= evicted_tensor.nbytes
+            Logger.debug(f'Evicted a quantized weights tensor of {evicted_tensor.nbytes} bytes from the cache.')
+
+    @staticmethod
+    def _get_key(weights_fingerprint: Tuple, weights_attr_cfg: Any, output_channels_axis: int) -> Tuple:
+        """
+        Returns: The cache key of quantizing the float weights with the weights attribute quantization configuration.
+        """
+        quantization_params: Dict[str, Any] = weights_attr_cfg.weights_quantization_params or {}
+        return (weights_fingerprint,
+                weights_attr_cfg.weights_quantization_fn,
+                weights_attr_cfg.weights_n_bits,
+                weights_attr_cfg.weights_per_channel_threshold,
+                output_channels_axis,
+                tuple((k, tensor_fingerprint(v)) for k, v in sorted(quantization_params.items())))
+
+    def __deepcopy__(self, memo: Dict) -> 'QuantizedWeightsCache':
+        """
+        The cache is shared by all copies of the graph that holds it (its keys include the float weights, so
+        modified weights in one of the copies do not get stale tensors).
+        """
+        return self
+
+    def __reduce__(self) -> Tuple:
+        """
+        The cached tensors are not pickled (e.g., in a graph snapshot), so an unpickled cache is empty.
+        """
+        return QuantizedWeightsCache, (self.max_bytes,)
@@ -13,8 +13,6 @@
 # limitations under the License.
 # ==============================================================================
 
-
-import copy
 from typing import List, Tuple
 
 from model_compression_toolkit.core.common import BaseNode
@@ -208,9 +206,9 @@ def _create_node_candidates_qc(qc: QuantizationConfig,
     node_attrs_list = node.get_node_weights_attributes()
 
     if mixed_precision_enable:
+        # The candidates only read values from the QuantizationConfig, so it is not copied for each candidate.
         for op_cfg in node_qc_options.quantization_config_list:
-            candidate_qc = copy.deepcopy(qc)
-            candidates.append(_create_node_single_candidate_qc(candidate_qc,
+            candidates.append(_create_node_single_candidate_qc(qc,
                                                                fw_info,
                                                                weight_channel_axis,
                                                                op_cfg,
@@ -0,0 +1,54 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Tuple
+
+from model_compression_toolkit.logger import Logger
+
+# Default quantiles of the collected histograms that are tracked for convergence.
+DEFAULT_TRACKED_QUANTILES = (0.01, 0.5, 0.99, 0.999)
+
+
+class StatsConvergenceConfig:
+    """
+    A class to configure an early stop of the statistics collection, once the collected statistics converged.
+    """
+    def __init__(self,
+                 tolerance: float = 1e-3,
+                 patience: int = 5,
+                 min_batches: int = 10,
+                 max_batches: int = None,
+                 tracked_quantiles: Tuple[float, ...] = DEFAULT_TRACKED_QUANTILES):
+        """
+
+        Args:
+            tolerance (float): Maximal relative change of a tensor's statistics (min, max, mean per-channel and
+             histogram quantiles) in a batch, for the tensor to be considered stable. The change is relative to the
+             tensor's range of values.
+            patience (int): Number of consecutive batches all tensors should be stable in, for the collection to stop.
+            min_batches (int): Minimal number of batches to collect statistics on.
+            max_batches (int): Maximal number of batches to collect statistics on (even if the statistics did not
+             converge). If None, the collection stops at the end of the representative dataset.
+            tracked_quantiles (Tuple[float, ...]): Quantiles of the tensors' histograms that are tracked for
+             convergence.
+        """
+        if patience < 1:
+            Logger.critical(f'patience must be at least 1, but got {patience}.')
+        if max_batches is not None and max_batches < min_batches:
+            Logger.critical(f'max_batches ({max_batches}) must not be smaller than min_batches ({min_batches}).')
+        self.tolerance = tolerance
+        self.patience = patience
+        self.min_batches = min_batches
+        self.max_batches = max_batches
+        self.tracked_quantiles = tracked_quantiles
@@ -0,0 +1,54 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from enum import Enum
+
+from model_compression_toolkit.logger import Logger
+
+# Default budget of elements per collected tensor for the histogram and mean statistics.
+DEFAULT_MAX_ELEMENTS = 2 ** 20
+
+
+class StatsSamplingMethod(Enum):
+    """
+    Method for sampling the elements of a collected tensor:
+    RANDOM - Sample positions of the tensor uniformly at random (with replacement).
+    STRATIFIED - Split the positions of the tensor into equal strata, and sample a random position from each stratum.
+    """
+    RANDOM = 0
+    STRATIFIED = 1
+
+
+class StatsSamplingConfig:
+    """
+    A class to configure the sampling of large collected tensors for the histogram and mean statistics.
+    The min/max statistics are always collected on the full tensor.
+    """
+    def __init__(self,
+                 max_elements: int = DEFAULT_MAX_ELEMENTS,
+                 method: StatsSamplingMethod = StatsSamplingMethod.STRATIFIED,
+                 seed: int = 0):
+        """
+
+        Args:
+            max_elements (int): Budget of elements per collected tensor. The histogram and mean of a tensor with more
+             elements are updated with a sample of its positions (all channels of each sampled position are used).
+            method (StatsSamplingMethod): Method for sampling the positions of a tensor.
+            seed (int): Seed of the random sampling of each statistics collector.
+        """
+        if max_elements < 1:
+            Logger.critical(f'max_elements must be at least 1, but got {max_elements}.')
+        self.max_elements = max_elements
+        self.method = method
+        self.seed = seed
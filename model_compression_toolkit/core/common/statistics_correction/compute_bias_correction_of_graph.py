@@ -21,6 +21,7 @@ from model_compression_toolkit.core.common.framework_implementation import Frame
 from model_compression_toolkit.core.common.framework_info import FrameworkInfo
 from model_compression_toolkit.core.common import BaseNode, Graph
 from model_compression_toolkit.core.common.quantization.quantize_node import get_quantized_weights_attr_by_qc
+from model_compression_toolkit.core.common.quantization.quantized_weights_cache import QuantizedWeightsCache
 from model_compression_toolkit.core.common.collectors.statistics_collector import BaseStatsCollector
 from model_compression_toolkit.logger import Logger
 
@@ -58,7 +59,8 @@ def compute_bias_correction_of_graph(graph: Graph,
                                                               kernel_attr,
                                                               fw_info,
                                                               graph.get_in_stats_collector(n),
-                                                              fw_impl=fw_impl)
+                                                              fw_impl=fw_impl,
+                                                              quantized_weights_cache=graph.quantized_weights_cache)
     return graph
 
 
@@ -66,7 +68,8 @@ def _compute_bias_correction_per_candidate_qc(node: BaseNode,
                                               kernel_attr: str,
                                               fw_info: FrameworkInfo,
                                               node_in_stats_collector: BaseStatsCollector,
-                                              fw_impl: FrameworkImplementation):
+                                              fw_impl: FrameworkImplementation,
+                                              quantized_weights_cache: QuantizedWeightsCache = None):
     """
     For each candidate weights quantization configuration of a given node,
     compute the bias-correction term, and store it in the candidate weights quantization configuration.
@@ -77,6 +80,7 @@ def _compute_bias_correction_per_candidate_qc(node: BaseNode,
         fw_info: Framework info like lists of nodes their kernel should quantized.
         node_in_stats_collector: Statistics collector of the node for the mean per-channel.
         fw_impl: FrameworkImplementation object with a specific framework methods implementation.
+        quantized_weights_cache: Cache of quantized weights to take the candidates' quantized kernels from.
 
     """
 
@@ -87,7 +91,8 @@ def _compute_bias_correction_per_candidate_qc(node: BaseNode,
             quantized_kernel, io_channels_axes = get_quantized_weights_attr_by_qc(kernel_attr,
                                                                                   node,
                                                                                   candidate_qc.weights_quantization_cfg
-                                                                                  .get_attr_config(kernel_attr))
+                                                                                  .get_attr_config(kernel_attr),
+                                                                                  quantized_weights_cache)
 
             bias_correction_term = _get_bias_correction_term_of_node(io_channels_axes[0],
                                                                      node,
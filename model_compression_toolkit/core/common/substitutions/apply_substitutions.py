@@ -16,6 +16,7 @@
 from typing import List
 
 from model_compression_toolkit.core import common
+from model_compression_toolkit.core.common.profiler import Profiler
 
 
 def substitute(graph: common.Graph,
@@ -31,7 +32,8 @@ def substitute(graph: common.Graph,
     """
 
     for substitution in substitutions_list:
-        matched_nodes = graph.filter(substitution.matcher_instance)
-        for idn in matched_nodes:
-            graph = substitution.substitute(graph, idn)
+        with Profiler.profile(type(substitution).__name__):
+            matched_nodes = graph.filter(substitution.matcher_instance)
+            for idn in matched_nodes:
+                graph = substitution.substitute(graph, idn)
     return graph
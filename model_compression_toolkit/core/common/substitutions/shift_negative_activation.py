@@ -30,7 +30,7 @@ from model_compression_toolkit.core.common.quantization.core_config import CoreC
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_activations_computation \
     import get_activations_qparams
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.error_functions import \
-    _mse_error_histogram
+    _batch_mse_error_histogram
 from model_compression_toolkit.core.common.quantization.quantization_params_generation import z_score_filter
 
 """
@@ -267,15 +267,21 @@ def shift_negative_function(graph: Graph,
         hist_count = z_score_filter(non_linear_node_cfg_candidate.z_threshold,
                                     hist_bins, hist_count)
 
+        # The histograms shifted by all shift values of a threshold are quantized at once (a shifted histogram per
+        # row), in chunks of rows that fit the quantization parameters search's bound on the arrays size.
+        hist_bins = hist_bins.astype(np.float32)
+        shifts_chunk = max(1, core_config.quantization_config.qparams_search_max_chunk_bytes // hist_bins.nbytes)
+
         min_mse, _th, _shift = np.inf, None, None
         for _activation_threshold in [activation_threshold, 2 * activation_threshold]:
             qparams = {THRESHOLD: _activation_threshold, SIGNED: False}
             _lsb = _activation_threshold / num_q_points
             _q_points = np.linspace(0, _activation_threshold - _lsb, num_q_points).astype(
                 'float32')  # Change to type float32 to support tensorflow dtypes
-            for _shift_value in _q_points:
-                _hist_bins = hist_bins.astype(np.float32) + _shift_value
-                fw_quant_fn = non_linear_node_cfg_candidate.activation_quantization_fn(non_linear_node_cfg_candidate.activation_n_bits,qparams)
+            fw_quant_fn = non_linear_node_cfg_candidate.activation_quantization_fn(non_linear_node_cfg_candidate.activation_n_bits,qparams)
+            for i in range(0, num_q_points, shifts_chunk):
+                _shift_values = _q_points[i:i + shifts_chunk]
+                _hist_bins = hist_bins + _shift_values.reshape([-1, 1])
                 """
                 In SNC, when better shifting values are tested for better choice,
                 the histogram (which is a numpy object) is quantized using the non-linear node activation
@@ -293,10 +299,11 @@ def shift_negative_function(graph: Graph,
                 else:
                     q_bins = params_search_quantization_fn(fw_quant_fn, _hist_bins)
 
-                mse = _mse_error_histogram(q_bins, None, _hist_bins, hist_count)
-                if mse < min_mse:
-                    min_mse = mse
-                    _th, _shift = _activation_threshold, _shift_value
+                mse = _batch_mse_error_histogram(q_bins, _hist_bins, hist_count)
+                best = np.argmin(mse)
+                if mse[best] < min_mse:
+                    min_mse = mse[best]
+                    _th, _shift = _activation_threshold, _shift_values[best]
 
         shift_value = _shift
         activation_threshold = _th
@@ -30,6 +30,7 @@ class UserInformation:
         self.gptq_info_dict = dict()
         self.mixed_precision_cfg = None
         self.final_resource_utilization = None
+        self.profiling_report = None
 
     def set_input_scale(self, scale_value: float):
         """
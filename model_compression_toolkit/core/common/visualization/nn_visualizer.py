@@ -48,12 +48,39 @@ def _get_compare_points(input_graph: Graph) -> Tuple[List[BaseNode], List[str]]:
     return compare_points, compare_points_name
 
 
+def _compute_batch_distance(float_tensor: np.ndarray,
+                            fxp_tensor: np.ndarray,
+                            distance_fn: Callable) -> np.ndarray:
+    """
+    Compute the distance between a float tensor and a quantized tensor for each sample in their batch.
+
+    Args:
+        float_tensor: Float tensor with the samples along its first axis.
+        fxp_tensor: Quantized tensor with the samples along its first axis.
+        distance_fn: Distance function to calculate the distance between two tensors.
+
+    Returns:
+        Array with the distance of each sample.
+    """
+    num_samples = float_tensor.shape[0]
+    distance = np.broadcast_to(np.asarray(distance_fn(float_tensor, fxp_tensor, batch=True), dtype=np.float64),
+                               [num_samples]).copy()
+
+    # Distance functions may handle constant-zero tensors as a special case, which the batched computation applies only
+    # when all the samples are zero, so these samples are computed separately.
+    zero_samples = np.logical_and(np.all(float_tensor.reshape([num_samples, -1]) == 0, axis=1),
+                                  np.all(fxp_tensor.reshape([num_samples, -1]) == 0, axis=1))
+    for i in np.flatnonzero(zero_samples):
+        distance[i] = distance_fn(float_tensor[i:i + 1], fxp_tensor[i:i + 1])
+    return distance
+
+
 class NNVisualizer:
     """
     Class to build two models from two graph: a float and a quantized version.
     NNVisualizer can compare the two models outputs after each layer.
-    The results can be displayed using plot_cs_graph by passing it an input image to use
-    for inference of the models.
+    The distances of a batch of inputs can be computed using compute_distances, and displayed using
+    plot_distances. plot_distance_graph computes and displays the distances of a single input sample.
     """
 
     def __init__(self,
@@ -110,6 +137,38 @@ class NNVisualizer:
             self.compare_points_name_float) > 0 and len(self.compare_points_name) > 0
 
 
+    def compute_distances(self,
+                          inputs: List[np.ndarray],
+                          distance_fn: Callable = compute_cs,
+                          convert_to_range: Callable = lambda a: a) -> np.ndarray:
+        """
+        Compare the outputs of the quantized and the float versions of the network at each compare point,
+        for each sample of a batch of inputs. Both models are run once on the whole batch, and the distance of
+        all samples is computed at once per compare point.
+
+        Args:
+            inputs: Batch of inputs to the networks (a tensor per model input).
+            distance_fn: Distance function to calculate the distance between two tensors. The function must support
+                a per-sample computation over a batch (using the 'batch' argument), like compute_cs.
+            convert_to_range: Optional function to move the distance values into a specific range, e.g., when using
+                cosine similarity for distance, use 'lambda a: 1 - 2 * a' to convert the distance values to the range
+                of [-1, 1].
+
+        Returns:
+            Array of the distances with shape (number of samples, number of compare points).
+        """
+        tensors_float = self.fw_impl.run_model_inference(self.float_model, inputs)
+        tensors_fxp = self.fw_impl.run_model_inference(self.quantized_model, inputs)
+        if not isinstance(tensors_float, (list, tuple)):
+            tensors_float, tensors_fxp = [tensors_float], [tensors_fxp]
+
+        distance_array = np.stack([_compute_batch_distance(self.fw_impl.to_numpy(t_float),
+                                                           self.fw_impl.to_numpy(t_fxp),
+                                                           distance_fn)
+                                   for t_float, t_fxp in zip(tensors_float, tensors_fxp)], axis=1)
+
+        return convert_to_range(distance_array)
+
     def plot_distance_graph(self,
                             input_image: np.ndarray,
                             sample_index: int,
@@ -133,20 +192,21 @@ class NNVisualizer:
 
         # To compare cosine similarity, we use a single image as input (per input),
         # to make the difference more noticeable when exists
-        new_inputs = []
-        for single_input in input_image:
-            img = single_input[sample_index]
-            new_inputs.append(np.expand_dims(img, axis=0))
+        new_inputs = [single_input[sample_index:sample_index + 1] for single_input in input_image]
+        distance_array = self.compute_distances(new_inputs, distance_fn=distance_fn, convert_to_range=convert_to_range)
+        return self.plot_distances(distance_array[0])
 
-        # Get outputs
-        tensors_float = self.fw_impl.run_model_inference(self.float_model, new_inputs)
-        tensors_fxp = self.fw_impl.run_model_inference(self.quantized_model, new_inputs)
+    @staticmethod
+    def plot_distances(distance_array: np.ndarray) -> Figure:
+        """
+        Plot the distances of a single sample at the compare points.
 
-        # Compute distance between couples of outputs.
-        distance_array = np.asarray(
-            [distance_fn(self.fw_impl.to_numpy(t_float), self.fw_impl.to_numpy(t_fxp)) for t_float, t_fxp in zip(tensors_float, tensors_fxp)])
+        Args:
+            distance_array: Distance at each compare point.
 
-        distance_array = convert_to_range(distance_array)
+        Returns:
+            Figure of the distance per layer.
+        """
 
         # Display the result: distance at every layer's output.
         fig = plt.figure()
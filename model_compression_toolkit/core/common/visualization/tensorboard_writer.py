@@ -12,11 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-
-from copy import deepcopy
-
 import io
 import os
+import queue
+import threading
 import numpy as np
 from PIL import Image
 from matplotlib.figure import Figure
@@ -30,17 +29,21 @@ from tensorboard.compat.proto.summary_pb2 import HistogramProto
 from tensorboard.compat.proto.summary_pb2 import Summary
 from tensorboard.compat.proto.tensor_shape_pb2 import TensorShapeProto
 from tensorboard.summary.writer.event_file_writer import EventFileWriter
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Callable, NamedTuple, Tuple
 from networkx import topological_sort
 from model_compression_toolkit.core import FrameworkInfo
 from model_compression_toolkit.core.common import Graph, BaseNode
 from model_compression_toolkit.core.common.collectors.statistics_collector import BaseStatsCollector
+from model_compression_toolkit.core.common.quantization.debug_config import DebugConfig
 from model_compression_toolkit.logger import Logger
 from model_compression_toolkit.core.common.visualization.final_config_visualizer import \
     WeightsFinalBitwidthConfigVisualizer, ActivationFinalBitwidthConfigVisualizer
 
 DEVICE_STEP_STATS = "/device:CPU:0"
 
+# Default bound on the number of pending logging tasks of the TensorboardWriter's background thread.
+DEFAULT_QUEUE_SIZE = 8
+
 
 def get_node_properties(node_dict_to_log: dict,
                         output_shapes: List[tuple] = None) -> Dict[str, Any]:
@@ -82,18 +85,74 @@ def get_node_properties(node_dict_to_log: dict,
     return node_properties
 
 
+class _NodeSnapshot(NamedTuple):
+    """
+    The data of a graph's node that is needed to create its NodeDefs, taken when the graph is logged.
+    """
+    name: str
+    op: str
+    attr: Dict[str, Any]
+    output_dims: List[tuple]
+    weights_attr: Dict[str, Any]
+    activation_attr: Dict[str, Any]
+    memory_bytes: int
+    inputs: List[Tuple[int, int]]
+    is_input: bool
+    is_output: bool
+
+
+def _create_hist_proto(bins: np.ndarray,
+                       counts: np.ndarray) -> HistogramProto:
+    """
+    Create a protobuf for a histogram using collected bins and counts.
+
+    Args:
+        bins: Values of histogram bins.
+        counts: Counts of histogram values.
+
+    Returns:
+        Protobuf of a histogram to display on Tensorboard.
+    """
+
+    sum_sq = ((bins * bins) * counts).sum()
+    return HistogramProto(min=bins.min(),
+                          max=bins.max(),
+                          num=len(bins),
+                          sum=(bins * counts).sum(),
+                          sum_squares=sum_sq,
+                          bucket_limit=bins.tolist(),
+                          bucket=counts.tolist())
+
+
 class TensorboardWriter(object):
     """
     Class to log events to display using Tensorboard such as graphs, histograms, images, etc.
+
+    Logging a graph (or its statistics) only takes a snapshot of the data the events are created from (such as the
+    nodes' attributes and the collected histograms). Creating the events, serializing them and writing them to the
+    event files is done by a background thread, which consumes a bounded queue of logging tasks (when the queue is
+    full, the logging methods wait for the background thread). The logged stages can be selected by their tag names,
+    and the statistics can be logged for a sample of the graph's nodes.
     """
 
-    def __init__(self, dir_path: str, fw_info: FrameworkInfo):
+    def __init__(self,
+                 dir_path: str,
+                 fw_info: FrameworkInfo,
+                 async_write: bool = True,
+                 stages: List[str] = None,
+                 max_logged_nodes: int = None,
+                 queue_size: int = DEFAULT_QUEUE_SIZE):
         """
         Initialize a TensorboardWriter object.
         
         Args:
             dir_path: Path to save all events to display on Tensorboard.
             fw_info: FrameworkInfo object (needed for computing nodes' weights memory).
+            async_write: Whether to create and write the events in a background thread, or in the calling thread.
+            stages: Tag names of the stages to log (e.g., 'initial_graph'). If None, all stages are logged.
+            max_logged_nodes: Maximal number of nodes to log the statistics of in each stage. The nodes are evenly
+                sampled from the graph's nodes. If None, the statistics of all nodes are logged.
+            queue_size: Maximal number of pending logging tasks of the background thread.
 
         """
         self.dir_path = dir_path
@@ -101,85 +160,161 @@ class TensorboardWriter(object):
         # process).
         self.tag_name_to_event_writer = {}
         self.fw_info = fw_info
+        self.async_write = async_write
+        self.stages = None if stages is None else set(stages)
+        self.max_logged_nodes = max_logged_nodes
+        self.queue_size = queue_size
+        # The background thread and its queue of logging tasks are created when the first task is submitted.
+        self.tasks_queue = None
+        self.worker = None
+
+    def is_logged_stage(self, main_tag_name: str) -> bool:
+        """
+        Args:
+            main_tag_name: Tag name of a stage.
+
+        Returns:
+            Whether the stage should be logged.
+        """
+        return self.stages is None or main_tag_name in self.stages
+
+    def flush(self):
+        """
+        Wait until all the submitted logging tasks are written.
+        """
+        if self.worker is not None:
+            self.tasks_queue.join()
 
     def close(self):
         """
 
-        Close all event-writers the TensorboardWriter holds.
+        Close all event-writers the TensorboardWriter holds (after the pending logging tasks are written).
         Should be called at the end of logging process.
 
         """
+        if self.worker is not None:
+            self.tasks_queue.put(None)
+            self.worker.join()
+            self.tasks_queue, self.worker = None, None
         for writer in self.tag_name_to_event_writer.values():
             writer.close()
+        # Events that are logged after closing the writer are written to new event files.
+        self.tag_name_to_event_writer = {}
 
-    def add_histograms(self, graph: Graph, main_tag_name: str):
+    def _submit(self, create_events: Callable[[], List[Tuple[str, List[Event]]]], main_tag_name: str):
         """
-        Add histograms to display on Tensorboard. All existing histograms in a graph are 
-        logged with a tag name main_tag_name.
-        
+        Submit a logging task, that creates the events to write.
+
         Args:
-            graph: Graph to display all collected histograms it contains.
-            main_tag_name: Tag to attach to all histograms.
+            create_events: Function that creates the events to write (list of events for each tag name).
+            main_tag_name: Tag name of the logged stage.
 
         """
+        if not self.async_write:
+            self._write_events(create_events())
+            return
+
+        if self.worker is None:
+            self.tasks_queue = queue.Queue(maxsize=self.queue_size)
+            self.worker = threading.Thread(target=self._run_tasks,
+                                           args=(self.tasks_queue,),
+                                           name='TensorboardWriter',
+                                           daemon=True)
+            self.worker.start()
+        self.tasks_queue.put((create_events, main_tag_name))
+
+    def _run_tasks(self, tasks_queue: queue.Queue):
+        """
+        Run the logging tasks of a queue, until a None task is received.
 
-        def __create_hist_proto(bins: np.ndarray,
-                                counts: np.ndarray) -> HistogramProto:
-            """
-            Create a protobuf for a histogram using collected bins and counts.
+        Args:
+            tasks_queue: Queue of logging tasks.
 
-            Args:
-                bins: Values of histogram bins.
-                counts: Counts of histogram values.
+        """
+        while True:
+            task = tasks_queue.get()
+            try:
+                if task is None:
+                    return
+                create_events, main_tag_name = task
+                self._write_events(create_events())
+            except Exception as e:
+                Logger.error(f'Failed to log {main_tag_name} to Tensorboard: {e}')
+            finally:
+                tasks_queue.task_done()
+
+    def _write_events(self, tags_events: List[Tuple[str, List[Event]]]):
+        """
+        Write events to the event-writers of their tag names.
 
-            Returns:
-                Protobuf of a histogram to display on Tensorboard.
-            """
+        Args:
+            tags_events: List of events to write for each tag name.
 
-            sum_sq = ((bins * bins) * counts).sum()
-            return HistogramProto(min=bins.min(),
-                                  max=bins.max(),
-                                  num=len(bins),
-                                  sum=(bins * counts).sum(),
-                                  sum_squares=sum_sq,
-                                  bucket_limit=bins.tolist(),
-                                  bucket=counts.tolist())
+        """
+        for tag_name, events in tags_events:
+            er = self.__get_event_writer_by_tag_name(tag_name)
+            for event in events:
+                er.add_event(event)
+            er.flush()
 
-        def __create_histo_event(statistics_collector: BaseStatsCollector):
-            """
-            Create an event of histogram, and attach it to a list of events outside
-            the scope called 'events'.
+    def _get_logged_collectors(self, graph: Graph) -> List[Tuple[BaseNode, BaseStatsCollector]]:
+        """
+        Get the statistics collectors to log of a graph's nodes (of the sampled nodes, if the number of logged nodes
+        is limited).
 
-            Args:
-                statistics_collector: Statistics collector to create an event from its histogram.
+        Args:
+            graph: Graph to get its statistics collectors.
 
-            """
+        Returns:
+            List of nodes and their statistics collectors.
+        """
+        nodes_collectors = []
+        for n in graph.nodes:
+            collector = graph.get_out_stats_collector(n)
+            if collector is not None:
+                nodes_collectors.append((n, collector if isinstance(collector, list) else [collector]))
+
+        if self.max_logged_nodes is not None and len(nodes_collectors) > self.max_logged_nodes:
+            sampled_nodes = np.round(np.linspace(0, len(nodes_collectors) - 1, self.max_logged_nodes)).astype(int)
+            nodes_collectors = [nodes_collectors[i] for i in sampled_nodes]
+
+        return [(n, c) for n, collectors in nodes_collectors for c in collectors]
+
+    def add_histograms(self, graph: Graph, main_tag_name: str):
+        """
+        Add histograms to display on Tensorboard. All existing histograms in a graph are 
+        logged with a tag name main_tag_name.
+        
+        Args:
+            graph: Graph to display all collected histograms it contains.
+            main_tag_name: Tag to attach to all histograms.
+
+        """
+        if not self.is_logged_stage(main_tag_name):
+            return
+
+        # Snapshot of the histograms to log
+        histograms = []
+        for n, statistics_collector in self._get_logged_collectors(graph):
             if statistics_collector.require_collection():
                 if hasattr(statistics_collector, 'hc'):
                     if statistics_collector.hc.is_legal:
                         bins, counts = statistics_collector.hc.get_histogram()
                         if bins is not None and counts is not None:
-                            hist = __create_hist_proto(bins[:-1], counts)
-                            summary = Summary(value=[Summary.Value(tag=n.name, histo=hist)])
-                            events.append(Event(summary=summary))
+                            histograms.append((n.name, np.array(bins[:-1]), np.array(counts)))
 
-        events = []
-        for n in graph.nodes:
-            collector = graph.get_out_stats_collector(n)
-            if collector is not None:
-                statistics = graph.get_out_stats_collector(n)
-                if isinstance(statistics, list):
-                    for s in statistics:
-                        __create_histo_event(s)
-                else:
-                    __create_histo_event(statistics)
+        def __create_histo_events() -> List[Tuple[str, List[Event]]]:
+            """
+            Create the events of the histograms.
 
-        # Get the event writer for this tag name
-        er = self.__get_event_writer_by_tag_name(main_tag_name)
+            Returns:
+                The events of the histograms, tagged with main_tag_name.
+            """
+            events = [Event(summary=Summary(value=[Summary.Value(tag=name, histo=_create_hist_proto(bins, counts))]))
+                      for name, bins, counts in histograms]
+            return [(main_tag_name, events)]
 
-        for event in events:
-            er.add_event(event)
-        er.flush()
+        self._submit(__create_histo_events, main_tag_name)
 
     def add_graph(self,
                   graph: Graph,
@@ -192,6 +327,8 @@ class TensorboardWriter(object):
             main_tag_name: Tag to attach to the graph.
 
         """
+        if not self.is_logged_stage(main_tag_name):
+            return
 
         def __get_node_act_attr(n: BaseNode) -> Dict[str, Any]:
             """
@@ -206,7 +343,7 @@ class TensorboardWriter(object):
             """
             attr = dict()
             if n.final_activation_quantization_cfg is not None:
-                attr.update(n.final_activation_quantization_cfg.__dict__)
+                attr.update(n.final_activation_quantization_cfg.get_config_dict())
             elif n.candidates_quantization_cfg is not None:
                 attr.update(n.get_unified_activation_candidates_dict())
             return attr
@@ -228,7 +365,7 @@ class TensorboardWriter(object):
             # Log final config or unified candidates, not both
             attr = dict()
             if n.final_weights_quantization_cfg is not None:
-                attr.update(n.final_weights_quantization_cfg.__dict__)
+                attr.update(n.final_weights_quantization_cfg.get_config_dict())
             elif n.candidates_quantization_cfg is not None:
                 attr.update(n.get_unified_weights_candidates_dict(self.fw_info))
             return attr
@@ -244,7 +381,9 @@ class TensorboardWriter(object):
             Returns:
                 Dictionary containing attributes to display.
             """
-            attr = deepcopy(n.framework_attr)
+            # The attributes are converted to their display values when the events are created, so only the
+            # dictionary is copied.
+            attr = dict(n.framework_attr)
             if n.quantization_attr is not None:
                 attr.update(n.quantization_attr)
             return attr
@@ -279,84 +418,87 @@ class TensorboardWriter(object):
                 dims = [(-1,) + output_shape[1:] if output_shape[0] is None else output_shape]
             return dims
 
-        def __create_node_stats(n: BaseNode):
+        # Snapshot of the graph's nodes (in a topological order) to create the graph's events from.
+        graph_name = graph.name
+        node_sort = list(topological_sort(graph))
+        node_index = {n: i for i, n in enumerate(node_sort)}
+        nodes_snapshots = [_NodeSnapshot(name=n.name,
+                                         op=n.type.__name__,
+                                         attr=__get_node_attr(n),
+                                         output_dims=__get_node_output_dims(n),
+                                         weights_attr=__get_node_weights_attr(n),
+                                         activation_attr=__get_node_act_attr(n),
+                                         memory_bytes=int(n.get_memory_bytes(self.fw_info)),
+                                         inputs=[(node_index[e.source_node], e.source_index)
+                                                 for e in graph.incoming_edges(n)],
+                                         is_input=len(graph.incoming_edges(n)) == 0,
+                                         is_output=len(graph.out_edges(n)) == 0)
+                           for n in node_sort]
+
+        def __create_graph_events() -> List[Tuple[str, List[Event]]]:
             """
-            Create a NodeExecStats for a node in the graph. A NodeExecStats contains the
-            memory and compute time a node requires.
-
-            Args:
-                n: Node to create its NodeExecStats.
+            Create the events of the graph: the GraphDef of the graph and the memory its nodes require.
 
             Returns:
-                A NodeExecStats for a node containing its memory and compute time.
-
+                The events of the graph, tagged with main_tag_name.
             """
-
-            return NodeExecStats(node_name=n.name,
-                                 memory=[AllocatorMemoryUsed(
-                                     total_bytes=int(n.get_memory_bytes(self.fw_info))
-                                 )])
-
-        graph_def = GraphDef()  # GraphDef to add to Tensorboard
-
-        node_stats = []
-        types_dict = dict()
-        node_sort = list(topological_sort(graph))
-        for n in node_sort:  # For each node in the graph, we create NodeDefs and connect them to existing NodeDefs
-            # ----------------------------
-            # Main NodeDef: framework attributes
-            # ----------------------------
-            main_node_def = NodeDef(attr=get_node_properties(__get_node_attr(n), __get_node_output_dims(n)))
-            main_node_def.device = n.type.__name__  # For coloring different ops differently
-            main_node_def.op = n.type.__name__
-            op_id = types_dict.get(main_node_def.op, 0)
-            if len(graph.incoming_edges(n)) == 0:  # Input layer
-                n.tb_node_def = 'Input/' + n.name
-            elif len(graph.out_edges(n)) == 0:  # Output layer
-                n.tb_node_def = 'Output/' + n.name
-            else:
-                n.tb_node_def = graph.name + '/' + main_node_def.op + '_' + str(op_id) + '/' + n.name
-            main_node_def.name = n.tb_node_def
-            for e in graph.incoming_edges(n):  # Connect node to its incoming nodes
-                i_tensor = f'{e.source_node.tb_node_def}:{e.source_index}'
-                main_node_def.input.append(i_tensor)
-            # ----------------------------
-            # Weights NodeDef
-            # ----------------------------
-            attr = __get_node_weights_attr(n)
-            if bool(attr):
-                weights_node_def = NodeDef(attr=get_node_properties(attr))
-                weights_node_def.name = main_node_def.name + ".weights"
-                main_node_def.input.append(f'{weights_node_def.name}:{1}')
-                graph_def.node.extend([weights_node_def])  # Add the node to the graph
-            # ----------------------------
-            # Activation NodeDef
-            # ----------------------------
-            attr = __get_node_act_attr(n)
-            if bool(attr):
-                act_node_def = NodeDef(attr=get_node_properties(attr, __get_node_output_dims(n)))
-                n.tb_node_def = main_node_def.name + ".activation"
-                act_node_def.name = n.tb_node_def
-                act_node_def.input.append(f'{main_node_def.name}:{0}')
-                graph_def.node.extend([act_node_def])  # Add the node to the graph
-
-            graph_def.node.extend([main_node_def])  # Add the node to the graph
-            node_stats.append(__create_node_stats(n))
-            types_dict.update({main_node_def.op: op_id + 1})
-
-        er = self.__get_event_writer_by_tag_name(main_tag_name)
-        event = Event(graph_def=graph_def.SerializeToString())
-        er.add_event(event)
-
-        # Logging nodes memory and computation time statistics
-        stepstats = RunMetadata(step_stats=StepStats(
-            dev_stats=[DeviceStepStats(device=DEVICE_STEP_STATS, node_stats=node_stats)])
-        )
-
-        trm = TaggedRunMetadata(tag='Resources', run_metadata=stepstats.SerializeToString())
-        event = Event(tagged_run_metadata=trm)
-        er.add_event(event)
-        er.flush()
+            graph_def = GraphDef()  # GraphDef to add to Tensorboard
+
+            node_stats = []
+            types_dict = dict()
+            tb_node_defs = []  # Name of the output NodeDef of each node
+            for n in nodes_snapshots:  # For each node in the graph, we create NodeDefs and connect them to existing NodeDefs
+                # ----------------------------
+                # Main NodeDef: framework attributes
+                # ----------------------------
+                main_node_def = NodeDef(attr=get_node_properties(n.attr, n.output_dims))
+                main_node_def.device = n.op  # For coloring different ops differently
+                main_node_def.op = n.op
+                op_id = types_dict.get(main_node_def.op, 0)
+                if n.is_input:  # Input layer
+                    main_node_def.name = 'Input/' + n.name
+                elif n.is_output:  # Output layer
+                    main_node_def.name = 'Output/' + n.name
+                else:
+                    main_node_def.name = graph_name + '/' + main_node_def.op + '_' + str(op_id) + '/' + n.name
+                tb_node_def = main_node_def.name
+                for source_index, output_index in n.inputs:  # Connect node to its incoming nodes
+                    main_node_def.input.append(f'{tb_node_defs[source_index]}:{output_index}')
+                # ----------------------------
+                # Weights NodeDef
+                # ----------------------------
+                if bool(n.weights_attr):
+                    weights_node_def = NodeDef(attr=get_node_properties(n.weights_attr))
+                    weights_node_def.name = main_node_def.name + ".weights"
+                    main_node_def.input.append(f'{weights_node_def.name}:{1}')
+                    graph_def.node.extend([weights_node_def])  # Add the node to the graph
+                # ----------------------------
+                # Activation NodeDef
+                # ----------------------------
+                if bool(n.activation_attr):
+                    act_node_def = NodeDef(attr=get_node_properties(n.activation_attr, n.output_dims))
+                    tb_node_def = main_node_def.name + ".activation"
+                    act_node_def.name = tb_node_def
+                    act_node_def.input.append(f'{main_node_def.name}:{0}')
+                    graph_def.node.extend([act_node_def])  # Add the node to the graph
+
+                graph_def.node.extend([main_node_def])  # Add the node to the graph
+                tb_node_defs.append(tb_node_def)
+                # A NodeExecStats contains the memory and compute time a node requires.
+                node_stats.append(NodeExecStats(node_name=n.name,
+                                                memory=[AllocatorMemoryUsed(total_bytes=n.memory_bytes)]))
+                types_dict.update({main_node_def.op: op_id + 1})
+
+            # Logging nodes memory and computation time statistics
+            stepstats = RunMetadata(step_stats=StepStats(
+                dev_stats=[DeviceStepStats(device=DEVICE_STEP_STATS, node_stats=node_stats)])
+            )
+
+            trm = TaggedRunMetadata(tag='Resources', run_metadata=stepstats.SerializeToString())
+            return [(main_tag_name, [Event(graph_def=graph_def.SerializeToString()),
+                                     Event(tagged_run_metadata=trm)])]
+
+        self._submit(__create_graph_events, main_tag_name)
 
     def __get_event_writer_by_tag_name(self,
                                        main_tag_name: str) -> EventFileWriter:
@@ -387,37 +529,39 @@ class TensorboardWriter(object):
             main_tag_name: Tag to attach to all MinMaxPerChannelCollectors.
 
         """
-        min_events = []
-        max_events = []
-        for n in graph.nodes:
-            collector = graph.get_out_stats_collector(n)
-            if collector is not None:
-                if hasattr(collector, 'mpcc'):
-                    if collector.mpcc.is_legal:
-                        mpcc = deepcopy(collector.mpcc)
-                        min_pc = mpcc.min_per_channel
-                        max_pc = mpcc.max_per_channel
-                        for i in range(len(min_pc)):
-                            min_i = min_pc[i]
-                            max_i = max_pc[i]
-                            # use step for channel index as we log the min/max per channel
-                            min_events.append(Event(step=i, summary=Summary(
-                                value=[Summary.Value(tag=n.name, simple_value=min_i)])))
-                            max_events.append(Event(step=i, summary=Summary(
-                                value=[Summary.Value(tag=n.name, simple_value=max_i)])))
-
-        # Use a new tag to include both main tag and a 'min_per_channel' tag.
-        er = self.__get_event_writer_by_tag_name(main_tag_name + '/min_per_channel')
-
-        for e in min_events:
-            er.add_event(e)
-
-        # Use a new tag to include both main tag and a 'max_per_channel' tag.
-        er = self.__get_event_writer_by_tag_name(main_tag_name + '/max_per_channel')
-        for e in max_events:
-            er.add_event(e)
-
-        er.flush()
+        if not self.is_logged_stage(main_tag_name):
+            return
+
+        # Snapshot of the min/max per channel to log
+        min_max = []
+        for n, collector in self._get_logged_collectors(graph):
+            if hasattr(collector, 'mpcc'):
+                if collector.mpcc.is_legal:
+                    min_max.append((n.name,
+                                    np.array(collector.mpcc.min_per_channel),
+                                    np.array(collector.mpcc.max_per_channel)))
+
+        def __create_min_max_events() -> List[Tuple[str, List[Event]]]:
+            """
+            Create the events of the min/max per channel. The channel index is used as the event's step.
+
+            Returns:
+                The events of the min and max per channel, tagged with main_tag_name and 'min_per_channel' or
+                'max_per_channel'.
+            """
+            min_events = []
+            max_events = []
+            for name, min_pc, max_pc in min_max:
+                for i in range(len(min_pc)):
+                    min_events.append(Event(step=i, summary=Summary(
+                        value=[Summary.Value(tag=name, simple_value=min_pc[i])])))
+                    max_events.append(Event(step=i, summary=Summary(
+                        value=[Summary.Value(tag=name, simple_value=max_pc[i])])))
+            # Use new tags to include both main tag and a 'min_per_channel' / 'max_per_channel' tag.
+            return [(main_tag_name + '/min_per_channel', min_events),
+                    (main_tag_name + '/max_per_channel', max_events)]
+
+        self._submit(__create_min_max_events, main_tag_name)
 
     def add_mean(self, graph: Graph, main_tag_name: str):
         """
@@ -429,27 +573,28 @@ class TensorboardWriter(object):
             main_tag_name: Tag to attach to all MeanCollectors.
 
         """
-        mean_events = []
-        for n in graph.nodes:
-            collector = graph.get_out_stats_collector(n)
-            if collector is not None:
-                if hasattr(collector, 'mc'):
-                    if collector.mc.is_legal:
-                        mc = deepcopy(collector.mc)
-                        mean_pc = mc.state
-                        for i in range(len(mean_pc)):
-                            mean_i = mean_pc[i]
-                            # use step for channel index as we log the mean per channel
-                            mean_events.append(Event(step=i, summary=Summary(
-                                value=[Summary.Value(tag=n.name, simple_value=mean_i)])))
+        if not self.is_logged_stage(main_tag_name):
+            return
 
-        # Get the event writer for this tag name
-        er = self.__get_event_writer_by_tag_name(main_tag_name + '/mean_per_channel')
+        # Snapshot of the mean per channel to log
+        means = []
+        for n, collector in self._get_logged_collectors(graph):
+            if hasattr(collector, 'mc'):
+                if collector.mc.is_legal:
+                    means.append((n.name, np.array(collector.mc.state)))
 
-        for e in mean_events:
-            er.add_event(e)
+        def __create_mean_events() -> List[Tuple[str, List[Event]]]:
+            """
+            Create the events of the mean per channel. The channel index is used as the event's step.
 
-        er.flush()
+            Returns:
+                The events of the mean per channel, tagged with main_tag_name and 'mean_per_channel'.
+            """
+            mean_events = [Event(step=i, summary=Summary(value=[Summary.Value(tag=name, simple_value=mean_pc[i])]))
+                           for name, mean_pc in means for i in range(len(mean_pc))]
+            return [(main_tag_name + '/mean_per_channel', mean_events)]
+
+        self._submit(__create_mean_events, main_tag_name)
 
     def add_all_statistics(self, graph: Graph, main_tag_name: str):
         """
@@ -465,6 +610,28 @@ class TensorboardWriter(object):
         self.add_min_max(graph, main_tag_name)
         self.add_mean(graph, main_tag_name)
 
+    def add_scalars(self,
+                    scalars: Dict[str, float],
+                    main_tag_name: str,
+                    step: int = 0):
+        """
+        Add scalars to display on Tensorboard. Each scalar is tagged by its key in the scalars dictionary,
+        under the main tag name.
+
+        Args:
+            scalars: Dictionary from scalar tag to its value.
+            main_tag_name: Main tag which the scalars are tagged under.
+            step: Step to log the scalars at.
+
+        """
+        if not self.is_logged_stage(main_tag_name):
+            return
+
+        scalars = dict(scalars)
+        self._submit(lambda: [(main_tag_name, [Event(step=step, summary=Summary(
+            value=[Summary.Value(tag=tag, simple_value=value) for tag, value in scalars.items()]))])],
+                     main_tag_name)
+
     def add_figure(self,
                    figure: Figure,
                    figure_tag: str,
@@ -479,32 +646,44 @@ class TensorboardWriter(object):
             main_tag_name: Main tag which the figure is tagged under.
 
         """
+        if not self.is_logged_stage(main_tag_name):
+            return
+
+        # Matplotlib is not thread-safe, so the figure is rendered in the calling thread, and only its encoding is
+        # done by the background thread.
         figure.canvas.draw()
         data = np.frombuffer(figure.canvas.tostring_rgb(), dtype=np.uint8)
         data = data.reshape(figure.canvas.get_width_height()[::-1] + (3,))
 
-        h, w, c = data.shape
-        output = io.BytesIO()
-        Image.fromarray(data).save(output, format='PNG')
+        def __create_figure_events() -> List[Tuple[str, List[Event]]]:
+            """
+            Create the event of the figure's image.
+
+            Returns:
+                The event of the figure, tagged with main_tag_name.
+            """
+            h, w, c = data.shape
+            output = io.BytesIO()
+            Image.fromarray(data).save(output, format='PNG')
+
+            img_summary = Summary.Image(height=h, width=w, colorspace=c, encoded_image_string=output.getvalue())
+            output.close()
+
+            return [(main_tag_name, [Event(summary=Summary(value=[Summary.Value(tag=figure_tag, image=img_summary)]))])]
 
-        img_summary = Summary.Image(height=h, width=w, colorspace=c, encoded_image_string=output.getvalue())
-        output.close()
+        self._submit(__create_figure_events, main_tag_name)
 
-        event = Event(summary=Summary(value=[Summary.Value(tag=figure_tag, image=img_summary)]))
 
-        # Get the event writer for this tag name
-        er = self.__get_event_writer_by_tag_name(main_tag_name)
-        er.add_event(event)
-        er.flush()
 
 
-def init_tensorboard_writer(fw_info: FrameworkInfo) -> TensorboardWriter:
+def init_tensorboard_writer(fw_info: FrameworkInfo, debug_config: DebugConfig = None) -> TensorboardWriter:
     """
     Create a TensorBoardWriter object initialized with the logger dir path if it was set,
     or None otherwise.
 
     Args:
         fw_info: FrameworkInfo object.
+        debug_config: DebugConfig with the TensorBoard logging options (if None, the default options are used).
 
     Returns:
         A TensorBoardWriter object.
@@ -513,7 +692,12 @@ def init_tensorboard_writer(fw_info: FrameworkInfo) -> TensorboardWriter:
     if Logger.LOG_PATH is not None:
         tb_log_dir = os.path.join(os.getcwd(), Logger.LOG_PATH, 'tensorboard_logs')
         Logger.info(f'To use Tensorboard, please run: tensorboard --logdir {tb_log_dir}')
-        tb_w = TensorboardWriter(tb_log_dir, fw_info)
+        debug_config = DebugConfig() if debug_config is None else debug_config
+        tb_w = TensorboardWriter(tb_log_dir,
+                                 fw_info,
+                                 async_write=debug_config.tensorboard_async_write,
+                                 stages=debug_config.tensorboard_stages,
+                                 max_logged_nodes=debug_config.tensorboard_max_logged_nodes)
     return tb_w
 
 
@@ -20,6 +20,8 @@ from model_compression_toolkit.core.common import FrameworkInfo
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
 from model_compression_toolkit.core.common.fusion.layer_fusing import fusion
 from model_compression_toolkit.core.common.graph.base_graph import Graph
+from model_compression_toolkit.core.common.pipeline_cache import PipelineCache, run_cached_stage
+from model_compression_toolkit.core.common.profiler import Profiler
 from model_compression_toolkit.core.common.quantization.filter_nodes_candidates import filter_nodes_candidates
 from model_compression_toolkit.core.common.quantization.quantization_config import DEFAULTCONFIG
 from model_compression_toolkit.core.common.quantization.quantization_config import QuantizationConfig
@@ -40,7 +42,8 @@ def graph_preparation_runner(in_model: Any,
                              tpc: TargetPlatformCapabilities,
                              tb_w: TensorboardWriter = None,
                              mixed_precision_enable: bool = False,
-                             running_gptq: bool = False) -> Graph:
+                             running_gptq: bool = False,
+                             pipeline_cache: PipelineCache = None) -> Graph:
     """
     Runs all required preparations in order to build a quantization graph from the given model,
     quantization configuration and target platform specifications.
@@ -61,28 +64,35 @@ def graph_preparation_runner(in_model: Any,
         tb_w: TensorboardWriter object for logging.
         mixed_precision_enable: is mixed precision enabled.
         running_gptq: Whether or not a GPTQ optimization is planned to run after the PTQ process.
+        pipeline_cache: PipelineCache to load the prepared graph from (if the model and the configurations did not
+            change since it was cached) or save it to.
 
     Returns:
         An internal graph representation of the input model.
     """
 
-    graph = read_model_to_graph(in_model,
-                                representative_data_gen,
-                                tpc,
-                                fw_info,
-                                fw_impl)
+    with Profiler.profile('read_model'):
+        graph = read_model_to_graph(in_model,
+                                    representative_data_gen,
+                                    tpc,
+                                    fw_info,
+                                    fw_impl)
 
     if tb_w is not None:
         tb_w.add_graph(graph, 'initial_graph')
 
-    transformed_graph = get_finalized_graph(graph,
-                                            tpc,
-                                            quantization_config,
-                                            fw_info,
-                                            tb_w,
-                                            fw_impl,
-                                            mixed_precision_enable=mixed_precision_enable,
-                                            running_gptq=running_gptq)
+    # The cached stage is keyed by the initial graph rather than by the input model, since reading the model is fast.
+    transformed_graph = run_cached_stage(pipeline_cache,
+                                         'graph_preparation',
+                                         (graph, tpc, quantization_config, mixed_precision_enable, running_gptq),
+                                         lambda: get_finalized_graph(graph,
+                                                                     tpc,
+                                                                     quantization_config,
+                                                                     fw_info,
+                                                                     tb_w,
+                                                                     fw_impl,
+                                                                     mixed_precision_enable=mixed_precision_enable,
+                                                                     running_gptq=running_gptq))
 
     return transformed_graph
 
@@ -117,7 +127,8 @@ def get_finalized_graph(initial_graph: Graph,
     ######################################
     # Graph substitution (prepare graph)
     ######################################
-    graph = substitute(initial_graph, fw_impl.get_substitutions_prepare_graph(fw_info))
+    with Profiler.profile('prepare_graph_substitutions'):
+        graph = substitute(initial_graph, fw_impl.get_substitutions_prepare_graph(fw_info))
 
     if tb_w is not None:
         tb_w.add_graph(graph, 'after_graph_preparation')
@@ -132,12 +143,13 @@ def get_finalized_graph(initial_graph: Graph,
     ##################################################
     # Graph substitution (pre statistics collection)
     ##################################################
-    transformed_graph = substitute(graph, fw_impl.get_substitutions_pre_statistics_collection(quant_config))
-    if quant_config.linear_collapsing:
-        transformed_graph = linear_collapsing_substitute(transformed_graph, fw_impl.get_linear_collapsing_substitution())
-        transformed_graph = linear_collapsing_substitute(transformed_graph, fw_impl.get_op2d_add_const_collapsing_substitution())
-    if quant_config.residual_collapsing:
-        transformed_graph = substitute(transformed_graph, fw_impl.get_residual_collapsing_substitution())
+    with Profiler.profile('pre_statistics_collection_substitutions'):
+        transformed_graph = substitute(graph, fw_impl.get_substitutions_pre_statistics_collection(quant_config))
+        if quant_config.linear_collapsing:
+            transformed_graph = linear_collapsing_substitute(transformed_graph, fw_impl.get_linear_collapsing_substitution())
+            transformed_graph = linear_collapsing_substitute(transformed_graph, fw_impl.get_op2d_add_const_collapsing_substitution())
+        if quant_config.residual_collapsing:
+            transformed_graph = substitute(transformed_graph, fw_impl.get_residual_collapsing_substitution())
 
     if tb_w is not None:
         tb_w.add_graph(transformed_graph, 'pre_statistics_collection_substitutions')
@@ -145,22 +157,25 @@ def get_finalized_graph(initial_graph: Graph,
     ######################################
     # Add quantization configurations
     ######################################
-    transformed_graph = set_quantization_configuration_to_graph(graph=transformed_graph,
-                                                                quant_config=quant_config,
-                                                                mixed_precision_enable=mixed_precision_enable,
-                                                                running_gptq=running_gptq)
+    with Profiler.profile('set_quantization_configuration'):
+        transformed_graph = set_quantization_configuration_to_graph(graph=transformed_graph,
+                                                                    quant_config=quant_config,
+                                                                    mixed_precision_enable=mixed_precision_enable,
+                                                                    running_gptq=running_gptq)
 
     ######################################
     # Layer fusing
     ######################################
-    transformed_graph = fusion(transformed_graph, tpc)
+    with Profiler.profile('layer_fusing'):
+        transformed_graph = fusion(transformed_graph, tpc)
 
     ######################################
     # Channel equalization
     ######################################
-    transformed_graph = substitute(transformed_graph,
-                                   fw_impl.get_substitutions_channel_equalization(quant_config,
-                                                                                  fw_info))
+    with Profiler.profile('channel_equalization'):
+        transformed_graph = substitute(transformed_graph,
+                                       fw_impl.get_substitutions_channel_equalization(quant_config,
+                                                                                      fw_info))
 
     if tb_w is not None:
         tb_w.add_graph(transformed_graph, 'after_graph_marking')
@@ -168,7 +183,8 @@ def get_finalized_graph(initial_graph: Graph,
     ######################################
     # Filter nodes' candidates
     ######################################
-    transformed_graph = filter_nodes_candidates(transformed_graph)
+    with Profiler.profile('filter_nodes_candidates'):
+        transformed_graph = filter_nodes_candidates(transformed_graph)
 
     if tb_w is not None:
         tb_w.add_graph(transformed_graph, 'after_candidates_filtering')
@@ -33,6 +33,8 @@ from model_compression_toolkit.core.keras.mixed_precision.configurable_activatio
     ConfigurableActivationQuantizer
 from model_compression_toolkit.core.keras.mixed_precision.configurable_weights_quantizer import \
     ConfigurableWeightsQuantizer
+from model_compression_toolkit.core.keras.mixed_precision.configurable_quantization_wrapper import \
+    ConfigurableQuantizationWrapper
 
 from model_compression_toolkit.exporter.model_wrapper.keras.builder.node_to_quantizer import \
     get_inferable_quantizer_kwargs
@@ -92,11 +94,11 @@ class MixedPrecisionKerasModelBuilder(KerasModelBuilder):
         if kernel_attr is not None and n.is_weights_quantization_enabled(kernel_attr):
             weights_conf_nodes_names = [node.name for node in self.graph.get_weights_configurable_nodes(self.fw_info)]
             if n.name in weights_conf_nodes_names:
-                return KerasQuantizationWrapper(layer,
-                                                weights_quantizers={
-                                                    kernel_attr: ConfigurableWeightsQuantizer(
-                                                        **self._get_weights_configurable_quantizer_kwargs(n,
-                                                                                                          kernel_attr))})
+                return ConfigurableQuantizationWrapper(layer,
+                                                       weights_quantizers={
+                                                           kernel_attr: ConfigurableWeightsQuantizer(
+                                                               **self._get_weights_configurable_quantizer_kwargs(
+                                                                   n, kernel_attr))})
             else:
                 # TODO: Do we want to include other quantized attributes that are not
                 #  the kernel attribute in the mixed precision model?
@@ -150,6 +152,8 @@ class MixedPrecisionKerasModelBuilder(KerasModelBuilder):
                 'float_weights': float_weights,
                 'max_candidate_idx': max_candidate_idx,
                 'kernel_attr': attr,
+                'quantized_weights_cache': self.graph.quantized_weights_cache,
+                'weights_fingerprint': n.get_weights_fingerprint(attr),
                 }
 
     def mixed_precision_activation_holder(self, n: BaseNode) -> KerasActivationQuantizationHolder:
@@ -0,0 +1,82 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import weakref
+from typing import Any, Callable, Iterator, List
+
+import numpy as np
+import tensorflow as tf
+from tensorflow.keras.models import Model
+
+# Compiled inference functions of models, kept only as long as the model itself is alive.
+_compiled_models_calls = weakref.WeakKeyDictionary()
+
+
+def get_compiled_model_call(model: Model) -> Callable:
+    """
+    Returns a tf.function-compiled inference function for the given Keras model.
+    The compiled function is built once per model and reused for all following calls. Configurable
+    mixed-precision quantizers read their active candidate index from a tf.Variable inside the graph, so
+    reconfiguring the model between calls does not trigger retracing.
+
+    Args:
+        model: Keras model to compile an inference function for.
+
+    Returns:
+        A callable that runs the model inference on a list of inputs.
+    """
+    compiled_call = _compiled_models_calls.get(model)
+    if compiled_call is None:
+        # The compiled function keeps only a weak reference to the model, otherwise the cache entry would
+        # keep its own key alive.
+        model_ref = weakref.ref(model)
+        compiled_call = tf.function(lambda inputs: model_ref()(inputs), reduce_retracing=True)
+        _compiled_models_calls[model] = compiled_call
+    return compiled_call
+
+
+def get_prefetched_inputs(representative_data_gen: Callable) -> Iterator[List[tf.Tensor]]:
+    """
+    Wraps a representative dataset generator with a prefetched tf.data pipeline, so the next batch is
+    prepared while the model runs inference on the current one.
+
+    Args:
+        representative_data_gen: Callable that returns an iterable of batches (lists of input arrays).
+
+    Returns:
+        An iterator over lists of TF tensors, one list per batch.
+    """
+    batches = iter(representative_data_gen())
+    first_batch = next(batches, None)
+    if first_batch is None:
+        return
+    if not isinstance(first_batch, (list, tuple)):
+        first_batch = [first_batch]
+    first_batch = [np.asarray(x) for x in first_batch]
+    # Only the inputs' ranks and dtypes are fixed by the first batch, since the batch size and the other dimensions
+    # (e.g., the images size) may change between batches.
+    output_signature = tuple(tf.TensorSpec(shape=(None,) * x.ndim, dtype=tf.as_dtype(x.dtype)) for x in first_batch)
+
+    def _gen():
+        # The first batch was already drawn to infer the inputs signature, so it is yielded here instead of
+        # calling the representative dataset generator again.
+        yield tuple(first_batch)
+        for batch in batches:
+            if not isinstance(batch, (list, tuple)):
+                batch = [batch]
+            yield tuple(np.asarray(x) for x in batch)
+
+    dataset = tf.data.Dataset.from_generator(_gen, output_signature=output_signature).prefetch(tf.data.AUTOTUNE)
+    for batch in dataset:
+        yield list(batch)
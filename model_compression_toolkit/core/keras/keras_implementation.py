@@ -13,7 +13,7 @@
 # limitations under the License.
 # ==============================================================================
 from functools import partial
-from typing import List, Any, Tuple, Callable, Dict, Union
+from typing import List, Any, Tuple, Callable, Dict, Union, Iterable
 
 import numpy as np
 import tensorflow as tf
@@ -32,8 +32,10 @@ from model_compression_toolkit.exporter.model_wrapper.keras.builder.node_to_quan
     get_weights_quantizer_for_node, get_activations_quantizer_for_node
 from model_compression_toolkit.logger import Logger
 from model_compression_toolkit.core.common.mixed_precision.sensitivity_evaluation import SensitivityEvaluation
-from model_compression_toolkit.core.common.mixed_precision.set_layer_to_bitwidth import set_layer_to_bitwidth
+from model_compression_toolkit.core.common.mixed_precision.set_layer_to_bitwidth import set_layer_to_bitwidth, \
+    set_layer_to_replicas_bitwidths
 from model_compression_toolkit.core.common.similarity_analyzer import compute_kl_divergence, compute_cs, compute_mse
+from model_compression_toolkit.core.keras.compiled_inference import get_compiled_model_call, get_prefetched_inputs
 from model_compression_toolkit.core.keras.constants import ACTIVATION, SOFTMAX, SIGMOID, ARGMAX, LAYER_NAME, \
     COMBINED_NMS
 from model_compression_toolkit.core.keras.graph_substitutions.substitutions.batchnorm_reconstruction import \
@@ -192,7 +194,20 @@ class KerasImplementation(FrameworkImplementation):
         Returns:
             The Keras model's output.
         """
-        return model(input_list)
+        return get_compiled_model_call(model)(input_list)
+
+    def get_representative_dataset_iterator(self,
+                                            representative_data_gen: Callable) -> Iterable:
+        """
+        Returns an iterator over the representative dataset batches, fed through a prefetched tf.data pipeline.
+
+        Args:
+            representative_data_gen: Dataset used for calibration.
+
+        Returns:
+            An iterator of batches (lists of TF tensors).
+        """
+        return get_prefetched_inputs(representative_data_gen)
 
     def shift_negative_correction(self,
                                   graph: Graph,
@@ -380,6 +395,11 @@ class KerasImplementation(FrameworkImplementation):
                                                                    activation_quantizer_type=ConfigurableActivationQuantizer,
                                                                    weights_quant_layer_type=KerasQuantizationWrapper,
                                                                    activation_quant_layer_type=KerasActivationQuantizationHolder),
+                                     set_layer_to_replicas_bitwidths=partial(set_layer_to_replicas_bitwidths,
+                                                                             weights_quantizer_type=ConfigurableWeightsQuantizer,
+                                                                             activation_quantizer_type=ConfigurableActivationQuantizer,
+                                                                             weights_quant_layer_type=KerasQuantizationWrapper,
+                                                                             activation_quant_layer_type=KerasActivationQuantizationHolder),
                                      disable_activation_for_metric=disable_activation_for_metric,
                                      hessian_info_service=hessian_info_service)
 
@@ -582,7 +602,7 @@ class KerasImplementation(FrameworkImplementation):
             The output of the model inference on the given input.
         """
 
-        return model(inputs)
+        return get_compiled_model_call(model)(inputs)
 
     def get_inferable_quantizers(self, node: BaseNode):
         """
@@ -29,6 +29,7 @@ import tensorflow as tf
 from mct_quantizers.keras.quantizers import BaseKerasInferableQuantizer
 from model_compression_toolkit.core.common.mixed_precision.configurable_quant_id import \
     ConfigurableQuantizerIdentifier
+from model_compression_toolkit.core.keras.mixed_precision.replicas_utils import split_replicas, merge_replicas
 
 
 @mark_quantizer(quantization_target=QuantizationTarget.Activation,
@@ -41,6 +42,11 @@ class ConfigurableActivationQuantizer(BaseKerasInferableQuantizer):
     It holds a set of activation quantizers for each of the given bit-width candidates, provided by the
     node's quantization config. This allows to use different quantized activations on-the-fly, according to the
     "active" quantization configuration index.
+    The active index is held in a non-trainable tf.Variable, so the quantizer can be used inside a tf.function and
+    switching the active candidate does not trigger retracing of the compiled graph.
+
+    To evaluate several candidates in a single inference, the quantizer can also hold a candidate index for each
+    replica of the inputs (replicated along the batch dimension), and quantize each replica with its candidate.
     """
 
     def __init__(self,
@@ -69,7 +75,27 @@ class ConfigurableActivationQuantizer(BaseKerasInferableQuantizer):
                 Logger.critical("Unsupported configuration: Mixing candidates with differing activation quantization states (enabled/disabled).")  # pragma: no cover
 
         self.activation_quantizers = init_activation_quantizers(self.node_q_cfg)
-        self.active_quantization_config_index = max_candidate_idx  # initialize with first config as default
+        self._active_index = tf.Variable(max_candidate_idx, trainable=False, dtype=tf.int32)
+        # Candidate index of each replica of the inputs. Empty when the active candidate is used for all inputs.
+        self._replicas_indices = tf.Variable(tf.zeros([0], dtype=tf.int32), trainable=False,
+                                             shape=tf.TensorShape([None]), dtype=tf.int32)
+
+    @property
+    def active_quantization_config_index(self) -> int:
+        """
+        Returns: The index of the active quantization configuration candidate.
+        """
+        return int(self._active_index.numpy())
+
+    @active_quantization_config_index.setter
+    def active_quantization_config_index(self, index: int):
+        """
+        Sets the index of the active quantization configuration candidate.
+
+        Args:
+            index: Quantization configuration candidate index to use.
+        """
+        self._active_index.assign(index)
 
     def set_active_activation_quantizer(self, index: int):
         """
@@ -84,6 +110,19 @@ class ConfigurableActivationQuantizer(BaseKerasInferableQuantizer):
                                              f'possible nbits. Can not set index {index}'
         self.active_quantization_config_index = index
 
+    def set_replicas_bit_width_indices(self, indices: List[int]):
+        """
+        Set an index of the activation quantizer to use for each replica of the inputs. An empty list sets the
+        quantizer back to use the active activation quantizer for all inputs.
+
+        Args:
+            indices: Index of a candidate quantization configuration to use for each replica.
+        """
+
+        assert all(index < len(self.node_q_cfg) for index in indices), f'Quantizer has {len(self.node_q_cfg)} ' \
+                                                                      f'possible nbits. Can not set indices {indices}'
+        self._replicas_indices.assign(tf.constant(indices, dtype=tf.int32))
+
     def __call__(self,
                  inputs: tf.Tensor) -> np.ndarray:
         """
@@ -97,7 +136,44 @@ class ConfigurableActivationQuantizer(BaseKerasInferableQuantizer):
         Returns:
             Quantized activation tensor.
         """
-        return self.activation_quantizers[self.active_quantization_config_index](inputs)
+        return tf.cond(tf.size(self._replicas_indices) > 0,
+                       lambda: self._replicas_call(inputs),
+                       lambda: self._active_call(inputs))
+
+    def _active_call(self, inputs: tf.Tensor) -> tf.Tensor:
+        """
+        Quantize the inputs with the active activation quantizer.
+
+        Args:
+            inputs: Input tensor to quantize.
+
+        Returns:
+            Quantized activation tensor.
+        """
+        if tf.executing_eagerly():
+            return self.activation_quantizers[self.active_quantization_config_index](inputs)
+        return tf.switch_case(self._active_index.read_value(),
+                              [lambda q=q: q(inputs) for q in self.activation_quantizers])
+
+    def _replicas_call(self, inputs: tf.Tensor) -> tf.Tensor:
+        """
+        Quantize each replica of the inputs with the activation quantizer of its index.
+
+        Args:
+            inputs: Input tensor to quantize, with the replicas as consecutive slices along the batch dimension.
+
+        Returns:
+            Quantized activation tensor.
+        """
+
+        def _quantize_replica(args):
+            replica_inputs, replica_index = args
+            return tf.switch_case(replica_index, [lambda q=q: q(replica_inputs) for q in self.activation_quantizers])
+
+        replicas_outputs = tf.map_fn(_quantize_replica,
+                                     (split_replicas(inputs, tf.size(self._replicas_indices)), self._replicas_indices),
+                                     fn_output_signature=inputs.dtype)
+        return merge_replicas(replicas_outputs)
 
     def get_config(self) -> Dict[str, Any]:  # pragma: no cover
         """
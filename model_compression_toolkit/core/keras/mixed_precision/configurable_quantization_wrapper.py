@@ -0,0 +1,102 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Dict
+
+import tensorflow as tf
+from mct_quantizers import KerasQuantizationWrapper
+
+from model_compression_toolkit.core.keras.mixed_precision.configurable_weights_quantizer import \
+    ConfigurableWeightsQuantizer
+from model_compression_toolkit.core.keras.mixed_precision.replicas_utils import split_replicas, merge_replicas
+
+
+class ConfigurableQuantizationWrapper(KerasQuantizationWrapper):
+    """
+    Quantization wrapper of a layer with a configurable weights quantizer, for Keras mixed precision search.
+    In addition to the KerasQuantizationWrapper functionality, when the configurable weights quantizer holds a
+    candidate index for each replica of the inputs (replicated along the batch dimension), the layer is applied on
+    each replica's slice of the inputs with the replica's quantized weights. This allows to evaluate several weights
+    candidates in a single inference of the model.
+    """
+
+    def call(self, inputs, training=None, **kwargs):
+        """
+        ConfigurableQuantizationWrapper call function.
+
+        Args:
+            inputs: Input tensors to the wrapped layer.
+            training: A boolean stating if layer is in training mode.
+            **kwargs: Additional arguments to the wrapped layer.
+
+        Returns: Tensors that simulate a quantized layer.
+
+        """
+        configurable_weights = [(name, quantizer) for name, quantizer in self.weights_quantizers.items()
+                                if isinstance(quantizer, ConfigurableWeightsQuantizer)]
+        if len(configurable_weights) != 1 or not self.is_str_attr:
+            return super(ConfigurableQuantizationWrapper, self).call(inputs, training=training, **kwargs)
+
+        name, quantizer = configurable_weights[0]
+        return tf.cond(quantizer.num_replicas > 0,
+                       lambda: self._replicas_call(inputs, name, quantizer, **kwargs),
+                       lambda: super(ConfigurableQuantizationWrapper, self).call(inputs, training=training, **kwargs))
+
+    def _replicas_call(self, inputs: tf.Tensor, name: str, quantizer: ConfigurableWeightsQuantizer, **kwargs):
+        """
+        Apply the wrapped layer on each replica of the inputs with the quantized weights of the replica's candidate.
+
+        Args:
+            inputs: Input tensor to the wrapped layer, with the replicas as consecutive slices along the batch dimension.
+            name: Name of the configurable weights attribute.
+            quantizer: The configurable weights quantizer of the attribute.
+            **kwargs: Additional arguments to the wrapped layer.
+
+        Returns: The output tensor of the wrapped layer.
+
+        """
+
+        def _replica_call(args):
+            replica_inputs, replica_weights = args
+            return self._call_layer_with_weights(replica_inputs, {name: replica_weights}, **kwargs)
+
+        replicas_outputs = tf.map_fn(_replica_call,
+                                     (split_replicas(inputs, quantizer.num_replicas),
+                                      quantizer.get_replicas_quantized_weights()),
+                                     fn_output_signature=inputs.dtype)
+        return merge_replicas(replicas_outputs)
+
+    def _call_layer_with_weights(self, inputs: tf.Tensor, weights: Dict[str, tf.Tensor], **kwargs) -> tf.Tensor:
+        """
+        Apply the wrapped layer with the given weights.
+        The weights are bound to the layer's attributes only for the duration of the layer call, and the previous
+        attributes are restored right after it. Thus, a replica's weights that are passed from inside a traced map
+        are not left on the layer, and the layer's state does not depend on the order the replicas are traced in.
+
+        Args:
+            inputs: Input tensor to the wrapped layer.
+            weights: A dictionary from a weights attribute name to the weights tensor to apply the layer with.
+            **kwargs: Additional arguments to the wrapped layer.
+
+        Returns: The output tensor of the wrapped layer.
+
+        """
+        previous_weights = {attr: getattr(self.layer, attr) for attr in weights}
+        try:
+            for attr, weight in weights.items():
+                setattr(self.layer, attr, weight)
+            return self.layer.call(inputs, **kwargs)
+        finally:
+            for attr, weight in previous_weights.items():
+                setattr(self.layer, attr, weight)
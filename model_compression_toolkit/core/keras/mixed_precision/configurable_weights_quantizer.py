@@ -13,12 +13,13 @@
 # limitations under the License.
 # ==============================================================================
 from functools import partial
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 
 from model_compression_toolkit.core.common.mixed_precision.configurable_quantizer_utils import \
     verify_candidates_descending_order, init_quantized_weights
 from model_compression_toolkit.core.common.quantization.candidate_node_quantization_config import \
     CandidateNodeQuantizationConfig
+from model_compression_toolkit.core.common.quantization.quantized_weights_cache import QuantizedWeightsCache
 from model_compression_toolkit.logger import Logger
 from model_compression_toolkit.target_platform_capabilities.target_platform import QuantizationMethod
 from mct_quantizers import QuantizationTarget
@@ -46,13 +47,23 @@ class ConfigurableWeightsQuantizer(BaseKerasInferableQuantizer):
     quantized version of the float weight, it returns only one quantized weight according to an "active"
     index - the index of a candidate weight quantization configuration from a list of candidates that was passed
     to the quantizer when it was initialized.
+
+    The quantized weights of all candidates are stacked into a single tensor and the active index is held in a
+    non-trainable tf.Variable, so the quantizer can be used inside a tf.function and switching the active
+    candidate does not trigger retracing of the compiled graph.
+
+    To evaluate several candidates in a single inference, the quantizer can also hold a candidate index for each
+    replica of the layer's inputs (replicated along the batch dimension). In this case, the layer is wrapped with a
+    ConfigurableQuantizationWrapper, which applies each replica's quantized weights on its slice of the inputs.
     """
 
     def __init__(self,
                  node_q_cfg: List[CandidateNodeQuantizationConfig],
                  float_weights: tf.Tensor,
                  kernel_attr: str,
-                 max_candidate_idx: int = 0):
+                 max_candidate_idx: int = 0,
+                 quantized_weights_cache: QuantizedWeightsCache = None,
+                 weights_fingerprint: Tuple = None):
         """
         Initializes a configurable quantizer.
 
@@ -62,6 +73,8 @@ class ConfigurableWeightsQuantizer(BaseKerasInferableQuantizer):
             float_weights: Float weights of the layer.
             kernel_attr: The kernel attribute name of the node. Only layers with kernel op can be configured.
             max_candidate_idx: Index of the node's candidate that has the maximal bitwidth (must exist absolute max).
+            quantized_weights_cache: Cache of quantized weights to take the candidates' quantized weights from.
+            weights_fingerprint: Fingerprint of the float weights in the quantized weights cache.
 
         """
 
@@ -79,14 +92,37 @@ class ConfigurableWeightsQuantizer(BaseKerasInferableQuantizer):
                     self.node_q_cfg[0].weights_quantization_cfg.get_attr_config(self.kernel_attr).enable_weights_quantization:
                 Logger.critical("Mixing candidates with varying weights quantization states (enabled/disabled) is not supported.")
 
-        # Initialize quantized weights for each weight that should be quantized.
-        self.quantized_weights = init_quantized_weights(node_q_cfg=self.node_q_cfg,
-                                                        float_weights=self.float_weights,
-                                                        fw_tensor_convert_func=partial(tf.convert_to_tensor,
-                                                                                       dtype=tf.float32),
-                                                        kernel_attr=self.kernel_attr)
+        # Initialize quantized weights for each weight that should be quantized, stacked along a new first axis
+        # so the active candidate can be gathered inside a compiled graph.
+        self.quantized_weights = tf.stack(init_quantized_weights(node_q_cfg=self.node_q_cfg,
+                                                                 float_weights=self.float_weights,
+                                                                 fw_tensor_convert_func=partial(tf.convert_to_tensor,
+                                                                                                dtype=tf.float32),
+                                                                 kernel_attr=self.kernel_attr,
+                                                                 quantized_weights_cache=quantized_weights_cache,
+                                                                 weights_fingerprint=weights_fingerprint))
+
+        self._active_index = tf.Variable(self.max_candidate_idx, trainable=False, dtype=tf.int32)
+        # Candidate index of each replica of the inputs. Empty when the active candidate is used for all inputs.
+        self._replicas_indices = tf.Variable(tf.zeros([0], dtype=tf.int32), trainable=False,
+                                             shape=tf.TensorShape([None]), dtype=tf.int32)
+
+    @property
+    def active_quantization_config_index(self) -> int:
+        """
+        Returns: The index of the active quantization configuration candidate.
+        """
+        return int(self._active_index.numpy())
 
-        self.active_quantization_config_index = self.max_candidate_idx
+    @active_quantization_config_index.setter
+    def active_quantization_config_index(self, index: int):
+        """
+        Sets the index of the active quantization configuration candidate.
+
+        Args:
+            index: Quantization configuration candidate index to use.
+        """
+        self._active_index.assign(index)
 
     def set_weights_bit_width_index(self,
                                     index: int):
@@ -103,6 +139,35 @@ class ConfigurableWeightsQuantizer(BaseKerasInferableQuantizer):
             Logger.critical(f'Quantizer supports only {len(self.node_q_cfg)} bit width configurations; index {index} is out of range.')# pragma: no cover
         self.active_quantization_config_index = index
 
+    def set_replicas_bit_width_indices(self,
+                                       indices: List[int]):
+        """
+        Set a bitwidth index for each replica of the layer's inputs, so the layer is evaluated with a different
+        quantized weight for each replica. An empty list sets the quantizer back to use the "active" bitwidth
+        index for all inputs.
+
+        Args:
+            indices: Quantization configuration candidate index to use for each replica.
+
+        """
+
+        if any(index >= len(self.node_q_cfg) for index in indices):
+            Logger.critical(f'Quantizer supports only {len(self.node_q_cfg)} bit width configurations; indices {indices} are out of range.')  # pragma: no cover
+        self._replicas_indices.assign(tf.constant(indices, dtype=tf.int32))
+
+    @property
+    def num_replicas(self) -> tf.Tensor:
+        """
+        Returns: The number of replicas of the layer's inputs (zero if the active candidate is used for all inputs).
+        """
+        return tf.size(self._replicas_indices)
+
+    def get_replicas_quantized_weights(self) -> tf.Tensor:
+        """
+        Returns: The quantized weights of each replica's candidate, stacked along a new first axis.
+        """
+        return tf.gather(self.quantized_weights, self._replicas_indices)
+
     def __call__(self,
                  inputs: tf.Tensor) -> tf.Tensor:
         """
@@ -120,7 +185,7 @@ class ConfigurableWeightsQuantizer(BaseKerasInferableQuantizer):
             index that is in active_quantization_config_index the quantizer holds).
         """
 
-        return self.quantized_weights[self.active_quantization_config_index]
+        return tf.gather(self.quantized_weights, self._active_index)
 
     def get_config(self) -> Dict[str, Any]:  # pragma: no cover
         """
@@ -0,0 +1,48 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import tensorflow as tf
+
+
+def split_replicas(inputs: tf.Tensor, num_replicas: tf.Tensor) -> tf.Tensor:
+    """
+    Split a tensor of replicated inputs (replicas are consecutive slices along the batch dimension) to a tensor
+    with a new leading replicas dimension.
+
+    Args:
+        inputs: Tensor to split, of shape (num_replicas * batch_size, ...).
+        num_replicas: Number of replicas in the tensor.
+
+    Returns:
+        A tensor of shape (num_replicas, batch_size, ...).
+    """
+    replicas_inputs = tf.reshape(inputs, tf.concat([[num_replicas, -1], tf.shape(inputs)[1:]], axis=0))
+    replicas_inputs.set_shape([None, None] + inputs.shape[1:])
+    return replicas_inputs
+
+
+def merge_replicas(replicas_outputs: tf.Tensor) -> tf.Tensor:
+    """
+    Merge a tensor with a leading replicas dimension back to a tensor of replicas that are consecutive slices along
+    the batch dimension (the inverse of split_replicas).
+
+    Args:
+        replicas_outputs: Tensor to merge, of shape (num_replicas, batch_size, ...).
+
+    Returns:
+        A tensor of shape (num_replicas * batch_size, ...).
+    """
+    outputs = tf.reshape(replicas_outputs, tf.concat([[-1], tf.shape(replicas_outputs)[2:]], axis=0))
+    outputs.set_shape([None] + replicas_outputs.shape[2:])
+    return outputs
@@ -33,6 +33,8 @@ from model_compression_toolkit.core.pytorch.mixed_precision.configurable_activat
     ConfigurableActivationQuantizer
 from model_compression_toolkit.core.pytorch.mixed_precision.configurable_weights_quantizer import \
     ConfigurableWeightsQuantizer
+from model_compression_toolkit.core.pytorch.mixed_precision.configurable_quantization_wrapper import \
+    ConfigurableQuantizationWrapper
 
 from model_compression_toolkit.exporter.model_wrapper.pytorch.builder.node_to_quantizer import \
     get_weights_inferable_quantizer_kwargs, get_activation_inferable_quantizer_kwargs
@@ -88,12 +90,12 @@ class MixedPrecisionPyTorchModelBuilder(PyTorchModelBuilder):
         if kernel_attr is not None and n.is_weights_quantization_enabled(kernel_attr):
 
             if n.name in weights_conf_nodes_names:
-                return PytorchQuantizationWrapper(layer,
-                                                  weights_quantizers={
-                                                      kernel_attr: ConfigurableWeightsQuantizer(
-                                                          **self._get_weights_configurable_quantizer_kwargs(n,
-                                                                                                            kernel_attr),
-                                                          kernel_attr=kernel_attr)})
+                return ConfigurableQuantizationWrapper(layer,
+                                                       weights_quantizers={
+                                                           kernel_attr: ConfigurableWeightsQuantizer(
+                                                               **self._get_weights_configurable_quantizer_kwargs(
+                                                                   n, kernel_attr),
+                                                               kernel_attr=kernel_attr)})
             else:
                 # TODO: Do we want to include other quantized attributes that are not
                 #  the kernel attribute in the mixed precision model?
@@ -144,7 +146,9 @@ class MixedPrecisionPyTorchModelBuilder(PyTorchModelBuilder):
 
         return {'node_q_cfg': node_q_cfg_candidates,
                 'float_weights': float_weights,
-                'max_candidate_idx': max_candidate_idx
+                'max_candidate_idx': max_candidate_idx,
+                'quantized_weights_cache': self.graph.quantized_weights_cache,
+                'weights_fingerprint': n.get_weights_fingerprint(attr),
                 }
 
     def mixed_precision_activation_holder(self, n: BaseNode) -> PytorchActivationQuantizationHolder:
@@ -40,6 +40,9 @@ class ConfigurableActivationQuantizer(BasePyTorchInferableQuantizer):
     It holds a set of activation quantizers for each of the given bit-width candidates, provided by the
     node's quantization config. This allows to use different quantized activations on-the-fly, according to the
     "active" quantization configuration index.
+
+    To evaluate several candidates in a single inference, the quantizer can also hold a candidate index for each
+    replica of the inputs (replicated along the batch dimension), and quantize each replica with its candidate.
     """
 
     def __init__(self,
@@ -70,6 +73,8 @@ class ConfigurableActivationQuantizer(BasePyTorchInferableQuantizer):
         # Setting layer's activation
         self.activation_quantizers = init_activation_quantizers(self.node_q_cfg)
         self.active_quantization_config_index = max_candidate_idx  # initialize with first config as default
+        # Candidate index of each replica of the inputs. Empty when the active candidate is used for all inputs.
+        self.replicas_indices = []
 
     def set_active_activation_quantizer(self,
                                         index: int):
@@ -85,6 +90,20 @@ class ConfigurableActivationQuantizer(BasePyTorchInferableQuantizer):
                                              f'possible nbits. Can not set index {index}'
         self.active_quantization_config_index = index
 
+    def set_replicas_bit_width_indices(self,
+                                       indices: List[int]):
+        """
+        Set an index of the activation quantizer to use for each replica of the inputs. An empty list sets the
+        quantizer back to use the active activation quantizer for all inputs.
+
+        Args:
+            indices: Index of a candidate quantization configuration to use for each replica.
+        """
+
+        assert all(index < len(self.node_q_cfg) for index in indices), f'Quantizer has {len(self.node_q_cfg)} ' \
+                                                                      f'possible nbits. Can not set indices {indices}'
+        self.replicas_indices = list(indices)
+
     def __call__(self,
                  inputs: nn.Parameter) -> torch.Tensor:
         """
@@ -99,4 +118,9 @@ class ConfigurableActivationQuantizer(BasePyTorchInferableQuantizer):
             Quantized activation tensor.
         """
 
+        if len(self.replicas_indices) > 0:
+            replicas_inputs = torch.chunk(inputs, len(self.replicas_indices))
+            return torch.cat([self.activation_quantizers[index](replica_inputs)
+                              for replica_inputs, index in zip(replicas_inputs, self.replicas_indices)])
+
         return self.activation_quantizers[self.active_quantization_config_index](inputs)
@@ -0,0 +1,59 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Any, Dict, List, Union
+
+import torch
+from mct_quantizers import PytorchQuantizationWrapper
+
+from model_compression_toolkit.core.pytorch.mixed_precision.configurable_weights_quantizer import \
+    ConfigurableWeightsQuantizer
+
+
+class ConfigurableQuantizationWrapper(PytorchQuantizationWrapper):
+    """
+    Quantization wrapper of a layer with a configurable weights quantizer, for Pytorch mixed precision search.
+    In addition to the PytorchQuantizationWrapper functionality, when the configurable weights quantizer holds a
+    candidate index for each replica of the inputs (replicated along the batch dimension), the layer is applied on
+    each replica's slice of the inputs with the replica's quantized weights. This allows to evaluate several weights
+    candidates in a single inference of the model.
+    """
+
+    def forward(self,
+                *args: List[Any],
+                **kwargs: Dict[str, Any]) -> Union[torch.Tensor, List[torch.Tensor]]:
+        """
+        ConfigurableQuantizationWrapper forward function.
+
+        Args:
+            args: Arguments to pass to the wrapped layer.
+            kwargs: Key-word dictionary to pass to the wrapped layer.
+
+        Returns: A tensor that simulates a quantized layer.
+
+        """
+        configurable_weights = [(name, quantizer) for name, quantizer in self.weights_quantizers.items()
+                                if isinstance(quantizer, ConfigurableWeightsQuantizer)]
+        if len(configurable_weights) != 1 or not self.is_str_attr or \
+                len(configurable_weights[0][1].replicas_indices) == 0:
+            return super().forward(*args, **kwargs)
+
+        name, quantizer = configurable_weights[0]
+        _kwargs = {**self.op_call_kwargs, **kwargs}
+        outputs = []
+        for replica_inputs, index in zip(torch.chunk(args[0], len(quantizer.replicas_indices)),
+                                         quantizer.replicas_indices):
+            self.set_quantize_weights({name: quantizer.quantized_weights[index]})
+            outputs.append(self.layer(replica_inputs, *args[1:], *self.op_call_args, **_kwargs))
+        return torch.cat(outputs)
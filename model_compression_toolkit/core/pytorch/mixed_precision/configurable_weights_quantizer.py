@@ -12,13 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 
 from model_compression_toolkit.core.common.mixed_precision.configurable_quant_id import ConfigurableQuantizerIdentifier
 from model_compression_toolkit.core.common.mixed_precision.configurable_quantizer_utils import \
     verify_candidates_descending_order, init_quantized_weights
 from model_compression_toolkit.core.common.quantization.candidate_node_quantization_config import \
     CandidateNodeQuantizationConfig
+from model_compression_toolkit.core.common.quantization.quantized_weights_cache import QuantizedWeightsCache
 from model_compression_toolkit.logger import Logger
 from model_compression_toolkit.target_platform_capabilities.target_platform import QuantizationMethod
 from mct_quantizers import QuantizationTarget
@@ -47,13 +48,19 @@ class ConfigurableWeightsQuantizer(BasePyTorchInferableQuantizer):
     quantized version of the float weight, it returns only one quantized weight according to an "active"
     index - the index of a candidate weight quantization configuration from a list of candidates that was passed
     to the quantizer when it was initialized.
+
+    To evaluate several candidates in a single inference, the quantizer can also hold a candidate index for each
+    replica of the layer's inputs (replicated along the batch dimension). In this case, the layer is wrapped with a
+    ConfigurableQuantizationWrapper, which applies each replica's quantized weights on its slice of the inputs.
     """
 
     def __init__(self,
                  node_q_cfg: List[CandidateNodeQuantizationConfig],
                  float_weights: torch.Tensor,
                  kernel_attr: str,
-                 max_candidate_idx: int = 0):
+                 max_candidate_idx: int = 0,
+                 quantized_weights_cache: QuantizedWeightsCache = None,
+                 weights_fingerprint: Tuple = None):
         """
         Initializes a configurable quantizer.
 
@@ -63,6 +70,8 @@ class ConfigurableWeightsQuantizer(BasePyTorchInferableQuantizer):
             float_weights: Float weights of the layer.
             kernel_attr: The kernel attribute name of the node. Only layers with kernel op can be configured.
             max_candidate_idx: Index of the node's candidate that has the maximal bitwidth (must exist absolute max).
+            quantized_weights_cache: Cache of quantized weights to take the candidates' quantized weights from.
+            weights_fingerprint: Fingerprint of the float weights in the quantized weights cache.
         """
 
         super(ConfigurableWeightsQuantizer, self).__init__()
@@ -83,9 +92,13 @@ class ConfigurableWeightsQuantizer(BasePyTorchInferableQuantizer):
         self.quantized_weights = init_quantized_weights(node_q_cfg=self.node_q_cfg,
                                                         float_weights=self.float_weights,
                                                         fw_tensor_convert_func=to_torch_tensor,
-                                                        kernel_attr=kernel_attr)
+                                                        kernel_attr=kernel_attr,
+                                                        quantized_weights_cache=quantized_weights_cache,
+                                                        weights_fingerprint=weights_fingerprint)
 
         self.active_quantization_config_index = self.max_candidate_idx
+        # Candidate index of each replica of the inputs. Empty when the active candidate is used for all inputs.
+        self.replicas_indices = []
 
     def set_weights_bit_width_index(self,
                                     index: int):
@@ -103,6 +116,23 @@ class ConfigurableWeightsQuantizer(BasePyTorchInferableQuantizer):
             f'possible nbits. Can not set index {index}'
         self.active_quantization_config_index = index
 
+    def set_replicas_bit_width_indices(self,
+                                       indices: List[int]):
+        """
+        Set a bitwidth index for each replica of the layer's inputs, so the layer is evaluated with a different
+        quantized weight for each replica. An empty list sets the quantizer back to use the "active" bitwidth
+        index for all inputs.
+
+        Args:
+            indices: Quantization configuration candidate index to use for each replica.
+
+        """
+
+        assert all(index < len(self.node_q_cfg) for index in indices), \
+            f'Quantizer has {len(self.node_q_cfg)} ' \
+            f'possible nbits. Can not set indices {indices}'
+        self.replicas_indices = list(indices)
+
     def __call__(self,
                  inputs: nn.Parameter) -> torch.Tensor:
         """
@@ -32,7 +32,8 @@ from model_compression_toolkit.core.common import Graph, BaseNode
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
 from model_compression_toolkit.core.common.hessian import TraceHessianRequest, HessianMode, HessianInfoService
 from model_compression_toolkit.core.common.mixed_precision.sensitivity_evaluation import SensitivityEvaluation
-from model_compression_toolkit.core.common.mixed_precision.set_layer_to_bitwidth import set_layer_to_bitwidth
+from model_compression_toolkit.core.common.mixed_precision.set_layer_to_bitwidth import set_layer_to_bitwidth, \
+    set_layer_to_replicas_bitwidths
 from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
 from model_compression_toolkit.core.common.node_prior_info import NodePriorInfo
 from model_compression_toolkit.core.common.similarity_analyzer import compute_mse, compute_kl_divergence, compute_cs
@@ -89,6 +90,7 @@ from model_compression_toolkit.core.pytorch.reader.reader import model_reader
 from model_compression_toolkit.core.pytorch.statistics_correction.apply_second_moment_correction import \
     pytorch_apply_second_moment_correction
 from model_compression_toolkit.core.pytorch.utils import to_torch_tensor, torch_tensor_to_numpy, set_model
+from model_compression_toolkit.core.pytorch.pytorch_device_config import get_working_device
 from model_compression_toolkit.exporter.model_wrapper.fw_agnostic.get_inferable_quantizers import \
     get_inferable_quantizers
 from model_compression_toolkit.exporter.model_wrapper.pytorch.builder.node_to_quantizer import \
@@ -132,6 +134,22 @@ class PytorchImplementation(FrameworkImplementation):
         """
         return to_torch_tensor(tensor)
 
+    @property
+    def supports_forked_workers(self) -> bool:
+        """
+        Returns: Whether the working device is the CPU, since a CUDA runtime can not be used in forked worker
+        processes.
+        """
+        return get_working_device().type == 'cpu'
+
+    def set_num_threads(self, num_threads: int):
+        """
+        Set the number of threads Pytorch uses for intra-op parallelism.
+        Args:
+            num_threads: Number of threads.
+        """
+        torch.set_num_threads(num_threads)
+
     def model_reader(self,
                      module: Module,
                      representative_data_gen: Callable) -> Graph:
@@ -369,6 +387,11 @@ class PytorchImplementation(FrameworkImplementation):
                                                                    activation_quantizer_type=ConfigurableActivationQuantizer,
                                                                    weights_quant_layer_type=PytorchQuantizationWrapper,
                                                                    activation_quant_layer_type=PytorchActivationQuantizationHolder),
+                                     set_layer_to_replicas_bitwidths=partial(set_layer_to_replicas_bitwidths,
+                                                                             weights_quantizer_type=ConfigurableWeightsQuantizer,
+                                                                             activation_quantizer_type=ConfigurableActivationQuantizer,
+                                                                             weights_quant_layer_type=PytorchQuantizationWrapper,
+                                                                             activation_quant_layer_type=PytorchActivationQuantizationHolder),
                                      disable_activation_for_metric=disable_activation_for_metric,
                                      hessian_info_service=hessian_info_service)
 
@@ -23,6 +23,8 @@ from model_compression_toolkit.core.common.framework_implementation import Frame
 from model_compression_toolkit.core.common.graph.base_graph import Graph
 from model_compression_toolkit.core.common.hessian import HessianInfoService
 from model_compression_toolkit.core.common.model_collector import ModelCollector
+from model_compression_toolkit.core.common.parallel_stats_collection import collect_statistics_in_parallel
+from model_compression_toolkit.core.common.profiler import Profiler
 from model_compression_toolkit.core.common.network_editors.edit_network import edit_network_graph
 from model_compression_toolkit.core.common.quantization.core_config import CoreConfig
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_computation import \
@@ -32,6 +34,7 @@ from model_compression_toolkit.core.common.statistics_correction.statistics_corr
 from model_compression_toolkit.core.common.substitutions.apply_substitutions import substitute
 
 from model_compression_toolkit.core.common.visualization.tensorboard_writer import TensorboardWriter
+from model_compression_toolkit.logger import Logger
 
 
 def quantization_preparation_runner(graph: Graph,
@@ -66,13 +69,30 @@ def quantization_preparation_runner(graph: Graph,
     ######################################
     # Statistic collection
     ######################################
-    mi = ModelCollector(graph,
-                        fw_impl,
-                        fw_info,
-                        core_config.quantization_config)  # Mark points for statistics collection
-
-    for _data in tqdm(representative_data_gen(), "Statistics Collection"):
-        mi.infer(_data)
+    with Profiler.profile('statistics_collection'):
+        mi = ModelCollector(graph,
+                            fw_impl,
+                            fw_info,
+                            core_config.quantization_config)  # Mark points for statistics collection
+
+        num_workers = core_config.quantization_config.num_stats_collection_workers
+        if num_workers > 1 and not fw_impl.supports_forked_workers:
+            Logger.warning(f'Parallel statistics collection is not supported for {type(fw_impl).__name__}, so the '
+                           f'statistics are collected in a single process.')
+            num_workers = 1
+
+        if num_workers > 1:
+            if mi.convergence_monitor is not None:
+                Logger.warning('The early stop of the statistics collection is not supported in parallel statistics '
+                               'collection, so the statistics are collected on the whole representative dataset.')
+            collect_statistics_in_parallel(mi, representative_data_gen, fw_impl, num_workers)
+        else:
+            for _data in tqdm(fw_impl.get_representative_dataset_iterator(representative_data_gen), "Statistics Collection"):
+                mi.infer(_data)
+                if mi.is_collection_done():
+                    break
+            if mi.convergence_monitor is not None:
+                mi.convergence_monitor.log_summary()
 
     if tb_w is not None:
         tb_w.add_graph(graph, 'after_statistic_collection')
@@ -90,7 +110,8 @@ def quantization_preparation_runner(graph: Graph,
     # Calculate quantization params
     ######################################
 
-    calculate_quantization_params(graph, hessian_info_service=hessian_info_service)
+    with Profiler.profile('quantization_params_calculation'):
+        calculate_quantization_params(graph, hessian_info_service=hessian_info_service)
 
     if tb_w is not None:
         tb_w.add_graph(graph, 'thresholds_selection')
@@ -99,16 +120,18 @@ def quantization_preparation_runner(graph: Graph,
     ######################################
     # Graph substitution (post statistics collection)
     ######################################
-    transformed_graph = substitute(graph,
-                                   fw_impl.get_substitutions_post_statistics_collection(core_config.quantization_config))
+    with Profiler.profile('post_statistics_collection_substitutions'):
+        transformed_graph = substitute(graph,
+                                       fw_impl.get_substitutions_post_statistics_collection(core_config.quantization_config))
 
     ######################################
     # Shift Negative Activations
     ######################################
     if core_config.quantization_config.shift_negative_activation_correction:
-        transformed_graph = fw_impl.shift_negative_correction(transformed_graph,
-                                                              core_config,
-                                                              fw_info)
+        with Profiler.profile('shift_negative_correction'):
+            transformed_graph = fw_impl.shift_negative_correction(transformed_graph,
+                                                                  core_config,
+                                                                  fw_info)
         if tb_w is not None:
             tb_w.add_graph(transformed_graph, 'after_shift_negative_correction')
             tb_w.add_all_statistics(transformed_graph, 'after_shift_negative_correction')
@@ -120,7 +143,8 @@ def quantization_preparation_runner(graph: Graph,
     ######################################
     # Statistics Correction
     ######################################
-    tg_with_bias = statistics_correction_runner(transformed_graph, core_config, fw_info, fw_impl, tb_w)
+    with Profiler.profile('statistics_correction'):
+        tg_with_bias = statistics_correction_runner(transformed_graph, core_config, fw_info, fw_impl, tb_w)
 
     for n in tg_with_bias.nodes:
         assert n.final_weights_quantization_cfg is None
@@ -14,12 +14,15 @@
 # ==============================================================================
 
 
+import copy
 from typing import Callable, Tuple, Any, List, Dict
 
 import numpy as np
 
 from model_compression_toolkit.core.common import FrameworkInfo
 from model_compression_toolkit.core.common.hessian.hessian_info_service import HessianInfoService
+from model_compression_toolkit.core.common.pipeline_cache import PipelineCache, run_cached_stage
+from model_compression_toolkit.core.common.profiler import Profiler
 from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.resource_utilization_data import \
     requires_mixed_precision
 from model_compression_toolkit.core.graph_prep_runner import graph_preparation_runner
@@ -32,7 +35,8 @@ from model_compression_toolkit.core.common.mixed_precision.resource_utilization_
 from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.ru_aggregation_methods import MpRuAggregation
 from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.ru_functions_mapping import ru_functions_mapping
 from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.ru_methods import MpRuMetric
-from model_compression_toolkit.core.common.mixed_precision.mixed_precision_search_facade import search_bit_width
+from model_compression_toolkit.core.common.mixed_precision.mixed_precision_search_facade import search_bit_width, \
+    search_bit_width_multi_target, MixedPrecisionParetoPoint
 from model_compression_toolkit.core.common.network_editors.edit_network import edit_network_graph
 from model_compression_toolkit.core.common.quantization.core_config import CoreConfig
 from model_compression_toolkit.target_platform_capabilities.target_platform.targetplatform2framework import TargetPlatformCapabilities
@@ -92,37 +96,30 @@ def core_runner(in_model: Any,
             Logger.critical("Provided an initialized target_resource_utilization, that means that mixed precision quantization is "
                             "enabled, but the provided MixedPrecisionQuantizationConfig is None.")
         # Determine whether to use mixed precision or single precision based on target_resource_utilization.
-        if requires_mixed_precision(in_model,
-                                    target_resource_utilization,
-                                    representative_data_gen,
-                                    core_config,
-                                    tpc,
-                                    fw_info,
-                                    fw_impl):
-            core_config.mixed_precision_config.set_mixed_precision_enable()
-            Logger.info('Mixed precision enabled.')
-
-    graph = graph_preparation_runner(in_model,
-                                     representative_data_gen,
-                                     core_config.quantization_config,
-                                     fw_info,
-                                     fw_impl,
-                                     tpc,
-                                     tb_w,
-                                     mixed_precision_enable=core_config.mixed_precision_enable,
-                                     running_gptq=running_gptq)
+        with Profiler.profile('mixed_precision_requirement_check'):
+            if requires_mixed_precision(in_model,
+                                        target_resource_utilization,
+                                        representative_data_gen,
+                                        core_config,
+                                        tpc,
+                                        fw_info,
+                                        fw_impl):
+                core_config.mixed_precision_config.set_mixed_precision_enable()
+                Logger.info('Mixed precision enabled.')
 
-    hessian_info_service = HessianInfoService(graph=graph,
-                                              representative_dataset=representative_data_gen,
-                                              fw_impl=fw_impl)
+    pipeline_cache = None
+    if core_config.pipeline_cache_config is not None:
+        pipeline_cache = PipelineCache(core_config.pipeline_cache_config)
 
-    tg = quantization_preparation_runner(graph=graph,
-                                         representative_data_gen=representative_data_gen,
-                                         core_config=core_config,
-                                         fw_info=fw_info,
-                                         fw_impl=fw_impl,
-                                         tb_w=tb_w,
-                                         hessian_info_service=hessian_info_service)
+    tg, hessian_info_service = _prepare_graph_for_quantization(in_model,
+                                                               representative_data_gen,
+                                                               core_config,
+                                                               fw_info,
+                                                               fw_impl,
+                                                               tpc,
+                                                               running_gptq,
+                                                               tb_w,
+                                                               pipeline_cache)
 
     ######################################
     # Finalize bit widths
@@ -130,13 +127,17 @@ def core_runner(in_model: Any,
     if core_config.mixed_precision_enable:
         if core_config.mixed_precision_config.configuration_overwrite is None:
 
-            bit_widths_config = search_bit_width(tg,
-                                                 fw_info,
-                                                 fw_impl,
-                                                 target_resource_utilization,
-                                                 core_config.mixed_precision_config,
-                                                 representative_data_gen,
-                                                 hessian_info_service=hessian_info_service)
+            with Profiler.profile('mixed_precision_search'):
+                bit_widths_config = run_cached_stage(pipeline_cache,
+                                                     'mixed_precision_search',
+                                                     (core_config.mixed_precision_config, target_resource_utilization),
+                                                     lambda: search_bit_width(tg,
+                                                                              fw_info,
+                                                                              fw_impl,
+                                                                              target_resource_utilization,
+                                                                              core_config.mixed_precision_config,
+                                                                              representative_data_gen,
+                                                                              hessian_info_service=hessian_info_service))
         else:
             Logger.warning(
                 f'Mixed Precision has overwrite bit-width configuration{core_config.mixed_precision_config.configuration_overwrite}')
@@ -145,6 +146,173 @@ def core_runner(in_model: Any,
     else:
         bit_widths_config = []
 
+    tg = _finalize_bit_widths(tg, bit_widths_config, core_config, fw_info, fw_impl, tb_w)
+
+    return tg, bit_widths_config, hessian_info_service
+
+
+def core_runner_multi_target(in_model: Any,
+                             representative_data_gen: Callable,
+                             core_config: CoreConfig,
+                             fw_info: FrameworkInfo,
+                             fw_impl: FrameworkImplementation,
+                             tpc: TargetPlatformCapabilities,
+                             target_resource_utilizations: List[ResourceUtilization],
+                             running_gptq: bool = False,
+                             tb_w: TensorboardWriter = None) -> Tuple[List[Graph], List[MixedPrecisionParetoPoint], HessianInfoService]:
+    """
+    Quantize a trained model using post-training mixed-precision quantization under multiple target resource
+    utilizations (e.g., a sweep over memory budgets).
+    Graph preparation, statistics collection, quantization parameters computation and the mixed-precision
+    sensitivity evaluation are done once (as in core_runner), and then a mixed-precision configuration is searched
+    for each target resource utilization. The configurations that are on the Pareto front of sensitivity and
+    resource utilization are returned, each with its own graph.
+
+    Args:
+        in_model: Model to quantize.
+        representative_data_gen: Dataset used for calibration.
+        core_config: CoreConfig containing parameters of how the model should be quantized
+        fw_info: Information needed for quantization about the specific framework (e.g., kernel channels indices,
+        groups of layers by how they should be quantized, etc.).
+        fw_impl: FrameworkImplementation object with a specific framework methods implementation.
+        tpc: TargetPlatformCapabilities object that models the inference target platform and
+                                              the attached framework operator's information.
+        target_resource_utilizations: List of ResourceUtilization to search a mixed-precision configuration for each.
+        All of them must constrain the same resource utilization metrics.
+        tb_w: TensorboardWriter object for logging
+
+    Returns:
+        A list of internal graph representations of the quantized model (one for each configuration on the Pareto
+        front), the list of the Pareto front configurations, and the HessianInfoService of the graph.
+
+    """
+    if core_config.mixed_precision_config is None:
+        Logger.critical("Provided target resource utilizations for a multi-target mixed precision search, "
+                        "but the provided MixedPrecisionQuantizationConfig is None.")
+    if core_config.mixed_precision_config.configuration_overwrite is not None:
+        Logger.critical("A bit-width configuration overwrite can not be used in a multi-target mixed precision search.")
+    core_config.mixed_precision_config.set_mixed_precision_enable()
+
+    pipeline_cache = None
+    if core_config.pipeline_cache_config is not None:
+        pipeline_cache = PipelineCache(core_config.pipeline_cache_config)
+
+    tg, hessian_info_service = _prepare_graph_for_quantization(in_model,
+                                                               representative_data_gen,
+                                                               core_config,
+                                                               fw_info,
+                                                               fw_impl,
+                                                               tpc,
+                                                               running_gptq,
+                                                               tb_w,
+                                                               pipeline_cache)
+
+    with Profiler.profile('mixed_precision_search'):
+        pareto_front = search_bit_width_multi_target(tg,
+                                                     fw_info,
+                                                     fw_impl,
+                                                     target_resource_utilizations,
+                                                     core_config.mixed_precision_config,
+                                                     representative_data_gen,
+                                                     hessian_info_service=hessian_info_service)
+
+    # Setting the bit widths finalizes the graph's nodes inplace, so each configuration gets its own graph copy.
+    graphs = [_finalize_bit_widths(copy.deepcopy(tg), pareto_point.bit_widths_config, core_config, fw_info, fw_impl,
+                                   tb_w)
+              for pareto_point in pareto_front]
+
+    return graphs, pareto_front, hessian_info_service
+
+
+def _prepare_graph_for_quantization(in_model: Any,
+                                    representative_data_gen: Callable,
+                                    core_config: CoreConfig,
+                                    fw_info: FrameworkInfo,
+                                    fw_impl: FrameworkImplementation,
+                                    tpc: TargetPlatformCapabilities,
+                                    running_gptq: bool,
+                                    tb_w: TensorboardWriter = None,
+                                    pipeline_cache: PipelineCache = None) -> Tuple[Graph, HessianInfoService]:
+    """
+    Build a graph from the model and prepare it for quantization (graph preparation, statistics collection and
+    quantization parameters computation). Stages whose inputs did not change since they were cached are loaded from
+    the pipeline cache.
+
+    Args:
+        in_model: Model to quantize.
+        representative_data_gen: Dataset used for calibration.
+        core_config: CoreConfig containing parameters of how the model should be quantized
+        fw_info: Information needed for quantization about the specific framework.
+        fw_impl: FrameworkImplementation object with a specific framework methods implementation.
+        tpc: TargetPlatformCapabilities object that models the inference target platform and
+                                              the attached framework operator's information.
+        running_gptq: Whether or not a GPTQ optimization is planned to run after the PTQ process.
+        tb_w: TensorboardWriter object for logging
+        pipeline_cache: PipelineCache to load the stages' results from or save them to (if None, nothing is cached).
+
+    Returns:
+        The graph, ready for quantization, and a HessianInfoService of the graph.
+
+    """
+    with Profiler.profile('graph_preparation'):
+        graph = graph_preparation_runner(in_model,
+                                         representative_data_gen,
+                                         core_config.quantization_config,
+                                         fw_info,
+                                         fw_impl,
+                                         tpc,
+                                         tb_w,
+                                         mixed_precision_enable=core_config.mixed_precision_enable,
+                                         running_gptq=running_gptq,
+                                         pipeline_cache=pipeline_cache)
+
+    hessian_info_service = HessianInfoService(graph=graph,
+                                              representative_dataset=representative_data_gen,
+                                              fw_impl=fw_impl)
+
+    stage_inputs = ()
+    if pipeline_cache is not None:
+        stage_inputs = (pipeline_cache.get_dataset_fingerprint(representative_data_gen, fw_impl),
+                        core_config.quantization_config,
+                        core_config.debug_config.network_editor,
+                        core_config.mixed_precision_enable)
+
+    with Profiler.profile('quantization_preparation'):
+        tg = run_cached_stage(pipeline_cache,
+                              'quantization_preparation',
+                              stage_inputs,
+                              lambda: quantization_preparation_runner(graph=graph,
+                                                                      representative_data_gen=representative_data_gen,
+                                                                      core_config=core_config,
+                                                                      fw_info=fw_info,
+                                                                      fw_impl=fw_impl,
+                                                                      tb_w=tb_w,
+                                                                      hessian_info_service=hessian_info_service))
+
+    return tg, hessian_info_service
+
+
+def _finalize_bit_widths(tg: Graph,
+                         bit_widths_config: List[int],
+                         core_config: CoreConfig,
+                         fw_info: FrameworkInfo,
+                         fw_impl: FrameworkImplementation,
+                         tb_w: TensorboardWriter = None) -> Graph:
+    """
+    Set the final bit-width configuration of a graph, and compute the resulting resource utilization.
+
+    Args:
+        tg: Graph to finalize its bit widths.
+        bit_widths_config: The mixed-precision configuration to set (an empty list if mixed precision is disabled).
+        core_config: CoreConfig containing parameters of how the model should be quantized
+        fw_info: A FrameworkInfo object.
+        fw_impl: FrameworkImplementation object with specific framework methods implementation.
+        tb_w: TensorboardWriter object for logging
+
+    Returns:
+        The graph with its final quantization configurations.
+
+    """
     tg = set_bit_widths(core_config.mixed_precision_enable,
                         tg,
                         bit_widths_config)
@@ -153,11 +321,12 @@ def core_runner(in_model: Any,
     # This is since some actions regard the final configuration and should be edited.
     edit_network_graph(tg, fw_info, core_config.debug_config.network_editor)
 
-    _set_final_resource_utilization(graph=tg,
-                                    final_bit_widths_config=bit_widths_config,
-                                    ru_functions_dict=ru_functions_mapping,
-                                    fw_info=fw_info,
-                                    fw_impl=fw_impl)
+    with Profiler.profile('final_resource_utilization'):
+        _set_final_resource_utilization(graph=tg,
+                                        final_bit_widths_config=bit_widths_config,
+                                        ru_functions_dict=ru_functions_mapping,
+                                        fw_info=fw_info,
+                                        fw_impl=fw_impl)
 
     if core_config.mixed_precision_enable:
         # Retrieve lists of tuples (node, node's final weights/activation bitwidth)
@@ -175,7 +344,7 @@ def core_runner(in_model: Any,
         if tb_w is not None:
             finalize_bitwidth_in_tb(tb_w, weights_conf_nodes_bitwidth, activation_conf_nodes_bitwidth)
 
-    return tg, bit_widths_config, hessian_info_service
+    return tg
 
 
 def _set_final_resource_utilization(graph: Graph,
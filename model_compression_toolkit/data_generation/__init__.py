@@ -14,13 +14,26 @@
 # ==============================================================================
 
 from model_compression_toolkit.constants import FOUND_TORCH, FOUND_TF, FOUND_TORCHVISION
-from model_compression_toolkit.data_generation.common.data_generation_config import DataGenerationConfig
-from model_compression_toolkit.data_generation.common.enums import ImageGranularity, DataInitType, SchedulerType, BNLayerWeightingType, OutputLossType, BatchNormAlignemntLossType, ImagePipelineType, ImageNormalizationType
+from model_compression_toolkit.lazy_loader import lazy_attributes
 
-if FOUND_TF:
-    from model_compression_toolkit.data_generation.keras.keras_data_generation import (
-        keras_data_generation_experimental, get_keras_data_generation_config)
+_LAZY_ATTRIBUTES = {
+    'DataGenerationConfig': ('model_compression_toolkit.data_generation.common.data_generation_config', 'DataGenerationConfig'),
+    'ImageGranularity': ('model_compression_toolkit.data_generation.common.enums', 'ImageGranularity'),
+    'DataInitType': ('model_compression_toolkit.data_generation.common.enums', 'DataInitType'),
+    'SchedulerType': ('model_compression_toolkit.data_generation.common.enums', 'SchedulerType'),
+    'BNLayerWeightingType': ('model_compression_toolkit.data_generation.common.enums', 'BNLayerWeightingType'),
+    'OutputLossType': ('model_compression_toolkit.data_generation.common.enums', 'OutputLossType'),
+    'BatchNormAlignemntLossType': ('model_compression_toolkit.data_generation.common.enums', 'BatchNormAlignemntLossType'),
+    'ImagePipelineType': ('model_compression_toolkit.data_generation.common.enums', 'ImagePipelineType'),
+    'ImageNormalizationType': ('model_compression_toolkit.data_generation.common.enums', 'ImageNormalizationType'),
+}
 
+if FOUND_TF:
+    _LAZY_ATTRIBUTES['keras_data_generation_experimental'] = ('model_compression_toolkit.data_generation.keras.keras_data_generation', 'keras_data_generation_experimental')
+    _LAZY_ATTRIBUTES['get_keras_data_generation_config'] = ('model_compression_toolkit.data_generation.keras.keras_data_generation', 'get_keras_data_generation_config')
 if FOUND_TORCH and FOUND_TORCHVISION:
-    from model_compression_toolkit.data_generation.pytorch.pytorch_data_generation import (
-        pytorch_data_generation_experimental, get_pytorch_data_generation_config)
+    _LAZY_ATTRIBUTES['pytorch_data_generation_experimental'] = ('model_compression_toolkit.data_generation.pytorch.pytorch_data_generation', 'pytorch_data_generation_experimental')
+    _LAZY_ATTRIBUTES['get_pytorch_data_generation_config'] = ('model_compression_toolkit.data_generation.pytorch.pytorch_data_generation', 'get_pytorch_data_generation_config')
+
+__all__ = list(_LAZY_ATTRIBUTES)
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
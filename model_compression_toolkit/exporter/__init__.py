@@ -12,11 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from model_compression_toolkit.exporter.model_exporter.fw_agonstic.quantization_format import QuantizationFormat
-from model_compression_toolkit.exporter.model_exporter.keras.export_serialization_format import \
-    KerasExportSerializationFormat
-from model_compression_toolkit.exporter.model_exporter.pytorch.export_serialization_format import \
-    PytorchExportSerializationFormat
-from model_compression_toolkit.exporter.model_exporter.keras.keras_export_facade import keras_export_model
-from model_compression_toolkit.exporter.model_exporter.pytorch.pytorch_export_facade import pytorch_export_model
 
+from model_compression_toolkit.lazy_loader import lazy_attributes
+
+_LAZY_ATTRIBUTES = {
+    'QuantizationFormat': ('model_compression_toolkit.exporter.model_exporter.fw_agonstic.quantization_format', 'QuantizationFormat'),
+    'KerasExportSerializationFormat': ('model_compression_toolkit.exporter.model_exporter.keras.export_serialization_format', 'KerasExportSerializationFormat'),
+    'PytorchExportSerializationFormat': ('model_compression_toolkit.exporter.model_exporter.pytorch.export_serialization_format', 'PytorchExportSerializationFormat'),
+    'keras_export_model': ('model_compression_toolkit.exporter.model_exporter.keras.keras_export_facade', 'keras_export_model'),
+    'pytorch_export_model': ('model_compression_toolkit.exporter.model_exporter.pytorch.pytorch_export_facade', 'pytorch_export_model'),
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
@@ -13,8 +13,17 @@
 # limitations under the License.
 # ==============================================================================
 
-from model_compression_toolkit.gptq.common.gptq_config import GradientPTQConfig, RoundingType, GPTQHessianScoresConfig
-from model_compression_toolkit.gptq.keras.quantization_facade import keras_gradient_post_training_quantization
-from model_compression_toolkit.gptq.keras.quantization_facade import get_keras_gptq_config
-from model_compression_toolkit.gptq.pytorch.quantization_facade import pytorch_gradient_post_training_quantization
-from model_compression_toolkit.gptq.pytorch.quantization_facade import get_pytorch_gptq_config
\ No newline at end of file
+from model_compression_toolkit.lazy_loader import lazy_attributes
+
+_LAZY_ATTRIBUTES = {
+    'GradientPTQConfig': ('model_compression_toolkit.gptq.common.gptq_config', 'GradientPTQConfig'),
+    'RoundingType': ('model_compression_toolkit.gptq.common.gptq_config', 'RoundingType'),
+    'GPTQHessianScoresConfig': ('model_compression_toolkit.gptq.common.gptq_config', 'GPTQHessianScoresConfig'),
+    'keras_gradient_post_training_quantization': ('model_compression_toolkit.gptq.keras.quantization_facade', 'keras_gradient_post_training_quantization'),
+    'get_keras_gptq_config': ('model_compression_toolkit.gptq.keras.quantization_facade', 'get_keras_gptq_config'),
+    'pytorch_gradient_post_training_quantization': ('model_compression_toolkit.gptq.pytorch.quantization_facade', 'pytorch_gradient_post_training_quantization'),
+    'get_pytorch_gptq_config': ('model_compression_toolkit.gptq.pytorch.quantization_facade', 'get_pytorch_gptq_config'),
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
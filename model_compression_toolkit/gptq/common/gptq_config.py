@@ -74,7 +74,8 @@ class GradientPTQConfig:
                  optimizer_bias: Any = None,
                  regularization_factor: float = REG_DEFAULT,
                  hessian_weights_config: GPTQHessianScoresConfig = GPTQHessianScoresConfig(),
-                 gptq_quantizer_params_override: Dict[str, Any] = None):
+                 gptq_quantizer_params_override: Dict[str, Any] = None,
+                 num_workers: int = 1):
         """
         Initialize a GradientPTQConfig.
 
@@ -94,6 +95,7 @@ class GradientPTQConfig:
             regularization_factor (float): A floating point number that defines the regularization factor.
             hessian_weights_config (GPTQHessianScoresConfig): A configuration that include all necessary arguments to run a computation of Hessian scores for the GPTQ loss.
             gptq_quantizer_params_override (dict): A dictionary of parameters to override in GPTQ quantizer instantiation. Defaults to None (no parameters).
+            num_workers (int): Number of local worker processes for data-parallel training (PyTorch only). Each worker trains on a shard of every batch, and the gradients are averaged over the workers. Keras GPTQ does not support data-parallel training: it logs a warning and trains in a single process.
 
         """
 
@@ -114,4 +116,7 @@ class GradientPTQConfig:
         self.gptq_quantizer_params_override = {} if gptq_quantizer_params_override is None \
             else gptq_quantizer_params_override
 
+        assert num_workers >= 1, f'num_workers must be at least 1, but got {num_workers}.'
+        self.num_workers = num_workers
+
 
@@ -246,6 +246,27 @@ class GPTQTrainer(ABC):
             )   # pragma: no cover
 
 
+    def update_regularization_schedule(self, num_batches: int, epoch_completed: bool):
+        """
+        Update the schedule of the regularization if the number of batches in an epoch was not known when the
+        regularization was created. In this case, the batches are counted during the first training epoch.
+        Until the epoch is completed, the number of batches in an epoch is estimated as the smallest power of two
+        that is larger than the number of batches seen so far, so the temperature decay starts even when
+        training for a single epoch. When the epoch is completed, the schedule is set by the measured count.
+
+        Args:
+            num_batches: Number of batches seen so far in the first epoch.
+            epoch_completed: Whether the first epoch is completed, i.e., num_batches is the number of batches
+                in an epoch.
+        """
+        if getattr(self.reg_func, 'total_gradient_steps', 0) is not None:
+            return
+        if epoch_completed:
+            self.reg_func.set_total_gradient_steps(num_batches * self.gptq_config.n_epochs)
+        else:
+            estimated_num_batches = 1 << num_batches.bit_length()
+            self.reg_func.linear_decay.set_t_max(estimated_num_batches * self.gptq_config.n_epochs)
+
     @abstractmethod
     def build_gptq_model(self):
         """
@@ -277,6 +298,24 @@ class GPTQTrainer(ABC):
         raise NotImplemented(f'{self.__class__.__name__} have to implement the '
                              f'framework\'s update_graph method.')  # pragma: no cover
 
+
+def get_dataset_num_batches(representative_data_gen: Callable) -> int:
+    """
+    Get the number of batches of a representative dataset without iterating it. The number of batches is known
+    only if the dataset declares it, i.e., the dataset callable defines __len__ (for example, a dataset object that
+    holds its cached batches).
+
+    Args:
+        representative_data_gen: Dataset to get its number of batches.
+
+    Returns:
+        The number of batches of the dataset, or None if the dataset does not declare it.
+    """
+    if hasattr(representative_data_gen, '__len__'):
+        return len(representative_data_gen)
+    return None
+
+
 def gptq_training(graph_float: Graph,
                   graph_quant: Graph,
                   gptq_config: GradientPTQConfig,
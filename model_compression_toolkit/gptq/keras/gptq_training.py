@@ -119,6 +119,10 @@ class KerasGPTQTrainer(GPTQTrainer):
 
         self.reg_func = get_regularization(self.gptq_config, representative_data_gen)
 
+        if self.gptq_config.num_workers > 1:
+            Logger.warning('Data-parallel GPTQ training is supported only for PyTorch models, so the training runs '
+                           'in a single process.')
+
     def _is_gptq_weights_trainable(self,
                                    node: common.BaseNode) -> bool:
         """
@@ -302,7 +306,8 @@ class KerasGPTQTrainer(GPTQTrainer):
 
         """
         with tqdm(range(n_epochs), "Running GPTQ optimization") as epochs_pbar:
-            for _ in epochs_pbar:
+            for epoch in epochs_pbar:
+                num_batches = 0
                 with tqdm(data_function(), position=1, leave=False) as data_pbar:
                     for data in data_pbar:
                         input_data = [d * self.input_scale for d in data]
@@ -318,6 +323,11 @@ class KerasGPTQTrainer(GPTQTrainer):
                                                           self.compare_points)
                         self.loss_list.append(loss_value_step.numpy())
                         Logger.debug(f'last loss value: {self.loss_list[-1]}')
+                        num_batches += 1
+                        if epoch == 0:
+                            self.update_regularization_schedule(num_batches, epoch_completed=False)
+                if epoch == 0:
+                    self.update_regularization_schedule(num_batches, epoch_completed=True)
 
     def update_graph(self):
         """
@@ -19,6 +19,7 @@ from packaging import version
 
 from model_compression_toolkit.core.common.quantization.quantize_graph_weights import quantize_graph_weights
 from model_compression_toolkit.core.common.visualization.tensorboard_writer import init_tensorboard_writer
+from model_compression_toolkit.core.common.profiler import Profiler
 from model_compression_toolkit.gptq.common.gptq_constants import REG_DEFAULT
 from model_compression_toolkit.logger import Logger
 from model_compression_toolkit.constants import TENSORFLOW, FOUND_TF
@@ -46,9 +47,9 @@ if FOUND_TF:
     from model_compression_toolkit.core.keras.keras_model_validation import KerasModelValidation
     from tensorflow.keras.models import Model
     from model_compression_toolkit.gptq.keras.gptq_loss import GPTQMultipleTensorsLoss
-    from model_compression_toolkit.target_platform_capabilities.constants import DEFAULT_TP_MODEL
     from model_compression_toolkit.exporter.model_wrapper import get_exportable_keras_model
-    from model_compression_toolkit import get_target_platform_capabilities
+    from model_compression_toolkit.target_platform_capabilities.tpc_models.get_target_platform_capabilities import \
+        get_default_target_platform_capabilities
     from mct_quantizers.keras.metadata import add_metadata
 
     # As from TF2.9 optimizers package is changed
@@ -59,8 +60,6 @@ if FOUND_TF:
     else:
         from tensorflow.python.keras.optimizer_v2.optimizer_v2 import OptimizerV2
 
-    DEFAULT_KERAS_TPC = get_target_platform_capabilities(TENSORFLOW, DEFAULT_TP_MODEL)
-
 
     def get_keras_gptq_config(n_epochs: int,
                               optimizer: OptimizerV2 = tf.keras.optimizers.Adam(learning_rate=LR_DEFAULT),
@@ -120,7 +119,7 @@ if FOUND_TF:
                                                   gptq_representative_data_gen: Callable = None,
                                                   target_resource_utilization: ResourceUtilization = None,
                                                   core_config: CoreConfig = CoreConfig(),
-                                                  target_platform_capabilities: TargetPlatformCapabilities = DEFAULT_KERAS_TPC) -> Tuple[Model, UserInformation]:
+                                                  target_platform_capabilities: TargetPlatformCapabilities = None) -> Tuple[Model, UserInformation]:
         """
         Quantize a trained Keras model using post-training quantization. The model is quantized using a
         symmetric constraint quantization thresholds (power of two).
@@ -192,6 +191,9 @@ if FOUND_TF:
             >>> quantized_model, quantization_info = mct.gptq.keras_gradient_post_training_quantization(model, repr_datagen, gptq_config, target_resource_utilization=ru, core_config=config)
 
         """
+        if target_platform_capabilities is None:
+            target_platform_capabilities = get_default_target_platform_capabilities(TENSORFLOW)
+
         KerasModelValidation(model=in_model,
                              fw_info=DEFAULT_KERAS_INFO).validate()
 
@@ -201,45 +203,59 @@ if FOUND_TF:
                                 "Ensure usage of the correct API for keras_post_training_quantization "
                                 "or provide a valid mixed-precision configuration.")  # pragma: no cover
 
-        tb_w = init_tensorboard_writer(DEFAULT_KERAS_INFO)
-
-        fw_impl = GPTQKerasImplemantation()
-
-        tg, bit_widths_config, hessian_info_service = core_runner(in_model=in_model,
-                                                                  representative_data_gen=representative_data_gen,
-                                                                  core_config=core_config,
-                                                                  fw_info=DEFAULT_KERAS_INFO,
-                                                                  fw_impl=fw_impl,
-                                                                  tpc=target_platform_capabilities,
-                                                                  target_resource_utilization=target_resource_utilization,
-                                                                  tb_w=tb_w,
-                                                                  running_gptq=True)
-
-        float_graph = copy.deepcopy(tg)
-
-        tg_gptq = gptq_runner(tg,
-                              core_config,
-                              gptq_config,
-                              representative_data_gen,
-                              gptq_representative_data_gen if gptq_representative_data_gen else representative_data_gen,
-                              DEFAULT_KERAS_INFO,
-                              fw_impl,
-                              tb_w,
-                              hessian_info_service=hessian_info_service)
-
-        del hessian_info_service
-
-        if core_config.debug_config.analyze_similarity:
-            analyzer_model_quantization(representative_data_gen,
-                                        tb_w,
-                                        float_graph,
-                                        tg_gptq,
-                                        fw_impl,
-                                        DEFAULT_KERAS_INFO)
-
-        exportable_model, user_info = get_exportable_keras_model(tg_gptq)
-        if target_platform_capabilities.tp_model.add_metadata:
-            exportable_model = add_metadata(exportable_model, get_versions_dict(target_platform_capabilities))
+        tb_w = init_tensorboard_writer(DEFAULT_KERAS_INFO, core_config.debug_config)
+
+        if core_config.debug_config.profile:
+            Profiler.start()
+
+        try:
+            fw_impl = GPTQKerasImplemantation()
+
+            tg, bit_widths_config, hessian_info_service = core_runner(in_model=in_model,
+                                                                      representative_data_gen=representative_data_gen,
+                                                                      core_config=core_config,
+                                                                      fw_info=DEFAULT_KERAS_INFO,
+                                                                      fw_impl=fw_impl,
+                                                                      tpc=target_platform_capabilities,
+                                                                      target_resource_utilization=target_resource_utilization,
+                                                                      tb_w=tb_w,
+                                                                      running_gptq=True)
+
+            float_graph = copy.deepcopy(tg)
+
+            with Profiler.profile('gptq'):
+                tg_gptq = gptq_runner(tg,
+                                      core_config,
+                                      gptq_config,
+                                      representative_data_gen,
+                                      gptq_representative_data_gen if gptq_representative_data_gen else representative_data_gen,
+                                      DEFAULT_KERAS_INFO,
+                                      fw_impl,
+                                      tb_w,
+                                      hessian_info_service=hessian_info_service)
+
+            del hessian_info_service
+
+            if core_config.debug_config.analyze_similarity:
+                with Profiler.profile('similarity_analysis'):
+                    analyzer_model_quantization(representative_data_gen,
+                                                tb_w,
+                                                float_graph,
+                                                tg_gptq,
+                                                fw_impl,
+                                                DEFAULT_KERAS_INFO)
+
+            with Profiler.profile('export'):
+                exportable_model, user_info = get_exportable_keras_model(tg_gptq)
+                if target_platform_capabilities.tp_model.add_metadata:
+                    exportable_model = add_metadata(exportable_model, get_versions_dict(target_platform_capabilities))
+        finally:
+            # Stop the profiler and close the Tensorboard writer also when the quantization fails, so they are not
+            # left open for later calls.
+            profiling_report = Profiler.stop(core_config.debug_config.profiling_report_path, tb_w)
+            if tb_w is not None:
+                tb_w.close()
+        user_info.profiling_report = profiling_report
         return exportable_model, user_info
 
 else:
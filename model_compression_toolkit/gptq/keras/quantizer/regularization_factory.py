@@ -12,10 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from tqdm import tqdm
 from typing import Callable
 
 from model_compression_toolkit.gptq import RoundingType, GradientPTQConfig, GradientPTQConfig
+from model_compression_toolkit.gptq.common.gptq_training import get_dataset_num_batches
 from model_compression_toolkit.gptq.keras.quantizer.soft_rounding.soft_quantizer_reg import \
     SoftQuantizerRegularization
 
@@ -34,11 +34,11 @@ def get_regularization(gptq_config: GradientPTQConfig, representative_data_gen:
 
     """
     if gptq_config.rounding_type == RoundingType.SoftQuantizer:
-        # dry run on the representative dataset to count number of batches
-        num_batches = 0
-        for _ in tqdm(representative_data_gen(), "GPTQ initialization"):
-            num_batches += 1
+        # The number of batches is taken from the dataset if it declares it, so the dataset is not iterated just
+        # to count its batches. Otherwise, the schedule is updated by the trainer during the first epoch.
+        num_batches = get_dataset_num_batches(representative_data_gen)
+        total_gradient_steps = None if num_batches is None else num_batches * gptq_config.n_epochs
 
-        return SoftQuantizerRegularization(total_gradient_steps=num_batches * gptq_config.n_epochs)
+        return SoftQuantizerRegularization(total_gradient_steps=total_gradient_steps)
     else:
         return lambda m, e_reg: 0
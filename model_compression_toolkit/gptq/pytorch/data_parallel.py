@@ -0,0 +1,201 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import socket
+import tempfile
+from typing import Callable, List, Iterator
+
+import numpy as np
+import torch
+import torch.distributed as dist
+import torch.multiprocessing as mp
+
+from model_compression_toolkit.core.pytorch.pytorch_device_config import get_working_device
+from model_compression_toolkit.logger import Logger
+
+# Backend of the process group of the data-parallel workers (CPU workers on a single machine).
+DATA_PARALLEL_BACKEND = 'gloo'
+TRAINING_RESULT_FILE = 'gptq_training_result.pt'
+FXP_MODEL_STATE = 'fxp_model_state'
+LOSS_LIST = 'loss_list'
+
+
+def run_data_parallel_training(trainer, representative_data_gen: Callable, num_workers: int):
+    """
+    Run the GPTQ training loop of a trainer in several local worker processes. The first worker reads the
+    representative dataset and sends each worker a shard of every batch (see iter_worker_batches), and the gradients
+    of the trained parameters (rounding, scale and bias) are averaged over all workers (weighted by their shards'
+    sizes) before each optimizer step, so all workers hold the same trained parameters.
+    When the training is done, the trained parameters of the first worker are loaded to the trainer's model, so the
+    trainer updates its graph as after single-process training.
+
+    The workers are forked from the current process, so they get the trainer and the representative dataset
+    without serializing them.
+
+    Args:
+        trainer: PytorchGPTQTrainer to run its training loop (after its optimizers and models modes were set).
+        representative_data_gen: Dataset generator to get images.
+        num_workers: Number of worker processes.
+
+    """
+    if 'fork' not in mp.get_all_start_methods():
+        Logger.critical('Data-parallel GPTQ requires forking worker processes, which is not supported on this '
+                        'platform.')  # pragma: no cover
+    if get_working_device().type != 'cpu':
+        Logger.critical(f'Data-parallel GPTQ runs on CPU workers, but the working device is '
+                        f'{get_working_device()}.')
+
+    with tempfile.TemporaryDirectory() as result_dir:
+        result_path = os.path.join(result_dir, TRAINING_RESULT_FILE)
+        mp.start_processes(_run_worker,
+                           args=(trainer, representative_data_gen, num_workers, _get_free_port(), result_path),
+                           nprocs=num_workers,
+                           join=True,
+                           start_method='fork')
+        result = torch.load(result_path)
+
+    trainer.fxp_model.load_state_dict(result[FXP_MODEL_STATE])
+    trainer.loss_list = result[LOSS_LIST]
+
+
+def _run_worker(rank: int,
+                trainer,
+                representative_data_gen: Callable,
+                world_size: int,
+                port: int,
+                result_path: str):
+    """
+    Run the training loop of a data-parallel worker. The first worker saves the trained model's state and losses
+    to result_path.
+
+    Args:
+        rank: Index of the worker.
+        trainer: PytorchGPTQTrainer to run its training loop.
+        representative_data_gen: Dataset generator to get images.
+        world_size: Number of workers.
+        port: Free local port for the workers' process group.
+        result_path: Path to save the training result to.
+
+    """
+    # The machine's cores are split between the workers.
+    torch.set_num_threads(max(1, (os.cpu_count() or 1) // world_size))
+    dist.init_process_group(DATA_PARALLEL_BACKEND,
+                            init_method=f'tcp://127.0.0.1:{port}',
+                            rank=rank,
+                            world_size=world_size)
+    try:
+        trainer.rank, trainer.world_size = rank, world_size
+        trainer.micro_training_loop(representative_data_gen, trainer.gptq_config.n_epochs)
+        if rank == 0:
+            torch.save({FXP_MODEL_STATE: trainer.fxp_model.state_dict(), LOSS_LIST: trainer.loss_list}, result_path)
+    finally:
+        dist.destroy_process_group()
+
+
+def iter_worker_batches(data_function: Callable, rank: int, world_size: int) -> Iterator[List[np.ndarray]]:
+    """
+    Iterate over the shards of a data-parallel worker of the representative dataset's batches. Only the first worker
+    reads the dataset, and it sends each worker its shard of every batch, so the dataset is read once per epoch
+    (rather than once per worker).
+
+    Args:
+        data_function: A callable function that gives a batch of samples.
+        rank: Index of the worker.
+        world_size: Number of workers.
+
+    Returns:
+        An iterator over the worker's shards of the batches.
+    """
+    if rank == 0:
+        for input_data in data_function():
+            yield _scatter_shards([get_batch_shard(input_data, r, world_size) for r in range(world_size)])
+        # Notify the other workers that the epoch is done.
+        _scatter_shards([None] * world_size)
+    else:
+        shard = _scatter_shards(None)
+        while shard is not None:
+            yield shard
+            shard = _scatter_shards(None)
+
+
+def _scatter_shards(shards: List[List[np.ndarray]]) -> List[np.ndarray]:
+    """
+    Send each data-parallel worker its shard of a batch from the first worker.
+
+    Args:
+        shards: The shard of each worker (on the first worker), or None (on the other workers).
+
+    Returns:
+        The worker's shard.
+    """
+    shard = [None]
+    dist.scatter_object_list(shard, shards, src=0)
+    return shard[0]
+
+
+def get_batch_shard(input_data: List[np.ndarray], rank: int, world_size: int) -> List[np.ndarray]:
+    """
+    Get the shard of a batch of a data-parallel worker.
+
+    Args:
+        input_data: A batch of inputs (a tensor per model input).
+        rank: Index of the worker.
+        world_size: Number of workers.
+
+    Returns:
+        The worker's part of each input tensor of the batch.
+    """
+    if input_data[0].shape[0] < world_size:
+        Logger.critical(f'Data-parallel GPTQ with {world_size} workers requires batches of at least {world_size} '
+                        f'samples, but got a batch of {input_data[0].shape[0]} samples.')
+    return [np.array_split(d, world_size)[rank] for d in input_data]
+
+
+def all_reduce_gradients(params: List[torch.Tensor], loss_value: torch.Tensor, num_samples: int) -> torch.Tensor:
+    """
+    Average the gradients of the trained parameters and the loss value over all data-parallel workers, weighted by
+    the number of samples in each worker's shard (the shards of a batch may differ in size by one sample).
+    All the values are reduced in a single all-reduce operation.
+
+    Args:
+        params: Trained parameters, which their gradients are averaged (in place). A parameter without a gradient
+            is reduced as zeros, and keeps having no gradient.
+        loss_value: The worker's loss value.
+        num_samples: Number of samples in the worker's shard of the batch.
+
+    Returns:
+        The average loss value.
+    """
+    grads = [torch.zeros_like(p) if p.grad is None else p.grad for p in params]
+    buffer = torch.cat([g.detach().flatten() for g in grads] + [loss_value.detach().reshape(1)])
+    buffer = torch.cat([buffer * num_samples, torch.tensor([num_samples], dtype=buffer.dtype, device=buffer.device)])
+    dist.all_reduce(buffer, op=dist.ReduceOp.SUM)
+    buffer = buffer[:-1] / buffer[-1]
+
+    offset = 0
+    for p, g in zip(params, grads):
+        if p.grad is not None:
+            p.grad.copy_(buffer[offset:offset + g.numel()].view_as(g))
+        offset += g.numel()
+    return buffer[-1]
+
+
+def _get_free_port() -> int:
+    """
+    Returns: A free local port.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
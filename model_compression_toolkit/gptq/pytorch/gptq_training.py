@@ -31,6 +31,8 @@ from model_compression_toolkit.core.common.framework_info import FrameworkInfo
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
 from model_compression_toolkit.core.pytorch.constants import BIAS
 from model_compression_toolkit.core.pytorch.utils import to_torch_tensor, set_model, torch_tensor_to_numpy
+from model_compression_toolkit.gptq.pytorch.data_parallel import run_data_parallel_training, iter_worker_batches, \
+    all_reduce_gradients
 from model_compression_toolkit.gptq.pytorch.graph_info import get_gptq_trainable_parameters, \
     get_weights_for_loss
 from model_compression_toolkit.gptq.pytorch.quantizer.quantization_builder import quantization_builder
@@ -100,6 +102,10 @@ class PytorchGPTQTrainer(GPTQTrainer):
 
         self.reg_func = get_regularization(self.gptq_config, representative_data_gen)
 
+        # Index of the data-parallel worker that runs the training loop and the number of workers.
+        self.rank = 0
+        self.world_size = 1
+
     def _is_gptq_weights_trainable(self,
                                    node: BaseNode) -> bool:
         """
@@ -197,7 +203,10 @@ class PytorchGPTQTrainer(GPTQTrainer):
         # ----------------------------------------------
         # Training loop
         # ----------------------------------------------
-        self.micro_training_loop(representative_data_gen, self.gptq_config.n_epochs)
+        if self.gptq_config.num_workers > 1:
+            run_data_parallel_training(self, representative_data_gen, self.gptq_config.num_workers)
+        else:
+            self.micro_training_loop(representative_data_gen, self.gptq_config.n_epochs)
 
     def compute_gradients(self,
                           y_float: List[torch.Tensor],
@@ -248,14 +257,25 @@ class PytorchGPTQTrainer(GPTQTrainer):
             data_function: A callable function that give a batch of samples.
             n_epochs: Number of update iterations of representative dataset.
         """
-        with tqdm(range(n_epochs), "Running GPTQ optimization") as epochs_pbar:
-            for _ in epochs_pbar:
-                with tqdm(data_function(), position=1, leave=False) as data_pbar:
+        # Only the first data-parallel worker reports the progress.
+        disable_pbar = self.rank > 0
+        with tqdm(range(n_epochs), "Running GPTQ optimization", disable=disable_pbar) as epochs_pbar:
+            for epoch in epochs_pbar:
+                num_batches = 0
+                # Data-parallel workers get their shards of the batches from the first worker.
+                batches = data_function() if self.world_size == 1 else \
+                    iter_worker_batches(data_function, self.rank, self.world_size)
+                with tqdm(batches, position=1, leave=False, disable=disable_pbar) as data_pbar:
                     for data in data_pbar:
                         input_data = [d * self.input_scale for d in data]
                         input_tensor = to_torch_tensor(input_data)
                         y_float = self.float_model(input_tensor)  # running float model
                         loss_value, grads = self.compute_gradients(y_float, input_tensor)
+                        if self.world_size > 1:
+                            loss_value = all_reduce_gradients([p for _, params in self.optimizer_with_param
+                                                               for p in params],
+                                                              loss_value,
+                                                              input_data[0].shape[0])
                         # Run one step of gradient descent by updating the value of the variables to minimize the loss.
                         for (optimizer, _) in self.optimizer_with_param:
                             optimizer.step()
@@ -266,6 +286,11 @@ class PytorchGPTQTrainer(GPTQTrainer):
                                                           torch_tensor_to_numpy(self.optimizer_with_param[0][-1]))
                         self.loss_list.append(loss_value.item())
                         Logger.debug(f'last loss value: {self.loss_list[-1]}')
+                        num_batches += 1
+                        if epoch == 0:
+                            self.update_regularization_schedule(num_batches, epoch_completed=False)
+                if epoch == 0:
+                    self.update_regularization_schedule(num_batches, epoch_completed=True)
 
     def update_graph(self) -> Graph:
         """
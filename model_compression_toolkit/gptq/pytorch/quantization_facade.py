@@ -18,6 +18,7 @@ from typing import Callable
 from model_compression_toolkit.core import common
 from model_compression_toolkit.constants import FOUND_TORCH
 from model_compression_toolkit.core.common.visualization.tensorboard_writer import init_tensorboard_writer
+from model_compression_toolkit.core.common.profiler import Profiler
 from model_compression_toolkit.gptq.common.gptq_constants import REG_DEFAULT
 from model_compression_toolkit.logger import Logger
 from model_compression_toolkit.constants import PYTORCH
@@ -41,15 +42,14 @@ LR_QUANTIZATION_PARAM_DEFAULT = 1e-4
 if FOUND_TORCH:
     from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
     from model_compression_toolkit.gptq.pytorch.gptq_pytorch_implementation import GPTQPytorchImplemantation
-    from model_compression_toolkit.target_platform_capabilities.constants import DEFAULT_TP_MODEL
     from model_compression_toolkit.gptq.pytorch.gptq_loss import multiple_tensors_mse_loss
     from model_compression_toolkit.exporter.model_wrapper.pytorch.builder.fully_quantized_model_builder import get_exportable_pytorch_model
     import torch
     from torch.nn import Module
     from torch.optim import Adam, Optimizer
-    from model_compression_toolkit import get_target_platform_capabilities
+    from model_compression_toolkit.target_platform_capabilities.tpc_models.get_target_platform_capabilities import \
+        get_default_target_platform_capabilities
     from mct_quantizers.pytorch.metadata import add_metadata
-    DEFAULT_PYTORCH_TPC = get_target_platform_capabilities(PYTORCH, DEFAULT_TP_MODEL)
 
     def get_pytorch_gptq_config(n_epochs: int,
                                 optimizer: Optimizer = Adam([torch.Tensor([])], lr=LR_DEFAULT),
@@ -57,7 +57,8 @@ if FOUND_TORCH:
                                 loss: Callable = multiple_tensors_mse_loss,
                                 log_function: Callable = None,
                                 use_hessian_based_weights: bool = True,
-                                regularization_factor: float = REG_DEFAULT) -> GradientPTQConfig:
+                                regularization_factor: float = REG_DEFAULT,
+                                num_workers: int = 1) -> GradientPTQConfig:
         """
         Create a GradientPTQConfigV2 instance for Pytorch models.
 
@@ -69,6 +70,7 @@ if FOUND_TORCH:
             log_function (Callable): Function to log information about the gptq process.
             use_hessian_based_weights (bool): Whether to use Hessian-based weights for weighted average loss.
             regularization_factor (float): A floating point number that defines the regularization factor.
+            num_workers (int): Number of local worker processes for data-parallel fine-tuning on CPU.
 
         returns:
             a GradientPTQConfigV2 object to use when fine-tuning the quantized model using gptq.
@@ -92,7 +94,8 @@ if FOUND_TORCH:
         return GradientPTQConfig(n_epochs, optimizer, optimizer_rest=optimizer_rest, loss=loss,
                                  log_function=log_function, train_bias=True, optimizer_bias=bias_optimizer,
                                  use_hessian_based_weights=use_hessian_based_weights,
-                                 regularization_factor=regularization_factor)
+                                 regularization_factor=regularization_factor,
+                                 num_workers=num_workers)
 
 
     def pytorch_gradient_post_training_quantization(model: Module,
@@ -101,7 +104,7 @@ if FOUND_TORCH:
                                                     core_config: CoreConfig = CoreConfig(),
                                                     gptq_config: GradientPTQConfig = None,
                                                     gptq_representative_data_gen: Callable = None,
-                                                    target_platform_capabilities: TargetPlatformCapabilities = DEFAULT_PYTORCH_TPC):
+                                                    target_platform_capabilities: TargetPlatformCapabilities = None):
         """
         Quantize a trained Pytorch module using post-training quantization.
         By default, the module is quantized using a symmetric constraint quantization thresholds
@@ -159,6 +162,8 @@ if FOUND_TORCH:
             >>> quantized_module, quantization_info = mct.gptq.pytorch_gradient_post_training_quantization(module, repr_datagen, core_config=config, gptq_config=gptq_conf)
 
         """
+        if target_platform_capabilities is None:
+            target_platform_capabilities = get_default_target_platform_capabilities(PYTORCH)
 
         if core_config.mixed_precision_enable:
             if not isinstance(core_config.mixed_precision_config, MixedPrecisionQuantizationConfig):
@@ -166,49 +171,63 @@ if FOUND_TORCH:
                                 "Ensure usage of the correct API for 'keras_post_training_quantization' "
                                 "or provide a valid mixed-precision configuration.")  # pragma: no cover
 
-        tb_w = init_tensorboard_writer(DEFAULT_PYTORCH_INFO)
-
-        fw_impl = GPTQPytorchImplemantation()
-
-        # ---------------------- #
-        # Core Runner
-        # ---------------------- #
-        graph, bit_widths_config, hessian_info_service = core_runner(in_model=model,
-                                                                     representative_data_gen=representative_data_gen,
-                                                                     core_config=core_config,
-                                                                     fw_info=DEFAULT_PYTORCH_INFO,
-                                                                     fw_impl=fw_impl,
-                                                                     tpc=target_platform_capabilities,
-                                                                     target_resource_utilization=target_resource_utilization,
-                                                                     tb_w=tb_w,
-                                                                     running_gptq=True)
-
-        float_graph = copy.deepcopy(graph)
-
-        # ---------------------- #
-        # GPTQ Runner
-        # ---------------------- #
-        graph_gptq = gptq_runner(graph,
-                                 core_config,
-                                 gptq_config,
-                                 representative_data_gen,
-                                 gptq_representative_data_gen if gptq_representative_data_gen else representative_data_gen,
-                                 DEFAULT_PYTORCH_INFO,
-                                 fw_impl,
-                                 tb_w,
-                                 hessian_info_service=hessian_info_service)
-
-        if core_config.debug_config.analyze_similarity:
-            analyzer_model_quantization(representative_data_gen,
-                                        tb_w,
-                                        float_graph,
-                                        graph_gptq,
-                                        fw_impl,
-                                        DEFAULT_PYTORCH_INFO)
-
-        exportable_model, user_info = get_exportable_pytorch_model(graph_gptq)
-        if target_platform_capabilities.tp_model.add_metadata:
-            exportable_model = add_metadata(exportable_model, get_versions_dict(target_platform_capabilities))
+        tb_w = init_tensorboard_writer(DEFAULT_PYTORCH_INFO, core_config.debug_config)
+
+        if core_config.debug_config.profile:
+            Profiler.start()
+
+        try:
+            fw_impl = GPTQPytorchImplemantation()
+
+            # ---------------------- #
+            # Core Runner
+            # ---------------------- #
+            graph, bit_widths_config, hessian_info_service = core_runner(in_model=model,
+                                                                         representative_data_gen=representative_data_gen,
+                                                                         core_config=core_config,
+                                                                         fw_info=DEFAULT_PYTORCH_INFO,
+                                                                         fw_impl=fw_impl,
+                                                                         tpc=target_platform_capabilities,
+                                                                         target_resource_utilization=target_resource_utilization,
+                                                                         tb_w=tb_w,
+                                                                         running_gptq=True)
+
+            float_graph = copy.deepcopy(graph)
+
+            # ---------------------- #
+            # GPTQ Runner
+            # ---------------------- #
+            with Profiler.profile('gptq'):
+                graph_gptq = gptq_runner(graph,
+                                         core_config,
+                                         gptq_config,
+                                         representative_data_gen,
+                                         gptq_representative_data_gen if gptq_representative_data_gen else representative_data_gen,
+                                         DEFAULT_PYTORCH_INFO,
+                                         fw_impl,
+                                         tb_w,
+                                         hessian_info_service=hessian_info_service)
+
+            if core_config.debug_config.analyze_similarity:
+                with Profiler.profile('similarity_analysis'):
+                    analyzer_model_quantization(representative_data_gen,
+                                                tb_w,
+                                                float_graph,
+                                                graph_gptq,
+                                                fw_impl,
+                                                DEFAULT_PYTORCH_INFO)
+
+            with Profiler.profile('export'):
+                exportable_model, user_info = get_exportable_pytorch_model(graph_gptq)
+                if target_platform_capabilities.tp_model.add_metadata:
+                    exportable_model = add_metadata(exportable_model, get_versions_dict(target_platform_capabilities))
+        finally:
+            # Stop the profiler and close the Tensorboard writer also when the quantization fails, so they are not
+            # left open for later calls.
+            profiling_report = Profiler.stop(core_config.debug_config.profiling_report_path, tb_w)
+            if tb_w is not None:
+                tb_w.close()
+        user_info.profiling_report = profiling_report
         return exportable_model, user_info
 
 
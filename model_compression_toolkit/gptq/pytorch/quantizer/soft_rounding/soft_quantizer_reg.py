@@ -29,21 +29,34 @@ class LinearTempDecay:
     Annealing process for the soft quantizer regularization temperature term.
     """
 
-    def __init__(self, t_max: int, rel_start_decay: float = 0.2, start_b: int = 20, end_b: int = 2):
+    def __init__(self, t_max: int = None, rel_start_decay: float = 0.2, start_b: int = 20, end_b: int = 2):
         """
         Initializes a LinearTempDecay object.
 
         Args:
-            t_max: maximal time step.
+            t_max: maximal time step. If None, the decay does not start until t_max is set using set_t_max.
             rel_start_decay: Decay step size at the beginning of the process.
             start_b: Starting value of the regularization term.
             end_b: Target value of the regularization term.
         """
 
-        self.t_max = t_max
-        self.start_decay = rel_start_decay * t_max
+        self.rel_start_decay = rel_start_decay
         self.start_b = start_b
         self.end_b = end_b
+        self.t_max = None
+        self.start_decay = None
+        if t_max is not None:
+            self.set_t_max(t_max)
+
+    def set_t_max(self, t_max: int):
+        """
+        Set the maximal time step of the decay.
+
+        Args:
+            t_max: maximal time step.
+        """
+        self.t_max = t_max
+        self.start_decay = self.rel_start_decay * t_max
 
     def __call__(self, t: float) -> float:
         """
@@ -55,6 +68,10 @@ class LinearTempDecay:
         Returns: Scheduled temperature.
         """
 
+        if self.t_max is None:
+            # The decay does not start before the maximal time step is known.
+            return self.start_b
+
         is_before_start_decay = (t < self.start_decay)
 
         rel_t = (t - self.start_decay) / (self.t_max - self.start_decay)
@@ -70,19 +87,31 @@ class SoftQuantizerRegularization:
     A class to handle the computation of soft quantizer regularization for GPTQ training.
     """
 
-    def __init__(self, total_gradient_steps: int):
+    def __init__(self, total_gradient_steps: int = None):
         """
         Initializes the regularization computation object with a LinearDecay object.
 
         Args:
-            total_gradient_steps: The number of gradient steps during optimization.
+            total_gradient_steps: The number of gradient steps during optimization. If None, the trainer estimates it
+                during the first epoch and sets it using set_total_gradient_steps when the epoch is completed.
         """
 
         # Initializing the temperature decay according to the number of expected gradient steps
+        self.total_gradient_steps = total_gradient_steps
         self.linear_decay = LinearTempDecay(total_gradient_steps)
 
         self.count_iter = 0
 
+    def set_total_gradient_steps(self, total_gradient_steps: int):
+        """
+        Set the number of gradient steps during optimization, which the temperature decay is scheduled by.
+
+        Args:
+            total_gradient_steps: The number of gradient steps during optimization.
+        """
+        self.total_gradient_steps = total_gradient_steps
+        self.linear_decay.set_t_max(total_gradient_steps)
+
     def __call__(self, model: nn.Module, entropy_reg: float):
         """
         Returns the soft quantizer regularization value for SoftRounding.
@@ -0,0 +1,54 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import importlib
+import importlib.util
+from typing import Callable, Dict, List, Tuple, Any
+
+
+def lazy_attributes(package_name: str, attributes: Dict[str, Tuple[str, str]]) -> Tuple[Callable, Callable]:
+    """
+    Create the module-level __getattr__ and __dir__ functions (PEP 562) of a package whose public API is loaded
+    lazily: an attribute's module is imported when the attribute is first accessed, so importing the package does
+    not import the frameworks (TensorFlow, PyTorch) that the attributes' modules depend on.
+    Subpackages and submodules of the package are also imported when they are first accessed as attributes.
+
+    Args:
+        package_name: Name of the package (its __name__).
+        attributes: Mapping from an attribute's name to the module it is defined in and its name in that module
+            (if the name is None, the attribute is the module itself).
+
+    Returns:
+        The __getattr__ and __dir__ functions of the package.
+    """
+    package = importlib.import_module(package_name)
+
+    def __getattr__(name: str) -> Any:
+        if name in attributes:
+            module_name, attribute_name = attributes[name]
+            value = importlib.import_module(module_name)
+            if attribute_name is not None:
+                value = getattr(value, attribute_name)
+        elif not name.startswith('__') and importlib.util.find_spec(f'{package_name}.{name}') is not None:
+            value = importlib.import_module(f'{package_name}.{name}')
+        else:
+            raise AttributeError(f"module '{package_name}' has no attribute '{name}'")
+        # Cache the attribute in the package, so it is loaded only once.
+        setattr(package, name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(package)) | set(attributes))
+
+    return __getattr__, __dir__
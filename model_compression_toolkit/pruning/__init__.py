@@ -13,8 +13,16 @@
 # limitations under the License.
 # ==============================================================================
 
-from model_compression_toolkit.core.common.pruning.pruning_info import PruningInfo
-from model_compression_toolkit.core.common.pruning.pruning_config import ImportanceMetric, PruningConfig, ChannelsFilteringStrategy
-from model_compression_toolkit.pruning.keras.pruning_facade import keras_pruning_experimental
-from model_compression_toolkit.pruning.pytorch.pruning_facade import pytorch_pruning_experimental
+from model_compression_toolkit.lazy_loader import lazy_attributes
 
+_LAZY_ATTRIBUTES = {
+    'PruningInfo': ('model_compression_toolkit.core.common.pruning.pruning_info', 'PruningInfo'),
+    'ImportanceMetric': ('model_compression_toolkit.core.common.pruning.pruning_config', 'ImportanceMetric'),
+    'PruningConfig': ('model_compression_toolkit.core.common.pruning.pruning_config', 'PruningConfig'),
+    'ChannelsFilteringStrategy': ('model_compression_toolkit.core.common.pruning.pruning_config', 'ChannelsFilteringStrategy'),
+    'keras_pruning_experimental': ('model_compression_toolkit.pruning.keras.pruning_facade', 'keras_pruning_experimental'),
+    'pytorch_pruning_experimental': ('model_compression_toolkit.pruning.pytorch.pruning_facade', 'pytorch_pruning_experimental'),
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
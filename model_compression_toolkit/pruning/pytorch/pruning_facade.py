@@ -14,7 +14,8 @@
 # ==============================================================================
 
 from typing import Callable, Tuple
-from model_compression_toolkit import get_target_platform_capabilities
+from model_compression_toolkit.target_platform_capabilities.tpc_models.get_target_platform_capabilities import \
+    get_default_target_platform_capabilities
 from model_compression_toolkit.constants import FOUND_TORCH, PYTORCH
 from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.resource_utilization import ResourceUtilization
 from model_compression_toolkit.core.common.pruning.pruner import Pruner
@@ -25,7 +26,6 @@ from model_compression_toolkit.core.graph_prep_runner import read_model_to_graph
 from model_compression_toolkit.logger import Logger
 from model_compression_toolkit.target_platform_capabilities.target_platform.targetplatform2framework import TargetPlatformCapabilities
 from model_compression_toolkit.core.common.quantization.quantization_config import DEFAULTCONFIG
-from model_compression_toolkit.target_platform_capabilities.constants import DEFAULT_TP_MODEL
 
 
 # Check if PyTorch is available in the environment.
@@ -37,14 +37,11 @@ if FOUND_TORCH:
     from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
     from torch.nn import Module
 
-    # Set the default Target Platform Capabilities (TPC) for PyTorch.
-    DEFAULT_PYOTRCH_TPC = get_target_platform_capabilities(PYTORCH, DEFAULT_TP_MODEL)
-
     def pytorch_pruning_experimental(model: Module,
                                      target_resource_utilization: ResourceUtilization,
                                      representative_data_gen: Callable,
                                      pruning_config: PruningConfig = PruningConfig(),
-                                     target_platform_capabilities: TargetPlatformCapabilities = DEFAULT_PYOTRCH_TPC) -> \
+                                     target_platform_capabilities: TargetPlatformCapabilities = None) -> \
             Tuple[Module, PruningInfo]:
         """
         Perform structured pruning on a Pytorch model to meet a specified target resource utilization.
@@ -64,7 +61,7 @@ if FOUND_TORCH:
             representative_data_gen (Callable): A function to generate representative data for pruning analysis.
             pruning_config (PruningConfig): Configuration settings for the pruning process. Defaults to standard config.
             target_platform_capabilities (TargetPlatformCapabilities): Platform-specific constraints and capabilities.
-                Defaults to DEFAULT_PYTORCH_TPC.
+                Defaults to the default PyTorch TPC.
 
         Returns:
             Tuple[Model, PruningInfo]: A tuple containing the pruned Pytorch model and associated pruning information.
@@ -107,6 +104,8 @@ if FOUND_TORCH:
             >>> pruned_model, pruning_info = mct.pruning.pytorch_pruning_experimental(model=model, target_resource_utilization=target_resource_utilization, representative_data_gen=repr_datagen, pruning_config=pruning_config)
 
         """
+        if target_platform_capabilities is None:
+            target_platform_capabilities = get_default_target_platform_capabilities(PYTORCH)
 
         Logger.warning(f"pytorch_pruning_experimental is experimental and is subject to future changes."
                        f"If you encounter an issue, please open an issue in our GitHub "
@@ -13,5 +13,12 @@
 # limitations under the License.
 # ==============================================================================
 
-from model_compression_toolkit.ptq.pytorch.quantization_facade import pytorch_post_training_quantization
-from model_compression_toolkit.ptq.keras.quantization_facade import keras_post_training_quantization
+from model_compression_toolkit.lazy_loader import lazy_attributes
+
+_LAZY_ATTRIBUTES = {
+    'pytorch_post_training_quantization': ('model_compression_toolkit.ptq.pytorch.quantization_facade', 'pytorch_post_training_quantization'),
+    'keras_post_training_quantization': ('model_compression_toolkit.ptq.keras.quantization_facade', 'keras_post_training_quantization'),
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
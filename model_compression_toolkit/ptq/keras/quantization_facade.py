@@ -20,6 +20,7 @@ from model_compression_toolkit.core import CoreConfig
 from model_compression_toolkit.core.analyzer import analyzer_model_quantization
 from model_compression_toolkit.core.common.quantization.quantize_graph_weights import quantize_graph_weights
 from model_compression_toolkit.core.common.visualization.tensorboard_writer import init_tensorboard_writer
+from model_compression_toolkit.core.common.profiler import Profiler
 from model_compression_toolkit.logger import Logger
 from model_compression_toolkit.constants import TENSORFLOW, FOUND_TF
 from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.resource_utilization import ResourceUtilization
@@ -35,19 +36,18 @@ if FOUND_TF:
     from model_compression_toolkit.core.keras.keras_implementation import KerasImplementation
     from model_compression_toolkit.core.keras.keras_model_validation import KerasModelValidation
     from tensorflow.keras.models import Model
-    from model_compression_toolkit.target_platform_capabilities.constants import DEFAULT_TP_MODEL
     from model_compression_toolkit.exporter.model_wrapper import get_exportable_keras_model
 
-    from model_compression_toolkit import get_target_platform_capabilities
+    from model_compression_toolkit.target_platform_capabilities.tpc_models.get_target_platform_capabilities import \
+        get_default_target_platform_capabilities
     from mct_quantizers.keras.metadata import add_metadata
-    DEFAULT_KERAS_TPC = get_target_platform_capabilities(TENSORFLOW, DEFAULT_TP_MODEL)
 
 
     def keras_post_training_quantization(in_model: Model,
                                          representative_data_gen: Callable,
                                          target_resource_utilization: ResourceUtilization = None,
                                          core_config: CoreConfig = CoreConfig(),
-                                         target_platform_capabilities: TargetPlatformCapabilities = DEFAULT_KERAS_TPC):
+                                         target_platform_capabilities: TargetPlatformCapabilities = None):
         """
          Quantize a trained Keras model using post-training quantization. The model is quantized using a
          symmetric constraint quantization thresholds (power of two).
@@ -117,6 +117,8 @@ if FOUND_TF:
             For more configuration options, please take a look at our `API documentation <https://sony.github.io/model_optimization/api/api_docs/modules/mixed_precision_quantization_config.html>`_.
 
          """
+        if target_platform_capabilities is None:
+            target_platform_capabilities = get_default_target_platform_capabilities(TENSORFLOW)
 
         fw_info = DEFAULT_KERAS_INFO
 
@@ -129,46 +131,60 @@ if FOUND_TF:
                                 "MixedPrecisionQuantizationConfig. Please use keras_post_training_quantization "
                                 "API, or pass a valid mixed precision configuration.")  # pragma: no cover
 
-        tb_w = init_tensorboard_writer(fw_info)
-
-        fw_impl = KerasImplementation()
-
-        # Ignore returned hessian service as PTQ does not use it
-        tg, bit_widths_config, _ = core_runner(in_model=in_model,
-                                               representative_data_gen=representative_data_gen,
-                                               core_config=core_config,
-                                               fw_info=fw_info,
-                                               fw_impl=fw_impl,
-                                               tpc=target_platform_capabilities,
-                                               target_resource_utilization=target_resource_utilization,
-                                               tb_w=tb_w)
-
-        # At this point, tg is a graph that went through substitutions (such as BN folding) and is
-        # ready for quantization (namely, it holds quantization params, etc.) but the weights are
-        # not quantized yet. For this reason, we use it to create a graph that acts as a "float" graph
-        # for things like similarity analyzer (because the quantized and float graph should have the same
-        # architecture to find the appropriate compare points for similarity computation).
-        similarity_baseline_graph = copy.deepcopy(tg)
-
-        graph_with_stats_correction = ptq_runner(tg,
-                                                 representative_data_gen,
-                                                 core_config,
-                                                 fw_info,
-                                                 fw_impl,
-                                                 tb_w)
-
-        if core_config.debug_config.analyze_similarity:
-            quantized_graph = quantize_graph_weights(graph_with_stats_correction)
-            analyzer_model_quantization(representative_data_gen,
-                                        tb_w,
-                                        similarity_baseline_graph,
-                                        quantized_graph,
-                                        fw_impl,
-                                        fw_info)
-
-        exportable_model, user_info = get_exportable_keras_model(graph_with_stats_correction)
-        if target_platform_capabilities.tp_model.add_metadata:
-            exportable_model = add_metadata(exportable_model, get_versions_dict(target_platform_capabilities))
+        tb_w = init_tensorboard_writer(fw_info, core_config.debug_config)
+
+        if core_config.debug_config.profile:
+            Profiler.start()
+
+        try:
+            fw_impl = KerasImplementation()
+
+            # Ignore returned hessian service as PTQ does not use it
+            tg, bit_widths_config, _ = core_runner(in_model=in_model,
+                                                   representative_data_gen=representative_data_gen,
+                                                   core_config=core_config,
+                                                   fw_info=fw_info,
+                                                   fw_impl=fw_impl,
+                                                   tpc=target_platform_capabilities,
+                                                   target_resource_utilization=target_resource_utilization,
+                                                   tb_w=tb_w)
+
+            # At this point, tg is a graph that went through substitutions (such as BN folding) and is
+            # ready for quantization (namely, it holds quantization params, etc.) but the weights are
+            # not quantized yet. For this reason, we use it to create a graph that acts as a "float" graph
+            # for things like similarity analyzer (because the quantized and float graph should have the same
+            # architecture to find the appropriate compare points for similarity computation).
+            similarity_baseline_graph = copy.deepcopy(tg)
+
+            with Profiler.profile('ptq'):
+                graph_with_stats_correction = ptq_runner(tg,
+                                                         representative_data_gen,
+                                                         core_config,
+                                                         fw_info,
+                                                         fw_impl,
+                                                         tb_w)
+
+            if core_config.debug_config.analyze_similarity:
+                with Profiler.profile('similarity_analysis'):
+                    quantized_graph = quantize_graph_weights(graph_with_stats_correction)
+                    analyzer_model_quantization(representative_data_gen,
+                                                tb_w,
+                                                similarity_baseline_graph,
+                                                quantized_graph,
+                                                fw_impl,
+                                                fw_info)
+
+            with Profiler.profile('export'):
+                exportable_model, user_info = get_exportable_keras_model(graph_with_stats_correction)
+                if target_platform_capabilities.tp_model.add_metadata:
+                    exportable_model = add_metadata(exportable_model, get_versions_dict(target_platform_capabilities))
+        finally:
+            # Stop the profiler and close the Tensorboard writer also when the quantization fails, so they are not
+            # left open for later calls.
+            profiling_report = Profiler.stop(core_config.debug_config.profiling_report_path, tb_w)
+            if tb_w is not None:
+                tb_w.close()
+        user_info.profiling_report = profiling_report
         return exportable_model, user_info
 
 
@@ -12,7 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from model_compression_toolkit.qat.common.qat_config import QATConfig, TrainingMethod
 
-from model_compression_toolkit.qat.keras.quantization_facade import keras_quantization_aware_training_init_experimental, keras_quantization_aware_training_finalize_experimental
-from model_compression_toolkit.qat.pytorch.quantization_facade import pytorch_quantization_aware_training_init_experimental, pytorch_quantization_aware_training_finalize_experimental
\ No newline at end of file
+from model_compression_toolkit.lazy_loader import lazy_attributes
+
+_LAZY_ATTRIBUTES = {
+    'QATConfig': ('model_compression_toolkit.qat.common.qat_config', 'QATConfig'),
+    'TrainingMethod': ('model_compression_toolkit.qat.common.qat_config', 'TrainingMethod'),
+    'keras_quantization_aware_training_init_experimental': ('model_compression_toolkit.qat.keras.quantization_facade', 'keras_quantization_aware_training_init_experimental'),
+    'keras_quantization_aware_training_finalize_experimental': ('model_compression_toolkit.qat.keras.quantization_facade', 'keras_quantization_aware_training_finalize_experimental'),
+    'pytorch_quantization_aware_training_init_experimental': ('model_compression_toolkit.qat.pytorch.quantization_facade', 'pytorch_quantization_aware_training_init_experimental'),
+    'pytorch_quantization_aware_training_finalize_experimental': ('model_compression_toolkit.qat.pytorch.quantization_facade', 'pytorch_quantization_aware_training_finalize_experimental'),
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
@@ -18,6 +18,7 @@ from functools import partial
 
 from model_compression_toolkit.core import CoreConfig
 from model_compression_toolkit.core.common.visualization.tensorboard_writer import init_tensorboard_writer
+from model_compression_toolkit.core.common.profiler import Profiler
 from model_compression_toolkit.logger import Logger
 from model_compression_toolkit.constants import FOUND_TF
 from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.resource_utilization import ResourceUtilization
@@ -37,26 +38,22 @@ if FOUND_TF:
     from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_KERAS_INFO
     from model_compression_toolkit.core.keras.keras_implementation import KerasImplementation
     from model_compression_toolkit.core.keras.keras_model_validation import KerasModelValidation
-    from model_compression_toolkit.target_platform_capabilities.constants import DEFAULT_TP_MODEL
 
     from model_compression_toolkit.core.keras.back2framework.keras_model_builder import KerasModelBuilder
 
-    from model_compression_toolkit import get_target_platform_capabilities
+    from model_compression_toolkit.target_platform_capabilities.tpc_models.get_target_platform_capabilities import \
+        get_default_target_platform_capabilities
 
-    from model_compression_toolkit import get_target_platform_capabilities
     from model_compression_toolkit.core import common
     from model_compression_toolkit.core.common import BaseNode
     from model_compression_toolkit.constants import TENSORFLOW
     from model_compression_toolkit.core.common.framework_info import FrameworkInfo
     from model_compression_toolkit.qat.common.qat_config import is_qat_applicable
-    from model_compression_toolkit.target_platform_capabilities.constants import DEFAULT_TP_MODEL
     from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_KERAS_INFO
     from model_compression_toolkit.qat.keras.quantizer.quantization_builder import quantization_builder, \
     get_activation_quantizer_holder
     from model_compression_toolkit.qat.common.qat_config import QATConfig
 
-    DEFAULT_KERAS_TPC = get_target_platform_capabilities(TENSORFLOW, DEFAULT_TP_MODEL)
-
 
     def qat_wrapper(n: common.BaseNode,
                     layer: Layer,
@@ -90,7 +87,7 @@ if FOUND_TF:
                                                             target_resource_utilization: ResourceUtilization = None,
                                                             core_config: CoreConfig = CoreConfig(),
                                                             qat_config: QATConfig = QATConfig(),
-                                                            target_platform_capabilities: TargetPlatformCapabilities = DEFAULT_KERAS_TPC):
+                                                            target_platform_capabilities: TargetPlatformCapabilities = None):
         """
          Prepare a trained Keras model for quantization aware training. First the model quantization is optimized
          with post-training quantization, then the model layers are wrapped with QuantizeWrappers. The model is
@@ -168,6 +165,8 @@ if FOUND_TF:
              For more configuration options, please take a look at our `API documentation <https://sony.github.io/model_optimization/api/api_docs/modules/mixed_precision_quantization_config.html>`_.
 
          """
+        if target_platform_capabilities is None:
+            target_platform_capabilities = get_default_target_platform_capabilities(TENSORFLOW)
 
         Logger.warning(f"keras_quantization_aware_training_init_experimental is experimental and is subject to future changes."
                        f"If you encounter an issue, please open an issue in our GitHub "
@@ -182,30 +181,43 @@ if FOUND_TF:
                              "MixedPrecisionQuantizationConfig. Please use keras_post_training_quantization API,"
                              "or pass a valid mixed precision configuration.")
 
-        tb_w = init_tensorboard_writer(DEFAULT_KERAS_INFO)
-
-        fw_impl = KerasImplementation()
-
-        # Ignore hessian service since is not used in QAT at the moment
-        tg, bit_widths_config, _ = core_runner(in_model=in_model,
-                                               representative_data_gen=representative_data_gen,
-                                               core_config=core_config,
-                                               fw_info=DEFAULT_KERAS_INFO,
-                                               fw_impl=fw_impl,
-                                               tpc=target_platform_capabilities,
-                                               target_resource_utilization=target_resource_utilization,
-                                               tb_w=tb_w)
-
-        tg = ptq_runner(tg, representative_data_gen, core_config, DEFAULT_KERAS_INFO, fw_impl, tb_w)
-
-        _qat_wrapper = partial(qat_wrapper, qat_config=qat_config)
-        qat_model, user_info = KerasModelBuilder(graph=tg,
-                                                 fw_info=DEFAULT_KERAS_INFO,
-                                                 wrapper=_qat_wrapper,
-                                                 get_activation_quantizer_holder_fn=partial(get_activation_quantizer_holder,
-                                                                                            qat_config=qat_config)).build_model()
-
-        user_info.mixed_precision_cfg = bit_widths_config
+        tb_w = init_tensorboard_writer(DEFAULT_KERAS_INFO, core_config.debug_config)
+
+        if core_config.debug_config.profile:
+            Profiler.start()
+
+        try:
+            fw_impl = KerasImplementation()
+
+            # Ignore hessian service since is not used in QAT at the moment
+            tg, bit_widths_config, _ = core_runner(in_model=in_model,
+                                                   representative_data_gen=representative_data_gen,
+                                                   core_config=core_config,
+                                                   fw_info=DEFAULT_KERAS_INFO,
+                                                   fw_impl=fw_impl,
+                                                   tpc=target_platform_capabilities,
+                                                   target_resource_utilization=target_resource_utilization,
+                                                   tb_w=tb_w)
+
+            with Profiler.profile('ptq'):
+                tg = ptq_runner(tg, representative_data_gen, core_config, DEFAULT_KERAS_INFO, fw_impl, tb_w)
+
+            _qat_wrapper = partial(qat_wrapper, qat_config=qat_config)
+            with Profiler.profile('qat_model_building'):
+                qat_model, user_info = KerasModelBuilder(graph=tg,
+                                                         fw_info=DEFAULT_KERAS_INFO,
+                                                         wrapper=_qat_wrapper,
+                                                         get_activation_quantizer_holder_fn=partial(get_activation_quantizer_holder,
+                                                                                                    qat_config=qat_config)).build_model()
+
+            user_info.mixed_precision_cfg = bit_widths_config
+        finally:
+            # Stop the profiler and close the Tensorboard writer also when the quantization fails, so they are not
+            # left open for later calls.
+            profiling_report = Profiler.stop(core_config.debug_config.profiling_report_path, tb_w)
+            if tb_w is not None:
+                tb_w.close()
+        user_info.profiling_report = profiling_report
         #TODO: remove the last output after updating documentation.
         return qat_model, user_info, {}
 
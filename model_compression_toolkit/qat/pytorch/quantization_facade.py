@@ -21,6 +21,7 @@ from model_compression_toolkit.constants import FOUND_TORCH, PYTORCH
 from model_compression_toolkit.core import CoreConfig
 from model_compression_toolkit.core import common
 from model_compression_toolkit.core.common.visualization.tensorboard_writer import init_tensorboard_writer
+from model_compression_toolkit.core.common.profiler import Profiler
 from model_compression_toolkit.logger import Logger
 from model_compression_toolkit.core.common.framework_info import FrameworkInfo
 from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.resource_utilization import ResourceUtilization
@@ -36,18 +37,16 @@ if FOUND_TORCH:
     from torch.nn import Module
     from mct_quantizers import PytorchActivationQuantizationHolder
     from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
-    from model_compression_toolkit.target_platform_capabilities.constants import DEFAULT_TP_MODEL
     from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
     from model_compression_toolkit.qat.common.qat_config import is_qat_applicable
     from model_compression_toolkit.core.pytorch.back2framework.pytorch_model_builder import PyTorchModelBuilder
     from mct_quantizers import PytorchQuantizationWrapper
-    from model_compression_toolkit import get_target_platform_capabilities
+    from model_compression_toolkit.target_platform_capabilities.tpc_models.get_target_platform_capabilities import \
+        get_default_target_platform_capabilities
     from model_compression_toolkit.qat.common.qat_config import QATConfig
     from model_compression_toolkit.qat.pytorch.quantizer.quantization_builder import get_activation_quantizer_holder
     from model_compression_toolkit.qat.pytorch.quantizer.quantization_builder import quantization_builder
 
-    DEFAULT_PYTORCH_TPC = get_target_platform_capabilities(PYTORCH, DEFAULT_TP_MODEL)
-
 
     def qat_wrapper(n: common.BaseNode,
                     module: nn.Module,
@@ -78,7 +77,7 @@ if FOUND_TORCH:
                                                               target_resource_utilization: ResourceUtilization = None,
                                                               core_config: CoreConfig = CoreConfig(),
                                                               qat_config: QATConfig = QATConfig(),
-                                                              target_platform_capabilities: TargetPlatformCapabilities = DEFAULT_PYTORCH_TPC):
+                                                              target_platform_capabilities: TargetPlatformCapabilities = None):
         """
          Prepare a trained Pytorch model for quantization aware training. First the model quantization is optimized
          with post-training quantization, then the model layers are wrapped with QuantizeWrappers. The model is
@@ -139,6 +138,9 @@ if FOUND_TORCH:
              For more configuration options, please take a look at our `API documentation <https://sony.github.io/model_optimization/api/api_docs/modules/mixed_precision_quantization_config.html>`_.
 
          """
+        if target_platform_capabilities is None:
+            target_platform_capabilities = get_default_target_platform_capabilities(PYTORCH)
+
         Logger.warning(
             f"pytorch_quantization_aware_training_init_experimental is experimental and is subject to future changes."
             f"If you encounter an issue, please open an issue in our GitHub "
@@ -150,31 +152,45 @@ if FOUND_TORCH:
                              "MixedPrecisionQuantizationConfig. Please use pytorch_post_training_quantization API,"
                              "or pass a valid mixed precision configuration.")
 
-        tb_w = init_tensorboard_writer(DEFAULT_PYTORCH_INFO)
-        fw_impl = PytorchImplementation()
+        tb_w = init_tensorboard_writer(DEFAULT_PYTORCH_INFO, core_config.debug_config)
 
-        # Ignore trace hessian service as we do not use it here
-        tg, bit_widths_config, _ = core_runner(in_model=in_model,
-                                               representative_data_gen=representative_data_gen,
-                                               core_config=core_config,
-                                               fw_info=DEFAULT_PYTORCH_INFO,
-                                               fw_impl=fw_impl,
-                                               tpc=target_platform_capabilities,
-                                               target_resource_utilization=target_resource_utilization,
-                                               tb_w=tb_w)
+        if core_config.debug_config.profile:
+            Profiler.start()
 
-        tg = ptq_runner(tg, representative_data_gen, core_config, DEFAULT_PYTORCH_INFO, fw_impl, tb_w)
+        try:
+            fw_impl = PytorchImplementation()
 
-        _qat_wrapper = partial(qat_wrapper, qat_config=qat_config)
-
-        qat_model, user_info = PyTorchModelBuilder(graph=tg,
+            # Ignore trace hessian service as we do not use it here
+            tg, bit_widths_config, _ = core_runner(in_model=in_model,
+                                                   representative_data_gen=representative_data_gen,
+                                                   core_config=core_config,
                                                    fw_info=DEFAULT_PYTORCH_INFO,
-                                                   wrapper=_qat_wrapper,
-                                                   get_activation_quantizer_holder_fn=partial(
-                                                       get_activation_quantizer_holder,
-                                                       qat_config=qat_config)).build_model()
-
-        user_info.mixed_precision_cfg = bit_widths_config
+                                                   fw_impl=fw_impl,
+                                                   tpc=target_platform_capabilities,
+                                                   target_resource_utilization=target_resource_utilization,
+                                                   tb_w=tb_w)
+
+            with Profiler.profile('ptq'):
+                tg = ptq_runner(tg, representative_data_gen, core_config, DEFAULT_PYTORCH_INFO, fw_impl, tb_w)
+
+            _qat_wrapper = partial(qat_wrapper, qat_config=qat_config)
+
+            with Profiler.profile('qat_model_building'):
+                qat_model, user_info = PyTorchModelBuilder(graph=tg,
+                                                           fw_info=DEFAULT_PYTORCH_INFO,
+                                                           wrapper=_qat_wrapper,
+                                                           get_activation_quantizer_holder_fn=partial(
+                                                               get_activation_quantizer_holder,
+                                                               qat_config=qat_config)).build_model()
+
+            user_info.mixed_precision_cfg = bit_widths_config
+        finally:
+            # Stop the profiler and close the Tensorboard writer also when the quantization fails, so they are not
+            # left open for later calls.
+            profiling_report = Profiler.stop(core_config.debug_config.profiling_report_path, tb_w)
+            if tb_w is not None:
+                tb_w.close()
+        user_info.profiling_report = profiling_report
 
         # Remove fw_info from graph to enable saving the pytorch model (fw_info can not be pickled)
         delattr(qat_model.graph, 'fw_info')
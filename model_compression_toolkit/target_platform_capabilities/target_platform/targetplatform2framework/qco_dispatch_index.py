@@ -0,0 +1,75 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Any, Dict, List, Tuple
+
+from model_compression_toolkit.target_platform_capabilities.target_platform.op_quantization_config import \
+    QuantizationConfigOptions
+from model_compression_toolkit.target_platform_capabilities.target_platform.targetplatform2framework.layer_filter_params import \
+    LayerFilterParams
+
+
+class QCODispatchIndex:
+    """
+    An index of the mappings from layers and LayerFilterParams to their QuantizationConfigOptions, bucketed by the
+    layer type, so the options of a node are looked up by its type instead of scanning all the mappings.
+    Each mapping is also bucketed by the name of its layer type, since a functional node can match a layer type by
+    its name (the function objects of TF may differ from the ones in the mappings). The candidates of a bucket still
+    need to be matched with the node, and they are kept in the order of the mappings, so the lookup resolves the same
+    options as scanning the mappings.
+    """
+
+    def __init__(self,
+                 layer2qco: Dict[Any, QuantizationConfigOptions],
+                 filterlayer2qco: Dict[LayerFilterParams, QuantizationConfigOptions]):
+        """
+        Args:
+            layer2qco: Mapping from layer types to their QuantizationConfigOptions.
+            filterlayer2qco: Mapping from LayerFilterParams to their QuantizationConfigOptions.
+        """
+        self.type_buckets = {}
+        self.name_buckets = {}
+        # The filters are matched before the layers, so they precede them in the order of the candidates.
+        mappings = [(fl, fl.layer, qco, True) for fl, qco in filterlayer2qco.items()] + \
+                   [(l, l, qco, False) for l, qco in layer2qco.items()]
+        for order, (key, layer_type, qco, is_filter) in enumerate(mappings):
+            candidate = (order, key, qco, is_filter)
+            self.type_buckets.setdefault(layer_type, []).append(candidate)
+            name = getattr(layer_type, '__name__', None)
+            if name is not None:
+                self.name_buckets.setdefault(name, []).append(candidate)
+
+    def get_candidates(self, node_type: Any) -> Tuple[List[Tuple[LayerFilterParams, QuantizationConfigOptions]],
+                                                      List[Tuple[Any, QuantizationConfigOptions]]]:
+        """
+        Get the mappings that a node of a given type may match: the mappings of the same layer type, or of a layer
+        type with the same name.
+
+        Args:
+            node_type: The type of the node (layer class or function).
+
+        Returns:
+            The candidate LayerFilterParams and the candidate layer types, each with its QuantizationConfigOptions,
+            in the order of the mappings.
+        """
+        candidates = self.type_buckets.get(node_type, [])
+        same_name_candidates = self.name_buckets.get(getattr(node_type, '__name__', None), [])
+        if len(same_name_candidates) > len(candidates):
+            # The bucket of the type is contained in the bucket of its name, so the buckets are merged only if the
+            # name bucket has additional candidates.
+            candidates = sorted({c[0]: c for c in candidates + same_name_candidates}.values(), key=lambda c: c[0])
+
+        filters_candidates = [(key, qco) for _, key, qco, is_filter in candidates if is_filter]
+        layers_candidates = [(key, qco) for _, key, qco, is_filter in candidates if not is_filter]
+        return filters_candidates, layers_candidates
@@ -28,6 +28,9 @@ tpc_dict = {DEFAULT_TP_MODEL: imx500_tpc_dict,
             TFLITE_TP_MODEL: tflite_tpc_dict,
             QNNPACK_TP_MODEL: qnnpack_tpc_dict}
 
+# The default TargetPlatformCapabilities of each framework, built on first use.
+_default_tpcs = {}
+
 
 def get_target_platform_capabilities(fw_name: str,
                                      target_platform_name: str,
@@ -57,3 +60,19 @@ def get_target_platform_capabilities(fw_name: str,
     else:
         assert target_platform_version in tpc_versions, f'TPC version {target_platform_version} is not supported for framework {fw_name}.'
     return tpc_versions[target_platform_version]()
+
+
+def get_default_target_platform_capabilities(fw_name: str) -> TargetPlatformCapabilities:
+    """
+    Get the default TargetPlatformCapabilities of a framework, which the facades use when no
+    TargetPlatformCapabilities is given. It is built on the first call, and later calls return the same object.
+
+    Args:
+        fw_name: Framework name of the TargetPlatformCapabilities.
+
+    Returns:
+        The default TargetPlatformCapabilities of the framework.
+    """
+    if fw_name not in _default_tpcs:
+        _default_tpcs[fw_name] = get_target_platform_capabilities(fw_name, DEFAULT_TP_MODEL)
+    return _default_tpcs[fw_name]
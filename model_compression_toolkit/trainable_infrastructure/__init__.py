@@ -13,7 +13,15 @@
 # limitations under the License.
 # ==============================================================================
 
-from model_compression_toolkit.trainable_infrastructure.common.trainable_quantizer_config import TrainableQuantizerWeightsConfig, TrainableQuantizerActivationConfig
-from model_compression_toolkit.trainable_infrastructure.keras.base_keras_quantizer import BaseKerasTrainableQuantizer
-from model_compression_toolkit.trainable_infrastructure.pytorch.base_pytorch_quantizer import BasePytorchTrainableQuantizer
-from model_compression_toolkit.trainable_infrastructure.keras.quantize_wrapper import KerasTrainableQuantizationWrapper
\ No newline at end of file
+from model_compression_toolkit.lazy_loader import lazy_attributes
+
+_LAZY_ATTRIBUTES = {
+    'TrainableQuantizerWeightsConfig': ('model_compression_toolkit.trainable_infrastructure.common.trainable_quantizer_config', 'TrainableQuantizerWeightsConfig'),
+    'TrainableQuantizerActivationConfig': ('model_compression_toolkit.trainable_infrastructure.common.trainable_quantizer_config', 'TrainableQuantizerActivationConfig'),
+    'BaseKerasTrainableQuantizer': ('model_compression_toolkit.trainable_infrastructure.keras.base_keras_quantizer', 'BaseKerasTrainableQuantizer'),
+    'BasePytorchTrainableQuantizer': ('model_compression_toolkit.trainable_infrastructure.pytorch.base_pytorch_quantizer', 'BasePytorchTrainableQuantizer'),
+    'KerasTrainableQuantizationWrapper': ('model_compression_toolkit.trainable_infrastructure.keras.quantize_wrapper', 'KerasTrainableQuantizationWrapper'),
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
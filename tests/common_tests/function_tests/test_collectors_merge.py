@@ -0,0 +1,89 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+
+from model_compression_toolkit.core.common.collectors.statistics_collector import StatsCollector, NoStatsCollector
+from model_compression_toolkit.core.common.framework_info import ChannelAxis
+
+
+def collect_stats(batches):
+    sc = StatsCollector(out_channel_axis=ChannelAxis.NHWC.value)
+    for x in batches:
+        sc.update_statistics(x)
+    return sc
+
+
+class TestCollectorsMerge(unittest.TestCase):
+
+    def setUp(self):
+        self.batches = [np.random.randn(2, 4, 4, 3) * (i + 1) for i in range(6)]
+
+    def test_merge_shards(self):
+        serial = collect_stats(self.batches)
+        # Contiguous shards are merged in order, so the merged collector holds the same statistics.
+        merged = collect_stats([])
+        for shard in [self.batches[:2], self.batches[2:3], [], self.batches[3:]]:
+            merged.merge(collect_stats(shard))
+
+        self.assertTrue(np.array_equal(merged.mpcc.state, serial.mpcc.state))
+        self.assertEqual(merged.get_min_max_values(), serial.get_min_max_values())
+        self.assertTrue(np.allclose(merged.get_mean(), serial.get_mean()))
+        merged_bins, merged_counts = merged.hc.get_histogram()
+        serial_bins, serial_counts = serial.hc.get_histogram()
+        self.assertTrue(np.array_equal(merged_bins, serial_bins))
+        self.assertTrue(np.allclose(merged_counts, serial_counts))
+
+    def test_merge_interleaved_shards(self):
+        serial = collect_stats(self.batches)
+        merged = collect_stats(self.batches[0::2])
+        merged.merge(collect_stats(self.batches[1::2]))
+
+        self.assertTrue(np.array_equal(merged.mpcc.state, serial.mpcc.state))
+        self.assertTrue(np.allclose(merged.get_mean(), serial.get_mean()))
+        merged_bins, merged_counts = merged.hc.get_histogram()
+        serial_bins, serial_counts = serial.hc.get_histogram()
+        self.assertTrue(np.allclose(merged_bins, serial_bins))
+        self.assertTrue(np.allclose(merged_counts, serial_counts))
+        self.assertAlmostEqual(merged_counts.sum(), serial_counts.sum())
+
+    def test_merge_merged_histogram(self):
+        # A collector which its histogram was already merged is merged by its merged histogram.
+        sc = collect_stats(self.batches[:3])
+        bins, counts = sc.hc.get_histogram()
+        other = collect_stats(self.batches[3:])
+        sc.merge(other)
+        merged_bins, merged_counts = sc.hc.get_histogram()
+        self.assertEqual(merged_bins.min(), min(bins.min(), other.hc.get_histogram()[0].min()))
+        self.assertAlmostEqual(merged_counts.sum(), counts.sum() + other.hc.get_histogram()[1].sum())
+
+    def test_merge_illegal_statistics(self):
+        sc = collect_stats(self.batches[:3])
+        other = collect_stats(self.batches[3:])
+        other.hc.scale(np.random.random(3))  # Per-channel scaling invalidates the histogram
+        sc.merge(other)
+        self.assertFalse(sc.hc.is_legal)
+        with self.assertRaises(Exception):
+            sc.hc.get_histogram()
+
+    def test_merge_no_stats_collector(self):
+        sc = NoStatsCollector()
+        sc.merge(NoStatsCollector())
+        self.assertFalse(sc.require_collection())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+from sklearn.cluster import KMeans
+
+from model_compression_toolkit.constants import LUT_VALUES
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.kmeans_1d import \
+    weighted_kmeans_1d
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.lut_kmeans_params import \
+    lut_kmeans_tensor
+from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import \
+    int_quantization_with_threshold
+
+
+def _clustering_cost(data, centers, sample_weight):
+    # Weighted sum of squared distances of the data from their closest centers.
+    distances = np.min(np.abs(data.reshape([-1, 1]) - centers.reshape([1, -1])), axis=1)
+    return np.sum(sample_weight * distances ** 2)
+
+
+class TestKMeans1D(unittest.TestCase):
+
+    def test_fewer_values_than_clusters(self):
+        data = np.array([3., 1., 3., -2.])
+        centers = weighted_kmeans_1d(data, 8)
+        self.assertTrue(np.array_equal(centers.flatten(), [-2., 1., 3.]))
+
+        # Values with zero weight are not clustered.
+        centers = weighted_kmeans_1d(data, 8, sample_weight=np.array([1., 0., 1., 1.]))
+        self.assertTrue(np.array_equal(centers.flatten(), [-2., 3.]))
+
+    def test_optimal_clustering(self):
+        data = np.array([0., 1., 10., 11., 12., 30.])
+        centers = weighted_kmeans_1d(data, 3)
+        self.assertTrue(np.allclose(centers.flatten(), [0.5, 11., 30.]))
+
+        # A heavy value pulls its cluster center.
+        centers = weighted_kmeans_1d(data, 3, sample_weight=np.array([1., 1., 1., 1., 7., 1.]))
+        self.assertTrue(np.allclose(centers.flatten(), [0.5, (10 + 11 + 7 * 12) / 9, 30.]))
+
+    def test_concentrated_values_with_outlier(self):
+        # Most of the values are within a tiny range compared to the outlier, so most of the evenly-spaced bins
+        # for the initial clustering are empty.
+        np.random.seed(0)
+        data = np.concatenate([np.random.randn(5000) * 1e-3, [1.0]])
+        centers = weighted_kmeans_1d(data, 16)
+        self.assertEqual(centers.shape, (16, 1))
+        self.assertTrue(np.all(np.diff(centers.flatten()) > 0))
+        sample_weight = np.ones_like(data)
+        sklearn_centers = KMeans(n_clusters=16, n_init=10).fit(data.reshape(-1, 1)).cluster_centers_
+        self.assertLessEqual(_clustering_cost(data, centers, sample_weight),
+                             _clustering_cost(data, sklearn_centers, sample_weight) * (1 + 1e-9))
+
+        w = np.random.randn(3, 3, 64, 64) * 1e-3
+        w[0, 0, 0, 0] = 1.0
+        lut_values = lut_kmeans_tensor(w, 2, 4, per_channel=False, channel_axis=3)[LUT_VALUES]
+        self.assertLessEqual(len(lut_values), 2 ** 4)
+
+    def test_compare_to_sklearn(self):
+        np.random.seed(0)
+        for n_bits in [2, 3, 4]:
+            tensor = int_quantization_with_threshold(np.random.randn(64, 3, 3, 64), 4, 8).flatten()
+            sample_weight = np.ones_like(tensor)
+            centers = weighted_kmeans_1d(tensor, 2 ** n_bits)
+            sklearn_centers = KMeans(n_clusters=2 ** n_bits, n_init=10).fit(tensor.reshape(-1, 1)).cluster_centers_
+            self.assertEqual(centers.shape, (2 ** n_bits, 1))
+            self.assertLessEqual(_clustering_cost(tensor, centers, sample_weight),
+                                 _clustering_cost(tensor, sklearn_centers, sample_weight) * (1 + 1e-9))
+
+
+if __name__ == '__main__':
+    unittest.main()
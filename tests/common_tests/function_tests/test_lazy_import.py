@@ -0,0 +1,84 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.constants import FOUND_TF, FOUND_TORCH
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def run_import(statement):
+    """
+    Run an import statement in a new interpreter, and return its time and whether it imported the frameworks.
+    """
+    code = (f"import json, sys, time\n"
+            f"start = time.perf_counter()\n"
+            f"{statement}\n"
+            f"import_time = time.perf_counter() - start\n"
+            f"print(json.dumps({{'time': import_time, 'tensorflow': 'tensorflow' in sys.modules, "
+            f"'torch': 'torch' in sys.modules}}))")
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([REPO_ROOT, os.environ.get('PYTHONPATH', '')]))
+    output = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().split('\n')[-1])
+
+
+class TestLazyImport(unittest.TestCase):
+
+    def test_import_time_benchmark(self):
+        lazy_import = run_import('import model_compression_toolkit')
+        self.assertFalse(lazy_import['tensorflow'])
+        self.assertFalse(lazy_import['torch'])
+
+        # The installed frameworks are imported when their facades are accessed.
+        full_import = run_import('import model_compression_toolkit as mct\n'
+                                 'mct.ptq, mct.gptq, mct.qat, mct.exporter, mct.core\n'
+                                 'mct.ptq.keras_post_training_quantization, mct.ptq.pytorch_post_training_quantization')
+        self.assertEqual(full_import['tensorflow'], FOUND_TF)
+        self.assertEqual(full_import['torch'], FOUND_TORCH)
+
+        # The import time depends on the machine, so it is reported and not asserted.
+        print(f'Import time: package {lazy_import["time"]:.3f}s, full public API {full_import["time"]:.3f}s '
+              f'(lazy/full ratio {lazy_import["time"] / full_import["time"]:.3f})')
+
+    def test_lazy_attributes(self):
+        from model_compression_toolkit.core.common.quantization.core_config import CoreConfig
+        from model_compression_toolkit.core.common import network_editors
+        self.assertIs(mct.core.CoreConfig, CoreConfig)
+        self.assertIs(mct.core.network_editor, network_editors)
+        self.assertIn('CoreConfig', dir(mct.core))
+        self.assertIn('core', mct.__all__)
+
+        # Subpackages are imported on first access.
+        from model_compression_toolkit.core import common
+        self.assertIs(mct.core.common, common)
+
+        with self.assertRaises(AttributeError):
+            mct.core.no_such_attribute
+
+    def test_default_tpc_built_once(self):
+        from model_compression_toolkit.target_platform_capabilities.tpc_models.get_target_platform_capabilities \
+            import get_default_target_platform_capabilities
+        tpc = get_default_target_platform_capabilities('tensorflow')
+        self.assertIs(get_default_target_platform_capabilities('tensorflow'), tpc)
+        self.assertEqual(tpc.tp_model.name, mct.get_target_platform_capabilities('tensorflow', 'default').tp_model.name)
+
+
+if __name__ == '__main__':
+    unittest.main()
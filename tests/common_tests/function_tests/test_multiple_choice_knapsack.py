@@ -0,0 +1,75 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import itertools
+import unittest
+
+import numpy as np
+
+from model_compression_toolkit.core.common.mixed_precision.search_methods.multiple_choice_knapsack import \
+    solve_multiple_choice_knapsack
+
+
+def _brute_force(costs, constraints, bounds):
+    # Returns the minimal cost of a feasible solution, or None if there is no feasible solution.
+    best_cost = None
+    for solution in itertools.product(*[range(len(c)) for c in costs]):
+        usage = sum(constraints[l][:, c] for l, c in enumerate(solution))
+        if np.all(usage <= bounds + 1e-9):
+            cost = sum(costs[l][c] for l, c in enumerate(solution))
+            best_cost = cost if best_cost is None else min(best_cost, cost)
+    return best_cost
+
+
+class TestMultipleChoiceKnapsack(unittest.TestCase):
+
+    def test_single_layer_constraints(self):
+        # The second constraint involves only the first layer, so it only filters its candidates.
+        costs = [np.array([0., 1., 2.]), np.array([0., 3.])]
+        constraints = [np.array([[3., 2., 1.], [5., 1., 1.]]), np.array([[2., 1.], [0., 0.]])]
+        solution = solve_multiple_choice_knapsack(costs, constraints, np.array([4., 2.]))
+        self.assertEqual(solution, [1, 0])
+
+    def test_optimal_against_brute_force(self):
+        rng = np.random.default_rng(0)
+        for _ in range(100):
+            n_layers, n_constraints = rng.integers(1, 6), rng.integers(1, 3)
+            costs = [rng.random(n) for n in rng.integers(1, 5, n_layers)]
+            constraints = [rng.random((n_constraints, len(c))) for c in costs]
+            bounds = rng.random(n_constraints) * n_layers * 0.6
+
+            best_cost = _brute_force(costs, constraints, bounds)
+            if best_cost is None:
+                with self.assertRaises(Exception):
+                    solve_multiple_choice_knapsack(costs, constraints, bounds)
+            else:
+                solution = solve_multiple_choice_knapsack(costs, constraints, bounds)
+                usage = sum(constraints[l][:, c] for l, c in enumerate(solution))
+                self.assertTrue(np.all(usage <= bounds + 1e-9))
+                self.assertAlmostEqual(sum(costs[l][c] for l, c in enumerate(solution)), best_cost)
+
+    def test_unsupported_problem(self):
+        # Three constraints that involve both layers.
+        costs = [np.array([0., 1.]), np.array([0., 1.])]
+        constraints = [np.ones((3, 2)), np.ones((3, 2))]
+        self.assertIsNone(solve_multiple_choice_knapsack(costs, constraints, np.array([2., 2., 2.])))
+
+        # Too many partial solutions.
+        costs = [np.array([0., 1., 2.]), np.array([0., 1., 2.])]
+        constraints = [np.array([[2., 1., 0.]]), np.array([[2., 1., 0.]])]
+        self.assertIsNone(solve_multiple_choice_knapsack(costs, constraints, np.array([10.]), max_states=2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import copy
+import unittest
+
+import numpy as np
+
+from model_compression_toolkit.core import QuantizationConfig, QuantizationErrorMethod
+from model_compression_toolkit.core.common.quantization import node_quantization_config
+from model_compression_toolkit.core.common.quantization.node_quantization_config import \
+    NodeActivationQuantizationConfig, WeightsAttrQuantizationConfig
+from model_compression_toolkit.core.common.quantization.quantization_params_fn_selection import \
+    get_activation_quantization_params_fn
+from model_compression_toolkit.target_platform_capabilities.target_platform import QuantizationMethod
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import \
+    get_op_quantization_configs
+
+
+def dummy_quantization_fn(n_bits, quantization_params):
+    return None
+
+
+class TestNodeQuantizationConfigInterning(unittest.TestCase):
+
+    def setUp(self):
+        self.qc = QuantizationConfig()
+        self.op_cfg, _, _ = get_op_quantization_configs()
+        self.params_fn = get_activation_quantization_params_fn(self.op_cfg.activation_quantization_method)
+
+    def _activation_cfg(self):
+        return NodeActivationQuantizationConfig(self.qc, self.op_cfg, dummy_quantization_fn, self.params_fn)
+
+    def _weights_attr_cfg(self):
+        return WeightsAttrQuantizationConfig(self.qc, self.op_cfg.default_weight_attr_config, (0, 1))
+
+    def test_configs_share_quantization_settings(self):
+        a, b = self._activation_cfg(), self._activation_cfg()
+        self.assertIs(a._spec, b._spec)
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertIsNot(a.activation_quantization_params, b.activation_quantization_params)
+
+        w1, w2 = self._weights_attr_cfg(), self._weights_attr_cfg()
+        self.assertIs(w1._spec, w2._spec)
+        self.assertEqual(w1, w2)
+        self.assertEqual(hash(w1), hash(w2))
+
+    def test_set_attribute_copy_on_write(self):
+        a, b = self._activation_cfg(), self._activation_cfg()
+        b.activation_n_bits = 4
+        self.assertEqual(a.activation_n_bits, self.op_cfg.activation_n_bits)
+        self.assertEqual(b.activation_n_bits, 4)
+        self.assertNotEqual(a, b)
+        # Setting back the original value shares the original settings again.
+        b.set_quant_config_attr('activation_n_bits', self.op_cfg.activation_n_bits)
+        self.assertIs(a._spec, b._spec)
+
+        w1, w2 = self._weights_attr_cfg(), self._weights_attr_cfg()
+        enabled = w1.enable_weights_quantization
+        w2.enable_weights_quantization = not enabled
+        self.assertEqual(w1.enable_weights_quantization, enabled)
+        self.assertNotEqual(w1, w2)
+
+    def test_interned_specs_bounded(self):
+        lut_attr_config = self.op_cfg.default_weight_attr_config.clone_and_edit(
+            weights_quantization_method=QuantizationMethod.LUT_POT_QUANTIZER)
+        configs = [WeightsAttrQuantizationConfig(self.qc, lut_attr_config, (0, 1)) for _ in range(10)]
+        num_specs = len(node_quantization_config._INTERNED_SPECS)
+
+        # Each LUT config has its own params function object, but configs with the same settings share a spec,
+        # so creating more configs does not grow the table.
+        configs += [WeightsAttrQuantizationConfig(self.qc, lut_attr_config, (0, 1)) for _ in range(1000)]
+        self.assertEqual(len(node_quantization_config._INTERNED_SPECS), num_specs)
+        self.assertTrue(all(c._spec is configs[0]._spec for c in configs))
+
+    def test_error_method_setter_updates_params_fn(self):
+        a = self._activation_cfg()
+        a.activation_quantization_params_fn = None
+        a.activation_error_method = QuantizationErrorMethod.MAE
+        self.assertEqual(a.activation_error_method, QuantizationErrorMethod.MAE)
+        self.assertEqual(a.activation_quantization_params_fn, self.params_fn)
+
+    def test_deepcopy_shares_settings(self):
+        a = self._activation_cfg()
+        a.set_activation_quantization_param({'threshold': np.ones(3)})
+        c = copy.deepcopy(a)
+        self.assertIs(a._spec, c._spec)
+        self.assertEqual(a, c)
+        c.activation_quantization_params['threshold'][0] = 2
+        self.assertEqual(a.activation_quantization_params['threshold'][0], 1)
+
+    def test_config_dict(self):
+        a = self._activation_cfg()
+        config_dict = a.get_config_dict()
+        self.assertEqual(config_dict['activation_n_bits'], a.activation_n_bits)
+        self.assertEqual(config_dict['activation_error_method'], a.activation_error_method)
+        self.assertIn('activation_quantization_params', config_dict)
+        self.assertNotIn('_spec', config_dict)
+
+        w = self._weights_attr_cfg()
+        config_dict = w.get_config_dict()
+        self.assertEqual(config_dict['weights_n_bits'], w.weights_n_bits)
+        self.assertEqual(config_dict['weights_channels_axis'], (0, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from model_compression_toolkit.core.common.profiler import Profiler, WALL_TIME, CALLS, PROCESS_PEAK_RSS, RSS_DELTA, \
+    PROC_STATM_FILE
+
+
+class TestProfiler(unittest.TestCase):
+
+    def tearDown(self):
+        Profiler.stop()
+
+    def test_disabled_profiler_records_nothing(self):
+        with Profiler.profile('stage'):
+            pass
+        self.assertEqual(Profiler.get_report(), {})
+        self.assertIsNone(Profiler.stop())
+
+    def test_nested_stages(self):
+        Profiler.start()
+        with Profiler.profile('outer'):
+            for _ in range(3):
+                with Profiler.profile('inner'):
+                    pass
+        with Profiler.profile('inner'):
+            pass
+
+        report = Profiler.get_report()
+        self.assertEqual(set(report.keys()), {'outer', 'outer/inner', 'inner'})
+        self.assertEqual(report['outer'][CALLS], 1)
+        self.assertEqual(report['outer/inner'][CALLS], 3)
+        self.assertEqual(report['inner'][CALLS], 1)
+        self.assertGreaterEqual(report['outer'][WALL_TIME], report['outer/inner'][WALL_TIME])
+        self.assertGreater(report['outer'][PROCESS_PEAK_RSS], 0)
+
+    @unittest.skipIf(not os.path.exists(PROC_STATM_FILE), 'The current RSS is measured on Linux only')
+    def test_stages_rss_delta(self):
+        Profiler.start()
+        with Profiler.profile('allocating_stage'):
+            # Touch the allocated memory, so it is resident.
+            allocated = np.ones(2 ** 27, dtype=np.uint8)
+        with Profiler.profile('freeing_stage'):
+            del allocated
+        with Profiler.profile('empty_stage'):
+            pass
+
+        # The RSS delta of each stage shows the memory it allocated or freed (128 MB).
+        report = Profiler.get_report()
+        self.assertGreater(report['allocating_stage'][RSS_DELTA], 100)
+        self.assertLess(report['freeing_stage'][RSS_DELTA], -100)
+        self.assertLess(abs(report['empty_stage'][RSS_DELTA]), 10)
+
+    def test_stage_recorded_on_exception(self):
+        Profiler.start()
+        with self.assertRaises(ValueError):
+            with Profiler.profile('failing_stage'):
+                raise ValueError()
+        self.assertEqual(Profiler.get_report()['failing_stage'][CALLS], 1)
+        self.assertEqual(Profiler.stages_stack, [])
+
+    def test_profile_each(self):
+        Profiler.start()
+        for i in Profiler.profile_each(range(3), lambda i: f'item_{i % 2}'):
+            with Profiler.profile('inner'):
+                pass
+        report = Profiler.get_report()
+        self.assertEqual(set(report.keys()), {'item_0', 'item_0/inner', 'item_1', 'item_1/inner'})
+        self.assertEqual(report['item_0'][CALLS], 2)
+        self.assertEqual(report['item_1'][CALLS], 1)
+        self.assertEqual(Profiler.stages_stack, [])
+
+    def test_stop_emits_report(self):
+        Profiler.start()
+        with Profiler.profile('stage'):
+            pass
+        tb_w = MagicMock()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            report_path = os.path.join(tmp_dir, 'report.json')
+            report = Profiler.stop(report_path, tb_w)
+            with open(report_path) as f:
+                self.assertEqual(json.load(f), report)
+
+        self.assertFalse(Profiler.enabled)
+        scalars = tb_w.add_scalars.call_args.args[0]
+        self.assertEqual(scalars[f'stage/{CALLS}'], 1)
+        self.assertEqual(scalars[f'stage/{WALL_TIME}'], report['stage'][WALL_TIME])
+
+
+if __name__ == '__main__':
+    unittest.main()
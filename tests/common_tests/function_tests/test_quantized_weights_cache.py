@@ -0,0 +1,126 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import copy
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from model_compression_toolkit.constants import THRESHOLD
+from model_compression_toolkit.core.common.graph.base_graph import Graph
+from model_compression_toolkit.core.common.graph.base_node import BaseNode
+from model_compression_toolkit.core.common.quantization import quantized_weights_cache
+from model_compression_toolkit.core.common.quantization.quantized_weights_cache import QuantizedWeightsCache
+from model_compression_toolkit.core.common.quantization.quantizers.uniform_quantizers import power_of_two_quantizer
+
+
+def get_weights_attr_cfg(n_bits, threshold, per_channel=True):
+    quantization_fn = MagicMock(wraps=power_of_two_quantizer)
+    return SimpleNamespace(weights_quantization_fn=quantization_fn,
+                           weights_n_bits=n_bits,
+                           weights_quantization_params={THRESHOLD: threshold},
+                           weights_per_channel_threshold=per_channel)
+
+
+class TestQuantizedWeightsCache(unittest.TestCase):
+
+    def setUp(self):
+        self.weights = np.random.randn(3, 3, 4, 8).astype(np.float32)
+        self.threshold = np.ones((1, 1, 1, 8), dtype=np.float32)
+
+    def test_cached_weights_equal_direct_quantization(self):
+        cache = QuantizedWeightsCache()
+        for n_bits in [8, 4, 2]:
+            cfg = get_weights_attr_cfg(n_bits, self.threshold)
+            quantized_weights = cache.get_quantized_weights(self.weights, cfg, 3)
+            expected = power_of_two_quantizer(self.weights, n_bits, True, {THRESHOLD: self.threshold}, True, 3)
+            self.assertTrue(np.array_equal(quantized_weights, expected))
+            self.assertFalse(quantized_weights.flags.writeable)
+
+            # A second request with an equal configuration is taken from the cache.
+            equal_cfg = SimpleNamespace(**vars(cfg))
+            equal_cfg.weights_quantization_params = {THRESHOLD: self.threshold.copy()}
+            self.assertIs(cache.get_quantized_weights(self.weights.copy(), equal_cfg, 3), quantized_weights)
+            self.assertEqual(cfg.weights_quantization_fn.call_count, 1)
+        self.assertEqual((cache.hits, cache.misses), (3, 3))
+
+    def test_cache_key(self):
+        cache = QuantizedWeightsCache()
+        cfg = get_weights_attr_cfg(8, self.threshold)
+        cfg.weights_quantization_fn = power_of_two_quantizer
+        cache.get_quantized_weights(self.weights, cfg, 3)
+
+        # Changes in the weights, the quantization params or the channels axis are quantized again.
+        cache.get_quantized_weights(self.weights + 1, cfg, 3)
+        cfg.weights_quantization_params = {THRESHOLD: 2 * self.threshold}
+        cache.get_quantized_weights(self.weights, cfg, 3)
+        cache.get_quantized_weights(self.weights, cfg, 2)
+        self.assertEqual((cache.hits, cache.misses), (0, 4))
+        self.assertEqual(len(cache.cached_tensors), 4)
+
+    def test_lru_eviction(self):
+        cache = QuantizedWeightsCache(max_bytes=2 * self.weights.nbytes)
+        cfgs = [get_weights_attr_cfg(n_bits, self.threshold) for n_bits in [8, 4, 2]]
+        cache.get_quantized_weights(self.weights, cfgs[0], 3)
+        cache.get_quantized_weights(self.weights, cfgs[1], 3)
+        # Use the first tensor, so the second is the least recently used one.
+        cache.get_quantized_weights(self.weights, cfgs[0], 3)
+        cache.get_quantized_weights(self.weights, cfgs[2], 3)
+        self.assertEqual(cache.cached_bytes, 2 * self.weights.nbytes)
+
+        cache.get_quantized_weights(self.weights, cfgs[0], 3)
+        cache.get_quantized_weights(self.weights, cfgs[2], 3)
+        self.assertEqual(cfgs[0].weights_quantization_fn.call_count, 1)
+        self.assertEqual(cfgs[2].weights_quantization_fn.call_count, 1)
+        cache.get_quantized_weights(self.weights, cfgs[1], 3)
+        self.assertEqual(cfgs[1].weights_quantization_fn.call_count, 2)
+
+        cache.clear()
+        self.assertEqual((len(cache.cached_tensors), cache.cached_bytes), (0, 0))
+
+    def test_node_weights_fingerprint(self):
+        node = BaseNode('node', {}, (1, 8, 8, 4), (1, 6, 6, 8), {'kernel': self.weights}, object)
+        cache = QuantizedWeightsCache()
+        cfg = get_weights_attr_cfg(8, self.threshold)
+        with patch('model_compression_toolkit.core.common.graph.base_node.tensor_fingerprint',
+                   wraps=quantized_weights_cache.tensor_fingerprint) as fingerprint_fn:
+            # The node's weights are hashed once, and the fingerprint is reused by the cache lookups.
+            for _ in range(3):
+                cache.get_quantized_weights(node.get_weights_by_keys('kernel'), cfg, 3,
+                                            node.get_weights_fingerprint('kernel'))
+            self.assertEqual(fingerprint_fn.call_count, 1)
+            self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+            # A copy of the node keeps the fingerprint, and it is computed again when the weights are set.
+            node_copy = copy.deepcopy(node)
+            self.assertEqual(node_copy.get_weights_fingerprint('kernel'), node.get_weights_fingerprint('kernel'))
+            self.assertEqual(fingerprint_fn.call_count, 1)
+            node.set_weights_by_keys('kernel', self.weights + 1)
+            cache.get_quantized_weights(node.get_weights_by_keys('kernel'), cfg, 3,
+                                        node.get_weights_fingerprint('kernel'))
+            self.assertEqual(fingerprint_fn.call_count, 2)
+            self.assertEqual((cache.hits, cache.misses), (2, 2))
+            self.assertNotEqual(node_copy.get_weights_fingerprint('kernel'), node.get_weights_fingerprint('kernel'))
+
+    def test_cache_shared_by_graph_copies(self):
+        graph = Graph('graph', [], [], [], [])
+        graph_copy = copy.deepcopy(graph)
+        self.assertIs(graph_copy.quantized_weights_cache, graph.quantized_weights_cache)
+        self.assertIsNot(Graph('graph', [], [], [], []).quantized_weights_cache, graph.quantized_weights_cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
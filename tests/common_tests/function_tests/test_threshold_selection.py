@@ -18,9 +18,54 @@ import unittest
 import numpy as np
 import model_compression_toolkit.core.common.quantization.quantization_config as qc
 from model_compression_toolkit.constants import THRESHOLD
-from model_compression_toolkit.core.common.quantization.quantization_params_generation.error_functions import _mse_error_histogram
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.error_functions import \
+    _batch_mse_error_histogram, _batch_mae_error_histogram, _batch_lp_error_histogram, _batch_kl_error_histogram, \
+    _kl_error_histogram
 from model_compression_toolkit.core.common.collectors.histogram_collector import HistogramCollector
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.power_of_two_selection import power_of_two_selection_tensor
+from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import quantize_tensor
+
+
+def smooth_distribution(probability):
+    smoothing_term = np.min(probability[probability != 0]) / (2.0 * len(probability))
+    zeros_indices = (probability == 0).astype(np.float32)
+    nonzeros_indices = (probability != 0).astype(np.float32)
+    reduce_to_fix = smoothing_term * float(probability.size - nonzeros_indices.sum()) / float(nonzeros_indices.sum())
+    return probability.astype(np.float32) + smoothing_term * zeros_indices + (-reduce_to_fix) * nonzeros_indices
+
+
+def reference_kl_error_histogram(q_bins, bins, counts, range_min, range_max):
+    """
+    Per-candidate KL-divergence between a histogram and its quantized version, as computed
+    before the batch implementation.
+    """
+    if len(np.where(bins >= range_min)[0]) == 0 or len(np.where(bins < range_max)[0]) == 0:
+        return np.inf
+
+    first_bin_idx = max(np.where(bins >= range_min)[0].min() - 1, 0)
+    last_bin_idx = np.where(bins < range_max)[0].max()
+    if first_bin_idx == last_bin_idx:
+        return 0.0
+
+    counts_subset = counts[first_bin_idx:last_bin_idx].copy()
+    q_bins_subset = q_bins[first_bin_idx:last_bin_idx + 1]
+    if not counts_subset.any():
+        return np.inf
+
+    counts_acc = counts_subset.copy()
+    counts_acc[0] += np.sum(counts[:first_bin_idx])
+    counts_acc[-1] += np.sum(counts[last_bin_idx:])
+
+    qbc = np.zeros(counts_subset.shape)
+    for qbvui in np.unique(q_bins_subset):
+        q_status = q_bins_subset[:-1] == qbvui
+        positive_bins = (counts_subset[q_status] > 0).astype(np.float32)
+        qbc[q_status] = np.sum(counts_subset[q_status]) / (np.sum(positive_bins) + 1e-6) * positive_bins
+
+    p_fxp = smooth_distribution(qbc / np.sum(qbc))
+    p_float = smooth_distribution(counts_acc / np.sum(counts_acc))
+    return np.sum(p_float * np.log(p_float / p_fxp))
+
 
 class TestThresholdSelection(unittest.TestCase):
     def test_no_clipping_function(self):
@@ -35,8 +80,30 @@ class TestThresholdSelection(unittest.TestCase):
             x = np.random.randn(10, 10, 10)
             hc.update(x)
         b, c = hc.get_histogram()
-        dummy = 0
-        _mse_error_histogram(b, c, dummy, 8)
+        mse = _batch_mse_error_histogram(b.reshape([1, -1]), b, c)
+        self.assertEqual(mse[0], 0)
+
+    def test_batch_histogram_errors(self):
+        hc = HistogramCollector()
+        for i in range(10):
+            x = np.random.randn(10, 10, 10)
+            hc.update(x)
+        b, c = hc.get_histogram()
+        thresholds = np.linspace(0.1, 2 * np.max(np.abs(b)), 20)
+        q_bins = quantize_tensor(b, thresholds.reshape([-1, 1]), 8, True)
+
+        mse = _batch_mse_error_histogram(q_bins, b, c)
+        mae = _batch_mae_error_histogram(q_bins, b, c)
+        lp = _batch_lp_error_histogram(q_bins, b, c, p=3)
+        kl = _batch_kl_error_histogram(q_bins, b, c, -thresholds, thresholds)
+        for i, t in enumerate(thresholds):
+            error = (q_bins[i] - b)[:-1]
+            self.assertAlmostEqual(mse[i], np.sum(error ** 2 * c) / np.sum(c))
+            self.assertAlmostEqual(mae[i], np.sum(np.abs(error) * c) / np.sum(c))
+            self.assertAlmostEqual(lp[i], np.sum(np.abs(error) ** 3 * c) / np.sum(c))
+            expected_kl = reference_kl_error_histogram(q_bins[i], b, c, -t, t)
+            self.assertAlmostEqual(kl[i], expected_kl, places=5)
+            self.assertAlmostEqual(_kl_error_histogram(q_bins[i], b, c, -t, t), expected_kl, places=5)
 
 
 if __name__ == '__main__':
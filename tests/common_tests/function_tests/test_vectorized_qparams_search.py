@@ -0,0 +1,110 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from model_compression_toolkit.core import QuantizationErrorMethod
+from model_compression_toolkit.core.common.quantization.quantization_params_generation import \
+    power_of_two_selection, symmetric_selection, uniform_selection, error_functions
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search import \
+    _batch_uniform_quantize
+
+HISTOGRAM_SELECTION_FUNCTIONS = [power_of_two_selection.power_of_two_selection_histogram,
+                                 symmetric_selection.symmetric_selection_histogram,
+                                 uniform_selection.uniform_selection_histogram]
+
+SELECTION_MODULES = [(power_of_two_selection, power_of_two_selection.power_of_two_selection_tensor),
+                     (symmetric_selection, symmetric_selection.symmetric_selection_tensor),
+                     (uniform_selection, uniform_selection.uniform_selection_tensor)]
+
+ERROR_METHODS = [QuantizationErrorMethod.MSE, QuantizationErrorMethod.MAE, QuantizationErrorMethod.LP]
+
+
+def loop_search(module, selection_fn, *args, **kwargs):
+    # Without a batch error function, the selection falls back to evaluating a candidate at a time.
+    with patch.object(module, 'get_threshold_selection_tensor_batch_error_function', return_value=None):
+        return selection_fn(*args, **kwargs)
+
+
+class TestVectorizedQParamsSearch(unittest.TestCase):
+
+    def setUp(self):
+        np.random.seed(0)
+        # (tensor shape, channel axis) pairs of Keras-like and Pytorch-like kernels.
+        self.tensors = []
+        for shape, axis in [((3, 3, 16, 32), 3), ((64, 32, 3, 3), 0), ((128, 10), 1)]:
+            scales = np.random.rand(shape[axis]).reshape([-1 if i == axis else 1 for i in range(len(shape))])
+            self.tensors.append(((np.random.randn(*shape) * scales).astype(np.float32), axis))
+
+    def test_vectorized_search_selects_loop_params(self):
+        for module, selection_fn in SELECTION_MODULES:
+            for x, axis in self.tensors:
+                for per_channel in [True, False]:
+                    for error_method in ERROR_METHODS:
+                        expected = loop_search(module, selection_fn, x, 3, 4, per_channel, axis,
+                                               quant_error_method=error_method)
+                        # A tiny memory budget evaluates the candidates in the smallest chunks.
+                        for max_chunk_bytes in [1, 2 ** 16, 2 ** 28]:
+                            params = selection_fn(x, 3, 4, per_channel, axis, quant_error_method=error_method,
+                                                  max_chunk_bytes=max_chunk_bytes)
+                            for k, v in expected.items():
+                                self.assertTrue(np.array_equal(params[k], v),
+                                                f'{selection_fn.__name__} selected different {k} (per_channel='
+                                                f'{per_channel}, {error_method}, max_chunk_bytes={max_chunk_bytes})')
+
+    def test_float32_search(self):
+        x, axis = self.tensors[0]
+        for _, selection_fn in SELECTION_MODULES:
+            expected = selection_fn(x, 3, 8, True, axis, quant_error_method=QuantizationErrorMethod.MSE)
+            params = selection_fn(x, 3, 8, True, axis, quant_error_method=QuantizationErrorMethod.MSE,
+                                  use_float32=True)
+            self.assertEqual(params.keys(), expected.keys())
+            for k, v in expected.items():
+                self.assertEqual(params[k].shape, v.shape)
+                self.assertTrue(np.allclose(params[k], v, rtol=0.1), f'{selection_fn.__name__} {k} is off')
+
+    def test_histogram_errors_by_ranges(self):
+        for x in [np.random.randn(10000), np.random.rand(10000) + 1, np.random.laplace(size=10000) * 3 - 1]:
+            counts, bins = np.histogram(x, bins=2048)
+            ranges = np.sort(np.random.uniform(-6, 6, (50, 2)), axis=-1)
+            for n_bits in [2, 4, 6]:
+                q_bins = _batch_uniform_quantize(bins, ranges[:, :1], ranges[:, 1:], n_bits)
+                for by_ranges_fn, by_bins_fn in [(error_functions._batch_mse_error_histogram_by_ranges,
+                                                  error_functions._batch_mse_error_histogram),
+                                                 (error_functions._batch_mae_error_histogram_by_ranges,
+                                                  error_functions._batch_mae_error_histogram)]:
+                    errors = by_ranges_fn(bins, counts, ranges[:, 0], ranges[:, 1], n_bits)
+                    self.assertTrue(np.allclose(errors, by_bins_fn(q_bins, bins, counts), rtol=1e-6),
+                                    f'{by_ranges_fn.__name__} is off (n_bits={n_bits})')
+        # Quantizing the bins is cheaper for grids as fine as the histogram.
+        counts, bins = np.histogram(np.random.randn(10000), bins=2048)
+        self.assertIsNone(error_functions._batch_mse_error_histogram_by_ranges(bins, counts, np.array([-4.0]),
+                                                                              np.array([4.0]), 8))
+
+    def test_histogram_search_by_ranges_selects_params(self):
+        counts, bins = np.histogram(np.random.randn(10000), bins=2048)
+        for selection_fn in HISTOGRAM_SELECTION_FUNCTIONS:
+            for error_method in [QuantizationErrorMethod.MSE, QuantizationErrorMethod.MAE]:
+                kwargs = dict(bins=bins, counts=counts, p=2, n_bits=4, min_value=-3, max_value=3,
+                              quant_error_method=error_method)
+                with patch.object(error_functions, '_histogram_quantization_levels', return_value=None):
+                    expected = selection_fn(**kwargs)
+                self.assertEqual(selection_fn(**kwargs), expected, f'{selection_fn.__name__} ({error_method})')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -260,6 +260,41 @@ class TestActivationWeightsComposition(unittest.TestCase):
         self.assertTrue(isinstance(sorted_v_nodes[7], VirtualSplitActivationNode))
         self.assertTrue(len(sorted_v_nodes[7].candidates_quantization_cfg) == 3)
 
+    def test_composed_node_candidates_factors(self):
+        in_model = multiple_weights_nodes_model()
+        keras_impl = KerasImplementation()
+
+        base_config, _, default_config = get_op_quantization_configs()
+        graph = prepare_graph(in_model, keras_impl,
+                              mixed_precision_candidates_list=_get_base_mp_nbits_candidates(),
+                              base_config=base_config,
+                              default_config=default_config)
+
+        # Nodes split and composition substitution
+        split_graph = substitute(graph, [WeightsActivationSplit()])
+        v_graph = substitute(split_graph, [VirtualActivationWeightsComposition()])
+
+        for v_node in [n for n in v_graph.nodes if isinstance(n, VirtualActivationWeightsNode)]:
+            act_node, weights_node = v_node.original_activation_node, v_node.original_weights_node
+            kernel_attr = DEFAULT_KERAS_INFO.get_kernel_op_attributes(weights_node.type)[0]
+            node_mac = keras_impl.get_node_mac_operations(weights_node, DEFAULT_KERAS_INFO)
+
+            # Each candidate is composed of a single pair of activation and weights candidates.
+            self.assertEqual(len(set(v_node.candidates_factors)), len(act_node.candidates_quantization_cfg) *
+                             len(weights_node.candidates_quantization_cfg))
+            for candidate_idx, (a_idx, w_idx) in enumerate(v_node.candidates_factors):
+                candidate = v_node.candidates_quantization_cfg[candidate_idx]
+                act_cfg = act_node.candidates_quantization_cfg[a_idx].activation_quantization_cfg
+                weights_cfg = weights_node.candidates_quantization_cfg[w_idx].weights_quantization_cfg
+                self.assertIs(candidate.activation_quantization_cfg, act_cfg)
+                self.assertIs(candidate.weights_quantization_cfg, weights_cfg)
+
+                weights_bits = weights_cfg.get_attr_config(kernel_attr).weights_n_bits \
+                    if weights_cfg.get_attr_config(kernel_attr).enable_weights_quantization else 32
+                act_bits = act_cfg.activation_n_bits if act_cfg.enable_activation_quantization else 32
+                self.assertEqual(v_node.get_bops_count(keras_impl, DEFAULT_KERAS_INFO, candidate_idx),
+                                 weights_bits * act_bits * node_mac)
+
     def test_multiple_output_activation(self):
         in_model = multiple_outputs_activation_model()
         keras_impl = KerasImplementation()
@@ -0,0 +1,102 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from model_compression_toolkit.core import CoreConfig, MixedPrecisionQuantizationConfig
+from model_compression_toolkit.core.common.mixed_precision.sensitivity_evaluation import MIN_ADAPTIVE_ROUNDS
+from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_KERAS_INFO
+from model_compression_toolkit.core.keras.keras_implementation import KerasImplementation
+from model_compression_toolkit.logger import Logger
+from tests.keras_tests.function_tests.test_batched_sensitivity_evaluation import prepare_graph
+
+
+def representative_dataset():
+    np.random.seed(0)
+    for _ in range(4):
+        yield [np.random.randn(8, 8, 8, 3).astype(np.float32)]
+
+
+def get_sensitivity_evaluator(graph, **mp_config_kwargs):
+    mp_config = MixedPrecisionQuantizationConfig(num_of_images=32, images_per_round=4, **mp_config_kwargs)
+    return KerasImplementation().get_sensitivity_evaluator(graph, mp_config, representative_dataset,
+                                                           DEFAULT_KERAS_INFO)
+
+
+def get_layers_configs(baseline_config, sensitivity_evaluator):
+    # Configurations that differ from the baseline configuration in a single node each.
+    configs = []
+    for node_idx, node_name in enumerate(sensitivity_evaluator.sorted_configurable_nodes_names):
+        node = sensitivity_evaluator.graph.find_node_by_name(node_name)[0]
+        for candidate_idx in range(len(node.candidates_quantization_cfg)):
+            if candidate_idx != baseline_config[node_idx]:
+                config = baseline_config.copy()
+                config[node_idx] = candidate_idx
+                configs.append((config, node_idx))
+    return configs
+
+
+class TestAdaptiveSensitivityEvaluation(unittest.TestCase):
+
+    def test_adaptive_num_of_images(self):
+        graph = prepare_graph(CoreConfig(mixed_precision_config=MixedPrecisionQuantizationConfig()))
+        baseline_config = graph.get_max_candidates_config(DEFAULT_KERAS_INFO)
+        sensitivity_evaluator = get_sensitivity_evaluator(graph)
+        configs = get_layers_configs(baseline_config, sensitivity_evaluator)
+        expected_metrics = [sensitivity_evaluator.compute_metric(config, [node_idx], baseline_config)
+                            for config, node_idx in configs]
+
+        # A zero tolerance does not stop the evaluation before the ranking of a node's candidates is settled.
+        sensitivity_evaluator = get_sensitivity_evaluator(graph, adaptive_num_of_images=True, adaptive_tolerance=0)
+        for (config, node_idx), expected_metric in zip(configs, expected_metrics):
+            metric = sensitivity_evaluator.compute_metric(config, [node_idx], baseline_config)
+            node_name = sensitivity_evaluator.sorted_configurable_nodes_names[node_idx]
+            if sensitivity_evaluator.num_images_per_node[node_name][-1] == 32:
+                self.assertAlmostEqual(metric, expected_metric, places=5)
+        for node_idx, num_images in enumerate(sensitivity_evaluator.num_images_per_node.values()):
+            self.assertEqual(len(num_images), len([c for c in configs if c[1] == node_idx]))
+            # The first candidate of a node has no other candidates to be ranked against.
+            self.assertEqual(num_images[0], 32)
+
+        # An infinite tolerance stops the evaluation after the minimal number of rounds.
+        for configurations_per_inference in [1, 3]:
+            sensitivity_evaluator = get_sensitivity_evaluator(graph,
+                                                              adaptive_num_of_images=True,
+                                                              adaptive_tolerance=np.inf,
+                                                              configurations_per_inference=configurations_per_inference)
+            for i in range(0, len(configs), configurations_per_inference):
+                chunk = configs[i:i + configurations_per_inference]
+                sensitivity_evaluator.compute_metrics([c for c, _ in chunk], sorted(set(n for _, n in chunk)),
+                                                      baseline_config)
+            for num_images in sensitivity_evaluator.num_images_per_node.values():
+                self.assertTrue(all(n == MIN_ADAPTIVE_ROUNDS * 4 for n in num_images))
+
+        # The summary logs the number of images of each node's candidates.
+        with patch.object(Logger, 'info') as log_info:
+            sensitivity_evaluator.log_num_images_summary()
+        messages = [c.args[0] for c in log_info.call_args_list]
+        self.assertIn('out of 32 images', messages[0])
+        num_images = MIN_ADAPTIVE_ROUNDS * 4
+        self.assertEqual(messages[1:], [f'{node_name}: {num_images}/{num_images:.1f}/{num_images}'
+                                        for node_name in sensitivity_evaluator.num_images_per_node])
+
+        # Metrics of configurations that are not compared to a baseline configuration use all images.
+        self.assertAlmostEqual(sensitivity_evaluator.compute_metric(configs[0][0]), expected_metrics[0], places=5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,179 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import glob
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+import keras
+import numpy as np
+from keras import Input
+from keras.layers import Conv2D, ReLU, Dense, Flatten
+from tensorboard.backend.event_processing import event_file_loader
+
+from model_compression_toolkit.core import CoreConfig
+from model_compression_toolkit.core.common.visualization.tensorboard_writer import TensorboardWriter
+from model_compression_toolkit.core.graph_prep_runner import graph_preparation_runner
+from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_KERAS_INFO
+from model_compression_toolkit.core.keras.keras_implementation import KerasImplementation
+from model_compression_toolkit.core.quantization_prep_runner import quantization_preparation_runner
+from model_compression_toolkit.target_platform_capabilities.tpc_models.get_target_platform_capabilities import \
+    get_target_platform_capabilities
+
+
+def base_model(input_shape):
+    inputs = Input(shape=input_shape)
+    x = inputs
+    for filters in [8, 16, 16, 32, 32, 16]:
+        x = Conv2D(filters, 3, padding='same')(x)
+        x = ReLU()(x)
+    x = Flatten()(x)
+    x = Dense(10)(x)
+    return keras.Model(inputs=inputs, outputs=x)
+
+
+def representative_dataset():
+    yield [np.random.randn(2, 16, 16, 3).astype(np.float32)]
+
+
+def prepare_graph():
+    core_config = CoreConfig()
+    tpc = get_target_platform_capabilities('tensorflow', 'imx500')
+    graph = graph_preparation_runner(base_model((16, 16, 3)), representative_dataset, core_config.quantization_config,
+                                     DEFAULT_KERAS_INFO, KerasImplementation(), tpc)
+    return quantization_preparation_runner(graph, representative_dataset, core_config, DEFAULT_KERAS_INFO,
+                                           KerasImplementation())
+
+
+def load_events(dir_path, tag_name):
+    """
+    Load the events (without the file version event) a TensorboardWriter wrote with a tag name.
+    """
+    events = []
+    for events_file in sorted(glob.glob(os.path.join(dir_path, tag_name, '*events*'))):
+        events.extend([e for e in event_file_loader.LegacyEventFileLoader(events_file).Load()
+                       if not e.HasField('file_version')])
+    return events
+
+
+def strip_wall_time(events):
+    for e in events:
+        e.ClearField('wall_time')
+    return [e.SerializeToString() for e in events]
+
+
+class TestAsyncTensorboardWriter(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.graph = prepare_graph()
+
+    def log_graph(self, tb_w):
+        tb_w.add_graph(self.graph, 'graph')
+        tb_w.add_all_statistics(self.graph, 'statistics')
+        tb_w.add_scalars({'scalar': 1.0}, 'scalars')
+
+    def test_async_writer_events(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            sync_dir, async_dir = os.path.join(tmp_dir, 'sync'), os.path.join(tmp_dir, 'async')
+            sync_tb_w = TensorboardWriter(sync_dir, DEFAULT_KERAS_INFO, async_write=False)
+            start = time.time()
+            self.log_graph(sync_tb_w)
+            sync_time = time.time() - start
+            sync_tb_w.close()
+
+            async_tb_w = TensorboardWriter(async_dir, DEFAULT_KERAS_INFO)
+            start = time.time()
+            self.log_graph(async_tb_w)
+            async_time = time.time() - start
+            async_tb_w.close()
+            self.assertIsNone(async_tb_w.worker)
+            print(f'Logging time in the calling thread: synchronous {sync_time:.4f}s, asynchronous {async_time:.4f}s')
+
+            # The background thread writes the same events as the synchronous writer.
+            for tag_name in ['graph', 'statistics', 'statistics/min_per_channel', 'statistics/max_per_channel',
+                             'statistics/mean_per_channel', 'scalars']:
+                sync_events = load_events(sync_dir, tag_name)
+                self.assertTrue(len(sync_events) > 0, tag_name)
+                self.assertEqual(strip_wall_time(sync_events), strip_wall_time(load_events(async_dir, tag_name)))
+
+    def test_selected_stages(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tb_w = TensorboardWriter(tmp_dir, DEFAULT_KERAS_INFO, stages=['statistics'])
+            self.log_graph(tb_w)
+            tb_w.close()
+            self.assertEqual(sorted(os.listdir(tmp_dir)), ['statistics'])
+
+    def test_sampled_nodes(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tb_w = TensorboardWriter(tmp_dir, DEFAULT_KERAS_INFO)
+            tb_w.add_histograms(self.graph, 'all_nodes')
+            tb_w.max_logged_nodes = 3
+            tb_w.add_histograms(self.graph, 'sampled_nodes')
+            tb_w.close()
+
+            all_nodes = [v.tag for e in load_events(tmp_dir, 'all_nodes') for v in e.summary.value]
+            sampled_nodes = [v.tag for e in load_events(tmp_dir, 'sampled_nodes') for v in e.summary.value]
+            self.assertTrue(len(all_nodes) > 3)
+            self.assertTrue(0 < len(sampled_nodes) <= 3)
+            self.assertTrue(set(sampled_nodes).issubset(all_nodes))
+
+        # The nodes with statistics collectors are evenly sampled, including the first and last nodes.
+        nodes = [n for n in self.graph.nodes if self.graph.get_out_stats_collector(n) is not None]
+        sampled_nodes = [n for n, _ in tb_w._get_logged_collectors(self.graph)]
+        self.assertEqual(len(sampled_nodes), 3)
+        self.assertEqual(sampled_nodes[0], nodes[0])
+        self.assertEqual(sampled_nodes[-1], nodes[-1])
+
+    def test_bounded_queue(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tb_w = TensorboardWriter(tmp_dir, DEFAULT_KERAS_INFO, queue_size=2)
+            # The pending logging tasks are bounded by the queue size, so the calling thread waits for the
+            # background thread.
+            max_pending_tasks = []
+            original_submit = tb_w._submit
+
+            def _submit(create_events, main_tag_name):
+                original_submit(create_events, main_tag_name)
+                max_pending_tasks.append(tb_w.tasks_queue.qsize())
+
+            with patch.object(tb_w, '_submit', _submit):
+                for i in range(10):
+                    tb_w.add_scalars({'scalar': float(i)}, 'scalars', step=i)
+            tb_w.close()
+            self.assertLessEqual(max(max_pending_tasks), 2)
+            self.assertEqual([e.step for e in load_events(tmp_dir, 'scalars')], list(range(10)))
+
+    def test_background_error_is_logged(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tb_w = TensorboardWriter(tmp_dir, DEFAULT_KERAS_INFO)
+
+            def _failing_task():
+                raise ValueError('failing task')
+
+            with patch('model_compression_toolkit.core.common.visualization.tensorboard_writer.Logger.error') as error:
+                tb_w._submit(_failing_task, 'failing_stage')
+                tb_w.add_scalars({'scalar': 1.0}, 'scalars')
+                tb_w.flush()
+            self.assertIn('failing_stage', error.call_args.args[0])
+            # The background thread keeps writing the next tasks.
+            self.assertEqual(len(load_events(tmp_dir, 'scalars')), 1)
+            tb_w.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import keras
+import numpy as np
+from keras import Input
+from keras.layers import Conv2D, ReLU, Dense, Flatten
+
+import model_compression_toolkit as mct
+
+from model_compression_toolkit.core import CoreConfig, MixedPrecisionQuantizationConfig, ResourceUtilization
+from model_compression_toolkit.core.common.mixed_precision.mixed_precision_search_facade import search_bit_width
+from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_KERAS_INFO
+from model_compression_toolkit.core.keras.keras_implementation import KerasImplementation
+from model_compression_toolkit.core.graph_prep_runner import graph_preparation_runner
+from model_compression_toolkit.core.quantization_prep_runner import quantization_preparation_runner
+from tests.keras_tests.exporter_tests.tflite_int8.imx500_int8_tp_model import get_op_quantization_configs
+from tests.keras_tests.tpc_keras import get_tpc_with_activation_mp_keras
+
+
+def base_model(input_shape):
+    inputs = Input(shape=input_shape)
+    x = Conv2D(8, 3, padding='same')(inputs)
+    x = ReLU()(x)
+    x = Conv2D(16, 3, padding='same')(x)
+    x = ReLU()(x)
+    x = Flatten()(x)
+    x = Dense(10)(x)
+    return keras.Model(inputs=inputs, outputs=x)
+
+
+def representative_dataset():
+    np.random.seed(0)
+    for _ in range(2):
+        yield [np.random.randn(2, 8, 8, 3).astype(np.float32)]
+
+
+def get_tpc():
+    base_config, _, default_config = get_op_quantization_configs()
+    return get_tpc_with_activation_mp_keras(base_config=base_config,
+                                            default_config=default_config,
+                                            mp_bitwidth_candidates_list=[(8, 8), (8, 4), (4, 8), (4, 4), (2, 4)],
+                                            name='batched_sensitivity_test')
+
+
+def prepare_graph(core_config):
+    core_config.mixed_precision_config.set_mixed_precision_enable()
+    graph = graph_preparation_runner(base_model((8, 8, 3)), representative_dataset, core_config.quantization_config,
+                                     DEFAULT_KERAS_INFO, KerasImplementation(), get_tpc(), mixed_precision_enable=True)
+    return quantization_preparation_runner(graph, representative_dataset, core_config, DEFAULT_KERAS_INFO,
+                                           KerasImplementation())
+
+
+class TestBatchedSensitivityEvaluation(unittest.TestCase):
+
+    def test_compute_metrics_per_replica(self):
+        mp_config = MixedPrecisionQuantizationConfig(num_of_images=4)
+        graph = prepare_graph(CoreConfig(mixed_precision_config=mp_config))
+        sensitivity_evaluator = KerasImplementation().get_sensitivity_evaluator(graph, mp_config,
+                                                                                representative_dataset,
+                                                                                DEFAULT_KERAS_INFO)
+        baseline_config = graph.get_max_candidates_config(DEFAULT_KERAS_INFO)
+
+        # Configurations that differ from the baseline configuration in a single node each.
+        configs, changed_nodes = [], []
+        for node_idx, n in enumerate(graph.get_configurable_sorted_nodes(DEFAULT_KERAS_INFO)):
+            for candidate_idx in range(len(n.candidates_quantization_cfg)):
+                if candidate_idx != baseline_config[node_idx]:
+                    config = baseline_config.copy()
+                    config[node_idx] = candidate_idx
+                    configs.append(config)
+                    changed_nodes.append(node_idx)
+
+        expected_metrics = [sensitivity_evaluator.compute_metric(config, [node_idx], baseline_config)
+                            for config, node_idx in zip(configs, changed_nodes)]
+
+        for num_replicas in [3, len(configs)]:
+            metrics = []
+            for i in range(0, len(configs), num_replicas):
+                metrics.extend(sensitivity_evaluator.compute_metrics(configs[i:i + num_replicas],
+                                                                     sorted(set(changed_nodes[i:i + num_replicas])),
+                                                                     baseline_config))
+            self.assertTrue(np.allclose(metrics, expected_metrics, rtol=1e-5, atol=1e-8))
+
+        # The model is configured back to the baseline configuration.
+        self.assertAlmostEqual(sensitivity_evaluator.compute_metric(baseline_config),
+                               sensitivity_evaluator.compute_metrics([baseline_config])[0])
+
+        # Without a baseline configuration, the model is left configured with the last configuration.
+        sensitivity_evaluator.compute_metrics(configs[:2], sorted(set(changed_nodes[:2])))
+        self.assertAlmostEqual(sensitivity_evaluator.compute_metric(configs[1]), expected_metrics[1], places=5)
+
+    def test_search_with_configurations_per_inference(self):
+        max_ru = mct.core.keras_resource_utilization_data(base_model((8, 8, 3)), representative_dataset, CoreConfig(),
+                                                          target_platform_capabilities=get_tpc())
+        target_ru = ResourceUtilization(weights_memory=max_ru.weights_memory * 0.6,
+                                        activation_memory=max_ru.activation_memory * 0.6)
+
+        bit_widths_configs = []
+        for configurations_per_inference in [1, 4]:
+            core_config = CoreConfig(mixed_precision_config=MixedPrecisionQuantizationConfig(
+                num_of_images=4, configurations_per_inference=configurations_per_inference))
+            graph = prepare_graph(core_config)
+            bit_widths_configs.append(list(search_bit_width(graph, DEFAULT_KERAS_INFO, KerasImplementation(),
+                                                            target_ru,
+                                                            core_config.mixed_precision_config,
+                                                            representative_dataset)))
+
+        self.assertEqual(bit_widths_configs[0], bit_widths_configs[1])
+        self.assertTrue(any(c != 0 for c in bit_widths_configs[0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import copy
+import csv
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+import keras
+import numpy as np
+from keras import Input
+from keras.layers import Conv2D, ReLU, Dense, Flatten
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.constants import NUM_SAMPLES_DISTANCE_TENSORBOARD
+from model_compression_toolkit.core import CoreConfig
+from model_compression_toolkit.core.analyzer import analyzer_model_quantization, SIMILARITY_TABLE_FILE
+from model_compression_toolkit.core.common.quantization.quantize_graph_weights import quantize_graph_weights
+from model_compression_toolkit.core.common.similarity_analyzer import compute_cs
+from model_compression_toolkit.core.common.visualization.nn_visualizer import NNVisualizer
+from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_KERAS_INFO
+from model_compression_toolkit.core.keras.keras_implementation import KerasImplementation
+from model_compression_toolkit.core.runner import core_runner
+
+BATCH_SIZE = 8
+
+
+def base_model(input_shape):
+    inputs = Input(shape=input_shape)
+    x = Conv2D(8, 3)(inputs)
+    x = ReLU()(x)
+    x = Conv2D(8, 3)(x)
+    x = ReLU()(x)
+    x = Flatten()(x)
+    x = Dense(4)(x)
+    return keras.Model(inputs=inputs, outputs=x)
+
+
+def representative_dataset():
+    for _ in range(2):
+        yield [np.random.randn(BATCH_SIZE, 8, 8, 3).astype(np.float32)]
+
+
+def get_graphs():
+    tg, _, _ = core_runner(base_model((8, 8, 3)), representative_dataset, CoreConfig(), DEFAULT_KERAS_INFO,
+                           KerasImplementation(), mct.get_target_platform_capabilities('tensorflow', 'imx500'))
+    float_graph = copy.deepcopy(tg)
+    return float_graph, quantize_graph_weights(tg)
+
+
+class TestBatchedSimilarityAnalyzer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.float_graph, cls.quantized_graph = get_graphs()
+
+    def test_batched_distances_equal_per_sample_distances(self):
+        visual = NNVisualizer(self.float_graph, self.quantized_graph, fw_impl=KerasImplementation(),
+                              fw_info=DEFAULT_KERAS_INFO)
+        inputs = [np.random.randn(BATCH_SIZE, 8, 8, 3).astype(np.float32)]
+        distances = visual.compute_distances(inputs, distance_fn=compute_cs)
+        self.assertEqual(distances.shape, (BATCH_SIZE, len(visual.compare_points)))
+
+        fw_impl = KerasImplementation()
+        for sample_index in range(BATCH_SIZE):
+            sample = [inputs[0][sample_index:sample_index + 1]]
+            tensors_float = fw_impl.run_model_inference(visual.float_model, sample)
+            tensors_fxp = fw_impl.run_model_inference(visual.quantized_model, sample)
+            expected = [compute_cs(fw_impl.to_numpy(t_float), fw_impl.to_numpy(t_fxp))
+                        for t_float, t_fxp in zip(tensors_float, tensors_fxp)]
+            self.assertTrue(np.allclose(distances[sample_index], expected, atol=1e-5))
+
+        # Samples of constant zeros get the distance of a single sample of zeros.
+        inputs[0][0] = 0
+        distances = visual.compute_distances(inputs, distance_fn=compute_cs)
+        self.assertTrue(np.all(distances[0] == 1.0))
+
+    def test_analyzer_stops_at_samples_quota(self):
+        num_batches = 10
+        read_batches = []
+
+        def long_dataset():
+            for i in range(num_batches):
+                read_batches.append(i)
+                yield [np.random.randn(BATCH_SIZE, 8, 8, 3).astype(np.float32)]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tb_w = MagicMock(dir_path=tmp_dir)
+            analyzer_model_quantization(long_dataset, tb_w, self.float_graph, self.quantized_graph,
+                                        KerasImplementation(), DEFAULT_KERAS_INFO)
+
+            self.assertEqual(len(read_batches), int(np.ceil(NUM_SAMPLES_DISTANCE_TENSORBOARD / BATCH_SIZE)))
+            self.assertEqual(tb_w.add_figure.call_count, NUM_SAMPLES_DISTANCE_TENSORBOARD)
+            tb_w.close.assert_called_once()
+
+            with open(os.path.join(tmp_dir, SIMILARITY_TABLE_FILE)) as f:
+                table = list(csv.reader(f))
+            num_compare_points = len(NNVisualizer(self.float_graph, self.quantized_graph, KerasImplementation(),
+                                                  DEFAULT_KERAS_INFO).compare_points)
+            self.assertEqual(table[0], ['layer', 'mean', 'std', 'min', 'max'])
+            self.assertEqual(len(table), num_compare_points + 1)
+            for row in table[1:]:
+                mean, std, min_similarity, max_similarity = map(float, row[1:])
+                self.assertTrue(-1 <= min_similarity <= mean <= max_similarity <= 1)
+            self.assertEqual(len(tb_w.add_scalars.call_args.args[0]), num_compare_points)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import gc
+import unittest
+import weakref
+
+import numpy as np
+import tensorflow as tf
+
+from model_compression_toolkit.core.keras.compiled_inference import get_compiled_model_call, get_prefetched_inputs
+
+
+def get_model():
+    inputs = tf.keras.layers.Input(shape=(4,))
+    outputs = tf.keras.layers.Dense(2)(inputs)
+    return tf.keras.Model(inputs=inputs, outputs=outputs)
+
+
+class TestCompiledInference(unittest.TestCase):
+
+    def test_compiled_call_does_not_keep_model_alive(self):
+        model = get_model()
+        x = np.random.randn(3, 4).astype(np.float32)
+        self.assertTrue(np.allclose(get_compiled_model_call(model)([x]), model([x])))
+        model_ref = weakref.ref(model)
+        del model
+        gc.collect()
+        self.assertIsNone(model_ref())
+
+    def test_prefetched_inputs(self):
+        num_calls = []
+        batches = [[np.full((2, 3), i, dtype=np.int32), np.full((2, 4), i, dtype=np.float64)] for i in range(3)]
+
+        def representative_data_gen():
+            num_calls.append(1)
+            for batch in batches:
+                yield batch
+
+        prefetched = list(get_prefetched_inputs(representative_data_gen))
+        self.assertEqual(len(num_calls), 1, 'The representative dataset should be iterated only once')
+        self.assertEqual(len(prefetched), len(batches))
+        for batch, expected in zip(prefetched, batches):
+            for x, expected_x in zip(batch, expected):
+                self.assertEqual(x.dtype, tf.as_dtype(expected_x.dtype))
+                self.assertTrue(np.array_equal(x.numpy(), expected_x))
+
+    def test_prefetched_inputs_with_varying_shapes(self):
+        batches = [[np.random.randn(2, 8, 8, 3).astype(np.float32)], [np.random.randn(1, 16, 12, 3).astype(np.float32)]]
+        prefetched = list(get_prefetched_inputs(lambda: iter(batches)))
+        self.assertEqual([batch[0].shape for batch in prefetched], [(2, 8, 8, 3), (1, 16, 12, 3)])
+
+        # A fully convolutional model runs on batches of different images sizes.
+        inputs = tf.keras.layers.Input(shape=(None, None, 3))
+        model = tf.keras.Model(inputs=inputs, outputs=tf.keras.layers.Conv2D(4, 3)(inputs))
+        for batch, expected in zip(prefetched, batches):
+            self.assertTrue(np.allclose(get_compiled_model_call(model)(batch), model(expected), atol=1e-5))
+
+    def test_prefetched_inputs_of_empty_dataset(self):
+        self.assertEqual(list(get_prefetched_inputs(lambda: iter([]))), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import time
+import unittest
+
+import keras
+import numpy as np
+from keras import Input
+from keras.layers import Conv2D, ReLU, Dense, Flatten
+
+from model_compression_toolkit.core import CoreConfig, MixedPrecisionQuantizationConfig, ResourceUtilization, MpSolver
+from model_compression_toolkit.core.common.mixed_precision.mixed_precision_search_facade import _get_search_manager
+from model_compression_toolkit.core.common.mixed_precision.search_methods.linear_programming import \
+    mp_integer_programming_search
+from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_KERAS_INFO
+from model_compression_toolkit.core.keras.keras_implementation import KerasImplementation
+from model_compression_toolkit.core.graph_prep_runner import graph_preparation_runner
+from model_compression_toolkit.core.quantization_prep_runner import quantization_preparation_runner
+from tests.keras_tests.exporter_tests.tflite_int8.imx500_int8_tp_model import get_op_quantization_configs
+from tests.keras_tests.tpc_keras import get_tpc_with_activation_mp_keras
+
+
+def base_model(input_shape):
+    inputs = Input(shape=input_shape)
+    x = inputs
+    for filters in [8, 16, 16, 32, 32, 32, 16, 16]:
+        x = Conv2D(filters, 3, padding='same')(x)
+        x = ReLU()(x)
+    x = Flatten()(x)
+    x = Dense(10)(x)
+    return keras.Model(inputs=inputs, outputs=x)
+
+
+def representative_dataset():
+    yield [np.random.randn(1, 8, 8, 3).astype(np.float32)]
+
+
+def prepare_graph(mp_bitwidth_candidates_list):
+    base_config, _, default_config = get_op_quantization_configs()
+    tpc = get_tpc_with_activation_mp_keras(base_config=base_config,
+                                           default_config=default_config,
+                                           mp_bitwidth_candidates_list=mp_bitwidth_candidates_list,
+                                           name='knapsack_solver_test')
+    core_config = CoreConfig(mixed_precision_config=MixedPrecisionQuantizationConfig(num_of_images=1))
+    core_config.mixed_precision_config.set_mixed_precision_enable()
+    graph = graph_preparation_runner(base_model((8, 8, 3)), representative_dataset, core_config.quantization_config,
+                                     DEFAULT_KERAS_INFO, KerasImplementation(), tpc, mixed_precision_enable=True)
+    return quantization_preparation_runner(graph, representative_dataset, core_config, DEFAULT_KERAS_INFO,
+                                           KerasImplementation()), core_config.mixed_precision_config
+
+
+class TestMpKnapsackSolver(unittest.TestCase):
+
+    def run_targets_sweep(self, graph, mp_config, sweep_name, target_fn):
+        fw_impl = KerasImplementation()
+        search_manager = _get_search_manager(graph, DEFAULT_KERAS_INFO, fw_impl,
+                                             target_fn(ResourceUtilization(1, 1, 1, 1)),
+                                             mp_config, representative_dataset)
+        # Sweep the targets between the resource utilization of the minimal and maximal configurations.
+        min_ru = search_manager.compute_resource_utilization_for_config(
+            graph.get_min_candidates_config(DEFAULT_KERAS_INFO)).get_resource_utilization_dict()
+        max_ru = search_manager.compute_resource_utilization_for_config(
+            graph.get_max_candidates_config(DEFAULT_KERAS_INFO)).get_resource_utilization_dict()
+
+        # The sensitivity is evaluated on the first search with the search manager, so it is done before timing the
+        # solvers.
+        mp_integer_programming_search(search_manager, target_fn(ResourceUtilization()), solver=MpSolver.KNAPSACK)
+
+        solvers_times = {MpSolver.CBC: 0, MpSolver.KNAPSACK: 0}
+        for f in np.linspace(0, 1, 6):
+            target_ru = ResourceUtilization()
+            target_ru.set_resource_utilization_by_target({t: min_ru[t] + f * (max_ru[t] - min_ru[t]) for t in min_ru})
+            target_ru = target_fn(target_ru)
+
+            solutions = {}
+            for solver in solvers_times:
+                start = time.time()
+                solutions[solver] = mp_integer_programming_search(search_manager, target_ru, solver=solver)
+                solvers_times[solver] += time.time() - start
+
+            # Both solutions hold the target, and have the same (optimal) sensitivity.
+            sensitivities = {}
+            for solver, cfg in solutions.items():
+                self.assertTrue(target_ru.holds_constraints(
+                    search_manager.compute_resource_utilization_for_config(cfg)))
+                sensitivities[solver] = search_manager.compute_metric_fn(cfg)
+            self.assertAlmostEqual(sensitivities[MpSolver.KNAPSACK], sensitivities[MpSolver.CBC], places=6)
+
+        print(f'{sweep_name} targets: CBC {solvers_times[MpSolver.CBC]:.4f}s, '
+              f'knapsack {solvers_times[MpSolver.KNAPSACK]:.4f}s')
+        self.assertLess(solvers_times[MpSolver.KNAPSACK], solvers_times[MpSolver.CBC])
+
+    def test_benchmark_against_cbc(self):
+        graph, mp_config = prepare_graph([(8, 8), (4, 8), (2, 8)])
+        self.run_targets_sweep(graph, mp_config, 'weights',
+                               lambda ru: ResourceUtilization(weights_memory=ru.weights_memory))
+        self.run_targets_sweep(graph, mp_config, 'bops',
+                               lambda ru: ResourceUtilization(bops=ru.bops))
+
+        graph, mp_config = prepare_graph([(8, 8), (8, 4), (8, 2), (4, 8), (4, 4), (4, 2), (2, 8), (2, 4), (2, 2)])
+        self.run_targets_sweep(graph, mp_config, 'activation',
+                               lambda ru: ResourceUtilization(activation_memory=ru.activation_memory))
+        self.run_targets_sweep(graph, mp_config, 'weights_activation',
+                               lambda ru: ResourceUtilization(weights_memory=ru.weights_memory,
+                                                              activation_memory=ru.activation_memory))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+from model_compression_toolkit.core import CoreConfig, MixedPrecisionQuantizationConfig, ResourceUtilization
+from model_compression_toolkit.core.common.mixed_precision.mixed_precision_search_facade import _get_search_manager
+from model_compression_toolkit.core.common.mixed_precision.search_methods.linear_programming import \
+    mp_integer_programming_search
+from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_KERAS_INFO
+from model_compression_toolkit.core.keras.keras_implementation import KerasImplementation
+from tests.keras_tests.function_tests.test_batched_sensitivity_evaluation import prepare_graph, \
+    representative_dataset
+
+
+def get_search_manager(prune_candidates):
+    mp_config = MixedPrecisionQuantizationConfig(num_of_images=1, prune_candidates=prune_candidates)
+    graph = prepare_graph(CoreConfig(mixed_precision_config=mp_config))
+    search_manager = _get_search_manager(graph, DEFAULT_KERAS_INFO, KerasImplementation(),
+                                         ResourceUtilization(weights_memory=1, activation_memory=1),
+                                         mp_config, representative_dataset)
+    min_ru = search_manager.compute_resource_utilization_for_config(
+        graph.get_min_candidates_config(DEFAULT_KERAS_INFO))
+    max_ru = search_manager.compute_resource_utilization_for_config(
+        graph.get_max_candidates_config(DEFAULT_KERAS_INFO))
+    return search_manager, min_ru, max_ru
+
+
+def get_weights_target(min_ru, max_ru, f):
+    return ResourceUtilization(weights_memory=min_ru.weights_memory + f * (max_ru.weights_memory - min_ru.weights_memory),
+                               activation_memory=max_ru.activation_memory)
+
+
+class TestMpSearchSpacePruning(unittest.TestCase):
+
+    def test_prune_dominated_candidates(self):
+        search_manager, _, max_ru = get_search_manager(prune_candidates=True)
+        search_space = search_manager.prune_search_space([ResourceUtilization(weights_memory=max_ru.weights_memory)])
+        bit_widths = search_manager._get_candidates_bit_widths()
+
+        for node_idx, candidates in search_space.items():
+            kept_bit_widths = [bit_widths[node_idx][c] for c in candidates]
+            if all(w == 0 for w, _ in bit_widths[node_idx]):
+                # Candidates of nodes without weights differ only in the activation bit-width, which does not
+                # affect the weights memory, so only the highest activation bit-width is kept.
+                self.assertEqual(kept_bit_widths, [(0, 8)])
+            elif len(bit_widths[node_idx]) == 5:
+                # (8, 4) and (4, 4) have the same weights memory as (8, 8) and (4, 8), with a lower activation bit-width.
+                self.assertEqual(kept_bit_widths, [(8, 8), (4, 8), (2, 4)])
+            else:
+                self.assertEqual(candidates, search_manager.layer_to_bitwidth_mapping[node_idx])
+
+    def test_prune_infeasible_candidates(self):
+        search_manager, min_ru, max_ru = get_search_manager(prune_candidates=True)
+        search_space = search_manager.prune_search_space([get_weights_target(min_ru, max_ru, 0.1)])
+        bit_widths = search_manager._get_candidates_bit_widths()
+
+        # The Dense layer holds most of the weights, so only its minimal bit-width fits the target.
+        dense_idx = [node_idx for node_idx, node_bit_widths in bit_widths.items() if len(node_bit_widths) == 5][0]
+        self.assertEqual([bit_widths[dense_idx][c] for c in search_space[dense_idx]], [(2, 4)])
+
+        # A candidate is kept if it is feasible under any of the targets.
+        search_space = search_manager.prune_search_space([get_weights_target(min_ru, max_ru, 0.1),
+                                                          get_weights_target(min_ru, max_ru, 1.0)])
+        self.assertEqual(search_space, search_manager.layer_to_bitwidth_mapping)
+
+    def test_pruning_disabled_by_default(self):
+        self.assertFalse(MixedPrecisionQuantizationConfig().prune_candidates)
+
+        search_manager, _, max_ru = get_search_manager(prune_candidates=False)
+        search_space = search_manager.prune_search_space([ResourceUtilization(weights_memory=max_ru.weights_memory)])
+        self.assertEqual(search_space, search_manager.layer_to_bitwidth_mapping)
+
+    def test_search_with_pruned_candidates(self):
+        num_evaluated = {}
+        for prune_candidates in [True, False]:
+            search_manager, min_ru, max_ru = get_search_manager(prune_candidates)
+            for f in [0.1, 0.5, 1.0]:
+                target_ru = get_weights_target(min_ru, max_ru, f)
+                config = list(mp_integer_programming_search(search_manager, target_ru))
+                # Pruning may change the selected configuration (when the sensitivity is not monotone in the
+                # bit-widths), but it never selects a configuration that violates the target.
+                self.assertLessEqual(search_manager.compute_resource_utilization_for_config(config).weights_memory,
+                                     target_ru.weights_memory)
+                if f == 0.1:
+                    num_evaluated[prune_candidates] = sum(len(m) for m in
+                                                          search_manager.layer_to_metrics_mapping.values())
+
+        self.assertLess(num_evaluated[True], num_evaluated[False])
+
+
+if __name__ == '__main__':
+    unittest.main()
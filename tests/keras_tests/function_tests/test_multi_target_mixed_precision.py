@@ -0,0 +1,104 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+from unittest.mock import patch
+
+import keras
+import numpy as np
+from keras import Input
+from keras.layers import Conv2D, ReLU
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.core import CoreConfig, MixedPrecisionQuantizationConfig, ResourceUtilization
+from model_compression_toolkit.core.common.mixed_precision.search_methods import linear_programming
+from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_KERAS_INFO
+from model_compression_toolkit.core.keras.keras_implementation import KerasImplementation
+from model_compression_toolkit.core.runner import core_runner_multi_target
+from model_compression_toolkit.target_platform_capabilities.constants import KERNEL_ATTR
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import \
+    get_op_quantization_configs
+from tests.keras_tests.tpc_keras import get_weights_only_mp_tpc_keras
+
+
+def base_model(input_shape):
+    inputs = Input(shape=input_shape)
+    x = Conv2D(8, 3)(inputs)
+    x = ReLU()(x)
+    x = Conv2D(16, 3)(x)
+    x = ReLU()(x)
+    x = Conv2D(4, 3)(x)
+    return keras.Model(inputs=inputs, outputs=x)
+
+
+def representative_dataset():
+    for _ in range(2):
+        yield [np.random.randn(2, 16, 16, 3).astype(np.float32)]
+
+
+class TestMultiTargetMixedPrecision(unittest.TestCase):
+
+    def test_multi_target_search(self):
+        base_config, mixed_precision_cfg_list, default_config = get_op_quantization_configs()
+        tpc = get_weights_only_mp_tpc_keras(base_config=base_config,
+                                            default_config=default_config,
+                                            mp_bitwidth_candidates_list=[
+                                                (c.attr_weights_configs_mapping[KERNEL_ATTR].weights_n_bits,
+                                                 c.activation_n_bits) for c in mixed_precision_cfg_list],
+                                            name="multi_target_mp_test")
+        model = base_model((16, 16, 3))
+        core_config = CoreConfig(mixed_precision_config=MixedPrecisionQuantizationConfig(num_of_images=1))
+
+        max_weights_memory = mct.core.keras_resource_utilization_data(model, representative_dataset, core_config,
+                                                                      target_platform_capabilities=tpc).weights_memory
+        targets = [ResourceUtilization(weights_memory=max_weights_memory * f) for f in [0.3, 0.5, 0.75, 1.0]]
+
+        with patch.object(linear_programming, '_build_layer_to_metrics_mapping',
+                          wraps=linear_programming._build_layer_to_metrics_mapping) as metrics_mapping_mock:
+            graphs, pareto_front, _ = core_runner_multi_target(model, representative_dataset, core_config,
+                                                               DEFAULT_KERAS_INFO, KerasImplementation(), tpc,
+                                                               targets)
+
+        # The sensitivity is evaluated once for all targets.
+        self.assertEqual(metrics_mapping_mock.call_count, 1)
+
+        self.assertEqual(len(graphs), len(pareto_front))
+        self.assertTrue(len(pareto_front) > 1)
+        for graph, pareto_point in zip(graphs, pareto_front):
+            self.assertEqual(list(graph.user_info.mixed_precision_cfg), pareto_point.bit_widths_config)
+            self.assertEqual(graph.user_info.final_resource_utilization.weights_memory,
+                             pareto_point.resource_utilization.weights_memory)
+            for target in pareto_point.target_resource_utilizations:
+                self.assertTrue(target.holds_constraints(pareto_point.resource_utilization))
+
+        # The Pareto front is sorted by descending sensitivity, so the weights memory must increase.
+        for pareto_point, next_pareto_point in zip(pareto_front[:-1], pareto_front[1:]):
+            self.assertGreater(pareto_point.sensitivity, next_pareto_point.sensitivity)
+            self.assertLess(pareto_point.resource_utilization.weights_memory,
+                            next_pareto_point.resource_utilization.weights_memory)
+
+        # The unconstrained target gets the maximal bit-width configuration.
+        self.assertTrue(all(c == 0 for c in pareto_front[-1].bit_widths_config))
+
+    def test_targets_with_different_constraints(self):
+        core_config = CoreConfig(mixed_precision_config=MixedPrecisionQuantizationConfig(num_of_images=1))
+        with self.assertRaises(Exception) as e:
+            core_runner_multi_target(base_model((16, 16, 3)), representative_dataset, core_config, DEFAULT_KERAS_INFO,
+                                     KerasImplementation(), mct.get_target_platform_capabilities('tensorflow', 'imx500'),
+                                     [ResourceUtilization(weights_memory=100), ResourceUtilization(bops=100)])
+        self.assertIn('must constrain the same resource utilization metrics', str(e.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,197 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import keras
+import numpy as np
+from keras import Input
+from keras.layers import Conv2D, BatchNormalization, ReLU
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.core import CoreConfig, MixedPrecisionQuantizationConfig, ResourceUtilization, \
+    PipelineCacheConfig, QuantizationErrorMethod
+from model_compression_toolkit.core.common.pipeline_cache import PipelineCache, get_fingerprint
+from model_compression_toolkit.core.common.graph.graph_snapshot import save_graph_snapshot, load_graph_snapshot
+from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_KERAS_INFO
+from model_compression_toolkit.core.keras.keras_implementation import KerasImplementation
+from model_compression_toolkit.core.runner import core_runner
+from model_compression_toolkit.target_platform_capabilities.constants import KERNEL_ATTR
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import \
+    get_op_quantization_configs
+from tests.keras_tests.tpc_keras import get_weights_only_mp_tpc_keras
+
+
+def base_model(input_shape):
+    inputs = Input(shape=input_shape)
+    x = Conv2D(16, 3)(inputs)
+    x = BatchNormalization()(x)
+    x = ReLU()(x)
+    x = Conv2D(8, 3)(x)
+    return keras.Model(inputs=inputs, outputs=x)
+
+
+def representative_dataset():
+    np.random.seed(0)
+    for _ in range(2):
+        yield [np.random.randn(2, 16, 16, 3).astype(np.float32)]
+
+
+def get_graph_quantization(graph):
+    """
+    Returns: The names, weights and final quantization parameters of the graph's nodes.
+    """
+    quantization = []
+    for n in graph.get_topo_sorted_nodes():
+        weights = {k: np.array(v) for k, v in n.weights.items()}
+        weights_params = {}
+        if n.final_weights_quantization_cfg is not None and n.final_weights_quantization_cfg.has_attribute_config(
+                KERNEL_ATTR):
+            attr_cfg = n.final_weights_quantization_cfg.get_attr_config(KERNEL_ATTR)
+            weights_params = {**attr_cfg.weights_quantization_params, 'n_bits': attr_cfg.weights_n_bits}
+        activation_params = {}
+        if n.final_activation_quantization_cfg is not None:
+            activation_params = n.final_activation_quantization_cfg.activation_quantization_params
+        quantization.append((n.name, weights, weights_params, activation_params))
+    return quantization
+
+
+class TestPipelineCache(unittest.TestCase):
+
+    def setUp(self):
+        keras.utils.set_random_seed(0)
+        self.model = base_model((16, 16, 3))
+        base_config, mixed_precision_cfg_list, default_config = get_op_quantization_configs()
+        self.tpc = get_weights_only_mp_tpc_keras(base_config=base_config,
+                                                 default_config=default_config,
+                                                 mp_bitwidth_candidates_list=[
+                                                     (c.attr_weights_configs_mapping[KERNEL_ATTR].weights_n_bits,
+                                                      c.activation_n_bits) for c in mixed_precision_cfg_list],
+                                                 name="pipeline_cache_test")
+        self.cache_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.cache_dir.cleanup()
+
+    def run_core(self, target_ru, quantization_config=None, mixed_precision_config=None):
+        core_config = CoreConfig(quantization_config=quantization_config or mct.core.QuantizationConfig(),
+                                 mixed_precision_config=mixed_precision_config or
+                                                        MixedPrecisionQuantizationConfig(num_of_images=1),
+                                 pipeline_cache_config=PipelineCacheConfig(self.cache_dir.name))
+        with patch.object(PipelineCache, 'save', autospec=True, side_effect=PipelineCache.save) as save_mock:
+            tg, bit_widths_config, _ = core_runner(self.model, representative_dataset, core_config, DEFAULT_KERAS_INFO,
+                                                   KerasImplementation(), self.tpc, target_ru)
+        # The stages that were run (rather than loaded from the cache) are saved to the cache.
+        run_stages = [call.args[1] for call in save_mock.call_args_list]
+        return tg, bit_widths_config, run_stages
+
+    def assert_same_quantization(self, tg, cached_tg):
+        for node, cached_node in zip(get_graph_quantization(tg), get_graph_quantization(cached_tg)):
+            self.assertEqual(node[0], cached_node[0])
+            for d, cached_d in zip(node[1:], cached_node[1:]):
+                self.assertEqual(d.keys(), cached_d.keys())
+                for k in d:
+                    self.assertTrue(np.array_equal(d[k], cached_d[k]), f'Mismatch in {node[0]}: {k}')
+
+    @staticmethod
+    def get_last_kernel(graph):
+        return graph.get_topo_sorted_nodes()[-1].get_weights_by_keys(DEFAULT_KERAS_INFO.get_kernel_op_attributes(
+            Conv2D)[0])
+
+    def test_stages_reused(self):
+        max_weights_memory = mct.core.keras_resource_utilization_data(self.model, representative_dataset,
+                                                                      CoreConfig(), self.tpc).weights_memory
+        target_ru = ResourceUtilization(weights_memory=max_weights_memory * 0.5)
+
+        tg, bit_widths_config, run_stages = self.run_core(target_ru)
+        self.assertEqual(run_stages, ['graph_preparation', 'quantization_preparation', 'mixed_precision_search'])
+
+        # A second run with the same inputs loads all the stages from the cache.
+        cached_tg, cached_bit_widths_config, run_stages = self.run_core(target_ru)
+        self.assertEqual(run_stages, [])
+        self.assertEqual(list(bit_widths_config), list(cached_bit_widths_config))
+        self.assert_same_quantization(tg, cached_tg)
+
+        # Changing the mixed-precision target reuses the preparation stages only.
+        _, _, run_stages = self.run_core(ResourceUtilization(weights_memory=max_weights_memory * 0.75))
+        self.assertEqual(run_stages, ['mixed_precision_search'])
+
+        # Changing the quantization configuration runs all the stages.
+        _, _, run_stages = self.run_core(target_ru, mct.core.QuantizationConfig(
+            activation_error_method=QuantizationErrorMethod.NOCLIPPING))
+        self.assertEqual(run_stages, ['graph_preparation', 'quantization_preparation', 'mixed_precision_search'])
+
+    def test_callables_fingerprint(self):
+        def get_weighting(scale):
+            return lambda d: scale * np.ones(d.shape[0]) / d.shape[0]
+
+        # Functions are fingerprinted by their constants, defaults and closures, not only by their code.
+        self.assertNotEqual(get_fingerprint(lambda d: d * 2), get_fingerprint(lambda d: d * 3))
+        self.assertNotEqual(get_fingerprint(get_weighting(1)), get_fingerprint(get_weighting(2)))
+        self.assertEqual(get_fingerprint(get_weighting(1)), get_fingerprint(get_weighting(1)))
+
+        max_weights_memory = mct.core.keras_resource_utilization_data(self.model, representative_dataset,
+                                                                      CoreConfig(), self.tpc).weights_memory
+        target_ru = ResourceUtilization(weights_memory=max_weights_memory * 0.5)
+        for scale, expected_run_stages in [(1, ['graph_preparation', 'quantization_preparation',
+                                                'mixed_precision_search']),
+                                           (1, []),
+                                           (2, ['mixed_precision_search'])]:
+            mp_config = MixedPrecisionQuantizationConfig(num_of_images=1,
+                                                         distance_weighting_method=get_weighting(scale))
+            _, _, run_stages = self.run_core(target_ru, mixed_precision_config=mp_config)
+            self.assertEqual(run_stages, expected_run_stages)
+
+    def test_unfingerprintable_inputs_not_cached(self):
+        class Weighting:
+            __slots__ = ()
+
+            def __call__(self, d):
+                return np.ones(d.shape[0]) / d.shape[0]
+
+        max_weights_memory = mct.core.keras_resource_utilization_data(self.model, representative_dataset,
+                                                                      CoreConfig(), self.tpc).weights_memory
+        target_ru = ResourceUtilization(weights_memory=max_weights_memory * 0.5)
+        mp_config = MixedPrecisionQuantizationConfig(num_of_images=1, distance_weighting_method=Weighting())
+        # An object without attributes can't be fingerprinted by its content, so the mixed precision search is run
+        # in each call rather than cached, while the stages before it are cached.
+        for expected_run_stages in [['graph_preparation', 'quantization_preparation'], []]:
+            with patch('model_compression_toolkit.core.common.pipeline_cache.Logger.warning') as warning_mock:
+                _, _, run_stages = self.run_core(target_ru, mixed_precision_config=mp_config)
+            self.assertEqual(run_stages, expected_run_stages)
+            self.assertIn('Stage mixed_precision_search and the stages after it are not cached',
+                          warning_mock.call_args.args[0])
+
+    def test_graph_snapshot(self):
+        tg, _, _ = self.run_core(None)
+        snapshot_dir = os.path.join(self.cache_dir.name, 'snapshot')
+        save_graph_snapshot(tg, snapshot_dir, extra={'info': 1})
+        loaded_tg, extra = load_graph_snapshot(snapshot_dir)
+        self.assertEqual(extra, {'info': 1})
+        self.assert_same_quantization(tg, loaded_tg)
+
+        # Large weights are mapped from the snapshot's file, and modifying them does not modify the snapshot.
+        kernel = self.get_last_kernel(loaded_tg)
+        self.assertFalse(kernel.flags.owndata)
+        expected_kernel = kernel.copy()
+        kernel[...] = 0
+        reloaded_tg, _ = load_graph_snapshot(snapshot_dir)
+        self.assertTrue(np.array_equal(self.get_last_kernel(reloaded_tg), expected_kernel))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import time
+import unittest
+
+import keras
+import numpy as np
+import tensorflow as tf
+from keras import Input
+from keras.layers import Conv2D, ReLU, Activation, Dense, Add, DepthwiseConv2D
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_KERAS_INFO
+from model_compression_toolkit.core.keras.keras_implementation import KerasImplementation
+from model_compression_toolkit.core.graph_prep_runner import read_model_to_graph
+from model_compression_toolkit.logger import Logger
+
+
+class CustomLayer(keras.layers.Layer):
+    pass
+
+
+def reference_get_qco(node, tpc):
+    """
+    Get the QuantizationConfigOptions of a node by scanning all the mappings of the TPC.
+    """
+    for fl, qco in tpc.filterlayer2qco.items():
+        if node.is_match_filter_params(fl):
+            return qco
+    matching_qcos = [_qco for _type, _qco in tpc.layer2qco.items() if node.is_match_type(_type)]
+    if matching_qcos:
+        return matching_qcos[0]
+    return tpc.tp_model.default_qco
+
+
+def base_model(input_shape):
+    inputs = Input(shape=input_shape)
+    x = Conv2D(8, 3, padding='same')(inputs)
+    x = ReLU(max_value=6)(x)
+    y = DepthwiseConv2D(3, padding='same')(x)
+    y = ReLU()(y)
+    y = Activation('relu')(y)
+    x = Add()([x, y])
+    x = tf.add(x, y)
+    x = tf.nn.relu(x)
+    x = Activation('sigmoid')(x)
+    x = Activation('swish')(x)
+    x = tf.reshape(x, (-1, 8 * input_shape[0] * input_shape[1]))
+    x = Dense(10)(x)
+    x = tf.nn.softmax(x)
+    return keras.Model(inputs=inputs, outputs=x)
+
+
+class TestQCODispatchIndex(unittest.TestCase):
+
+    def test_same_qco_as_scan(self):
+        def representative_dataset():
+            yield [np.random.randn(1, 8, 8, 3).astype(np.float32)]
+
+        for tpc_name in ['imx500', 'tflite', 'qnnpack']:
+            tpc = mct.get_target_platform_capabilities('tensorflow', tpc_name)
+            graph = read_model_to_graph(base_model((8, 8, 3)), representative_dataset, tpc, DEFAULT_KERAS_INFO,
+                                        KerasImplementation())
+            for node in graph.nodes:
+                self.assertIs(node.get_qco(tpc), reference_get_qco(node, tpc), f'{tpc_name}: {node.name}')
+
+            # Benchmark the lookup against the scan of all mappings.
+            nodes = list(graph.nodes) * 50
+            start = time.time()
+            for node in nodes:
+                node.get_qco(tpc)
+            index_time = time.time() - start
+            start = time.time()
+            for node in nodes:
+                reference_get_qco(node, tpc)
+            scan_time = time.time() - start
+            Logger.info(f'{tpc_name} TPC: dispatch index {index_time:.4f}s, scan {scan_time:.4f}s')
+            self.assertLess(index_time, scan_time)
+
+    def test_candidates_in_mappings_order(self):
+        tpc = mct.get_target_platform_capabilities('tensorflow', 'imx500')
+        filters_candidates, layers_candidates = tpc.qco_dispatch_index.get_candidates(Activation)
+        self.assertTrue(len(filters_candidates) > 0)
+        self.assertEqual([fl for fl, _ in filters_candidates],
+                         [fl for fl in tpc.filterlayer2qco if fl.layer is Activation])
+        self.assertEqual([l for l, _ in layers_candidates], [l for l in tpc.layer2qco if l is Activation])
+
+        # Types that are not in the mappings have no candidates.
+        self.assertEqual(tpc.qco_dispatch_index.get_candidates(CustomLayer), ([], []))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+from unittest.mock import patch
+
+import keras
+import numpy as np
+from keras import Input
+from keras.layers import Conv2D
+
+from model_compression_toolkit.core.common.quantization.quantization_params_generation import qparams_computation
+from model_compression_toolkit.core.keras.constants import KERNEL
+from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_KERAS_INFO
+from model_compression_toolkit.core.keras.keras_implementation import KerasImplementation
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+from tests.keras_tests.exporter_tests.tflite_int8.imx500_int8_tp_model import get_op_quantization_configs
+from tests.keras_tests.tpc_keras import get_tpc_with_activation_mp_keras
+
+
+def base_model(input_shape):
+    inputs = Input(shape=input_shape)
+    x = Conv2D(2, 3)(inputs)
+    return keras.Model(inputs=inputs, outputs=x)
+
+
+def representative_dataset():
+    yield [np.random.randn(1, 8, 8, 3).astype(np.float32)]
+
+
+class TestQParamsComputationCache(unittest.TestCase):
+
+    def test_shared_kernel_config_computed_once(self):
+        base_config, _, default_config = get_op_quantization_configs()
+        tpc = get_tpc_with_activation_mp_keras(base_config=base_config,
+                                               default_config=default_config,
+                                               mp_bitwidth_candidates_list=[(8, 8), (8, 4), (8, 2)],
+                                               name='qparams_cache_test')
+
+        with patch.object(qparams_computation, 'get_weights_qparams',
+                          wraps=qparams_computation.get_weights_qparams) as weights_qparams_mock:
+            graph = prepare_graph_with_quantization_parameters(base_model((8, 8, 3)), KerasImplementation(),
+                                                               DEFAULT_KERAS_INFO, representative_dataset,
+                                                               lambda x, y: tpc, input_shape=(1, 8, 8, 3),
+                                                               mixed_precision_enabled=True)
+
+        conv_node = graph.get_topo_sorted_nodes()[1]
+        self.assertEqual(len(conv_node.candidates_quantization_cfg), 3)
+
+        # All 3 candidates share the same 8-bit kernel configuration, so the kernel search runs only once for the node.
+        kernel_calls = [c for c in weights_qparams_mock.call_args_list if c.kwargs['node'] is conv_node]
+        self.assertEqual(len(kernel_calls), 1)
+
+        kernel_params = [c.weights_quantization_cfg.get_attr_config(KERNEL).weights_quantization_params
+                         for c in conv_node.candidates_quantization_cfg]
+        for params in kernel_params[1:]:
+            self.assertEqual(params.keys(), kernel_params[0].keys())
+            for k in params:
+                self.assertTrue(np.array_equal(params[k], kernel_params[0][k]))
+                # Candidates hold their own copies of the params.
+                self.assertIsNot(params[k], kernel_params[0][k])
+
+
+if __name__ == '__main__':
+    unittest.main()
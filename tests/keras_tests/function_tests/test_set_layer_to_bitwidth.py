@@ -15,6 +15,7 @@
 import unittest
 import keras
 import numpy as np
+import tensorflow as tf
 
 from keras import Input
 from keras.layers import Conv2D
@@ -126,3 +127,32 @@ class TestKerasSetLayerToBitwidth(unittest.TestCase):
                               activation_quant_layer_type=KerasActivationQuantizationHolder)
 
         self.assertEqual(q.active_quantization_config_index, 0)
+
+    def test_configurable_quantizers_in_compiled_graph(self):
+        base_config, _, default_config = get_op_quantization_configs()
+        tpc = get_weights_only_mp_tpc_keras(
+            base_config=base_config,
+            default_config=default_config,
+            mp_bitwidth_candidates_list=[(8, 8), (4, 8), (2, 8)],
+            name='set_layer_test_tpc')
+
+        layer, node = test_setup(get_tpc_fn=lambda x, y: tpc)
+
+        q = ConfigurableWeightsQuantizer(node_q_cfg=node.candidates_quantization_cfg,
+                                         float_weights=node.get_weights_by_keys(KERNEL),
+                                         max_candidate_idx=node.find_max_candidates_indices()[0],
+                                         kernel_attr=KERNEL)
+
+        traces = []
+
+        @tf.function
+        def compiled_quantizer(x):
+            traces.append(1)
+            return q(x)
+
+        # Changing the active candidate must change the compiled output without retracing the function.
+        for idx in range(len(node.candidates_quantization_cfg)):
+            q.set_weights_bit_width_index(idx)
+            self.assertTrue(np.array_equal(compiled_quantizer(tf.constant(0.)).numpy(),
+                                           q.quantized_weights[idx].numpy()))
+        self.assertEqual(len(traces), 1)
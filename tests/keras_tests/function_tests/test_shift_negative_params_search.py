@@ -0,0 +1,91 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+from unittest.mock import patch
+
+import keras
+import numpy as np
+from keras import Input
+from keras.layers import Activation, Conv2D
+
+from model_compression_toolkit.constants import THRESHOLD
+from model_compression_toolkit.core import CoreConfig, QuantizationConfig, QuantizationErrorMethod
+from model_compression_toolkit.core.common.substitutions import shift_negative_activation
+from model_compression_toolkit.core.graph_prep_runner import graph_preparation_runner
+from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_KERAS_INFO
+from model_compression_toolkit.core.keras.graph_substitutions.substitutions import \
+    shift_negative_activation as keras_shift_negative_activation
+from model_compression_toolkit.core.keras.keras_implementation import KerasImplementation
+from model_compression_toolkit.core.quantization_prep_runner import quantization_preparation_runner
+from model_compression_toolkit.target_platform_capabilities.tpc_models.get_target_platform_capabilities import \
+    get_target_platform_capabilities
+
+
+def base_model(input_shape):
+    inputs = Input(shape=input_shape)
+    x = Activation('swish')(inputs)
+    x = Conv2D(4, 3)(x)
+    return keras.Model(inputs=inputs, outputs=x)
+
+
+def representative_dataset():
+    np.random.seed(0)
+    for _ in range(2):
+        yield [np.random.randn(4, 8, 8, 3).astype(np.float32)]
+
+
+class TestShiftNegativeParamsSearch(unittest.TestCase):
+
+    def run_shift_negative_correction(self, model, max_chunk_bytes):
+        """
+        Run the shift negative correction with its parameters search, and return the selected shift and threshold
+        and the number of chunks of shifts that were evaluated.
+        """
+        quantization_config = QuantizationConfig(QuantizationErrorMethod.MSE, QuantizationErrorMethod.MSE,
+                                                 shift_negative_activation_correction=True,
+                                                 shift_negative_ratio=np.inf,
+                                                 shift_negative_params_search=True,
+                                                 qparams_search_max_chunk_bytes=max_chunk_bytes)
+        core_config = CoreConfig(quantization_config=quantization_config)
+        fw_impl = KerasImplementation()
+        graph = graph_preparation_runner(model, representative_dataset, quantization_config, DEFAULT_KERAS_INFO,
+                                         fw_impl, get_target_platform_capabilities('tensorflow', 'imx500'))
+
+        with patch.object(keras_shift_negative_activation, 'create_add_node',
+                          wraps=keras_shift_negative_activation.create_add_node) as add_node_mock, \
+                patch.object(shift_negative_activation, '_batch_mse_error_histogram',
+                             wraps=shift_negative_activation._batch_mse_error_histogram) as error_mock:
+            graph = quantization_preparation_runner(graph, representative_dataset, core_config, DEFAULT_KERAS_INFO,
+                                                    fw_impl)
+
+        add_node = [n for n in graph.get_topo_sorted_nodes() if n.name.endswith('_post_add')][0]
+        threshold = add_node.candidates_quantization_cfg[0].activation_quantization_cfg.activation_quantization_params[
+            THRESHOLD]
+        return add_node_mock.call_args.args[0], threshold, error_mock.call_count
+
+    def test_batched_search_equals_per_shift_search(self):
+        model = base_model((8, 8, 3))
+        shift, threshold, num_chunks = self.run_shift_negative_correction(model, max_chunk_bytes=2 ** 20)
+
+        # With a bound of a single byte, each shift value is quantized and evaluated on its own.
+        ref_shift, ref_threshold, ref_num_chunks = self.run_shift_negative_correction(model, max_chunk_bytes=1)
+
+        self.assertLess(num_chunks, ref_num_chunks)
+        self.assertEqual(shift, ref_shift)
+        self.assertEqual(threshold, ref_threshold)
+
+
+if __name__ == '__main__':
+    unittest.main()
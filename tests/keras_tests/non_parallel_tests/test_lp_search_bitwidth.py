@@ -18,6 +18,7 @@ import unittest
 import keras
 from model_compression_toolkit.core import DEFAULTCONFIG
 from model_compression_toolkit.core.common.mixed_precision.distance_weighting import MpDistanceWeighting
+from model_compression_toolkit.core.common.mixed_precision.mp_solver import MpSolver
 from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.resource_utilization import \
     ResourceUtilization, RUTarget
 from model_compression_toolkit.core.common.mixed_precision.mixed_precision_quantization_config import \
@@ -58,6 +59,8 @@ class MockMixedPrecisionSearchManager:
         self.layer_to_bitwidth_mapping = {0: [0, 1, 2]}
         self.layer_to_ru_mapping = layer_to_ru_mapping
         self.compute_metric_fn = lambda x, y=None, z=None: {0: 2, 1: 1, 2: 0}[x[0]]
+        self.compute_metrics_fn = lambda xs, y=None, z=None: [self.compute_metric_fn(x) for x in xs]
+        self.configurations_per_inference = 1
         self.min_ru = {RUTarget.WEIGHTS: [[1], [1], [1]],
                        RUTarget.ACTIVATION: [[1], [1], [1]],
                        RUTarget.TOTAL: [[2], [2], [2]],
@@ -70,6 +73,7 @@ class MockMixedPrecisionSearchManager:
         self.max_ru_config = [0]
         self.config_reconstruction_helper = MockReconstructionHelper()
         self.non_conf_ru_dict = None
+        self.layer_to_metrics_mapping = None
 
     def compute_resource_utilization_matrix(self, target):
         # minus 1 is normalization by the minimal resource utilization (which is always 1 in this test)
@@ -91,6 +95,9 @@ class MockMixedPrecisionSearchManager:
     def finalize_distance_metric(self, d):
         return d
 
+    def prune_search_space(self, target_resource_utilizations):
+        return self.layer_to_bitwidth_mapping
+
 
 class TestLpSearchBitwidth(unittest.TestCase):
 
@@ -199,6 +206,33 @@ class TestLpSearchBitwidth(unittest.TestCase):
         self.assertTrue(len(bit_cfg) == 1)
         self.assertTrue(bit_cfg[0] == 1)
 
+    def test_search_knapsack_solver(self):
+        layer_to_ru_mapping = {0: {2: ResourceUtilization(weights_memory=1, activation_memory=1, bops=1),
+                                   1: ResourceUtilization(weights_memory=2, activation_memory=2, bops=2),
+                                   0: ResourceUtilization(weights_memory=3, activation_memory=3, bops=3)}}
+        mock_search_manager = MockMixedPrecisionSearchManager(layer_to_ru_mapping)
+
+        for target_resource_utilization in [ResourceUtilization(weights_memory=2),
+                                            ResourceUtilization(activation_memory=2),
+                                            ResourceUtilization(weights_memory=2, activation_memory=2),
+                                            ResourceUtilization(total_memory=4),
+                                            ResourceUtilization(bops=2)]:
+            bit_cfg = mp_integer_programming_search(mock_search_manager,
+                                                    target_resource_utilization=target_resource_utilization,
+                                                    solver=MpSolver.KNAPSACK)
+            self.assertTrue(len(bit_cfg) == 1)
+            self.assertTrue(bit_cfg[0] == 1)
+
+        bit_cfg = mp_integer_programming_search(mock_search_manager,
+                                                target_resource_utilization=ResourceUtilization(weights_memory=np.inf),
+                                                solver=MpSolver.KNAPSACK)
+        self.assertTrue(bit_cfg[0] == 0)  # ResourceUtilization is Inf so expecting for the maximal bit-width result
+
+        with self.assertRaises(Exception):
+            mp_integer_programming_search(mock_search_manager,
+                                          target_resource_utilization=ResourceUtilization(weights_memory=0),
+                                          solver=MpSolver.KNAPSACK)  # Infeasible solution!
+
 
 class TestSearchBitwidthConfiguration(unittest.TestCase):
 
@@ -0,0 +1,99 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import multiprocessing
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import torch
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.gptq.pytorch import gptq_training
+from model_compression_toolkit.gptq.pytorch.data_parallel import get_batch_shard
+
+N_EPOCHS = 2
+
+
+class Model(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.conv1 = torch.nn.Conv2d(3, 8, 3)
+        self.relu = torch.nn.ReLU()
+        self.conv2 = torch.nn.Conv2d(8, 8, 3)
+
+    def forward(self, x):
+        return self.conv2(self.relu(self.conv1(x)))
+
+
+class TestGPTQDataParallel(unittest.TestCase):
+
+    def run_gptq(self, model, representative_dataset, num_workers):
+        trained = {}
+        train_fn = gptq_training.PytorchGPTQTrainer.train
+
+        def train(trainer, data_gen):
+            train_fn(trainer, data_gen)
+            trained['state'] = {k: v.clone() for k, v in trainer.fxp_model.state_dict().items()}
+            trained['loss'] = trainer.loss_list
+
+        with patch.object(gptq_training.PytorchGPTQTrainer, 'train', train):
+            gptq_config = mct.gptq.get_pytorch_gptq_config(n_epochs=N_EPOCHS, num_workers=num_workers,
+                                                           use_hessian_based_weights=False)
+            mct.gptq.pytorch_gradient_post_training_quantization(model, representative_dataset,
+                                                                 gptq_config=gptq_config)
+        return trained
+
+    def test_data_parallel_training_equals_single_process(self):
+        # Batches of odd sizes are split to shards of different sizes.
+        data = [np.random.randn(batch_size, 3, 16, 16).astype(np.float32) for batch_size in [8, 7, 5]]
+        # Number of reads of the dataset, shared with the forked workers.
+        num_reads = multiprocessing.Value('i', 0)
+
+        def representative_dataset():
+            with num_reads.get_lock():
+                num_reads.value += 1
+            for d in data:
+                yield [d]
+
+        model = Model()
+        single_process = self.run_gptq(model, representative_dataset, num_workers=1)
+        single_process_reads = num_reads.value
+        num_reads.value = 0
+        data_parallel = self.run_gptq(model, representative_dataset, num_workers=3)
+
+        # Only the first worker reads the dataset, so it is read as in the single-process training.
+        self.assertEqual(num_reads.value, single_process_reads)
+
+        # The data-parallel loss and gradients are averaged over the shards of each batch (weighted by the shards'
+        # sizes), so the training follows the single-process training.
+        self.assertEqual(len(data_parallel['loss']), len(data) * N_EPOCHS)
+        self.assertTrue(np.allclose(data_parallel['loss'], single_process['loss'], rtol=1e-3))
+        self.assertEqual(data_parallel['state'].keys(), single_process['state'].keys())
+        for k, v in single_process['state'].items():
+            self.assertTrue(torch.allclose(data_parallel['state'][k], v, atol=1e-3), k)
+
+    def test_batch_shard(self):
+        batch = [np.arange(10).reshape([5, 2]), np.arange(5)]
+        shards = [get_batch_shard(batch, rank, 2) for rank in range(2)]
+        self.assertTrue(np.array_equal(np.concatenate([s[0] for s in shards]), batch[0]))
+        self.assertTrue(np.array_equal(np.concatenate([s[1] for s in shards]), batch[1]))
+
+        with self.assertRaises(Exception) as e:
+            get_batch_shard(batch, 0, 6)
+        self.assertIn('requires batches of at least 6 samples', str(e.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
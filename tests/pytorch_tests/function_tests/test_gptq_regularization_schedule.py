@@ -0,0 +1,112 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.gptq.common.gptq_training import GPTQTrainer
+from model_compression_toolkit.gptq.pytorch.quantizer.regularization_factory import get_regularization
+from model_compression_toolkit.gptq.pytorch.quantizer.soft_rounding.soft_quantizer_reg import LinearTempDecay
+
+N_BATCHES = 7
+N_EPOCHS = 5
+
+
+def get_schedule(linear_decay, steps):
+    return [float(linear_decay(t)) for t in steps]
+
+
+class CountingDataset:
+    def __init__(self):
+        self.iterations = 0
+
+    def __call__(self):
+        self.iterations += 1
+        for _ in range(N_BATCHES):
+            yield [np.random.randn(1, 8, 8, 3).astype(np.float32)]
+
+
+class DeclaredLengthDataset(CountingDataset):
+    def __len__(self):
+        return N_BATCHES
+
+
+class TestGPTQRegularizationSchedule(unittest.TestCase):
+
+    def test_schedule_set_after_first_epoch(self):
+        total_steps = N_BATCHES * N_EPOCHS
+        known_decay = LinearTempDecay(total_steps)
+        expected = get_schedule(known_decay, range(total_steps))
+        self.assertLess(expected[-1], expected[0])
+
+        # Without a known number of steps, the decay does not start. When it is set after the first epoch, the rest
+        # of the schedule is unchanged.
+        decay = LinearTempDecay()
+        schedule = get_schedule(decay, range(N_BATCHES))
+        decay.set_t_max(total_steps)
+        schedule += get_schedule(decay, range(N_BATCHES, total_steps))
+        self.assertTrue(np.array_equal(schedule, expected))
+
+    def run_first_epoch_schedule(self, n_epochs):
+        # Simulates the training loop for a dataset that does not declare its length: the trainer updates the
+        # schedule after every batch of the first epoch and when the epoch is completed.
+        gptq_config = mct.gptq.get_pytorch_gptq_config(n_epochs=n_epochs)
+        reg = get_regularization(gptq_config, CountingDataset())
+        trainer = SimpleNamespace(reg_func=reg, gptq_config=gptq_config)
+        schedule = []
+        for num_batches in range(1, N_BATCHES + 1):
+            schedule += get_schedule(reg.linear_decay, [num_batches - 1])
+            GPTQTrainer.update_regularization_schedule(trainer, num_batches, epoch_completed=False)
+            self.assertIsNone(reg.total_gradient_steps)
+        GPTQTrainer.update_regularization_schedule(trainer, N_BATCHES, epoch_completed=True)
+        self.assertEqual(reg.total_gradient_steps, N_BATCHES * n_epochs)
+        self.assertEqual(reg.linear_decay.t_max, N_BATCHES * n_epochs)
+        return schedule + get_schedule(reg.linear_decay, range(N_BATCHES, N_BATCHES * n_epochs))
+
+    def test_first_epoch_schedule(self):
+        # With several epochs, the estimated schedule of the first epoch matches the schedule of a known count,
+        # since the decay starts after 20% of the steps.
+        schedule = self.run_first_epoch_schedule(N_EPOCHS)
+        expected = get_schedule(LinearTempDecay(N_BATCHES * N_EPOCHS), range(N_BATCHES * N_EPOCHS))
+        self.assertTrue(np.allclose(schedule, expected))
+
+        # With a single epoch, the decay starts from the estimated number of batches.
+        schedule = self.run_first_epoch_schedule(1)
+        start_b = LinearTempDecay().start_b
+        self.assertEqual(schedule[0], start_b)
+        self.assertLess(min(schedule), start_b)
+
+    def test_regularization_num_gradient_steps(self):
+        gptq_config = mct.gptq.get_pytorch_gptq_config(n_epochs=N_EPOCHS)
+
+        # A dataset that does not declare its length is not iterated to count its batches, so the number of steps
+        # is not known until the first epoch is completed.
+        dataset = CountingDataset()
+        reg = get_regularization(gptq_config, dataset)
+        self.assertEqual(dataset.iterations, 0)
+        self.assertIsNone(reg.total_gradient_steps)
+        self.assertIsNone(reg.linear_decay.t_max)
+
+        # A dataset that declares its length sets the number of steps without iterating the dataset.
+        dataset = DeclaredLengthDataset()
+        reg = get_regularization(gptq_config, dataset)
+        self.assertEqual(dataset.iterations, 0)
+        self.assertEqual(reg.total_gradient_steps, N_BATCHES * N_EPOCHS)
+        self.assertEqual(reg.linear_decay.t_max, N_BATCHES * N_EPOCHS)
+
+if __name__ == '__main__':
+    unittest.main()
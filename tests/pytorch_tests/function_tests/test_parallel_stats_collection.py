@@ -0,0 +1,114 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import time
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.core import CoreConfig, QuantizationConfig
+from model_compression_toolkit.core.common.model_collector import ModelCollector
+from model_compression_toolkit.core.graph_prep_runner import graph_preparation_runner
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.core.quantization_prep_runner import quantization_preparation_runner
+from model_compression_toolkit.target_platform_capabilities.tpc_models.get_target_platform_capabilities import \
+    get_target_platform_capabilities
+
+
+class Model(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.conv1 = torch.nn.Conv2d(3, 16, 3, padding=1)
+        self.relu = torch.nn.ReLU()
+        self.conv2 = torch.nn.Conv2d(16, 16, 3, padding=1)
+        self.conv3 = torch.nn.Conv2d(16, 8, 3, padding=1)
+
+    def forward(self, x):
+        x = self.relu(self.conv1(x))
+        x = self.relu(self.conv2(x))
+        return self.conv3(x)
+
+
+class TestParallelStatsCollection(unittest.TestCase):
+
+    def setUp(self):
+        self.data = [np.random.randn(4, 3, 32, 32).astype(np.float32) * (i + 1) for i in range(8)]
+        self.model = Model()
+
+    def representative_dataset(self):
+        for d in self.data:
+            yield [d]
+
+    def prepare_graph(self, num_workers):
+        core_config = CoreConfig(quantization_config=QuantizationConfig(num_stats_collection_workers=num_workers))
+        fw_impl = PytorchImplementation()
+        graph = graph_preparation_runner(self.model, self.representative_dataset, core_config.quantization_config,
+                                         DEFAULT_PYTORCH_INFO, fw_impl,
+                                         get_target_platform_capabilities('pytorch', 'imx500'))
+        start = time.time()
+        graph = quantization_preparation_runner(graph, self.representative_dataset, core_config,
+                                                DEFAULT_PYTORCH_INFO, fw_impl)
+        return graph, time.time() - start
+
+    def test_parallel_collection_equals_serial(self):
+        serial_graph, serial_time = self.prepare_graph(num_workers=1)
+        parallel_graph, parallel_time = self.prepare_graph(num_workers=2)
+        print(f'Quantization preparation: serial {serial_time:.3f}s, 2 workers {parallel_time:.3f}s')
+
+        for serial_node, parallel_node in zip(serial_graph.get_topo_sorted_nodes(),
+                                              parallel_graph.get_topo_sorted_nodes()):
+            self.assertEqual(serial_node.name, parallel_node.name)
+            serial_sc = serial_graph.get_out_stats_collector(serial_node)
+            parallel_sc = parallel_graph.get_out_stats_collector(parallel_node)
+            if serial_sc.require_collection():
+                self.assertTrue(np.array_equal(serial_sc.mpcc.state, parallel_sc.mpcc.state))
+                self.assertTrue(np.allclose(serial_sc.get_mean(), parallel_sc.get_mean()))
+                self.assertTrue(np.allclose(serial_sc.hc.get_histogram()[1], parallel_sc.hc.get_histogram()[1]))
+
+            # The quantization parameters computed from the merged statistics are the same.
+            for serial_qc, parallel_qc in zip(serial_node.candidates_quantization_cfg,
+                                              parallel_node.candidates_quantization_cfg):
+                serial_params = serial_qc.activation_quantization_cfg.activation_quantization_params
+                parallel_params = parallel_qc.activation_quantization_cfg.activation_quantization_params
+                self.assertEqual(serial_params.keys(), parallel_params.keys())
+                for k, v in serial_params.items():
+                    self.assertTrue(np.allclose(v, parallel_params[k]), f'{serial_node.name}: {k}')
+
+    def test_failing_worker(self):
+        infer = ModelCollector.infer
+
+        def failing_infer(model_collector, inputs_list):
+            if inputs_list[0].shape[0] == 3:
+                raise ValueError('failing batch')
+            infer(model_collector, inputs_list)
+
+        self.data[5] = self.data[5][:3]
+        with patch.object(ModelCollector, 'infer', failing_infer):
+            with self.assertRaises(Exception) as e:
+                self.prepare_graph(num_workers=2)
+        self.assertIn('Statistics collection worker 1 failed', str(e.exception))
+        self.assertIn('failing batch', str(e.exception))
+
+    def test_forked_workers_only_on_cpu(self):
+        self.assertTrue(PytorchImplementation().supports_forked_workers)
+        with patch('model_compression_toolkit.core.pytorch.pytorch_implementation.get_working_device',
+                   return_value=torch.device('cuda')):
+            self.assertFalse(PytorchImplementation().supports_forked_workers)
+
+
+if __name__ == '__main__':
+    unittest.main()
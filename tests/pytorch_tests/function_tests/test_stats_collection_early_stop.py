@@ -0,0 +1,140 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.core import CoreConfig, QuantizationConfig, StatsConvergenceConfig
+from model_compression_toolkit.core.common.collectors.histogram_collector import HistogramCollector
+from model_compression_toolkit.core.common.collectors.statistics_collector import StatsCollector, NoStatsCollector
+from model_compression_toolkit.core.common.collectors.stats_convergence_monitor import StatsConvergenceMonitor, \
+    get_histogram_quantiles
+from model_compression_toolkit.core.common.framework_info import ChannelAxis
+from model_compression_toolkit.core.common.model_collector import ModelCollector
+from model_compression_toolkit.core.graph_prep_runner import graph_preparation_runner
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.core.quantization_prep_runner import quantization_preparation_runner
+from model_compression_toolkit.target_platform_capabilities.tpc_models.get_target_platform_capabilities import \
+    get_target_platform_capabilities
+
+NUM_BATCHES = 100
+
+
+class Model(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.conv1 = torch.nn.Conv2d(3, 8, 3)
+        self.relu = torch.nn.ReLU()
+        self.conv2 = torch.nn.Conv2d(8, 8, 3)
+
+    def forward(self, x):
+        return self.conv2(self.relu(self.conv1(x)))
+
+
+def representative_dataset():
+    for _ in range(NUM_BATCHES):
+        yield [np.random.randn(8, 3, 16, 16).astype(np.float32)]
+
+
+class TestStatsCollectionEarlyStop(unittest.TestCase):
+
+    def run_monitor(self, config, batches):
+        monitor = StatsConvergenceMonitor(config)
+        stats_containers_list = [StatsCollector(out_channel_axis=ChannelAxis.NHWC.value),
+                                 [NoStatsCollector(), StatsCollector(out_channel_axis=ChannelAxis.NHWC.value)]]
+        for x in batches:
+            stats_containers_list[0].update_statistics(x)
+            stats_containers_list[1][1].update_statistics(2 * x)
+            monitor.update(stats_containers_list)
+            if monitor.should_stop():
+                break
+        return monitor
+
+    def test_histogram_quantiles(self):
+        counts, bins = np.histogram(np.random.rand(100000), bins=100)
+        quantiles = get_histogram_quantiles(counts, bins, [0, 0.5, 0.99, 1])
+        self.assertTrue(np.allclose(quantiles, [bins[0], 0.5, 0.99, bins[-1]], atol=0.01))
+
+    def test_constant_statistics_converge(self):
+        x = np.random.randn(4, 8, 8, 3)
+        monitor = self.run_monitor(StatsConvergenceConfig(patience=3, min_batches=5), [x] * 20)
+        # The statistics are stable from the second batch.
+        self.assertTrue(monitor.converged)
+        self.assertEqual(monitor.num_batches, 5)
+
+        monitor = self.run_monitor(StatsConvergenceConfig(patience=6, min_batches=2), [x] * 20)
+        self.assertEqual(monitor.num_batches, 7)
+
+    def test_empty_histograms_converge(self):
+        counts, bins = np.zeros(10), np.linspace(0, 1, 11)
+        self.assertIsNone(get_histogram_quantiles(counts, bins, [0.5]))
+
+        # The quantiles of empty histograms are undefined, so they are skipped rather than preventing the convergence.
+        x = np.random.randn(4, 8, 8, 3)
+        with patch.object(HistogramCollector, 'get_last_histogram', return_value=(counts, bins)):
+            monitor = self.run_monitor(StatsConvergenceConfig(patience=3, min_batches=5), [x] * 20)
+        self.assertTrue(monitor.converged)
+        self.assertEqual(monitor.num_batches, 5)
+
+    def test_changing_statistics_do_not_converge(self):
+        # The range of the values grows in every batch, so the statistics do not converge.
+        batches = [np.random.randn(4, 8, 8, 3) * (i + 1) for i in range(20)]
+        monitor = self.run_monitor(StatsConvergenceConfig(patience=2, min_batches=2), batches)
+        self.assertFalse(monitor.converged)
+        self.assertEqual(monitor.num_batches, 20)
+
+        monitor = self.run_monitor(StatsConvergenceConfig(patience=2, min_batches=2, max_batches=8), batches)
+        self.assertFalse(monitor.converged)
+        self.assertEqual(monitor.num_batches, 8)
+
+    def test_invalid_config(self):
+        with self.assertRaises(Exception):
+            StatsConvergenceConfig(patience=0)
+        with self.assertRaises(Exception):
+            StatsConvergenceConfig(min_batches=10, max_batches=5)
+
+    def prepare_graph(self, quantization_config):
+        core_config = CoreConfig(quantization_config=quantization_config)
+        fw_impl = PytorchImplementation()
+        graph = graph_preparation_runner(Model(), representative_dataset, core_config.quantization_config,
+                                         DEFAULT_PYTORCH_INFO, fw_impl,
+                                         get_target_platform_capabilities('pytorch', 'imx500'))
+        with patch.object(ModelCollector, 'infer', autospec=True, side_effect=ModelCollector.infer) as infer_mock:
+            graph = quantization_preparation_runner(graph, representative_dataset, core_config, DEFAULT_PYTORCH_INFO,
+                                                    fw_impl)
+        return graph, infer_mock.call_count
+
+    def test_early_stop_in_quantization_preparation(self):
+        _, num_batches = self.prepare_graph(QuantizationConfig())
+        self.assertEqual(num_batches, NUM_BATCHES)
+
+        config = StatsConvergenceConfig(tolerance=0.05, patience=3, min_batches=5)
+        with patch('model_compression_toolkit.core.common.collectors.stats_convergence_monitor.Logger.info') as info:
+            graph, num_batches = self.prepare_graph(QuantizationConfig(stats_convergence_config=config))
+        self.assertTrue(5 <= num_batches < NUM_BATCHES)
+        info.assert_any_call(f'Statistics collection converged after {num_batches} batches.')
+
+        # The quantization parameters are computed from the statistics of the collected batches.
+        for n in graph.get_topo_sorted_nodes():
+            if n.is_activation_quantization_enabled():
+                activation_cfg = n.candidates_quantization_cfg[0].activation_quantization_cfg
+                self.assertTrue(len(activation_cfg.activation_quantization_params) > 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import time
+import unittest
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.constants import FOUND_TORCHVISION
+from model_compression_toolkit.core import CoreConfig, QuantizationConfig, StatsSamplingConfig, StatsSamplingMethod
+from model_compression_toolkit.core.common.collectors.statistics_collector import StatsCollector, sample_tensor
+from model_compression_toolkit.core.graph_prep_runner import graph_preparation_runner
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.core.quantization_prep_runner import quantization_preparation_runner
+from model_compression_toolkit.target_platform_capabilities.tpc_models.get_target_platform_capabilities import \
+    get_target_platform_capabilities
+
+
+class Model(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.conv1 = torch.nn.Conv2d(3, 16, 3, padding=1)
+        self.relu = torch.nn.ReLU()
+        self.conv2 = torch.nn.Conv2d(16, 16, 3, padding=1)
+        self.conv3 = torch.nn.Conv2d(16, 8, 3, padding=1)
+
+    def forward(self, x):
+        return self.conv3(self.relu(self.conv2(self.relu(self.conv1(x)))))
+
+
+class SegmentationModel(torch.nn.Module):
+    """
+    A segmentation-sized model: a MobileNetV2 encoder, and a head that upsamples the class scores to the input size.
+    """
+    def __init__(self, num_classes=21):
+        super().__init__()
+        from torchvision.models import mobilenet_v2
+        self.encoder = mobilenet_v2().features
+        self.head = torch.nn.Conv2d(1280, num_classes, 1)
+        self.upsample = torch.nn.Upsample(scale_factor=32, mode='bilinear')
+
+    def forward(self, x):
+        return self.upsample(self.head(self.encoder(x)))
+
+
+def representative_dataset():
+    np.random.seed(0)
+    for _ in range(4):
+        yield [np.random.randn(4, 3, 128, 128).astype(np.float32)]
+
+
+def segmentation_representative_dataset():
+    np.random.seed(0)
+    for _ in range(2):
+        yield [np.random.randn(2, 3, 512, 512).astype(np.float32)]
+
+
+class TestStatsSampling(unittest.TestCase):
+
+    def test_sample_tensor(self):
+        rng = np.random.default_rng(0)
+        x = np.random.randn(4, 6, 10, 10) + np.arange(6)[None, :, None, None]
+        for method in StatsSamplingMethod:
+            for channel_axis in [0, 1, 3, -1]:
+                sample = sample_tensor(x, channel_axis, StatsSamplingConfig(max_elements=120, method=method), rng)
+                num_channels = x.shape[channel_axis]
+                self.assertEqual(sample.shape[channel_axis], num_channels)
+                self.assertEqual(sample.size, (120 // num_channels) * num_channels)
+
+            # The sample keeps the per-channel statistics of the tensor.
+            sample = sample_tensor(x, 1, StatsSamplingConfig(max_elements=1200, method=method), rng)
+            self.assertTrue(np.allclose(sample.mean(axis=(0, 2, 3)), np.arange(6), atol=0.5))
+
+        # The sample is determined by the generator's seed.
+        config = StatsSamplingConfig(max_elements=100, method=StatsSamplingMethod.RANDOM)
+        self.assertTrue(np.array_equal(sample_tensor(x, 1, config, np.random.default_rng(1)),
+                                       sample_tensor(x, 1, config, np.random.default_rng(1))))
+
+    def test_invalid_config(self):
+        with self.assertRaises(Exception):
+            StatsSamplingConfig(max_elements=0)
+
+    def test_exact_min_max(self):
+        x = np.random.randn(8, 16, 64, 64).astype(np.float32)
+        exact_sc = StatsCollector(out_channel_axis=1)
+        sampled_sc = StatsCollector(out_channel_axis=1, sampling_config=StatsSamplingConfig(max_elements=1024))
+        exact_sc.update_statistics(x)
+        sampled_sc.update_statistics(x)
+
+        # The min/max values are tracked on the full tensor, and the histogram covers their range.
+        self.assertEqual(sampled_sc.get_min_max_values(), exact_sc.get_min_max_values())
+        bins, _ = sampled_sc.hc.get_histogram()
+        self.assertTrue(np.allclose((bins[0], bins[-1]), exact_sc.get_min_max_values(), rtol=1e-3))
+        self.assertTrue(np.allclose(sampled_sc.get_mean(), exact_sc.get_mean(), atol=0.5))
+
+    def get_activation_thresholds(self, quantization_config, model_class=Model, dataset=representative_dataset):
+        core_config = CoreConfig(quantization_config=quantization_config)
+        fw_impl = PytorchImplementation()
+        torch.manual_seed(0)
+        graph = graph_preparation_runner(model_class().eval(), dataset, core_config.quantization_config,
+                                         DEFAULT_PYTORCH_INFO, fw_impl,
+                                         get_target_platform_capabilities('pytorch', 'imx500'))
+        start = time.time()
+        graph = quantization_preparation_runner(graph, dataset, core_config, DEFAULT_PYTORCH_INFO, fw_impl)
+        return {n.name: n.candidates_quantization_cfg[0].activation_quantization_cfg.activation_quantization_params
+                for n in graph.get_topo_sorted_nodes() if n.is_activation_quantization_enabled()}, time.time() - start
+
+    def run_benchmark(self, model_class, dataset):
+        exact_params, exact_time = self.get_activation_thresholds(QuantizationConfig(), model_class, dataset)
+        for method in StatsSamplingMethod:
+            sampling_config = StatsSamplingConfig(max_elements=2 ** 14, method=method)
+            sampled_params, sampled_time = self.get_activation_thresholds(
+                QuantizationConfig(stats_sampling_config=sampling_config), model_class, dataset)
+            # The collection time depends on the machine, so it is reported and not asserted.
+            print(f'Statistics collection of {model_class.__name__}: exact {exact_time:.2f}s, '
+                  f'{method.name} sampling {sampled_time:.2f}s')
+
+            # The quantization thresholds are computed from the sampled histograms, so they are close to the exact
+            # thresholds (power-of-two thresholds may differ by a single step).
+            self.assertEqual(sampled_params.keys(), exact_params.keys())
+            for name, params in exact_params.items():
+                for k, v in params.items():
+                    if isinstance(v, float) and v > 0:
+                        self.assertTrue(0.5 <= sampled_params[name][k] / v <= 2, f'{name} {k}')
+
+    def test_benchmark_against_exact_collection(self):
+        self.run_benchmark(Model, representative_dataset)
+
+    @unittest.skipIf(not FOUND_TORCHVISION, 'Requires torchvision')
+    def test_benchmark_segmentation_model(self):
+        self.run_benchmark(SegmentationModel, segmentation_representative_dataset)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -23,7 +23,16 @@ from tests.common_tests.function_tests.test_edge_matcher import TestEdgeMatcher
 #  ----------------  Individual test suites
 from tests.common_tests.function_tests.test_histogram_collector import TestHistogramCollector
 from tests.common_tests.function_tests.test_immutable_class import TestImmutableClass
+from tests.common_tests.function_tests.test_kmeans_1d import TestKMeans1D
 from tests.common_tests.function_tests.test_logger import TestLogger
+from tests.common_tests.function_tests.test_multiple_choice_knapsack import TestMultipleChoiceKnapsack
+from tests.common_tests.function_tests.test_profiler import TestProfiler
+from tests.common_tests.function_tests.test_quantized_weights_cache import TestQuantizedWeightsCache
+from tests.common_tests.function_tests.test_lazy_import import TestLazyImport
+from tests.common_tests.function_tests.test_collectors_merge import TestCollectorsMerge
+from tests.common_tests.function_tests.test_vectorized_qparams_search import TestVectorizedQParamsSearch
+from tests.common_tests.function_tests.test_node_quantization_config_interning import \
+    TestNodeQuantizationConfigInterning
 from tests.common_tests.function_tests.test_resource_utilization_object import TestResourceUtilizationObject
 from tests.common_tests.function_tests.test_threshold_selection import TestThresholdSelection
 from tests.common_tests.test_doc_examples import TestCommonDocsExamples
@@ -72,12 +81,28 @@ if found_tf:
     from tests.trainable_infrastructure_tests.keras.test_keras_trainable_infra_runner import \
         KerasTrainableInfrastructureTestRunner
     from tests.keras_tests.function_tests.test_gptq_soft_quantizer import TestGPTQSoftQuantizer as keras_gptq_soft_quantizer_test
+    from tests.keras_tests.function_tests.test_gptq_regularization_schedule import \
+        TestGPTQRegularizationSchedule as keras_gptq_regularization_schedule_test
     from tests.keras_tests.function_tests.test_activation_quantization_holder_gptq import TestGPTQModelBuilderWithActivationHolder
     from tests.data_generation_tests.keras.test_keras_data_generation_runner import KerasDataGenerationTestRunner
     from tests.keras_tests.pruning_tests.test_memory_calculator import TestParameterCounter
     from tests.keras_tests.pruning_tests.test_pretrained_models import PruningPretrainedModelsTest
     from tests.keras_tests.pruning_tests.feature_networks.test_pruning_feature_networks import PruningFeatureNetworksTest
     from tests.keras_tests.function_tests.test_hmse_error_method import TestParamSelectionWithHMSE
+    from tests.keras_tests.function_tests.test_qparams_computation_cache import TestQParamsComputationCache
+    from tests.keras_tests.function_tests.test_shift_negative_params_search import TestShiftNegativeParamsSearch
+    from tests.keras_tests.function_tests.test_multi_target_mixed_precision import TestMultiTargetMixedPrecision
+    from tests.keras_tests.function_tests.test_mp_knapsack_solver import TestMpKnapsackSolver
+    from tests.keras_tests.function_tests.test_batched_sensitivity_evaluation import \
+        TestBatchedSensitivityEvaluation
+    from tests.keras_tests.function_tests.test_mp_search_space_pruning import TestMpSearchSpacePruning
+    from tests.keras_tests.function_tests.test_adaptive_sensitivity_evaluation import \
+        TestAdaptiveSensitivityEvaluation
+    from tests.keras_tests.function_tests.test_batched_similarity_analyzer import TestBatchedSimilarityAnalyzer
+    from tests.keras_tests.function_tests.test_pipeline_cache import TestPipelineCache
+    from tests.keras_tests.function_tests.test_qco_dispatch_index import TestQCODispatchIndex
+    from tests.keras_tests.function_tests.test_async_tensorboard_writer import TestAsyncTensorboardWriter
+    from tests.keras_tests.function_tests.test_compiled_inference import TestCompiledInference
     from tests.data_generation_tests.keras.test_scheduler_step import TestCustomReduceLROnPlateau
 
 
@@ -93,6 +118,12 @@ if found_pytorch:
     from tests.trainable_infrastructure_tests.pytorch.test_pytorch_trainable_infra_runner import \
         PytorchTrainableInfrastructureTestRunner
     from tests.pytorch_tests.function_tests.test_gptq_soft_quantizer import TestGPTQSoftQuantizer as pytorch_gptq_soft_quantier_test
+    from tests.pytorch_tests.function_tests.test_gptq_regularization_schedule import \
+        TestGPTQRegularizationSchedule as pytorch_gptq_regularization_schedule_test
+    from tests.pytorch_tests.function_tests.test_gptq_data_parallel import TestGPTQDataParallel
+    from tests.pytorch_tests.function_tests.test_parallel_stats_collection import TestParallelStatsCollection
+    from tests.pytorch_tests.function_tests.test_stats_collection_early_stop import TestStatsCollectionEarlyStop
+    from tests.pytorch_tests.function_tests.test_stats_sampling import TestStatsSampling
     from tests.pytorch_tests.function_tests.test_activation_quantization_holder_gptq import \
         TestGPTQModelBuilderWithActivationHolder as TestGPTQModelBuilderWithActivationHolderPytorch
     from tests.pytorch_tests.exporter_tests.test_runner import PytorchExporterTestsRunner
@@ -107,6 +138,14 @@ if __name__ == '__main__':
     suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestHistogramCollector))
     suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestCollectorsManipulations))
     suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestThresholdSelection))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestKMeans1D))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestProfiler))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestMultipleChoiceKnapsack))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestQuantizedWeightsCache))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestLazyImport))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestCollectorsMerge))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestVectorizedQParamsSearch))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestNodeQuantizationConfigInterning))
     suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TargetPlatformModelingTest))
     suiteList.append(unittest.TestLoader().loadTestsFromTestCase(OpsetTest))
     suiteList.append(unittest.TestLoader().loadTestsFromTestCase(QCOptionsTest))
@@ -156,9 +195,22 @@ if __name__ == '__main__':
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestGPTQLossFunctions))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(KerasTrainableInfrastructureTestRunner))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(keras_gptq_soft_quantizer_test))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(keras_gptq_regularization_schedule_test))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TFLayerTest))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(KerasDataGenerationTestRunner))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestParamSelectionWithHMSE))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestQParamsComputationCache))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestShiftNegativeParamsSearch))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestMultiTargetMixedPrecision))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestMpKnapsackSolver))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestBatchedSensitivityEvaluation))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestMpSearchSpacePruning))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestAdaptiveSensitivityEvaluation))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestBatchedSimilarityAnalyzer))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestPipelineCache))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestQCODispatchIndex))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestAsyncTensorboardWriter))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestCompiledInference))
 
     if found_pytorch:
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestActivationQuantizationFunctionsPytorch))
@@ -176,6 +228,11 @@ if __name__ == '__main__':
         # suiteList.append(unittest.TestLoader().loadTestsFromName('test_shufflenet_v2_x1_0', ModelTest))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestPytorchTPModel))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(pytorch_gptq_soft_quantier_test))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(pytorch_gptq_regularization_schedule_test))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestGPTQDataParallel))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestParallelStatsCollection))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestStatsCollectionEarlyStop))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestStatsSampling))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(PytorchTrainableInfrastructureTestRunner))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(PytorchExporterTestsRunner))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(PytorchDataGenerationTestRunner))